@@ -8,6 +8,8 @@ from .columns import router as columns_router
 from .tasks import router as tasks_router
 from .users import router as users_router
 from .comments import router as comments_router
+from .search import router as search_router
+from .archive import router as archive_router
 
 router = APIRouter()
 
@@ -23,6 +25,10 @@ router.include_router(tasks_router)
 router.include_router(users_router)
 # 注册评论路由
 router.include_router(comments_router)
+# 注册检索路由
+router.include_router(search_router)
+# 注册归档路由
+router.include_router(archive_router)
 
 
 @router.get("/health")
@@ -0,0 +1,152 @@
+"""归档任务API路由。"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from ..deps import get_current_user
+from ..models.database import get_db, get_read_db
+from ..schemas.archive import ArchivedTaskDetailResponse, ArchivedTaskResponse, TaskUnarchive
+from ..schemas.project import CursorPaginatedResponse
+from ..schemas.task import TaskResponse
+from ..services.archive import ArchiveService
+from ..services.principal_cache import Principal
+from ..services.project import ProjectService
+from .tasks import can_edit_project
+
+router = APIRouter(tags=["归档"])
+
+
+def get_archive_service(db: Session = Depends(get_db)) -> ArchiveService:
+    """获取归档服务实例。"""
+    return ArchiveService(db)
+
+
+def get_archive_reader(db: Session = Depends(get_read_db)) -> ArchiveService:
+    """获取基于只读会话的归档服务实例（用于GET接口）。"""
+    return ArchiveService(db)
+
+
+@router.get(
+    "/projects/{project_id}/archive",
+    response_model=CursorPaginatedResponse[ArchivedTaskResponse],
+)
+def get_archived_tasks(
+    project_id: int,
+    q: Optional[str] = Query(None, max_length=100, description="检索词，匹配标题、描述与评论"),
+    cursor: Optional[str] = Query(None, description="分页游标（取自上一页的 next_cursor）"),
+    limit: int = Query(50, ge=1, le=200, description="每页数量"),
+    current_user: Principal = Depends(get_current_user),
+    archive_service: ArchiveService = Depends(get_archive_reader),
+) -> CursorPaginatedResponse[ArchivedTaskResponse]:
+    """按归档时间倒序浏览、检索项目的归档任务。
+
+    Args:
+        project_id: 项目ID
+        q: 检索词
+        cursor: 分页游标
+        limit: 每页数量
+        current_user: 当前用户
+        archive_service: 归档服务
+
+    Returns:
+        游标分页的归档任务列表
+
+    Raises:
+        HTTPException: 如果项目不存在或游标无效
+    """
+    if not ProjectService(archive_service.db).get_project_by_id(project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="项目不存在",
+        )
+
+    try:
+        return archive_service.get_archived_page(project_id, q, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.get("/archive/tasks/{archived_id}", response_model=ArchivedTaskDetailResponse)
+def get_archived_task(
+    archived_id: int,
+    current_user: Principal = Depends(get_current_user),
+    archive_service: ArchiveService = Depends(get_archive_reader),
+) -> ArchivedTaskDetailResponse:
+    """获取归档任务详情及其评论。
+
+    Args:
+        archived_id: 归档ID
+        current_user: 当前用户
+        archive_service: 归档服务
+
+    Returns:
+        归档任务详情
+
+    Raises:
+        HTTPException: 如果归档任务不存在
+    """
+    archived = archive_service.get_archived_task(archived_id)
+    if not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="归档任务不存在",
+        )
+
+    detail = ArchivedTaskDetailResponse.model_validate(archived)
+    detail.comments = archive_service.get_archived_comments(archived_id)
+    return detail
+
+
+@router.post(
+    "/archive/tasks/{archived_id}/unarchive",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def unarchive_task(
+    archived_id: int,
+    unarchive_data: TaskUnarchive,
+    current_user: Principal = Depends(get_current_user),
+    archive_service: ArchiveService = Depends(get_archive_service),
+) -> TaskResponse:
+    """将归档任务恢复到看板的指定位置。
+
+    Args:
+        archived_id: 归档ID
+        unarchive_data: 目标列与位置
+        current_user: 当前用户
+        archive_service: 归档服务
+
+    Returns:
+        恢复后的任务信息（任务ID为新分配的ID）
+
+    Raises:
+        HTTPException: 如果归档任务不存在、无权操作或目标列无效
+    """
+    archived = archive_service.get_archived_task(archived_id)
+    if not archived:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="归档任务不存在",
+        )
+
+    project = ProjectService(archive_service.db).get_project_by_id(archived.project_id)
+    if not can_edit_project(current_user, project):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="无权恢复此任务",
+        )
+
+    try:
+        return archive_service.unarchive(
+            archived, unarchive_data.column_id, unarchive_data.position
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
@@ -8,13 +8,14 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ..config import settings
-from ..deps import get_auth_service, get_current_user
+from ..deps import get_auth_reader, get_auth_service, get_current_user
 from ..models.user import User
 from ..schemas.user import Token, UserCreate, UserLogin, UserResponse
 from ..services.auth import AuthService
+from ..services.principal_cache import Principal
 from ..services.rate_limiter import login_rate_limiter
 from ..services.token_blacklist import token_blacklist
-from ..utils.security import create_access_token, decode_access_token
+from ..utils.security import create_access_token, decode_access_token, forget_access_token
 
 router = APIRouter(prefix="/auth", tags=["认证"])
 security = HTTPBearer(auto_error=False)
@@ -140,7 +141,7 @@ def login(
 
 @router.post("/logout")
 def logout(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ) -> dict:
     """用户登出。
@@ -167,20 +168,32 @@ def logout(
                 if exp:
                     exp_datetime = datetime.fromtimestamp(exp, tz=timezone.utc)
                 token_blacklist.add(jti, exp_datetime)
+            forget_access_token(token)
 
     return {"message": "登出成功"}
 
 
 @router.get("/me", response_model=UserResponse)
 def get_current_user_info(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
+    auth_service: AuthService = Depends(get_auth_reader),
 ) -> User:
     """获取当前用户信息。
 
     Args:
         current_user: 当前认证用户
+        auth_service: 认证服务（只读）
 
     Returns:
         当前用户信息
+
+    Raises:
+        HTTPException: 如果用户不存在
     """
-    return current_user
+    user = auth_service.get_user_by_id(current_user.id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="用户不存在",
+        )
+    return user
@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 
 from ..deps import get_current_user
 from ..models.database import get_db
-from ..models.user import User, UserRole
+from ..models.user import UserRole
 from ..schemas.column import (
     ColumnCreate,
     ColumnReorder,
@@ -15,6 +15,7 @@ from ..schemas.column import (
 )
 from ..schemas.column import ColumnUpdate
 from ..services.column import ColumnService
+from ..services.principal_cache import Principal
 from ..services.project import ProjectService
 
 router = APIRouter(tags=["看板列"])
@@ -30,7 +31,7 @@ def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
     return ProjectService(db)
 
 
-def can_edit_project(user: User, project) -> bool:
+def can_edit_project(user: Principal, project) -> bool:
     """检查用户是否有权限编辑项目。"""
     if user.role in [UserRole.OWNER.value, UserRole.ADMIN.value]:
         return True
@@ -45,7 +46,7 @@ def can_edit_project(user: User, project) -> bool:
 def create_column(
     project_id: int,
     column_data: ColumnCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> ColumnResponse:
@@ -84,7 +85,7 @@ def create_column(
 @router.put("/columns/reorder", response_model=List[ColumnResponse])
 def reorder_columns(
     reorder_data: ColumnReorder,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> List[ColumnResponse]:
@@ -108,8 +109,14 @@ def reorder_columns(
             detail="列ID列表不能为空",
         )
 
+    # 一次查询取出所有待排序的列
+    columns_by_id = {
+        column.id: column
+        for column in column_service.get_columns_by_ids(reorder_data.column_ids)
+    }
+
     # 获取第一个列以确定项目
-    first_column = column_service.get_column_by_id(reorder_data.column_ids[0])
+    first_column = columns_by_id.get(reorder_data.column_ids[0])
     if not first_column:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -125,7 +132,7 @@ def reorder_columns(
 
     # 验证所有列是否属于同一项目
     for column_id in reorder_data.column_ids[1:]:
-        column = column_service.get_column_by_id(column_id)
+        column = columns_by_id.get(column_id)
         if not column:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -145,7 +152,7 @@ def reorder_columns(
 def update_column(
     column_id: int,
     column_data: ColumnUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> ColumnResponse:
@@ -185,7 +192,7 @@ def update_column(
 @router.delete("/columns/{column_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_column(
     column_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> None:
@@ -215,3 +222,41 @@ def delete_column(
         )
 
     column_service.delete_column(column_id)
+
+
+@router.post("/columns/{column_id}/restore", response_model=ColumnResponse)
+def restore_column(
+    column_id: int,
+    current_user: Principal = Depends(get_current_user),
+    column_service: ColumnService = Depends(get_column_service),
+    project_service: ProjectService = Depends(get_project_service),
+) -> ColumnResponse:
+    """恢复恢复期限内已删除的列。
+
+    Args:
+        column_id: 列ID
+        current_user: 当前用户
+        column_service: 列服务
+        project_service: 项目服务
+
+    Returns:
+        恢复后的列信息
+
+    Raises:
+        HTTPException: 如果列不存在、已超过恢复期限或无权访问
+    """
+    column = column_service.get_deleted_column(column_id)
+    if not column:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="列不存在或已超过恢复期限",
+        )
+
+    project = project_service.get_project_by_id(column.project_id)
+    if not can_edit_project(current_user, project):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="无权恢复此列",
+        )
+
+    return column_service.restore_column(column)
@@ -1,19 +1,26 @@
 """评论API路由。"""
 
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..deps import get_current_user
-from ..models.database import get_db
-from ..models.user import User
+from ..deps import get_current_user, get_current_user_async
+from ..models.database import get_async_read_db, get_db
 from ..schemas.comment import CommentCreate, CommentResponse
-from ..services.comment import CommentService
-from ..services.task import TaskService
+from ..services.comment import AsyncCommentService, CommentService, comment_cursor
+from ..services.principal_cache import Principal
+from ..services.task import AsyncTaskService, TaskService
 
 router = APIRouter(tags=["评论"])
 
+# 评论总数、更早一页游标、最新评论游标、是否还有下一页的响应头
+TOTAL_COUNT_HEADER = "X-Total-Count"
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+LATEST_CURSOR_HEADER = "X-Latest-Cursor"
+HAS_MORE_HEADER = "X-Has-More"
+
 
 def get_comment_service(db: Session = Depends(get_db)) -> CommentService:
     """获取评论服务实例。"""
@@ -25,20 +32,45 @@ def get_task_service(db: Session = Depends(get_db)) -> TaskService:
     return TaskService(db)
 
 
+def get_comment_reader(db: AsyncSession = Depends(get_async_read_db)) -> AsyncCommentService:
+    """获取基于异步只读会话的评论服务实例（用于GET接口）。"""
+    return AsyncCommentService(db)
+
+
+def get_task_reader(db: AsyncSession = Depends(get_async_read_db)) -> AsyncTaskService:
+    """获取基于异步只读会话的任务服务实例（用于GET接口）。"""
+    return AsyncTaskService(db)
+
+
 @router.get(
     "/tasks/{task_id}/comments",
     response_model=List[CommentResponse],
 )
-def get_task_comments(
+async def get_task_comments(
     task_id: int,
-    current_user: User = Depends(get_current_user),
-    comment_service: CommentService = Depends(get_comment_service),
-    task_service: TaskService = Depends(get_task_service),
+    response: Response,
+    before: Optional[str] = Query(None, description="只返回早于该游标的评论（取自 X-Next-Cursor 头）"),
+    after: Optional[str] = Query(None, description="只返回晚于该游标的评论（取自 X-Latest-Cursor 头）"),
+    limit: int = Query(50, ge=1, le=200, description="每页数量"),
+    current_user: Principal = Depends(get_current_user_async),
+    comment_service: AsyncCommentService = Depends(get_comment_reader),
+    task_service: AsyncTaskService = Depends(get_task_reader),
 ) -> List[CommentResponse]:
-    """获取任务的评论列表。
+    """获取任务的评论列表（游标分页，按时间倒序）。
+
+    响应头：
+    - X-Total-Count: 任务的评论总数
+    - X-Next-Cursor: 还有更早的评论时，作为 before 获取下一页
+    - X-Latest-Cursor: 本页最新评论的游标，作为 after 获取新增评论
+    - X-Has-More: 翻页方向上是否还有评论（true/false）；使用 after 时为 true 表示
+      新增评论超过一页，应以 X-Latest-Cursor 继续获取
 
     Args:
         task_id: 任务ID
+        response: 响应对象
+        before: 更早评论的游标
+        after: 更新评论的游标
+        limit: 每页数量
         current_user: 当前用户
         comment_service: 评论服务
         task_service: 任务服务
@@ -47,16 +79,33 @@ def get_task_comments(
         评论列表
 
     Raises:
-        HTTPException: 如果任务不存在
+        HTTPException: 如果任务不存在或游标无效
     """
-    task = task_service.get_task_by_id(task_id)
+    task = await task_service.get_task_by_id(task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="任务不存在",
         )
 
-    return comment_service.get_comments_by_task(task_id)
+    try:
+        comments, next_cursor, has_more = await comment_service.get_comments_page(
+            task_id, limit, before=before, after=after
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    response.headers[TOTAL_COUNT_HEADER] = str(await comment_service.count_comments(task_id))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    latest_cursor = comment_cursor(comments[0]) if comments else after
+    if latest_cursor:
+        response.headers[LATEST_CURSOR_HEADER] = latest_cursor
+    response.headers[HAS_MORE_HEADER] = "true" if has_more else "false"
+    return comments
 
 
 @router.post(
@@ -67,7 +116,7 @@ def get_task_comments(
 def create_comment(
     task_id: int,
     comment_data: CommentCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
     task_service: TaskService = Depends(get_task_service),
 ) -> CommentResponse:
@@ -108,7 +157,7 @@ def create_comment(
 )
 def delete_comment(
     comment_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     comment_service: CommentService = Depends(get_comment_service),
 ) -> None:
     """删除评论（仅自己的评论）。
@@ -1,33 +1,80 @@
 """项目API路由。"""
 
+import hashlib
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..deps import get_current_user
-from ..models.database import get_db
-from ..models.user import User, UserRole
+from ..deps import get_current_user, get_current_user_async
+from ..models.database import get_async_read_db, get_db, get_read_db
+from ..models.user import UserRole
 from ..schemas.project import (
-    PaginatedResponse,
+    MAX_BOARD_TASK_LIMIT,
+    CursorPaginatedResponse,
+    ProjectChangesResponse,
     ProjectCreate,
     ProjectDetailResponse,
     ProjectResponse,
     ProjectUpdate,
 )
 from ..schemas.task import TaskFilter, TaskPriority
-from ..services.project import ProjectService
+from ..services.principal_cache import Principal
+from ..services.project import AsyncProjectService, ProjectService
 
 router = APIRouter(prefix="/projects", tags=["项目"])
 
+# 项目列表默认与最大返回数量
+DEFAULT_PROJECT_LIMIT = 100
+MAX_PROJECT_LIMIT = 500
+# 列表接口返回下一页游标的响应头
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def board_etag(project_id: int, version: int, query: str) -> str:
+    """生成看板的 ETag：同一项目版本、同一查询参数的响应内容相同。
+
+    Args:
+        project_id: 项目ID
+        version: 项目版本号
+        query: 请求的查询字符串（筛选与截取参数）
+
+    Returns:
+        带引号的强 ETag
+    """
+    digest = hashlib.sha1(query.encode()).hexdigest()[:12] if query else "all"
+    return f'"{project_id}-{version}-{digest}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """检查 If-None-Match 请求头是否包含当前 ETag。"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match 使用弱比较，忽略 W/ 前缀
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
 
 def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
     """获取项目服务实例。"""
     return ProjectService(db)
 
 
-def can_edit_project(user: User, project) -> bool:
+def get_project_reader(db: Session = Depends(get_read_db)) -> ProjectService:
+    """获取基于只读会话的项目服务实例（用于GET接口）。"""
+    return ProjectService(db)
+
+
+def get_async_project_reader(db: AsyncSession = Depends(get_async_read_db)) -> AsyncProjectService:
+    """获取基于异步只读会话的项目服务实例（用于高频轮询接口）。"""
+    return AsyncProjectService(db)
+
+
+def can_edit_project(user: Principal, project) -> bool:
     """检查用户是否有权限编辑项目。
 
     Args:
@@ -47,7 +94,7 @@ def can_edit_project(user: User, project) -> bool:
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
 def create_project(
     project_data: ProjectCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     project_service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """创建项目。
@@ -64,92 +111,150 @@ def create_project(
     return project
 
 
+def _get_projects_page(
+    project_service: ProjectService, cursor: Optional[str], limit: int, owner_id: Optional[int] = None
+):
+    """按游标获取一页项目，游标无效时返回400。"""
+    try:
+        return project_service.get_projects_page(cursor, limit, owner_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
 @router.get("", response_model=List[ProjectResponse])
 def get_projects(
-    page: Optional[int] = Query(None, ge=1, description="页码（从1开始）"),
-    page_size: Optional[int] = Query(None, ge=1, le=100, description="每页数量"),
-    current_user: User = Depends(get_current_user),
-    project_service: ProjectService = Depends(get_project_service),
+    response: Response,
+    cursor: Optional[str] = Query(None, description="分页游标（取自上一次响应的 X-Next-Cursor 头）"),
+    limit: int = Query(DEFAULT_PROJECT_LIMIT, ge=1, le=MAX_PROJECT_LIMIT, description="返回数量"),
+    current_user: Principal = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_reader),
 ) -> List[ProjectResponse]:
-    """获取所有项目。
+    """获取项目列表（按创建时间倒序，单次最多返回 limit 个）。
+
+    还有更多项目时通过 X-Next-Cursor 响应头返回下一页游标。
 
     Args:
-        page: 页码（可选，不传则返回全部）
-        page_size: 每页数量（可选）
+        response: 响应对象
+        cursor: 分页游标
+        limit: 返回数量
         current_user: 当前用户
         project_service: 项目服务
 
     Returns:
         项目列表
-    """
-    return project_service.get_all_projects()
 
-
-@router.get("/paginated", response_model=PaginatedResponse[ProjectResponse])
-def get_projects_paginated(
-    page: int = Query(1, ge=1, description="页码（从1开始）"),
-    page_size: int = Query(10, ge=1, le=100, description="每页数量"),
-    current_user: User = Depends(get_current_user),
-    project_service: ProjectService = Depends(get_project_service),
-) -> PaginatedResponse[ProjectResponse]:
-    """获取所有项目（分页）。
+    Raises:
+        HTTPException: 如果游标无效
+    """
+    projects, next_cursor = _get_projects_page(project_service, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return projects
+
+
+@router.get("/cursor", response_model=CursorPaginatedResponse[ProjectResponse])
+def get_projects_by_cursor(
+    cursor: Optional[str] = Query(None, description="分页游标（取自上一页的 next_cursor）"),
+    limit: int = Query(20, ge=1, le=100, description="每页数量"),
+    owner_id: Optional[int] = Query(None, description="只列出该用户创建的项目"),
+    include_total: bool = Query(False, description="是否返回总数量（缓存的近似值）"),
+    current_user: Principal = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_reader),
+) -> CursorPaginatedResponse[ProjectResponse]:
+    """获取项目列表（游标分页）。
 
     Args:
-        page: 页码
-        page_size: 每页数量
+        cursor: 分页游标
+        limit: 每页数量
+        owner_id: 所有者ID
+        include_total: 是否返回总数量
         current_user: 当前用户
         project_service: 项目服务
 
     Returns:
-        分页的项目列表
+        游标分页的项目列表
+
+    Raises:
+        HTTPException: 如果游标无效
     """
-    projects, total = project_service.get_all_projects_paginated(page, page_size)
-    total_pages = (total + page_size - 1) // page_size
-    return PaginatedResponse(
+    projects, next_cursor = _get_projects_page(project_service, cursor, limit, owner_id)
+    total = project_service.count_projects(owner_id) if include_total else None
+    return CursorPaginatedResponse(
         items=projects,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None,
         total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
     )
 
 
 @router.get("/{project_id}", response_model=ProjectDetailResponse)
-def get_project(
+async def get_project(
     project_id: int,
-    keyword: Optional[str] = Query(None, description="标题关键词（模糊匹配）"),
+    request: Request,
+    response: Response,
+    keyword: Optional[str] = Query(None, description="关键词（全文检索标题、描述与评论）"),
     assignee_id: Optional[int] = Query(None, description="负责人ID"),
     priority: Optional[TaskPriority] = Query(None, description="优先级"),
     due_date_start: Optional[datetime] = Query(None, description="截止日期起始"),
     due_date_end: Optional[datetime] = Query(None, description="截止日期结束"),
-    current_user: User = Depends(get_current_user),
-    project_service: ProjectService = Depends(get_project_service),
+    task_limit: Optional[int] = Query(
+        None, ge=1, le=MAX_BOARD_TASK_LIMIT, description="每列返回的任务数（默认使用项目配置）"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_user_async),
+    project_service: AsyncProjectService = Depends(get_async_project_reader),
 ) -> ProjectDetailResponse:
     """获取项目详情（包含列和任务）。
 
     支持任务筛选参数：
-    - keyword: 标题关键词（不区分大小写）
+    - keyword: 关键词，全文检索标题、描述与评论（不区分大小写）
     - assignee_id: 负责人ID
     - priority: 优先级（high/medium/low）
     - due_date_start: 截止日期起始
     - due_date_end: 截止日期结束
 
+    未设置筛选条件时，每列只返回前 task_limit 个任务（未指定时使用项目的
+    board_task_limit），列的 task_total 为任务总数，其余任务通过
+    next_cursor 调用 GET /columns/{id}/tasks 续读。
+
+    响应带有由项目版本号与查询参数生成的 ETag。请求头 If-None-Match 与之相同时
+    返回 304，只读取项目行，不加载列和任务。
+
     Args:
         project_id: 项目ID
-        keyword: 标题关键词
+        request: 请求对象（读取查询参数）
+        response: 响应对象（写入 ETag）
+        keyword: 关键词
         assignee_id: 负责人ID
         priority: 优先级
         due_date_start: 截止日期起始
         due_date_end: 截止日期结束
+        task_limit: 每列任务数
+        if_none_match: 客户端缓存的 ETag
         current_user: 当前用户
         project_service: 项目服务
 
     Returns:
-        项目详情
+        项目详情，内容未变化时为 304 响应
 
     Raises:
         HTTPException: 如果项目不存在
     """
+    version = await project_service.get_board_version(project_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="项目不存在",
+        )
+    # 先读取版本号再加载看板：期间若有修改，ETag 偏旧只会导致下次多取一次完整看板
+    etag = board_etag(project_id, version, request.url.query)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     # 构建筛选条件
     task_filter = TaskFilter(
         keyword=keyword,
@@ -159,21 +264,55 @@ def get_project(
         due_date_end=due_date_end,
     )
 
-    project = project_service.get_project_with_filter(project_id, task_filter)
+    project = await project_service.get_project_with_filter(project_id, task_filter, task_limit)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="项目不存在",
         )
+    response.headers.update(headers)
     # 所有用户都可以查看任意项目
     return project
 
 
+@router.get("/{project_id}/changes", response_model=ProjectChangesResponse)
+async def get_project_changes(
+    project_id: int,
+    since: int = Query(..., ge=0, description="客户端已有的看板版本号"),
+    current_user: Principal = Depends(get_current_user_async),
+    project_service: AsyncProjectService = Depends(get_async_project_reader),
+) -> ProjectChangesResponse:
+    """获取看板自 since 版本以来的变更（增量同步）。
+
+    返回变更后的项目信息、新增或修改的列与任务，以及已删除的列ID与任务ID；
+    since 早于保留的变更记录或变更过多时 full_resync 为真，客户端需重新获取完整看板。
+
+    Args:
+        project_id: 项目ID
+        since: 客户端已有的看板版本号
+        current_user: 当前用户
+        project_service: 项目服务
+
+    Returns:
+        看板变更
+
+    Raises:
+        HTTPException: 如果项目不存在
+    """
+    changes = await project_service.get_changes(project_id, since)
+    if changes is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="项目不存在",
+        )
+    return changes
+
+
 @router.put("/{project_id}", response_model=ProjectResponse)
 def update_project(
     project_id: int,
     project_data: ProjectUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     project_service: ProjectService = Depends(get_project_service),
 ) -> ProjectResponse:
     """更新项目。
@@ -209,7 +348,7 @@ def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     project_service: ProjectService = Depends(get_project_service),
 ) -> None:
     """删除项目。
@@ -235,3 +374,37 @@ def delete_project(
         )
 
     project_service.delete_project(project_id)
+
+
+@router.post("/{project_id}/restore", response_model=ProjectResponse)
+def restore_project(
+    project_id: int,
+    current_user: Principal = Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_service),
+) -> ProjectResponse:
+    """恢复恢复期限内已删除的项目。
+
+    Args:
+        project_id: 项目ID
+        current_user: 当前用户
+        project_service: 项目服务
+
+    Returns:
+        恢复后的项目信息
+
+    Raises:
+        HTTPException: 如果项目不存在、已超过恢复期限或无权访问
+    """
+    project = project_service.get_deleted_project(project_id)
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="项目不存在或已超过恢复期限",
+        )
+    if not can_edit_project(current_user, project):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="无权恢复此项目",
+        )
+
+    return project_service.restore_project(project)
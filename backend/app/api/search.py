@@ -0,0 +1,64 @@
+"""全文检索API路由。"""
+
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from ..deps import get_current_user
+from ..models.database import get_read_db
+from ..schemas.search import SearchResult
+from ..services.principal_cache import Principal
+from ..services.project import ProjectService
+from ..services.search import SearchService
+
+router = APIRouter(tags=["检索"])
+
+
+def get_search_reader(db: Session = Depends(get_read_db)) -> SearchService:
+    """获取基于只读会话的检索服务实例。"""
+    return SearchService(db)
+
+
+def get_project_reader(db: Session = Depends(get_read_db)) -> ProjectService:
+    """获取基于只读会话的项目服务实例。"""
+    return ProjectService(db)
+
+
+@router.get("/search", response_model=List[SearchResult])
+def search_tasks(
+    q: str = Query(..., min_length=1, max_length=100, description="检索词，多个词以空格分隔"),
+    project_id: Optional[int] = Query(None, description="限定项目ID，不传则检索所有项目"),
+    limit: int = Query(20, ge=1, le=100, description="最大结果数"),
+    current_user: Principal = Depends(get_current_user),
+    search_service: SearchService = Depends(get_search_reader),
+    project_service: ProjectService = Depends(get_project_reader),
+) -> List[SearchResult]:
+    """检索任务标题、描述与评论，结果按相关度排序。
+
+    Args:
+        q: 检索词
+        project_id: 限定项目ID
+        limit: 最大结果数
+        current_user: 当前用户
+        search_service: 检索服务
+        project_service: 项目服务
+
+    Returns:
+        检索结果列表（含高亮片段）
+
+    Raises:
+        HTTPException: 如果检索词为空或项目不存在
+    """
+    if not q.strip():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="检索词不能为空",
+        )
+    if project_id is not None and not project_service.get_project_by_id(project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="项目不存在",
+        )
+    # 所有用户都可以查看任意项目
+    return search_service.search_tasks(q, project_id, limit)
@@ -1,15 +1,27 @@
 """任务API路由。"""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from ..deps import get_current_user
-from ..models.database import get_db
-from ..models.user import User, UserRole
-from ..schemas.task import TaskCreate, TaskMove, TaskResponse, TaskUpdate
+from ..models.database import get_db, get_read_db
+from ..models.user import UserRole
+from ..schemas.project import CursorPaginatedResponse
+from ..schemas.task import (
+    TaskBatchRequest,
+    TaskBatchResponse,
+    TaskCreate,
+    TaskMove,
+    TaskResponse,
+    TaskUpdate,
+)
 from ..services.column import ColumnService
+from ..services.principal_cache import Principal
 from ..services.project import ProjectService
 from ..services.task import TaskService
+from ..services.task_batch import TaskBatchService
 
 router = APIRouter(tags=["任务"])
 
@@ -19,6 +31,11 @@ def get_task_service(db: Session = Depends(get_db)) -> TaskService:
     return TaskService(db)
 
 
+def get_task_reader(db: Session = Depends(get_read_db)) -> TaskService:
+    """获取基于只读会话的任务服务实例（用于GET接口）。"""
+    return TaskService(db)
+
+
 def get_column_service(db: Session = Depends(get_db)) -> ColumnService:
     """获取列服务实例。"""
     return ColumnService(db)
@@ -29,13 +46,60 @@ def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
     return ProjectService(db)
 
 
-def can_edit_project(user: User, project) -> bool:
+def get_task_batch_service(db: Session = Depends(get_db)) -> TaskBatchService:
+    """获取批量任务操作服务实例。"""
+    return TaskBatchService(db)
+
+
+def can_edit_project(user: Principal, project) -> bool:
     """检查用户是否有权限编辑项目。"""
     if user.role in [UserRole.OWNER.value, UserRole.ADMIN.value]:
         return True
     return project.owner_id == user.id
 
 
+@router.get(
+    "/columns/{column_id}/tasks",
+    response_model=CursorPaginatedResponse[TaskResponse],
+)
+def get_column_tasks(
+    column_id: int,
+    cursor: Optional[str] = Query(None, description="分页游标（取自看板列或上一页的 next_cursor）"),
+    limit: int = Query(50, ge=1, le=200, description="每页数量"),
+    current_user: Principal = Depends(get_current_user),
+    task_service: TaskService = Depends(get_task_reader),
+) -> CursorPaginatedResponse[TaskResponse]:
+    """按列内顺序分页获取列的任务。
+
+    Args:
+        column_id: 列ID
+        cursor: 分页游标
+        limit: 每页数量
+        current_user: 当前用户
+        task_service: 任务服务
+
+    Returns:
+        游标分页的任务列表（total 为列内任务总数）
+
+    Raises:
+        HTTPException: 如果列不存在或游标无效
+    """
+    column = ColumnService(task_service.db).get_column_by_id(column_id)
+    if not column:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="列不存在",
+        )
+
+    try:
+        return task_service.get_tasks_page(column_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
 @router.post(
     "/columns/{column_id}/tasks",
     response_model=TaskResponse,
@@ -44,7 +108,7 @@ def can_edit_project(user: User, project) -> bool:
 def create_task(
     column_id: int,
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
@@ -93,9 +157,8 @@ def create_task(
 def update_task(
     task_id: int,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
-    column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> TaskResponse:
     """更新任务。
@@ -105,7 +168,6 @@ def update_task(
         task_data: 任务更新数据
         current_user: 当前用户
         task_service: 任务服务
-        column_service: 列服务
         project_service: 项目服务
 
     Returns:
@@ -121,8 +183,7 @@ def update_task(
             detail="任务不存在",
         )
 
-    column = column_service.get_column_by_id(task.column_id)
-    project = project_service.get_project_by_id(column.project_id)
+    project = project_service.get_project_by_id(task.project_id)
     if not can_edit_project(current_user, project):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -142,9 +203,8 @@ def update_task(
 @router.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_task(
     task_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
-    column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
 ) -> None:
     """删除任务。
@@ -153,7 +213,6 @@ def delete_task(
         task_id: 任务ID
         current_user: 当前用户
         task_service: 任务服务
-        column_service: 列服务
         project_service: 项目服务
 
     Raises:
@@ -166,8 +225,7 @@ def delete_task(
             detail="任务不存在",
         )
 
-    column = column_service.get_column_by_id(task.column_id)
-    project = project_service.get_project_by_id(column.project_id)
+    project = project_service.get_project_by_id(task.project_id)
     if not can_edit_project(current_user, project):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -181,7 +239,7 @@ def delete_task(
 def move_task(
     task_id: int,
     move_data: TaskMove,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     task_service: TaskService = Depends(get_task_service),
     column_service: ColumnService = Depends(get_column_service),
     project_service: ProjectService = Depends(get_project_service),
@@ -209,10 +267,9 @@ def move_task(
             detail="任务不存在",
         )
 
-    # 验证源列权限
-    source_column = column_service.get_column_by_id(task.column_id)
-    source_project = project_service.get_project_by_id(source_column.project_id)
-    if not can_edit_project(current_user, source_project):
+    # 验证任务所属项目的权限
+    project = project_service.get_project_by_id(task.project_id)
+    if not can_edit_project(current_user, project):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="无权移动此任务",
@@ -225,7 +282,7 @@ def move_task(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="目标列不存在",
         )
-    if target_column.project_id != source_column.project_id:
+    if target_column.project_id != task.project_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="目标列必须属于同一项目",
@@ -233,3 +290,28 @@ def move_task(
 
     moved_task = task_service.move_task(task_id, move_data.target_column_id, move_data.position)
     return moved_task
+
+
+@router.post("/tasks/batch", response_model=TaskBatchResponse)
+def batch_tasks(
+    batch: TaskBatchRequest,
+    current_user: Principal = Depends(get_current_user),
+    batch_service: TaskBatchService = Depends(get_task_batch_service),
+) -> TaskBatchResponse:
+    """在一个事务中批量创建、更新、移动、删除任务。
+
+    操作按顺序执行，每个项目只校验一次权限；单个操作失败时在结果中返回
+    与单个接口一致的状态码和原因，其余操作照常提交。
+
+    Args:
+        batch: 批量操作请求
+        current_user: 当前用户
+        batch_service: 批量任务操作服务
+
+    Returns:
+        每个操作的执行结果
+    """
+    return batch_service.apply(
+        batch.operations,
+        lambda project: can_edit_project(current_user, project),
+    )
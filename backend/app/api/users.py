@@ -2,42 +2,62 @@
 
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from sqlalchemy.exc import IntegrityError
 
-from ..deps import get_current_user
-from ..models.database import get_db
+from ..deps import get_current_user, get_current_user_async
+from ..models.archive import ArchivedComment
+from ..models.comment import Comment
+from ..models.database import get_async_read_db, get_db, get_read_db
+from ..models.project import Project
+from ..models.task import Task
 from ..models.user import User, UserRole
-from ..schemas.user import UserCreate, UserInfoUpdate, UserListItem, UserRoleUpdate, UserResponse, UserSelfUpdate
+from ..schemas.user import (
+    UserCreate,
+    UserImportRequest,
+    UserImportResponse,
+    UserInfoUpdate,
+    UserListItem,
+    UserRoleUpdate,
+    UserResponse,
+    UserSelfUpdate,
+)
+from ..services.changes import record_task_changes
+from ..services.counters import bump_assignee_project_versions, bump_comment_author_project_versions
+from ..services.principal_cache import Principal, principal_cache
+from ..services.user_import import UserImportService, parse_users_csv
 from ..utils.security import get_password_hash, verify_password
 
 router = APIRouter(prefix="/users", tags=["用户"])
 
 
 @router.get("", response_model=List[UserListItem])
-def get_users(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+async def get_users(
+    current_user: Principal = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> List[User]:
     """获取所有用户列表（用于负责人选择）。
 
     Args:
         current_user: 当前用户（需要认证）
-        db: 数据库会话
+        db: 异步只读数据库会话
 
     Returns:
         用户列表
     """
-    return db.query(User).filter(User.is_active.is_(True)).all()
+    result = await db.execute(select(User).where(User.is_active.is_(True)))
+    return list(result.scalars().all())
 
 
 @router.put("/{user_id}/role", response_model=UserResponse)
 def update_user_role(
     user_id: int,
     role_data: UserRoleUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> User:
     """更新用户角色（仅所有者可操作）。
@@ -86,14 +106,15 @@ def update_user_role(
     # 更新角色
     target_user.role = role_data.role.value
     db.commit()
+    principal_cache.invalidate(target_user.id)
     db.refresh(target_user)
     return target_user
 
 
 @router.get("/all", response_model=List[UserResponse])
 def get_all_users(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ) -> List[User]:
     """获取所有用户完整信息（仅所有者可操作）。
 
@@ -119,23 +140,34 @@ def get_all_users(
 
 @router.get("/me/profile", response_model=UserResponse)
 def get_my_profile(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ) -> User:
     """获取当前用户个人信息。
 
     Args:
         current_user: 当前用户
+        db: 只读数据库会话
 
     Returns:
         当前用户信息
+
+    Raises:
+        HTTPException: 如果用户不存在
     """
-    return current_user
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="用户不存在",
+        )
+    return user
 
 
 @router.put("/me/profile", response_model=UserResponse)
 def update_my_profile(
     user_data: UserSelfUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> User:
     """更新当前用户个人信息。
@@ -151,23 +183,29 @@ def update_my_profile(
     Raises:
         HTTPException: 如果密码验证失败或邮箱已被使用
     """
+    # 当前用户仅含鉴权字段，需在写会话中加载完整用户后再修改
+    user = db.query(User).filter(User.id == current_user.id).first()
+
     # 更新显示名称
     if user_data.display_name is not None:
-        current_user.display_name = user_data.display_name
+        user.display_name = user_data.display_name
+        # 看板中显示负责人名称
+        bump_assignee_project_versions(db, user.id)
+        record_task_changes(db, Task.assignee_id == user.id)
 
     # 更新邮箱
     if user_data.email is not None:
         # 检查邮箱是否已被其他用户使用
         existing_user = db.query(User).filter(
             User.email == user_data.email,
-            User.id != current_user.id
+            User.id != user.id
         ).first()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="邮箱已被其他用户使用",
             )
-        current_user.email = user_data.email
+        user.email = user_data.email
 
     # 更新密码（需要验证当前密码）
     if user_data.new_password is not None:
@@ -176,23 +214,24 @@ def update_my_profile(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="修改密码需要提供当前密码",
             )
-        if not verify_password(user_data.current_password, current_user.password_hash):
+        if not verify_password(user_data.current_password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="当前密码错误",
             )
-        current_user.password_hash = get_password_hash(user_data.new_password)
+        user.password_hash = get_password_hash(user_data.new_password)
 
     db.commit()
-    db.refresh(current_user)
-    return current_user
+    principal_cache.invalidate(user.id)
+    db.refresh(user)
+    return user
 
 
 @router.get("/{user_id}", response_model=UserResponse)
 def get_user_detail(
     user_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
 ) -> User:
     """获取用户详情（仅所有者可操作）。
 
@@ -228,7 +267,7 @@ def get_user_detail(
 def update_user_info(
     user_id: int,
     user_data: UserInfoUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> User:
     """更新用户信息（仅所有者可操作）。
@@ -263,6 +302,9 @@ def update_user_info(
     # 更新字段
     if user_data.display_name is not None:
         target_user.display_name = user_data.display_name
+        # 看板中显示负责人名称
+        bump_assignee_project_versions(db, user_id)
+        record_task_changes(db, Task.assignee_id == user_id)
     if user_data.email is not None:
         # 检查邮箱是否已被其他用户使用
         existing_user = db.query(User).filter(
@@ -287,6 +329,7 @@ def update_user_info(
         target_user.is_active = user_data.is_active
 
     db.commit()
+    principal_cache.invalidate(target_user.id)
     db.refresh(target_user)
     return target_user
 
@@ -294,7 +337,7 @@ def update_user_info(
 @router.post("", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 def create_user(
     user_data: UserCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> User:
     """创建新用户（仅所有者可操作）。
@@ -339,10 +382,96 @@ def create_user(
     return new_user
 
 
+def _ensure_owner_can_import(current_user: Principal) -> None:
+    """检查当前用户能否批量导入用户。
+
+    Raises:
+        HTTPException: 如果不是所有者
+    """
+    # 只有所有者可以创建用户
+    if current_user.role != UserRole.OWNER.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="只有所有者可以创建用户",
+        )
+
+
+def _import_users(rows: list, db: Session, read_db: Session) -> UserImportResponse:
+    """批量导入用户。
+
+    Raises:
+        HTTPException: 如果与并发创建的用户冲突
+    """
+    try:
+        return UserImportService(db, read_db).import_users(rows)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post("/import", response_model=UserImportResponse)
+def import_users(
+    import_data: UserImportRequest,
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+) -> UserImportResponse:
+    """批量导入用户（JSON，仅所有者可操作）。
+
+    Args:
+        import_data: 待导入的用户
+        current_user: 当前用户
+        db: 数据库会话
+        read_db: 只读数据库会话
+
+    Returns:
+        创建成功的用户与各失败行的原因
+
+    Raises:
+        HTTPException: 如果无权操作
+    """
+    _ensure_owner_can_import(current_user)
+    return _import_users(import_data.users, db, read_db)
+
+
+@router.post("/import/csv", response_model=UserImportResponse)
+def import_users_csv(
+    file: UploadFile = File(..., description="CSV文件，表头包含 username、email、password，可选 display_name"),
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
+) -> UserImportResponse:
+    """批量导入用户（CSV，仅所有者可操作）。
+
+    Args:
+        file: CSV文件（UTF-8编码）
+        current_user: 当前用户
+        db: 数据库会话
+        read_db: 只读数据库会话
+
+    Returns:
+        创建成功的用户与各失败行的原因
+
+    Raises:
+        HTTPException: 如果无权操作或文件格式无效
+    """
+    _ensure_owner_can_import(current_user)
+    try:
+        rows = parse_users_csv(file.file.read().decode("utf-8"))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV文件必须使用UTF-8编码" if isinstance(e, UnicodeDecodeError) else str(e),
+        )
+    return _import_users(rows, db, read_db)
+
+
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_user(
     user_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
     db: Session = Depends(get_db),
 ) -> None:
     """删除用户（仅所有者可操作）。
@@ -353,7 +482,7 @@ def delete_user(
         db: 数据库会话
 
     Raises:
-        HTTPException: 如果无权操作、用户不存在或尝试删除自己
+        HTTPException: 如果无权操作、用户不存在、尝试删除自己或用户仍拥有项目
     """
     # 只有所有者可以删除用户
     if current_user.role != UserRole.OWNER.value:
@@ -377,6 +506,21 @@ def delete_user(
             detail="用户不存在",
         )
 
-    # 删除用户
+    # 项目不随用户删除（包括尚未清理的已删除项目）
+    if db.query(Project.id).filter(Project.owner_id == user_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="该用户仍拥有项目，无法删除",
+        )
+
+    # 删除用户：其评论保留并由数据库将作者置空，负责的任务置为未指派
+    commented_task_ids = select(Comment.task_id).where(Comment.user_id == user_id)
+    bump_assignee_project_versions(db, user_id)
+    bump_comment_author_project_versions(db, user_id)
+    record_task_changes(db, or_(Task.assignee_id == user_id, Task.id.in_(commented_task_ids)))
+    db.execute(
+        update(ArchivedComment).where(ArchivedComment.user_id == user_id).values(user_id=None)
+    )
     db.delete(target_user)
     db.commit()
+    principal_cache.invalidate(user_id)
@@ -41,12 +41,38 @@ class Settings(BaseSettings):
     SECRET_KEY: str = _get_secret_key()
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24小时
+    PASSWORD_HASH_WORKERS: int = 4  # 批量导入用户时哈希密码的进程数（0 表示在当前线程计算）
+    PRINCIPAL_CACHE_SIZE: int = 10000  # 进程内缓存的已认证用户数（0 表示不缓存）
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # 已认证用户缓存的有效期（秒）
+    TOKEN_CACHE_SIZE: int = 10000  # 进程内缓存的已验证令牌数（0 表示不缓存）
 
     # CORS配置
     CORS_ORIGINS: List[str] = ["http://localhost:5173", "http://127.0.0.1:5173"]
 
     # 数据库配置
-    DATABASE_URL: Optional[str] = None
+    DATABASE_URL: Optional[str] = None  # 未设置时使用 data/kanban.db
+    DB_TUNING_PROFILE: str = "default"  # SQLite调优配置档：default/safe/legacy
+    DB_POOL_SIZE: int = 5  # 只读连接池大小（写连接固定为1个）
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # 获取连接的最长等待时间（秒）
+    DB_POOL_RECYCLE: int = 3600  # 连接回收周期（秒）
+
+    # 任务排序方式：position（连续整数位置）或 rank（排序键，移动任务只改写一行）
+    TASK_ORDERING: str = "position"
+
+    # 任务归档：进入最后一列超过该天数的任务移入归档表（0 表示不自动归档）
+    ARCHIVE_AFTER_DAYS: int = 30
+    ARCHIVE_INTERVAL_SECONDS: int = 3600  # 后台归档任务的执行间隔
+    ARCHIVE_BATCH_SIZE: int = 500  # 每批归档的任务数（每批单独提交）
+
+    # 软删除：删除的项目、列在保留期内可恢复，之后由后台分批清理
+    DELETED_RETENTION_DAYS: int = 7
+    PURGE_INTERVAL_SECONDS: int = 600  # 后台清理任务的执行间隔（0 表示不自动清理）
+    PURGE_BATCH_SIZE: int = 500  # 每批清理的任务数（每批单独提交）
+
+    # 看板增量同步：变更记录的保留时长（由后台清理任务一并清理），早于此的版本需重新获取完整看板
+    CHANGE_LOG_RETENTION_HOURS: int = 24
+    MAX_CHANGES_PER_SYNC: int = 500  # 单次增量同步最多返回的变更对象数，超出时需重新获取完整看板
 
 
 settings = Settings()
@@ -4,11 +4,12 @@ from typing import Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .models.database import get_db
-from .models.user import User
-from .services.auth import AuthService
+from .models.database import get_async_read_db, get_db, get_read_db
+from .services.auth import AsyncAuthService, AuthService
+from .services.principal_cache import Principal, principal_cache
 from .services.token_blacklist import token_blacklist
 from .utils.security import decode_access_token
 
@@ -28,21 +29,28 @@ def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     return AuthService(db)
 
 
-def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service),
-) -> Optional[User]:
-    """获取当前用户（可选）。
+def get_auth_reader(db: Session = Depends(get_read_db)) -> AuthService:
+    """获取基于只读会话的认证服务实例（用于查询当前用户）。
 
     Args:
-        credentials: HTTP认证凭据
-        auth_service: 认证服务
+        db: 只读数据库会话
 
     Returns:
-        当前用户对象，如果未认证则返回None
+        认证服务实例
+    """
+    return AuthService(db)
 
-    Raises:
-        HTTPException: 如果用户账户已被禁用
+
+def _get_user_id_from_credentials(
+    credentials: Optional[HTTPAuthorizationCredentials],
+) -> Optional[int]:
+    """从认证凭据中解析用户ID。
+
+    Args:
+        credentials: HTTP认证凭据
+
+    Returns:
+        用户ID，如果令牌无效或已失效则返回None
     """
     if not credentials:
         return None
@@ -62,34 +70,100 @@ def get_current_user_optional(
         return None
 
     try:
-        user_id = int(user_id)
+        return int(user_id)
     except ValueError:
         return None
 
-    user = auth_service.get_user_by_id(user_id)
-    if not user:
-        return None
 
+def _ensure_active(user: Optional[Principal]) -> Optional[Principal]:
+    """检查用户是否被禁用。
+
+    Args:
+        user: 用户鉴权信息
+
+    Returns:
+        原用户鉴权信息
+
+    Raises:
+        HTTPException: 如果用户账户已被禁用
+    """
     # 用户被禁用时抛出明确的错误提示
-    if not user.is_active:
+    if user and not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="您的账户已被禁用，请联系管理员",
         )
-
     return user
 
 
-def get_current_user(
-    user: Optional[User] = Depends(get_current_user_optional),
-) -> User:
-    """获取当前用户（必须认证）。
+def get_current_user_optional(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    auth_service: AuthService = Depends(get_auth_reader),
+) -> Optional[Principal]:
+    """获取当前用户（可选）。
+
+    优先使用进程内缓存，未命中时从数据库加载鉴权所需字段并写回缓存。
+
+    Args:
+        credentials: HTTP认证凭据
+        auth_service: 认证服务
+
+    Returns:
+        当前用户鉴权信息，如果未认证则返回None
+
+    Raises:
+        HTTPException: 如果用户账户已被禁用
+    """
+    user_id = _get_user_id_from_credentials(credentials)
+    if user_id is None:
+        return None
+
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        version = principal_cache.version
+        principal = auth_service.get_principal(user_id)
+        if principal is not None:
+            principal_cache.set(principal, version)
+    return _ensure_active(principal)
+
+
+async def get_current_user_optional_async(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> Optional[Principal]:
+    """获取当前用户（可选，异步版本，供异步读接口使用）。
+
+    Args:
+        credentials: HTTP认证凭据
+        db: 异步只读数据库会话
+
+    Returns:
+        当前用户鉴权信息，如果未认证则返回None
+
+    Raises:
+        HTTPException: 如果用户账户已被禁用
+    """
+    user_id = _get_user_id_from_credentials(credentials)
+    if user_id is None:
+        return None
+
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        version = principal_cache.version
+        principal = await AsyncAuthService(db).get_principal(user_id)
+        if principal is not None:
+            principal_cache.set(principal, version)
+    return _ensure_active(principal)
+
+
+def _require_user(user: Optional[Principal]) -> Principal:
+    """要求用户已认证。
 
     Args:
         user: 当前用户
 
     Returns:
-        当前用户对象
+        当前用户鉴权信息
 
     Raises:
         HTTPException: 如果未认证或用户无效
@@ -101,3 +175,37 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     return user
+
+
+def get_current_user(
+    user: Optional[Principal] = Depends(get_current_user_optional),
+) -> Principal:
+    """获取当前用户（必须认证）。
+
+    Args:
+        user: 当前用户
+
+    Returns:
+        当前用户鉴权信息
+
+    Raises:
+        HTTPException: 如果未认证或用户无效
+    """
+    return _require_user(user)
+
+
+async def get_current_user_async(
+    user: Optional[Principal] = Depends(get_current_user_optional_async),
+) -> Principal:
+    """获取当前用户（必须认证，异步版本）。
+
+    Args:
+        user: 当前用户
+
+    Returns:
+        当前用户鉴权信息
+
+    Raises:
+        HTTPException: 如果未认证或用户无效
+    """
+    return _require_user(user)
@@ -0,0 +1,10 @@
+"""数据库迁移模块。
+
+迁移脚本位于 versions 包中，文件名形如 ``v001_xxx.py``，
+每个脚本定义 ``VERSION``、``NAME`` 与 ``upgrade(conn)``。
+已执行的版本记录在 schema_migrations 表中。
+"""
+
+from app.migrations.runner import get_migration_status, load_migrations, run_migrations
+
+__all__ = ["get_migration_status", "load_migrations", "run_migrations"]
@@ -0,0 +1,78 @@
+"""迁移命令行入口。
+
+在 backend 目录下运行::
+
+    python -m app.migrations upgrade        # 执行所有未执行的迁移
+    python -m app.migrations upgrade --to 2 # 执行到指定版本
+    python -m app.migrations status         # 查看迁移状态
+    python -m app.migrations rebuild-search # 重建任务全文检索数据
+    python -m app.migrations check-counters [--dry-run]  # 检查并修复任务数、列数计数器
+    python -m app.migrations archive-tasks [--days N]    # 按归档策略立即归档任务
+    python -m app.migrations purge-deleted [--days N]    # 立即清理超过恢复期限的已删除项目、列
+"""
+
+import argparse
+
+from app.migrations.runner import get_migration_status, run_migrations
+from app.models.counters import repair_counters
+from app.models.database import SessionLocal, engine
+from app.models.search import rebuild_task_search
+from app.services.archive import ArchiveService
+from app.services.purge import PurgeService
+
+
+def main() -> None:
+    """命令行入口。"""
+    parser = argparse.ArgumentParser(description="数据库迁移工具")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    upgrade_parser = subparsers.add_parser("upgrade", help="执行未执行的迁移")
+    upgrade_parser.add_argument("--to", type=int, default=None, help="目标版本号")
+    subparsers.add_parser("status", help="查看迁移状态")
+    subparsers.add_parser("rebuild-search", help="重建任务全文检索数据")
+    counters_parser = subparsers.add_parser("check-counters", help="检查并修复任务数、列数计数器")
+    counters_parser.add_argument("--dry-run", action="store_true", help="只检查不修复")
+    counters_parser.add_argument("--batch-size", type=int, default=500, help="每批检查的行数")
+    archive_parser = subparsers.add_parser("archive-tasks", help="按归档策略立即归档任务")
+    archive_parser.add_argument("--days", type=int, default=None, help="在最后一列停留的天数")
+    archive_parser.add_argument("--batch-size", type=int, default=None, help="每批归档的任务数")
+    purge_parser = subparsers.add_parser("purge-deleted", help="立即清理超过恢复期限的已删除项目、列")
+    purge_parser.add_argument("--days", type=int, default=None, help="恢复期限天数")
+    purge_parser.add_argument("--batch-size", type=int, default=None, help="每批删除的任务数")
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        executed = run_migrations(engine, target=args.to)
+        if executed:
+            print(f"已执行迁移: {', '.join(str(v) for v in executed)}")
+        else:
+            print("数据库结构已是最新")
+    elif args.command == "rebuild-search":
+        with engine.begin() as conn:
+            count = rebuild_task_search(conn)
+        print(f"已重建全文检索，共 {count} 个任务")
+    elif args.command == "check-counters":
+        with engine.connect() as conn:
+            mismatched = repair_counters(conn, args.batch_size, dry_run=args.dry_run)
+        action = "发现" if args.dry_run else "已修复"
+        print(f"{action}计数器不一致：列 {mismatched['columns']} 行，项目 {mismatched['projects']} 行")
+    elif args.command == "archive-tasks":
+        db = SessionLocal()
+        try:
+            count = ArchiveService(db).archive_stale_tasks(args.days, args.batch_size)
+        finally:
+            db.close()
+        print(f"已归档 {count} 个任务")
+    elif args.command == "purge-deleted":
+        db = SessionLocal()
+        try:
+            count = PurgeService(db).purge_expired(args.days, args.batch_size)
+        finally:
+            db.close()
+        print(f"已清理 {count} 个已删除的项目或列")
+    else:
+        for version, name, applied in get_migration_status(engine):
+            print(f"{version:03d} {name:<40} {'已执行' if applied else '待执行'}")
+
+
+if __name__ == "__main__":
+    main()
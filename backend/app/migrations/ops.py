@@ -0,0 +1,122 @@
+"""迁移脚本使用的辅助操作。"""
+
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import Table, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateTable
+
+# 数据回填每批处理的行数
+DEFAULT_BATCH_SIZE = 1000
+
+
+def table_exists(conn: Connection, table: str) -> bool:
+    """检查表是否存在。
+
+    Args:
+        conn: 数据库连接
+        table: 表名
+
+    Returns:
+        表是否存在
+    """
+    return inspect(conn).has_table(table)
+
+
+def get_table_columns(conn: Connection, table: str) -> Set[str]:
+    """获取表的所有字段名。
+
+    Args:
+        conn: 数据库连接
+        table: 表名
+
+    Returns:
+        字段名集合，表不存在时为空集合
+    """
+    if not table_exists(conn, table):
+        return set()
+    return {column["name"] for column in inspect(conn).get_columns(table)}
+
+
+def add_column_if_missing(conn: Connection, table: str, column: str, ddl: str) -> bool:
+    """表存在且缺少字段时添加字段。
+
+    Args:
+        conn: 数据库连接
+        table: 表名
+        column: 字段名
+        ddl: 字段定义（不含字段名），如 ``TEXT`` 或 ``INTEGER DEFAULT 0 NOT NULL``
+
+    Returns:
+        是否添加了字段
+    """
+    if not table_exists(conn, table) or column in get_table_columns(conn, table):
+        return False
+    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+    return True
+
+
+def backfill_in_batches(
+    conn: Connection,
+    table: str,
+    set_clause: str,
+    where_clause: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    params: Optional[Dict[str, Any]] = None,
+) -> int:
+    """分批回填数据，每批单独提交，避免长时间持有写锁。
+
+    where_clause 必须在回填后不再匹配已处理的行（如 ``col IS NULL``），
+    这样中断后重新执行即可从剩余部分继续。
+
+    Args:
+        conn: 数据库连接
+        table: 表名
+        set_clause: SET子句，如 ``project_id = (SELECT ...)``
+        where_clause: 需要回填的行的筛选条件
+        batch_size: 每批行数
+        params: SQL参数
+
+    Returns:
+        回填的总行数
+    """
+    statement = text(
+        f"UPDATE {table} SET {set_clause} "
+        f"WHERE rowid IN (SELECT rowid FROM {table} WHERE {where_clause} LIMIT :batch_size)"
+    )
+    total = 0
+    while True:
+        result = conn.execute(statement, {**(params or {}), "batch_size": batch_size})
+        conn.commit()
+        total += result.rowcount
+        if result.rowcount < batch_size:
+            return total
+
+
+def rebuild_table(conn: Connection, table: Table) -> None:
+    """按模型定义重建表，用于修改 SQLite 无法 ALTER 的约束（如外键）。
+
+    新建临时表、复制新旧表共有字段的数据、删除旧表后改名，再按模型重建索引。
+    旧表上的触发器随旧表删除，需由调用方重新创建。调用前必须关闭外键检查，
+    否则删除旧表会触发子表的级联删除。
+
+    Args:
+        conn: 数据库连接
+        table: 模型中的表定义
+    """
+    temp_name = f"_{table.name}_rebuild"
+    ddl = str(CreateTable(table).compile(dialect=conn.dialect)).replace(
+        f"CREATE TABLE {table.name} ", f"CREATE TABLE {temp_name} ", 1
+    )
+    # 上次中断时可能残留临时表
+    conn.execute(text(f"DROP TABLE IF EXISTS {temp_name}"))
+    conn.execute(text(ddl))
+    columns = ", ".join(
+        column.name for column in table.columns
+        if column.name in get_table_columns(conn, table.name)
+    )
+    conn.execute(text(f"INSERT INTO {temp_name} ({columns}) SELECT {columns} FROM {table.name}"))
+    conn.execute(text(f"DROP TABLE {table.name}"))
+    conn.execute(text(f"ALTER TABLE {temp_name} RENAME TO {table.name}"))
+    for index in table.indexes:
+        index.create(conn)
@@ -0,0 +1,130 @@
+"""迁移执行器。
+
+启动时的流程：
+1. 确保 schema_migrations 表存在并读取已执行版本；
+2. 全新数据库：直接按模型建表，并将所有迁移记为已执行；
+3. 已有数据库：依次执行未记录的迁移，最后补建模型中新增的表；
+4. 所有迁移均已记录时不做任何建表工作。
+"""
+
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from .. import models
+from . import versions
+
+SCHEMA_TABLE = "schema_migrations"
+
+
+def load_migrations() -> List[ModuleType]:
+    """加载 versions 包中的所有迁移脚本。
+
+    Returns:
+        按版本号升序排列的迁移模块列表
+
+    Raises:
+        ValueError: 如果存在重复的版本号
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        if not module_info.name.startswith("v"):
+            continue
+        migrations.append(importlib.import_module(f"{versions.__name__}.{module_info.name}"))
+    migrations.sort(key=lambda module: module.VERSION)
+
+    version_numbers = [module.VERSION for module in migrations]
+    if len(version_numbers) != len(set(version_numbers)):
+        raise ValueError("迁移版本号重复")
+    return migrations
+
+
+def _ensure_schema_table(conn: Connection) -> None:
+    """创建迁移记录表（如不存在）。"""
+    conn.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {SCHEMA_TABLE} ("
+        "version INTEGER PRIMARY KEY, "
+        "name VARCHAR(100) NOT NULL, "
+        "applied_at DATETIME NOT NULL)"
+    ))
+    conn.commit()
+
+
+def _get_applied_versions(conn: Connection) -> List[int]:
+    """读取已执行的迁移版本。"""
+    rows = conn.execute(text(f"SELECT version FROM {SCHEMA_TABLE} ORDER BY version"))
+    return [row[0] for row in rows]
+
+
+def _record_version(conn: Connection, migration: ModuleType) -> None:
+    """记录迁移已执行。"""
+    conn.execute(
+        text(f"INSERT INTO {SCHEMA_TABLE} (version, name, applied_at) VALUES (:version, :name, :applied_at)"),
+        {"version": migration.VERSION, "name": migration.NAME, "applied_at": datetime.now(timezone.utc)},
+    )
+
+
+def _is_fresh_database(conn: Connection) -> bool:
+    """判断数据库中是否还没有任何业务表。"""
+    existing = set(inspect(conn).get_table_names())
+    return not existing.intersection(models.Base.metadata.tables)
+
+
+def run_migrations(bind: Engine, target: Optional[int] = None) -> List[int]:
+    """执行所有未执行的迁移。
+
+    Args:
+        bind: 数据库引擎
+        target: 目标版本号，默认执行到最新版本
+
+    Returns:
+        本次执行的迁移版本号列表（全新数据库建表时为空列表）
+    """
+    migrations = [m for m in load_migrations() if target is None or m.VERSION <= target]
+
+    with bind.connect() as conn:
+        _ensure_schema_table(conn)
+        applied = set(_get_applied_versions(conn))
+        pending = [m for m in migrations if m.VERSION not in applied]
+        if not pending:
+            return []
+
+        if not applied and _is_fresh_database(conn):
+            # 全新数据库：模型即最新结构，直接建表并记录基线
+            models.Base.metadata.create_all(bind=conn)
+            for migration in pending:
+                _record_version(conn, migration)
+            conn.commit()
+            return []
+
+        executed = []
+        for migration in pending:
+            migration.upgrade(conn)
+            _record_version(conn, migration)
+            conn.commit()
+            executed.append(migration.VERSION)
+
+        # 补建模型中新增、但尚无迁移负责创建的表
+        models.Base.metadata.create_all(bind=conn)
+        conn.commit()
+        return executed
+
+
+def get_migration_status(bind: Engine) -> List[Tuple[int, str, bool]]:
+    """获取所有迁移的执行状态。
+
+    Args:
+        bind: 数据库引擎
+
+    Returns:
+        (版本号, 名称, 是否已执行) 列表
+    """
+    with bind.connect() as conn:
+        _ensure_schema_table(conn)
+        applied = set(_get_applied_versions(conn))
+    return [(m.VERSION, m.NAME, m.VERSION in applied) for m in load_migrations()]
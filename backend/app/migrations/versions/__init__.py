@@ -0,0 +1 @@
+"""迁移脚本包。"""
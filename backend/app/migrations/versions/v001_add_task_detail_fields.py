@@ -0,0 +1,29 @@
+"""迁移 001：为任务表添加详情字段。
+
+为tasks表添加以下字段：
+- description: 任务描述
+- due_date: 截止日期
+- priority: 优先级
+- assignee_id: 负责人ID
+"""
+
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing
+
+VERSION = 1
+NAME = "add_task_detail_fields"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    add_column_if_missing(conn, "tasks", "description", "TEXT")
+    add_column_if_missing(conn, "tasks", "due_date", "DATETIME")
+    add_column_if_missing(conn, "tasks", "priority", "VARCHAR(10) DEFAULT 'medium' NOT NULL")
+    add_column_if_missing(
+        conn, "tasks", "assignee_id", "INTEGER REFERENCES users(id) ON DELETE SET NULL"
+    )
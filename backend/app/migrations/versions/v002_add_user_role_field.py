@@ -0,0 +1,30 @@
+"""迁移 002：为用户表添加角色字段。
+
+为users表添加以下字段：
+- role: 用户角色（owner/admin/user）
+
+并将最早注册的用户设置为所有者。
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing
+
+VERSION = 2
+NAME = "add_user_role_field"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not add_column_if_missing(conn, "users", "role", "VARCHAR(20) DEFAULT 'user' NOT NULL"):
+        return
+
+    # 将第一个用户设置为所有者
+    conn.execute(text(
+        "UPDATE users SET role = 'owner' WHERE id = (SELECT id FROM users ORDER BY id LIMIT 1)"
+    ))
@@ -0,0 +1,39 @@
+"""迁移 003：为高频查询添加索引。
+
+- tasks(column_id, position)：列内任务查询与位置平移
+- tasks(assignee_id)、tasks(due_date)：看板筛选
+- columns(project_id, position)：项目内列查询
+- projects(created_at)、projects(owner_id, created_at)：项目列表与分页
+- comments(task_id, created_at)：任务评论时间线，取代单列 task_id 索引
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..ops import table_exists
+
+VERSION = 3
+NAME = "add_hot_path_indexes"
+
+INDEXES = [
+    ("ix_tasks_column_id_position", "tasks", "column_id, position"),
+    ("ix_tasks_assignee_id", "tasks", "assignee_id"),
+    ("ix_tasks_due_date", "tasks", "due_date"),
+    ("ix_columns_project_id_position", "columns", "project_id, position"),
+    ("ix_projects_created_at", "projects", "created_at"),
+    ("ix_projects_owner_id_created_at", "projects", "owner_id, created_at"),
+    ("ix_comments_task_id_created_at", "comments", "task_id, created_at"),
+]
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    for name, table, columns in INDEXES:
+        if table_exists(conn, table):
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+    # 复合索引已覆盖按 task_id 的查询
+    conn.execute(text("DROP INDEX IF EXISTS ix_comments_task_id"))
@@ -0,0 +1,30 @@
+"""迁移 004：为任务添加排序键字段。
+
+- tasks.rank：rank 排序模式使用的排序键，旧数据保持为空，
+  首次在 rank 模式下写入该列时按现有顺序重新分配
+- tasks(column_id, position, rank)：取代 tasks(column_id, position) 索引
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing, table_exists
+
+VERSION = 4
+NAME = "add_task_rank"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not table_exists(conn, "tasks"):
+        return
+    add_column_if_missing(conn, "tasks", "rank", "VARCHAR(64)")
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_tasks_column_id_position_rank "
+        "ON tasks (column_id, position, rank)"
+    ))
+    conn.execute(text("DROP INDEX IF EXISTS ix_tasks_column_id_position"))
@@ -0,0 +1,33 @@
+"""迁移 005：添加任务全文检索。
+
+- task_search、comment_search：FTS5 虚拟表，分别收录任务标题与描述、每条评论
+- tasks、comments 上的同步触发器
+- 按现有数据填充检索表
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...models.search import COMMENT_SEARCH_DDL, TASK_SEARCH_DDL, rebuild_task_search
+from ..ops import table_exists
+
+VERSION = 5
+NAME = "add_task_search"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    表尚不存在时跳过，由随后的建表流程一并创建检索表与触发器。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not table_exists(conn, "tasks"):
+        return
+    for statement in TASK_SEARCH_DDL:
+        conn.execute(text(statement))
+    if table_exists(conn, "comments"):
+        for statement in COMMENT_SEARCH_DDL:
+            conn.execute(text(statement))
+    rebuild_task_search(conn)
@@ -0,0 +1,22 @@
+"""迁移 006：为项目添加看板每列任务数配置。
+
+- projects.board_task_limit：看板每列显示的任务数，旧数据保持为空（显示全部）
+"""
+
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing, table_exists
+
+VERSION = 6
+NAME = "add_project_board_task_limit"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not table_exists(conn, "projects"):
+        return
+    add_column_if_missing(conn, "projects", "board_task_limit", "INTEGER")
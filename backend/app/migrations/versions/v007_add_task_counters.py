@@ -0,0 +1,26 @@
+"""迁移 007：添加任务数、列数计数器。
+
+- columns.task_count：列内任务数
+- projects.task_count、projects.column_count：项目的任务数与列数
+新增字段默认为0，随后按实际数量分批回填。
+"""
+
+from sqlalchemy.engine import Connection
+
+from ...models.counters import repair_counters
+from ..ops import add_column_if_missing
+
+VERSION = 7
+NAME = "add_task_counters"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    add_column_if_missing(conn, "columns", "task_count", "INTEGER NOT NULL DEFAULT 0")
+    add_column_if_missing(conn, "projects", "task_count", "INTEGER NOT NULL DEFAULT 0")
+    add_column_if_missing(conn, "projects", "column_count", "INTEGER NOT NULL DEFAULT 0")
+    repair_counters(conn)
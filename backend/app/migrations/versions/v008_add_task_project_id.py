@@ -0,0 +1,34 @@
+"""迁移 008：为任务添加冗余的项目ID。
+
+- tasks.project_id：取自任务所在列，按批回填
+- tasks(project_id)：项目范围的任务查询与权限检查使用的索引
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing, backfill_in_batches, table_exists
+
+VERSION = 8
+NAME = "add_task_project_id"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not table_exists(conn, "tasks"):
+        return
+    add_column_if_missing(conn, "tasks", "project_id", "INTEGER REFERENCES projects (id)")
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_project_id ON tasks (project_id)"))
+    if not table_exists(conn, "columns"):
+        return
+    # 所在列已不存在的任务无法确定项目，跳过以免重复匹配
+    backfill_in_batches(
+        conn,
+        "tasks",
+        "project_id = (SELECT columns.project_id FROM columns WHERE columns.id = tasks.column_id)",
+        "project_id IS NULL AND column_id IN (SELECT id FROM columns)",
+    )
@@ -0,0 +1,31 @@
+"""迁移 009：添加任务归档。
+
+- tasks.column_entered_at：任务进入当前列的时间，以更新时间回填
+- tasks_archive：归档任务，按 (project_id, archived_at) 建索引
+- comments_archive：归档任务的评论
+"""
+
+from sqlalchemy.engine import Connection
+
+from ...models.archive import ArchivedComment, ArchivedTask
+from ..ops import add_column_if_missing, backfill_in_batches, get_table_columns, table_exists
+
+VERSION = 9
+NAME = "add_task_archive"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    ArchivedTask.__table__.create(conn, checkfirst=True)
+    ArchivedComment.__table__.create(conn, checkfirst=True)
+    if not table_exists(conn, "tasks"):
+        return
+    add_column_if_missing(conn, "tasks", "column_entered_at", "DATETIME")
+    # 旧库的任务表可能缺少时间字段，只取存在的字段
+    sources = [name for name in ("updated_at", "created_at") if name in get_table_columns(conn, "tasks")]
+    value = f"coalesce({', '.join(sources)}, CURRENT_TIMESTAMP)" if sources else "CURRENT_TIMESTAMP"
+    backfill_in_batches(conn, "tasks", f"column_entered_at = {value}", "column_entered_at IS NULL")
@@ -0,0 +1,26 @@
+"""迁移 010：为项目与列添加软删除时间。
+
+- projects.deleted_at、columns.deleted_at：非空表示已删除、等待后台清理
+- 对应索引：后台清理按删除时间查找过期的行
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing, table_exists
+
+VERSION = 10
+NAME = "add_soft_delete"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    for table in ("projects", "columns"):
+        if not table_exists(conn, table):
+            continue
+        add_column_if_missing(conn, table, "deleted_at", "DATETIME")
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_deleted_at ON {table} (deleted_at)"))
@@ -0,0 +1,81 @@
+"""迁移 011：在表结构中声明外键级联。
+
+- columns.project_id、tasks.column_id、tasks.project_id：ON DELETE CASCADE
+- tasks.assignee_id：ON DELETE SET NULL（此前已声明，但连接未开启外键检查，从未生效）
+- comments.user_id：ON DELETE SET NULL，删除用户时保留其评论
+- comments(user_id)：删除用户时置空评论作者使用的索引
+
+SQLite 无法修改已有表的外键，按模型重建 columns、tasks、comments 三张表。
+此前外键未生效，可能残留引用已删除数据的行：重建前先清除这些不可见的孤立行，
+并将指向已删除用户的负责人与评论作者置空。
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...models.column import KanbanColumn
+from ...models.comment import Comment
+from ...models.search import COMMENT_SEARCH_DDL, TASK_SEARCH_DDL, TASK_SEARCH_TABLE
+from ...models.task import Task
+from ..ops import rebuild_table, table_exists
+
+VERSION = 11
+NAME = "add_foreign_key_cascades"
+
+# (子表, 外键字段, 父表)：父行已不存在的子行需清除
+_ORPHANS = [
+    ("columns", "project_id", "projects"),
+    ("tasks", "column_id", "columns"),
+    ("comments", "task_id", "tasks"),
+]
+
+# (表, 外键字段)：指向已删除用户时置空
+_DELETED_USERS = [
+    ("tasks", "assignee_id"),
+    ("comments", "user_id"),
+]
+
+
+def _remove_orphans(conn: Connection) -> None:
+    """清除引用已删除数据的行（父表不存在时无法判断，跳过）。"""
+    if table_exists(conn, "tasks"):
+        # 迁移 008 无法确定项目的任务（所在列早已删除）
+        conn.execute(text("DELETE FROM tasks WHERE project_id IS NULL"))
+    for child, column, parent in _ORPHANS:
+        if table_exists(conn, child) and table_exists(conn, parent):
+            conn.execute(text(
+                f"DELETE FROM {child} WHERE {column} NOT IN (SELECT id FROM {parent})"
+            ))
+    for table, column in _DELETED_USERS:
+        if table_exists(conn, table) and table_exists(conn, "users"):
+            conn.execute(text(
+                f"UPDATE {table} SET {column} = NULL "
+                f"WHERE {column} IS NOT NULL AND {column} NOT IN (SELECT id FROM users)"
+            ))
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    # 外键检查只能在事务外切换；关闭后删除旧表才不会级联删除子表数据
+    conn.commit()
+    conn.execute(text("PRAGMA foreign_keys=OFF"))
+    try:
+        _remove_orphans(conn)
+        for table in (KanbanColumn.__table__, Task.__table__, Comment.__table__):
+            if table_exists(conn, table.name):
+                rebuild_table(conn, table)
+
+        # 全文检索的同步触发器随旧表删除，按原定义重建
+        if table_exists(conn, TASK_SEARCH_TABLE):
+            statements = TASK_SEARCH_DDL[1:] if table_exists(conn, "tasks") else []
+            if table_exists(conn, "comments"):
+                statements += COMMENT_SEARCH_DDL
+            for statement in statements:
+                conn.execute(text(statement))
+        conn.commit()
+    finally:
+        conn.execute(text("PRAGMA foreign_keys=ON"))
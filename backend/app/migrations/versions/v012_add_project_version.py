@@ -0,0 +1,22 @@
+"""迁移 012：添加项目版本号。
+
+- projects.version：看板内容的变更版本，每次修改项目、列、任务时递增，
+  看板接口据此生成 ETag。已有项目从0开始。
+"""
+
+from sqlalchemy.engine import Connection
+
+from ..ops import add_column_if_missing, table_exists
+
+VERSION = 12
+NAME = "add_project_version"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if table_exists(conn, "projects"):
+        add_column_if_missing(conn, "projects", "version", "INTEGER NOT NULL DEFAULT 0")
@@ -0,0 +1,21 @@
+"""迁移 013：添加看板变更记录。
+
+- project_changes：项目、列、任务的变更记录，按 (project_id, version) 建索引，
+  按 created_at 清理过期记录。已有数据没有变更记录，客户端首次增量同步时会重新获取完整看板。
+"""
+
+from sqlalchemy.engine import Connection
+
+from ...models.change import ProjectChange
+
+VERSION = 13
+NAME = "add_project_changes"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    ProjectChange.__table__.create(conn, checkfirst=True)
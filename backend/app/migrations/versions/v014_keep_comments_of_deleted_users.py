@@ -0,0 +1,68 @@
+"""迁移 014：删除用户时保留其评论。
+
+- comments.user_id：可为空，ON DELETE SET NULL（此前为 CASCADE，删除用户会删除其全部评论）
+- comments_archive.user_id：可为空，作者已删除的归档评论与看板上的评论一致
+
+已执行过迁移 011 的数据库需按模型重建 comments、comments_archive 两张表；
+结构已是最新（如由迁移 011 按新模型重建）时跳过。
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...models.archive import ArchivedComment
+from ...models.comment import Comment
+from ...models.search import COMMENT_SEARCH_DDL, TASK_SEARCH_TABLE
+from ..ops import rebuild_table, table_exists
+
+VERSION = 14
+NAME = "keep_comments_of_deleted_users"
+
+
+def _user_id_nullable(conn: Connection, table: str) -> bool:
+    """检查表的 user_id 字段是否可为空。"""
+    return any(
+        row[1] == "user_id" and not row[3]
+        for row in conn.execute(text(f"PRAGMA table_info({table})"))
+    )
+
+
+def _user_id_set_null(conn: Connection) -> bool:
+    """检查 comments.user_id 外键是否为 ON DELETE SET NULL。"""
+    return any(
+        row[3] == "user_id" and row[6] == "SET NULL"
+        for row in conn.execute(text("PRAGMA foreign_key_list(comments)"))
+    )
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    rebuild_comments = (
+        table_exists(conn, "comments")
+        and not (_user_id_nullable(conn, "comments") and _user_id_set_null(conn))
+    )
+    rebuild_archive = (
+        table_exists(conn, "comments_archive") and not _user_id_nullable(conn, "comments_archive")
+    )
+    if not (rebuild_comments or rebuild_archive):
+        return
+
+    # 外键检查只能在事务外切换；关闭后删除旧表才不会级联删除子表数据
+    conn.commit()
+    conn.execute(text("PRAGMA foreign_keys=OFF"))
+    try:
+        if rebuild_comments:
+            rebuild_table(conn, Comment.__table__)
+            # 全文检索的同步触发器随旧表删除，按原定义重建
+            if table_exists(conn, TASK_SEARCH_TABLE):
+                for statement in COMMENT_SEARCH_DDL:
+                    conn.execute(text(statement))
+        if rebuild_archive:
+            rebuild_table(conn, ArchivedComment.__table__)
+        conn.commit()
+    finally:
+        conn.execute(text("PRAGMA foreign_keys=ON"))
@@ -0,0 +1,51 @@
+"""迁移 015：评论单独收录到全文检索表。
+
+- task_search：去掉合并全部评论的 comments 字段，只收录任务标题与描述
+- comment_search：FTS5 虚拟表，每条评论一行（rowid 即评论ID），携带所属任务ID
+- 重建 tasks、comments 上的同步触发器并按现有数据填充检索表
+
+此前评论的增删改都要重新拼接整个任务的评论，耗时随评论数线性增长；
+检索表已是最新结构（如由迁移 005 按新定义创建）时跳过。
+"""
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from ...models.search import (
+    COMMENT_SEARCH_DDL,
+    COMMENT_SEARCH_TABLE,
+    SEARCH_TRIGGERS,
+    TASK_SEARCH_DDL,
+    TASK_SEARCH_TABLE,
+    rebuild_task_search,
+)
+from ..ops import get_table_columns, table_exists
+
+VERSION = 15
+NAME = "split_comment_search"
+
+
+def upgrade(conn: Connection) -> None:
+    """执行迁移。
+
+    Args:
+        conn: 数据库连接
+    """
+    if not table_exists(conn, TASK_SEARCH_TABLE):
+        return
+    has_comments = table_exists(conn, "comments")
+    if "comments" not in get_table_columns(conn, TASK_SEARCH_TABLE) and (
+        not has_comments or table_exists(conn, COMMENT_SEARCH_TABLE)
+    ):
+        return
+
+    for trigger in SEARCH_TRIGGERS:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {TASK_SEARCH_TABLE}"))
+    conn.execute(text(f"DROP TABLE IF EXISTS {COMMENT_SEARCH_TABLE}"))
+    for statement in TASK_SEARCH_DDL:
+        conn.execute(text(statement))
+    if has_comments:
+        for statement in COMMENT_SEARCH_DDL:
+            conn.execute(text(statement))
+    rebuild_task_search(conn)
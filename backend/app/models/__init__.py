@@ -1,10 +1,30 @@
 """数据模型模块。"""
 
-from app.models.database import Base, get_db, init_db
+from app.models.database import Base, get_db, get_read_db, get_write_db, init_db
 from app.models.user import User
 from app.models.project import Project
 from app.models.column import KanbanColumn
 from app.models.task import Task
 from app.models.comment import Comment
+from app.models.archive import ArchivedComment, ArchivedTask
+from app.models.change import ProjectChange
+from app.models.search import COMMENT_SEARCH_TABLE, TASK_SEARCH_TABLE, rebuild_task_search
 
-__all__ = ["Base", "get_db", "init_db", "User", "Project", "KanbanColumn", "Task", "Comment"]
+__all__ = [
+    "Base",
+    "get_db",
+    "get_read_db",
+    "get_write_db",
+    "init_db",
+    "User",
+    "Project",
+    "KanbanColumn",
+    "Task",
+    "Comment",
+    "ArchivedTask",
+    "ArchivedComment",
+    "ProjectChange",
+    "TASK_SEARCH_TABLE",
+    "COMMENT_SEARCH_TABLE",
+    "rebuild_task_search",
+]
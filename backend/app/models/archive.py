@@ -0,0 +1,54 @@
+"""归档任务模型定义。
+
+已完成的任务按归档策略从 tasks 移入 tasks_archive，其评论一并移入 comments_archive，
+使热表只保留看板上仍在使用的任务。归档表不参与看板查询与全文检索。
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+
+from .database import Base, utc_now
+
+
+class ArchivedTask(Base):
+    """归档任务模型。
+
+    task_id 为归档前的任务ID（仅供追溯，任务ID可能被新任务复用），
+    column_id、project_id 为归档时所在的列与项目。
+    """
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        # 按项目浏览归档任务（最近归档在前）
+        Index("ix_tasks_archive_project_id_archived_at", "project_id", "archived_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    task_id = Column(Integer, nullable=False)
+    title = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    due_date = Column(DateTime, nullable=True)
+    priority = Column(String(10), nullable=False, default="medium")
+    assignee_id = Column(Integer, nullable=True)
+    column_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False, default=utc_now)
+
+
+class ArchivedComment(Base):
+    """归档评论模型。"""
+
+    __tablename__ = "comments_archive"
+    __table_args__ = (
+        Index("ix_comments_archive_archived_task_id", "archived_task_id", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    archived_task_id = Column(
+        Integer, ForeignKey("tasks_archive.id", ondelete="CASCADE"), nullable=False
+    )
+    # 作者已删除时为空
+    user_id = Column(Integer, nullable=True)
+    content = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=True)
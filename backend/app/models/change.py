@@ -0,0 +1,35 @@
+"""看板变更记录模型定义。
+
+项目、列、任务的每次修改在同一事务中写入一条变更记录（修改后的项目版本号与
+变更的对象），客户端据此只拉取自某一版本以来变化的对象。变更记录只保留
+CHANGE_LOG_RETENTION_HOURS 小时，更早的版本需重新获取完整看板。
+"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from .database import Base, utc_now
+
+# 变更对象类型
+CHANGE_ENTITY_PROJECT = "project"
+CHANGE_ENTITY_COLUMN = "column"
+CHANGE_ENTITY_TASK = "task"
+
+
+class ProjectChange(Base):
+    """看板变更记录模型。
+
+    只记录对象类型与ID，不区分新增、修改与删除：读取时对象仍可见即为更新，否则为删除。
+    """
+
+    __tablename__ = "project_changes"
+    __table_args__ = (
+        Index("ix_project_changes_project_id_version", "project_id", "version"),
+        Index("ix_project_changes_created_at", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    version = Column(Integer, nullable=False)  # 修改后的项目版本号
+    entity = Column(String(10), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=utc_now)
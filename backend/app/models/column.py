@@ -1,6 +1,6 @@
 """看板列模型定义。"""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from .database import Base, utc_now
@@ -10,13 +10,20 @@ class KanbanColumn(Base):
     """看板列模型。"""
 
     __tablename__ = "columns"
+    __table_args__ = (
+        Index("ix_columns_project_id_position", "project_id", "position"),
+        Index("ix_columns_deleted_at", "deleted_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     position = Column(Integer, nullable=False, default=0)
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")  # 列内任务数（计数器）
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    # 软删除时间，非空时列及其任务对外不可见，保留期后由后台清理
+    deleted_at = Column(DateTime, nullable=True)
 
     # 关系
     project = relationship("Project", back_populates="columns")
@@ -24,5 +31,7 @@ class KanbanColumn(Base):
         "Task",
         back_populates="column",
         cascade="all, delete-orphan",
-        order_by="Task.position",
+        # 任务由数据库级联删除，删除列时无需逐个加载
+        passive_deletes=True,
+        order_by="[Task.position, Task.rank]",
     )
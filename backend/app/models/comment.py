@@ -1,6 +1,6 @@
 """评论模型定义。"""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 
 from .database import Base, utc_now
@@ -10,10 +10,17 @@ class Comment(Base):
     """任务评论模型。"""
 
     __tablename__ = "comments"
+    __table_args__ = (
+        # 按任务取评论并按时间排序（前缀亦覆盖按task_id查询）
+        Index("ix_comments_task_id_created_at", "task_id", "created_at"),
+        # 删除用户时将其评论的作者置空
+        Index("ix_comments_user_id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    task_id = Column(Integer, ForeignKey("tasks.id", ondelete="CASCADE"), nullable=False)
+    # 作者已删除时为空，评论保留
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=utc_now)
 
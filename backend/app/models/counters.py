@@ -0,0 +1,88 @@
+"""计数器一致性检查。
+
+按ID分批重算列与项目的计数器，只改写与实际数量不符的行，每批单独提交，
+避免长时间持有写锁。
+"""
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+
+DEFAULT_BATCH_SIZE = 500
+
+_COLUMN_TASK_COUNT = "(SELECT count(*) FROM tasks WHERE tasks.column_id = columns.id)"
+_PROJECT_TASK_COUNT = (
+    "(SELECT count(*) FROM tasks JOIN columns ON columns.id = tasks.column_id "
+    "WHERE columns.project_id = projects.id{visible})"
+)
+_PROJECT_COLUMN_COUNT = (
+    "(SELECT count(*) FROM columns WHERE columns.project_id = projects.id{visible})"
+)
+# 已软删除的列不计入项目计数器
+_VISIBLE_COLUMNS = " AND columns.deleted_at IS NULL"
+
+
+def _counters(soft_delete: bool) -> Dict[str, List[Tuple[str, str]]]:
+    """表名 -> [(计数器字段, 实际数量子查询)]。
+
+    Args:
+        soft_delete: 列表是否已有 deleted_at 字段（早期迁移执行时尚未添加）
+    """
+    visible = _VISIBLE_COLUMNS if soft_delete else ""
+    return {
+        "columns": [("task_count", _COLUMN_TASK_COUNT)],
+        "projects": [
+            ("task_count", _PROJECT_TASK_COUNT.format(visible=visible)),
+            ("column_count", _PROJECT_COLUMN_COUNT.format(visible=visible)),
+        ],
+    }
+
+
+def _mismatch_clause(table: str, counters: List[Tuple[str, str]]) -> str:
+    """计数器与实际数量不符的条件。"""
+    return " OR ".join(f"{table}.{field} != {actual}" for field, actual in counters)
+
+
+def repair_counters(
+    conn: Connection, batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False
+) -> Dict[str, int]:
+    """重算并修复计数器。
+
+    Args:
+        conn: 数据库连接
+        batch_size: 每批检查的行数
+        dry_run: 为True时只统计不一致的行，不做修改
+
+    Returns:
+        各表计数器不一致的行数，如 ``{"columns": 2, "projects": 1}``
+    """
+    result = {"columns": 0, "projects": 0}
+    # 旧版数据库可能缺少部分表，此时尚无需要统计的数据
+    inspector = inspect(conn)
+    if not all(inspector.has_table(table) for table in ("tasks", "columns", "projects")):
+        return result
+    soft_delete = any(column["name"] == "deleted_at" for column in inspector.get_columns("columns"))
+    for table, counters in _counters(soft_delete).items():
+        set_clause = ", ".join(f"{field} = {actual}" for field, actual in counters)
+        last_id = 0
+        while True:
+            ids = conn.execute(
+                text(f"SELECT id FROM {table} WHERE id > :last_id ORDER BY id LIMIT :batch_size"),
+                {"last_id": last_id, "batch_size": batch_size},
+            ).scalars().all()
+            if not ids:
+                break
+            last_id = ids[-1]
+            params = {"first_id": ids[0], "last_id": last_id}
+            where = f"id BETWEEN :first_id AND :last_id AND ({_mismatch_clause(table, counters)})"
+            if dry_run:
+                result[table] += conn.execute(
+                    text(f"SELECT count(*) FROM {table} WHERE {where}"), params
+                ).scalar()
+            else:
+                result[table] += conn.execute(
+                    text(f"UPDATE {table} SET {set_clause} WHERE {where}"), params
+                ).rowcount
+                conn.commit()
+    return result
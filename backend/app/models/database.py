@@ -2,32 +2,282 @@
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Tuple, Type
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool, StaticPool
+
+from ..config import settings
 
 # 数据库文件路径
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
-DATA_DIR.mkdir(exist_ok=True)
-DATABASE_URL = f"sqlite:///{DATA_DIR}/kanban.db"
-
-# 创建数据库引擎
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=False,
+
+# SQLite调优配置档（按顺序执行，busy_timeout需最先设置以便后续PRAGMA等待锁）
+# - default: WAL + NORMAL同步，读写互不阻塞，适合轮询负载
+# - safe: WAL + FULL同步，掉电时也不丢失已提交事务
+# - legacy: 不设置任何调优PRAGMA，等同于旧版回滚日志模式（用于基准对比）
+SQLITE_TUNING_PROFILES: Dict[str, Dict[str, Any]] = {
+    "default": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -20000,  # 负数单位为KiB，约20MB
+        "mmap_size": 268435456,  # 256MB
+        "temp_store": "MEMORY",
+    },
+    "safe": {
+        "busy_timeout": 10000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    "legacy": {},
+}
+
+# 与调优配置档无关、每个连接都必须设置的PRAGMA：
+# SQLite默认不检查外键，需逐连接开启，ON DELETE CASCADE / SET NULL 才会生效
+SQLITE_REQUIRED_PRAGMAS: Dict[str, Any] = {
+    "foreign_keys": "ON",
+}
+
+
+def get_database_url() -> str:
+    """获取数据库连接URL。
+
+    Returns:
+        配置中的DATABASE_URL，未配置时为 data/kanban.db
+    """
+    if settings.DATABASE_URL:
+        return settings.DATABASE_URL
+    DATA_DIR.mkdir(exist_ok=True)
+    return f"sqlite:///{DATA_DIR}/kanban.db"
+
+
+def get_tuning_profile(name: Optional[str] = None) -> Dict[str, Any]:
+    """获取SQLite调优配置档。
+
+    Args:
+        name: 配置档名称，默认读取 settings.DB_TUNING_PROFILE
+
+    Returns:
+        PRAGMA名称到取值的映射
+
+    Raises:
+        ValueError: 如果配置档不存在
+    """
+    profile_name = name or settings.DB_TUNING_PROFILE
+    if profile_name not in SQLITE_TUNING_PROFILES:
+        raise ValueError(f"未知的数据库调优配置档: {profile_name}")
+    return SQLITE_TUNING_PROFILES[profile_name]
+
+
+def is_sqlite_memory_url(url: str) -> bool:
+    """判断是否为SQLite内存数据库URL。
+
+    Args:
+        url: 数据库连接URL
+
+    Returns:
+        是否为内存数据库
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return False
+    return parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+
+
+def make_read_only_url(url: str) -> Optional[str]:
+    """将SQLite文件库URL转换为只读URI。
+
+    Args:
+        url: 数据库连接URL
+
+    Returns:
+        只读URI形式的URL；非SQLite文件库返回None
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite" or is_sqlite_memory_url(url):
+        return None
+    path = Path(parsed.database).resolve()
+    return f"sqlite:///file:{path}?mode=ro&uri=true"
+
+
+def _set_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """在每个新建连接上执行PRAGMA。
+
+    Args:
+        engine: 数据库引擎
+        pragmas: PRAGMA名称到取值的映射
+    """
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def make_async_url(url: str) -> str:
+    """将SQLite URL转换为aiosqlite异步驱动URL。
+
+    Args:
+        url: 数据库连接URL
+
+    Returns:
+        异步驱动URL；非SQLite数据库原样返回
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return url
+    return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+
+def _prepare_engine_options(
+    url: Optional[str],
+    profile: Optional[str],
+    read_only: bool,
+    pool_class: Type[Pool],
+) -> Tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """计算创建引擎所需的URL、PRAGMA和连接池参数。
+
+    Args:
+        url: 数据库连接URL，默认读取配置
+        profile: 调优配置档名称，默认读取配置
+        read_only: 是否以只读方式打开SQLite文件库
+        pool_class: 文件库使用的连接池类
+
+    Returns:
+        (连接URL, PRAGMA映射, create_engine参数)
+
+    Raises:
+        ValueError: 如果要求只读但URL不是SQLite文件库
+    """
+    url = url or get_database_url()
+    pragmas = {**get_tuning_profile(profile), **SQLITE_REQUIRED_PRAGMAS}
+    if read_only:
+        read_only_url = make_read_only_url(url)
+        if read_only_url is None:
+            raise ValueError("只读引擎仅支持SQLite文件数据库")
+        url = read_only_url
+        # 日志模式由写连接设置，只读连接无权修改
+        pragmas = {name: value for name, value in pragmas.items() if name != "journal_mode"}
+        pragmas["query_only"] = "ON"
+    is_sqlite = make_url(url).get_backend_name() == "sqlite"
+
+    options: Dict[str, Any] = {"echo": False}
+    if is_sqlite:
+        options["connect_args"] = {"check_same_thread": False}
+    if is_sqlite and is_sqlite_memory_url(url):
+        options["poolclass"] = StaticPool
+    else:
+        options.update(
+            poolclass=pool_class,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+    return url, (pragmas if is_sqlite else {}), options
+
+
+def create_db_engine(
+    url: Optional[str] = None,
+    profile: Optional[str] = None,
+    read_only: bool = False,
+    **engine_kwargs: Any,
+) -> Engine:
+    """根据配置创建数据库引擎。
+
+    SQLite文件库使用显式大小的QueuePool并按调优配置档设置PRAGMA（始终开启外键检查）；
+    内存库使用StaticPool以便所有会话共享同一连接。
+
+    Args:
+        url: 数据库连接URL，默认读取配置
+        profile: 调优配置档名称，默认读取配置
+        read_only: 是否以只读方式（mode=ro + query_only）打开SQLite文件库
+        **engine_kwargs: 透传给 create_engine 的额外参数
+
+    Returns:
+        数据库引擎
+
+    Raises:
+        ValueError: 如果要求只读但URL不是SQLite文件库
+    """
+    url, pragmas, options = _prepare_engine_options(url, profile, read_only, QueuePool)
+    options.update(engine_kwargs)
+
+    db_engine = create_engine(url, **options)
+    _set_sqlite_pragmas(db_engine, pragmas)
+    return db_engine
+
+
+def create_async_db_engine(
+    url: Optional[str] = None,
+    profile: Optional[str] = None,
+    read_only: bool = False,
+    **engine_kwargs: Any,
+) -> AsyncEngine:
+    """根据配置创建异步数据库引擎（SQLite使用aiosqlite驱动）。
+
+    Args:
+        url: 数据库连接URL，默认读取配置
+        profile: 调优配置档名称，默认读取配置
+        read_only: 是否以只读方式（mode=ro + query_only）打开SQLite文件库
+        **engine_kwargs: 透传给 create_async_engine 的额外参数
+
+    Returns:
+        异步数据库引擎
+
+    Raises:
+        ValueError: 如果要求只读但URL不是SQLite文件库
+    """
+    url, pragmas, options = _prepare_engine_options(url, profile, read_only, AsyncAdaptedQueuePool)
+    options.update(engine_kwargs)
+
+    db_engine = create_async_engine(make_async_url(url), **options)
+    _set_sqlite_pragmas(db_engine.sync_engine, pragmas)
+    return db_engine
+
+
+DATABASE_URL = get_database_url()
+
+# 写引擎：SQLite同一时刻只允许一个写事务，使用单连接串行化所有写操作
+engine = create_db_engine(DATABASE_URL, pool_size=1, max_overflow=0)
+
+# 读引擎：只读连接池，WAL模式下读操作不会与写操作互相阻塞
+if make_read_only_url(DATABASE_URL) is not None:
+    read_engine = create_db_engine(DATABASE_URL, read_only=True)
+else:
+    read_engine = engine
+
+# 异步只读引擎：供高频轮询的读接口使用，不占用线程池
+async_read_engine = create_async_db_engine(
+    DATABASE_URL, read_only=make_read_only_url(DATABASE_URL) is not None
 )
 
 # 创建会话工厂
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False
+)
 
 # 声明基类
 Base = declarative_base()
 
 
-def get_db() -> Generator[Session, None, None]:
-    """获取数据库会话。
+def get_write_db() -> Generator[Session, None, None]:
+    """获取写数据库会话（单一写连接）。
 
     Yields:
         数据库会话对象
@@ -39,9 +289,50 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """获取只读数据库会话。
+
+    Yields:
+        只读数据库会话对象
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """获取异步只读数据库会话。
+
+    Yields:
+        异步只读数据库会话对象
+    """
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+# 兼容旧代码：默认会话即写会话
+get_db = get_write_db
+
+
 def init_db() -> None:
-    """初始化数据库，创建所有表。"""
-    Base.metadata.create_all(bind=engine)
+    """初始化数据库，执行未执行的迁移。
+
+    全新数据库会按模型建表；结构已是最新时不做任何建表工作。
+    """
+    from ..migrations import run_migrations
+
+    run_migrations(engine)
+
+
+async def dispose_async_engines() -> None:
+    """释放异步引擎的连接池（应用关闭时调用）。
+
+    aiosqlite连接绑定创建它的事件循环，关闭时必须释放，
+    否则下一个事件循环会拿到失效的连接。
+    """
+    await async_read_engine.dispose()
 
 
 def utc_now() -> datetime:
@@ -1,7 +1,7 @@
 """项目模型定义。"""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import backref, relationship
 
 from .database import Base, utc_now
 
@@ -10,19 +10,34 @@ class Project(Base):
     """项目模型。"""
 
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_at", "created_at"),
+        Index("ix_projects_owner_id_created_at", "owner_id", "created_at"),
+        Index("ix_projects_deleted_at", "deleted_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
+    # 仍拥有项目的用户不能删除（外键不级联）
     owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    board_task_limit = Column(Integer, nullable=True)  # 看板每列显示的任务数，为空时显示全部
+    task_count = Column(Integer, nullable=False, default=0, server_default="0")  # 任务数（计数器）
+    column_count = Column(Integer, nullable=False, default=0, server_default="0")  # 列数（计数器）
+    # 看板版本号，项目、列、任务的每次修改都在同一事务中递增
+    version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    # 软删除时间，非空时项目对外不可见，保留期后由后台清理
+    deleted_at = Column(DateTime, nullable=True)
 
     # 关系
-    owner = relationship("User", backref="projects")
+    owner = relationship("User", backref=backref("projects", passive_deletes="all"))
     columns = relationship(
         "KanbanColumn",
         back_populates="project",
         cascade="all, delete-orphan",
+        # 列由数据库级联删除，删除项目时无需逐个加载
+        passive_deletes=True,
         order_by="KanbanColumn.position",
     )
@@ -0,0 +1,100 @@
+"""任务全文检索表定义。
+
+task_search 是 FTS5 虚拟表，rowid 即任务ID，收录任务标题与描述；
+comment_search 是 FTS5 虚拟表，rowid 即评论ID，每条评论一行并携带所属任务ID。
+评论单独成行，增删改一条评论只改写检索表中的一行，与任务已有的评论数无关。
+使用 trigram 分词以支持中文子串匹配（检索词至少3个字符）。
+表中数据由 tasks、comments 上的触发器同步，批量SQL操作同样生效。
+"""
+
+from typing import List
+
+from sqlalchemy import DDL, event, inspect, text
+from sqlalchemy.engine import Connection
+
+from .comment import Comment
+from .task import Task
+
+TASK_SEARCH_TABLE = "task_search"
+COMMENT_SEARCH_TABLE = "comment_search"
+
+TASK_SEARCH_DDL: List[str] = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASK_SEARCH_TABLE} "
+    "USING fts5(title, description, tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_search_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO {TASK_SEARCH_TABLE} (rowid, title, description)
+        VALUES (new.id, new.title, coalesce(new.description, ''));
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_search_update
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        UPDATE {TASK_SEARCH_TABLE}
+        SET title = new.title, description = coalesce(new.description, '')
+        WHERE rowid = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS tasks_search_delete AFTER DELETE ON tasks BEGIN
+        DELETE FROM {TASK_SEARCH_TABLE} WHERE rowid = old.id;
+    END""",
+]
+
+COMMENT_SEARCH_DDL: List[str] = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {COMMENT_SEARCH_TABLE} "
+    "USING fts5(content, task_id UNINDEXED, tokenize='trigram')",
+    f"""CREATE TRIGGER IF NOT EXISTS comments_search_insert AFTER INSERT ON comments BEGIN
+        INSERT INTO {COMMENT_SEARCH_TABLE} (rowid, content, task_id)
+        VALUES (new.id, new.content, new.task_id);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS comments_search_update
+    AFTER UPDATE OF content, task_id ON comments BEGIN
+        UPDATE {COMMENT_SEARCH_TABLE} SET content = new.content, task_id = new.task_id
+        WHERE rowid = new.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS comments_search_delete AFTER DELETE ON comments BEGIN
+        DELETE FROM {COMMENT_SEARCH_TABLE} WHERE rowid = old.id;
+    END""",
+]
+
+# 检索表的同步触发器名（重建检索表时需先删除旧定义）
+SEARCH_TRIGGERS = (
+    "tasks_search_insert",
+    "tasks_search_update",
+    "tasks_search_delete",
+    "comments_search_insert",
+    "comments_search_update",
+    "comments_search_delete",
+)
+
+
+def rebuild_task_search(conn: Connection) -> int:
+    """根据 tasks、comments 表重建全文检索数据。
+
+    Args:
+        conn: 数据库连接
+
+    Returns:
+        收录的任务数量
+    """
+    conn.execute(text(f"DELETE FROM {TASK_SEARCH_TABLE}"))
+    result = conn.execute(text(
+        f"INSERT INTO {TASK_SEARCH_TABLE} (rowid, title, description) "
+        "SELECT id, title, coalesce(description, '') FROM tasks"
+    ))
+    tables = [TASK_SEARCH_TABLE]
+    # 旧版数据库可能尚无评论表
+    if inspect(conn).has_table("comments"):
+        conn.execute(text(f"DELETE FROM {COMMENT_SEARCH_TABLE}"))
+        conn.execute(text(
+            f"INSERT INTO {COMMENT_SEARCH_TABLE} (rowid, content, task_id) "
+            "SELECT id, content, task_id FROM comments"
+        ))
+        tables.append(COMMENT_SEARCH_TABLE)
+    # 合并索引段，提升重建后的查询性能
+    for search_table in tables:
+        conn.execute(text(f"INSERT INTO {search_table} ({search_table}) VALUES ('optimize')"))
+    return result.rowcount
+
+
+# 随 create_all 建表时一并创建检索表与触发器
+for _statement in TASK_SEARCH_DDL:
+    event.listen(Task.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+for _statement in COMMENT_SEARCH_DDL:
+    event.listen(Comment.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
@@ -1,6 +1,6 @@
 """任务模型定义。"""
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from .database import Base, utc_now
@@ -10,6 +10,14 @@ class Task(Base):
     """任务卡片模型。"""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # 列内按顺序取任务、移动/删除时的位置平移（前缀亦覆盖按column_id查询）
+        Index("ix_tasks_column_id_position_rank", "column_id", "position", "rank"),
+        # 项目范围的任务查询与权限检查，无需经由列关联
+        Index("ix_tasks_project_id", "project_id"),
+        Index("ix_tasks_assignee_id", "assignee_id"),
+        Index("ix_tasks_due_date", "due_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
@@ -17,12 +25,21 @@ class Task(Base):
     due_date = Column(DateTime, nullable=True)
     priority = Column(String(10), nullable=False, default="medium")
     assignee_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    column_id = Column(Integer, ForeignKey("columns.id"), nullable=False)
+    column_id = Column(Integer, ForeignKey("columns.id", ondelete="CASCADE"), nullable=False)
+    # 所属项目（冗余自列，随创建、移动任务维护）
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     position = Column(Integer, nullable=False, default=0)
+    # 排序键（rank 排序模式下使用，position 固定为0）
+    rank = Column(String(64), nullable=True)
+    # 进入当前列的时间（跨列移动时更新，归档策略据此判断在最后一列停留的时长）
+    column_entered_at = Column(DateTime, default=utc_now)
     created_at = Column(DateTime, default=utc_now)
     updated_at = Column(DateTime, default=utc_now, onupdate=utc_now)
 
     # 关系
     column = relationship("KanbanColumn", back_populates="tasks")
     assignee = relationship("User", foreign_keys=[assignee_id], lazy="joined")
-    comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan")
+    # 评论由数据库级联删除，删除任务时无需逐个加载
+    comments = relationship(
+        "Comment", back_populates="task", cascade="all, delete-orphan", passive_deletes=True
+    )
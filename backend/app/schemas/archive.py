@@ -0,0 +1,49 @@
+"""归档任务相关的Pydantic模型。"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ArchivedTaskResponse(BaseModel):
+    """归档任务响应模型。"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    task_id: int = Field(..., description="归档前的任务ID")
+    title: str
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    priority: str
+    assignee_id: Optional[int] = None
+    column_id: int = Field(..., description="归档时所在的列")
+    project_id: int
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    archived_at: datetime
+
+
+class ArchivedCommentResponse(BaseModel):
+    """归档评论响应模型。"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: Optional[int] = Field(None, description="作者ID，作者已删除时为空")
+    content: str
+    created_at: Optional[datetime] = None
+
+
+class ArchivedTaskDetailResponse(ArchivedTaskResponse):
+    """归档任务详情响应模型（含评论）。"""
+
+    comments: List[ArchivedCommentResponse] = []
+
+
+class TaskUnarchive(BaseModel):
+    """恢复归档任务请求模型。"""
+
+    column_id: Optional[int] = Field(None, description="目标列ID，默认恢复到归档时所在的列")
+    position: Optional[int] = Field(None, ge=0, description="目标位置，默认追加到列尾")
@@ -38,6 +38,7 @@ class ColumnResponse(ColumnBase):
     id: int
     project_id: int
     position: int
+    task_count: int = Field(0, description="列内任务数")
     created_at: datetime
     updated_at: datetime
 
@@ -46,6 +47,10 @@ class ColumnWithTasksResponse(ColumnResponse):
     """列响应模型（包含任务）。"""
 
     tasks: List["TaskResponse"] = []
+    task_total: int = Field(0, description="列内（符合筛选条件的）任务总数")
+    next_cursor: Optional[str] = Field(
+        None, description="列内还有未返回的任务时，用于 GET /columns/{id}/tasks 续读的游标"
+    )
 
 
 # 前向引用，需要在文件末尾更新
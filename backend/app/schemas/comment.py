@@ -29,7 +29,7 @@ class CommentResponse(BaseModel):
 
     id: int
     task_id: int
-    user_id: int
+    user_id: Optional[int] = Field(None, description="作者ID，作者已删除时为空")
     content: str
     created_at: datetime
-    user: CommentUserInfo
+    user: Optional[CommentUserInfo] = Field(None, description="作者信息，作者已删除时为空")
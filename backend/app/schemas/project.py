@@ -9,14 +9,17 @@ from pydantic import BaseModel, ConfigDict, Field
 T = TypeVar("T")
 
 
-class PaginatedResponse(BaseModel, Generic[T]):
-    """分页响应模型。"""
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """游标分页响应模型。"""
 
     items: List[T]
-    total: int = Field(..., description="总数量")
-    page: int = Field(..., description="当前页码")
-    page_size: int = Field(..., description="每页数量")
-    total_pages: int = Field(..., description="总页数")
+    next_cursor: Optional[str] = Field(None, description="下一页游标，没有更多数据时为空")
+    has_more: bool = Field(..., description="是否还有下一页")
+    total: Optional[int] = Field(None, description="总数量（缓存的近似值，仅在请求时返回）")
+
+
+# 看板每列显示任务数的上限
+MAX_BOARD_TASK_LIMIT = 500
 
 
 class ProjectBase(BaseModel):
@@ -24,6 +27,9 @@ class ProjectBase(BaseModel):
 
     name: str = Field(..., min_length=1, max_length=100, description="项目名称")
     description: Optional[str] = Field(None, description="项目描述")
+    board_task_limit: Optional[int] = Field(
+        None, ge=1, le=MAX_BOARD_TASK_LIMIT, description="看板每列显示的任务数，为空时显示全部"
+    )
 
 
 class ProjectCreate(ProjectBase):
@@ -37,6 +43,9 @@ class ProjectUpdate(BaseModel):
 
     name: Optional[str] = Field(None, min_length=1, max_length=100, description="项目名称")
     description: Optional[str] = Field(None, description="项目描述")
+    board_task_limit: Optional[int] = Field(
+        None, ge=1, le=MAX_BOARD_TASK_LIMIT, description="看板每列显示的任务数，为空时显示全部"
+    )
 
 
 class ProjectResponse(ProjectBase):
@@ -46,6 +55,9 @@ class ProjectResponse(ProjectBase):
 
     id: int
     owner_id: int
+    task_count: int = Field(0, description="任务数")
+    column_count: int = Field(0, description="列数")
+    version: int = Field(0, description="看板版本号，项目、列、任务、评论的每次修改都会递增")
     created_at: datetime
     updated_at: datetime
 
@@ -56,7 +68,27 @@ class ProjectDetailResponse(ProjectResponse):
     columns: List["ColumnWithTasksResponse"] = []
 
 
+class ProjectChangesResponse(BaseModel):
+    """看板增量同步响应模型。
+
+    列和任务的 position 为其在看板、列内的序号；客户端先移除已删除与已变更的对象，
+    再按 position 从小到大插入变更后的对象。
+    """
+
+    version: int = Field(..., description="当前看板版本号，下次增量同步时作为 since")
+    full_resync: bool = Field(
+        False, description="变更记录已清理或变更过多，需重新获取完整看板（此时其余字段为空）"
+    )
+    project: Optional[ProjectResponse] = Field(None, description="项目信息")
+    columns: List["ColumnResponse"] = Field([], description="新增或修改的列")
+    deleted_column_ids: List[int] = Field([], description="已删除的列ID")
+    tasks: List["TaskResponse"] = Field([], description="新增、修改或移入的任务")
+    deleted_task_ids: List[int] = Field([], description="已删除、归档或移出看板的任务ID")
+
+
 # 前向引用，需要在文件末尾更新
-from app.schemas.column import ColumnWithTasksResponse
+from app.schemas.column import ColumnResponse, ColumnWithTasksResponse
+from app.schemas.task import TaskResponse
 
 ProjectDetailResponse.model_rebuild()
+ProjectChangesResponse.model_rebuild()
@@ -0,0 +1,19 @@
+"""全文检索相关的Pydantic模型。"""
+
+from pydantic import BaseModel, Field
+
+
+class SearchResult(BaseModel):
+    """任务检索结果模型。
+
+    高亮片段为 HTML：文本已做转义，只有检索词以 <mark></mark> 包裹，可直接渲染。
+    """
+
+    task_id: int
+    title: str
+    column_id: int
+    project_id: int
+    project_name: str
+    title_highlight: str = Field(..., description="高亮后的标题")
+    snippet: str = Field(..., description="命中内容摘要（标题、描述或评论）")
+    score: float = Field(..., description="相关度得分（bm25，越小越相关）")
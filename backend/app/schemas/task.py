@@ -2,10 +2,13 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Annotated, List, Literal, Optional, Union
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# 批量操作单次请求的最大操作数
+MAX_BATCH_OPERATIONS = 5000
+
 
 class TaskPriority(str, Enum):
     """任务优先级枚举。"""
@@ -60,7 +63,7 @@ class TaskMove(BaseModel):
 class TaskFilter(BaseModel):
     """任务筛选参数模型。"""
 
-    keyword: Optional[str] = Field(None, description="标题关键词（模糊匹配）")
+    keyword: Optional[str] = Field(None, description="关键词（全文检索标题、描述与评论）")
     assignee_id: Optional[int] = Field(None, description="负责人ID")
     priority: Optional[TaskPriority] = Field(None, description="优先级")
     due_date_start: Optional[datetime] = Field(None, description="截止日期起始")
@@ -82,3 +85,68 @@ class TaskResponse(TaskBase):
     assignee: Optional[AssigneeInfo] = None
     created_at: datetime
     updated_at: datetime
+
+
+class TaskBatchCreate(BaseModel):
+    """批量操作：创建任务。"""
+
+    op: Literal["create"]
+    column_id: int = Field(..., description="列ID")
+    data: TaskCreate
+
+
+class TaskBatchUpdate(BaseModel):
+    """批量操作：更新任务。"""
+
+    op: Literal["update"]
+    task_id: int = Field(..., description="任务ID")
+    data: TaskUpdate
+
+
+class TaskBatchMove(TaskMove):
+    """批量操作：移动任务。"""
+
+    op: Literal["move"]
+    task_id: int = Field(..., description="任务ID")
+
+
+class TaskBatchDelete(BaseModel):
+    """批量操作：删除任务。"""
+
+    op: Literal["delete"]
+    task_id: int = Field(..., description="任务ID")
+
+
+TaskBatchOperation = Annotated[
+    Union[TaskBatchCreate, TaskBatchUpdate, TaskBatchMove, TaskBatchDelete],
+    Field(discriminator="op"),
+]
+
+
+class TaskBatchRequest(BaseModel):
+    """批量任务操作请求模型。"""
+
+    operations: List[TaskBatchOperation] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_OPERATIONS, description="按顺序执行的操作列表"
+    )
+
+
+class TaskBatchResult(BaseModel):
+    """批量操作中单个操作的结果。"""
+
+    index: int = Field(..., description="操作在请求中的序号")
+    op: str = Field(..., description="操作类型")
+    success: bool = Field(..., description="是否成功")
+    status_code: int = Field(..., description="与单个接口一致的状态码")
+    detail: Optional[str] = Field(None, description="失败原因")
+    task_id: Optional[int] = Field(None, description="任务ID（创建成功时为新任务ID）")
+    column_id: Optional[int] = Field(None, description="批量操作完成后任务所在列")
+    position: Optional[int] = Field(None, description="批量操作完成后任务在列中的位置")
+
+
+class TaskBatchResponse(BaseModel):
+    """批量任务操作响应模型。"""
+
+    results: List[TaskBatchResult]
+    succeeded: int = Field(..., description="成功的操作数")
+    failed: int = Field(..., description="失败的操作数")
@@ -2,10 +2,13 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+# 单次批量导入的最大用户数
+MAX_IMPORT_USERS = 5000
+
 
 class UserRoleEnum(str, Enum):
     """用户角色枚举。"""
@@ -97,3 +100,30 @@ class UserSelfUpdate(BaseModel):
     email: Optional[EmailStr] = Field(None, description="邮箱")
     current_password: Optional[str] = Field(None, description="当前密码（修改密码时必填）")
     new_password: Optional[str] = Field(None, min_length=6, max_length=100, description="新密码")
+
+
+class UserImportRequest(BaseModel):
+    """批量导入用户请求模型（JSON）。
+
+    每行按 UserCreate 的字段（username、email、password、display_name）逐行校验，
+    单行不合法只记入错误报告，不影响其他行。
+    """
+
+    users: List[Dict[str, Any]] = Field(
+        ..., min_length=1, max_length=MAX_IMPORT_USERS, description="待导入的用户"
+    )
+
+
+class UserImportRowError(BaseModel):
+    """批量导入中单行的错误。"""
+
+    row: int = Field(..., description="数据行序号（从1开始，CSV不含表头）")
+    username: Optional[str] = Field(None, description="该行的用户名")
+    detail: str = Field(..., description="错误原因")
+
+
+class UserImportResponse(BaseModel):
+    """批量导入用户响应模型。"""
+
+    created: List[UserResponse] = Field(..., description="创建成功的用户")
+    errors: List[UserImportRowError] = Field(..., description="未导入的行及原因")
@@ -0,0 +1,380 @@
+"""任务归档服务模块。
+
+归档策略：进入项目最后一列（通常为"已完成"）超过 ARCHIVE_AFTER_DAYS 天的任务
+按批移入 tasks_archive，评论一并移入 comments_archive，每批单独提交，
+避免长时间占用写锁。归档任务只读，可按项目浏览、检索，并可恢复到看板。
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, exists, func, insert, literal, or_, select, tuple_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+
+from ..config import settings
+from ..models.archive import ArchivedComment, ArchivedTask
+from ..models.change import CHANGE_ENTITY_TASK
+from ..models.column import KanbanColumn
+from ..models.comment import Comment
+from ..models.database import SessionLocal, utc_now
+from ..models.project import Project
+from ..models.task import Task
+from ..models.user import User
+from ..schemas.archive import ArchivedTaskResponse
+from ..schemas.project import CursorPaginatedResponse
+from ..utils.pagination import decode_cursor, decode_datetime, encode_cursor
+from .changes import record_changes
+from .counters import adjust_column_task_count, adjust_project_counts
+from .search import _like_pattern, split_terms
+from .task import TaskService, use_rank_ordering
+
+logger = logging.getLogger(__name__)
+
+# 归档时从 tasks 复制到 tasks_archive 的字段
+_ARCHIVED_FIELDS = (
+    "title",
+    "description",
+    "due_date",
+    "priority",
+    "assignee_id",
+    "column_id",
+    "project_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def archive_cutoff(days: int) -> datetime:
+    """计算归档截止时间：早于该时间进入最后一列的任务可归档。
+
+    Args:
+        days: 天数
+
+    Returns:
+        截止时间
+    """
+    return utc_now() - timedelta(days=days)
+
+
+def _last_columns():
+    """各项目最后一列的ID子查询（仅含两列及以上的项目，避免归档唯一的列）。"""
+    other = aliased(KanbanColumn)
+    last_position = (
+        select(func.max(other.position))
+        .where(other.project_id == KanbanColumn.project_id, other.deleted_at.is_(None))
+        .scalar_subquery()
+    )
+    return (
+        select(KanbanColumn.id)
+        .join(Project, Project.id == KanbanColumn.project_id)
+        .where(
+            Project.column_count > 1,
+            Project.deleted_at.is_(None),
+            KanbanColumn.deleted_at.is_(None),
+            KanbanColumn.position == last_position,
+        )
+    )
+
+
+def _decode_archive_cursor(cursor: str) -> Tuple:
+    """解析归档任务游标。
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        (归档时间, 归档ID)
+
+    Raises:
+        ValueError: 如果游标无效
+    """
+    values = decode_cursor(cursor)
+    archived_id = values.get("id")
+    if not isinstance(archived_id, int):
+        raise ValueError("无效的分页游标")
+    return decode_datetime(values.get("archived_at")), archived_id
+
+
+class ArchiveService:
+    """任务归档服务类。"""
+
+    def __init__(self, db: Session):
+        """初始化任务归档服务。
+
+        Args:
+            db: 数据库会话
+        """
+        self.db = db
+
+    def archive_stale_tasks(
+        self, days: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> int:
+        """按归档策略分批归档任务，每批单独提交。
+
+        Args:
+            days: 在最后一列停留的天数，默认取 ARCHIVE_AFTER_DAYS
+            batch_size: 每批任务数，默认取 ARCHIVE_BATCH_SIZE
+
+        Returns:
+            归档的任务数
+        """
+        days = settings.ARCHIVE_AFTER_DAYS if days is None else days
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        cutoff = archive_cutoff(days)
+        total = 0
+        column_ids: Set[int] = set()
+        while True:
+            task_ids = list(self.db.scalars(
+                select(Task.id)
+                .where(Task.column_id.in_(_last_columns()), Task.column_entered_at < cutoff)
+                .order_by(Task.id)
+                .limit(batch_size)
+            ))
+            if not task_ids:
+                break
+            # 各批之间不补齐位置空缺，否则每批都要改写整列剩余的任务
+            column_ids.update(self.archive_tasks(task_ids, close_gaps=False))
+            total += len(task_ids)
+        self._close_position_gaps(column_ids)
+        return total
+
+    def archive_tasks(self, task_ids: List[int], close_gaps: bool = True) -> Set[int]:
+        """将一批任务及其评论移入归档表并提交。
+
+        Args:
+            task_ids: 任务ID列表
+            close_gaps: position 模式下是否立即补齐各列的位置空缺；
+                分批归档时传 False，由调用方在最后一批之后统一补齐
+
+        Returns:
+            任务移出的列ID
+        """
+        # 按列汇总计数器变化，按项目记录移出看板的任务
+        column_counts: Dict[Tuple[int, int], int] = {}
+        project_tasks: Dict[int, List[int]] = {}
+        for task_id, column_id, project_id in self.db.execute(
+            select(Task.id, Task.column_id, Task.project_id).where(Task.id.in_(task_ids))
+        ):
+            column_counts[column_id, project_id] = column_counts.get((column_id, project_id), 0) + 1
+            project_tasks.setdefault(project_id, []).append(task_id)
+
+        self.db.execute(insert(ArchivedTask).from_select(
+            ["task_id", *_ARCHIVED_FIELDS, "archived_at"],
+            select(
+                Task.id,
+                *(getattr(Task, field) for field in _ARCHIVED_FIELDS),
+                literal(utc_now(), ArchivedTask.archived_at.type),
+            ).where(Task.id.in_(task_ids)),
+        ))
+        # 任务ID可能被复用，评论归入同一任务ID下最新的归档记录
+        archived_id = (
+            select(func.max(ArchivedTask.id))
+            .where(ArchivedTask.task_id == Comment.task_id)
+            .scalar_subquery()
+        )
+        self.db.execute(insert(ArchivedComment).from_select(
+            ["archived_task_id", "user_id", "content", "created_at"],
+            select(archived_id, Comment.user_id, Comment.content, Comment.created_at)
+            .where(Comment.task_id.in_(task_ids)),
+        ))
+        # 评论由外键级联删除
+        self.db.execute(delete(Task).where(Task.id.in_(task_ids)))
+
+        column_ids = {column_id for column_id, _ in column_counts}
+        for (column_id, _), count in column_counts.items():
+            adjust_column_task_count(self.db, column_id, -count)
+        for project_id, archived_ids in project_tasks.items():
+            adjust_project_counts(self.db, project_id, tasks=-len(archived_ids))
+            record_changes(self.db, project_id, CHANGE_ENTITY_TASK, archived_ids)
+        self.db.commit()
+        if close_gaps:
+            self._close_position_gaps(column_ids)
+        return column_ids
+
+    def _close_position_gaps(self, column_ids: Iterable[int]) -> None:
+        """position 模式下补齐各列被移走任务留下的位置空缺并提交。
+
+        Args:
+            column_ids: 列ID
+        """
+        if use_rank_ordering():
+            return
+        task_service = TaskService(self.db)
+        for column_id in column_ids:
+            task_service.close_position_gaps(column_id)
+        self.db.commit()
+
+    def get_archived_page(
+        self,
+        project_id: int,
+        keyword: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> CursorPaginatedResponse[ArchivedTaskResponse]:
+        """按归档时间倒序分页浏览项目的归档任务。
+
+        Args:
+            project_id: 项目ID
+            keyword: 检索词，按空白拆分，每个词需匹配标题、描述或任一评论
+            cursor: 分页游标
+            limit: 每页数量
+
+        Returns:
+            游标分页的归档任务列表
+
+        Raises:
+            ValueError: 如果游标无效
+        """
+        query = select(ArchivedTask).where(ArchivedTask.project_id == project_id)
+        for term in split_terms(keyword or ""):
+            pattern = _like_pattern(term)
+            query = query.where(or_(
+                ArchivedTask.title.ilike(pattern, escape="\\"),
+                ArchivedTask.description.ilike(pattern, escape="\\"),
+                exists().where(
+                    ArchivedComment.archived_task_id == ArchivedTask.id,
+                    ArchivedComment.content.ilike(pattern, escape="\\"),
+                ),
+            ))
+        if cursor:
+            query = query.where(
+                tuple_(ArchivedTask.archived_at, ArchivedTask.id)
+                < tuple_(*_decode_archive_cursor(cursor))
+            )
+        # 多取一行判断是否还有下一页
+        items = list(self.db.scalars(
+            query.order_by(ArchivedTask.archived_at.desc(), ArchivedTask.id.desc()).limit(limit + 1)
+        ))
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor({"archived_at": items[-1].archived_at, "id": items[-1].id})
+        return CursorPaginatedResponse[ArchivedTaskResponse](
+            items=items,
+            next_cursor=next_cursor,
+            has_more=next_cursor is not None,
+        )
+
+    def get_archived_task(self, archived_id: int) -> Optional[ArchivedTask]:
+        """根据ID获取归档任务。
+
+        Args:
+            archived_id: 归档ID
+
+        Returns:
+            归档任务对象，如果不存在或所属项目已删除则返回None
+        """
+        return self.db.scalar(
+            select(ArchivedTask)
+            .join(Project, Project.id == ArchivedTask.project_id)
+            .where(ArchivedTask.id == archived_id, Project.deleted_at.is_(None))
+        )
+
+    def get_archived_comments(self, archived_id: int) -> List[ArchivedComment]:
+        """获取归档任务的评论。
+
+        Args:
+            archived_id: 归档ID
+
+        Returns:
+            评论列表，按时间倒序排列
+        """
+        return list(self.db.scalars(
+            select(ArchivedComment)
+            .where(ArchivedComment.archived_task_id == archived_id)
+            .order_by(ArchivedComment.created_at.desc(), ArchivedComment.id.desc())
+        ))
+
+    def unarchive(
+        self, archived: ArchivedTask, column_id: Optional[int] = None, position: Optional[int] = None
+    ) -> Task:
+        """将归档任务连同评论恢复到看板。
+
+        Args:
+            archived: 归档任务
+            column_id: 目标列ID，默认为归档时所在的列
+            position: 目标位置，默认追加到列尾
+
+        Returns:
+            恢复后的任务对象（任务ID为新分配的ID）
+
+        Raises:
+            ValueError: 如果目标列不存在或不属于归档任务所在项目
+        """
+        column = self.db.get(KanbanColumn, column_id or archived.column_id)
+        if column is None or column.deleted_at is not None:
+            raise ValueError("目标列不存在" if column_id else "原所在列已删除，请指定目标列")
+        if column.project_id != archived.project_id:
+            raise ValueError("目标列必须属于同一项目")
+
+        # 负责人已删除或禁用时不再指派
+        assignee_id = archived.assignee_id
+        if assignee_id is not None and not self.db.scalar(
+            select(User.is_active).where(User.id == assignee_id)
+        ):
+            assignee_id = None
+
+        db_task = Task(
+            title=archived.title,
+            description=archived.description,
+            due_date=archived.due_date,
+            priority=archived.priority,
+            assignee_id=assignee_id,
+            created_at=archived.created_at or utc_now(),
+        )
+        task_service = TaskService(self.db)
+        placed = task_service.place_new_task(
+            db_task, column, column.task_count if position is None else position
+        )
+        self.db.flush()
+        record_changes(self.db, column.project_id, CHANGE_ENTITY_TASK, [db_task.id])
+
+        self.db.execute(insert(Comment).from_select(
+            ["task_id", "user_id", "content", "created_at"],
+            select(
+                literal(db_task.id),
+                # 作者已删除的评论照常恢复，作者置空
+                select(User.id).where(User.id == ArchivedComment.user_id).scalar_subquery(),
+                ArchivedComment.content,
+                ArchivedComment.created_at,
+            ).where(ArchivedComment.archived_task_id == archived.id),
+        ))
+        self.db.execute(
+            delete(ArchivedComment).where(ArchivedComment.archived_task_id == archived.id)
+        )
+        self.db.delete(archived)
+        self.db.commit()
+
+        self.db.refresh(db_task)
+        if use_rank_ordering():
+            set_committed_value(db_task, "position", placed)
+        return db_task
+
+
+def run_archive_job() -> int:
+    """执行一次自动归档（在独立会话中）。
+
+    Returns:
+        归档的任务数
+    """
+    db = SessionLocal()
+    try:
+        return ArchiveService(db).archive_stale_tasks()
+    finally:
+        db.close()
+
+
+async def run_archive_loop() -> None:
+    """后台循环：按 ARCHIVE_INTERVAL_SECONDS 间隔在线程中执行自动归档。"""
+    while True:
+        await asyncio.sleep(settings.ARCHIVE_INTERVAL_SECONDS)
+        try:
+            archived = await asyncio.to_thread(run_archive_job)
+        except Exception:
+            logger.exception("自动归档失败")
+            continue
+        if archived:
+            logger.info("已归档 %d 个任务", archived)
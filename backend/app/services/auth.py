@@ -2,12 +2,20 @@
 
 from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..models.user import User, UserRole
 from ..schemas.user import UserCreate
 from ..utils.security import get_password_hash, verify_password
+from .principal_cache import Principal
+
+
+def _principal_query(user_id: int):
+    """查询用户鉴权信息的语句（字段顺序与 Principal 一致）。"""
+    return select(User.id, User.role, User.is_active).where(User.id == user_id)
 
 
 class AuthService:
@@ -54,6 +62,18 @@ class AuthService:
         """
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_principal(self, user_id: int) -> Optional[Principal]:
+        """根据ID获取用户的鉴权信息（只查询鉴权所需字段）。
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            鉴权信息，如果用户不存在则返回None
+        """
+        row = self.db.execute(_principal_query(user_id)).first()
+        return Principal(*row) if row else None
+
     def create_user(self, user_data: UserCreate) -> User:
         """创建新用户。
 
@@ -99,3 +119,39 @@ class AuthService:
         if not verify_password(password, user.password_hash):
             return None
         return user
+
+
+class AsyncAuthService:
+    """认证服务类（异步只读版本）。"""
+
+    def __init__(self, db: AsyncSession):
+        """初始化异步认证服务。
+
+        Args:
+            db: 异步数据库会话
+        """
+        self.db = db
+
+    async def get_user_by_id(self, user_id: int) -> Optional[User]:
+        """根据ID获取用户。
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            用户对象，如果不存在则返回None
+        """
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalar_one_or_none()
+
+    async def get_principal(self, user_id: int) -> Optional[Principal]:
+        """根据ID获取用户的鉴权信息（只查询鉴权所需字段）。
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            鉴权信息，如果用户不存在则返回None
+        """
+        row = (await self.db.execute(_principal_query(user_id))).first()
+        return Principal(*row) if row else None
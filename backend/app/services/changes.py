@@ -0,0 +1,100 @@
+"""看板变更记录模块。
+
+服务层在递增项目版本号之后，于同一事务中记录变更的项目、列、任务（不提交），
+增量同步接口据此返回自某一版本以来变化的对象。过期记录由后台清理任务分批删除。
+"""
+
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from sqlalchemy import DateTime, delete, insert, literal, select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.change import CHANGE_ENTITY_TASK, ProjectChange
+from ..models.database import utc_now
+from ..models.project import Project
+from ..models.task import Task
+
+
+def record_changes(db: Session, project_id: int, entity: str, entity_ids: Iterable[int]) -> None:
+    """记录项目中对象的变更（不提交），需在递增项目版本号之后调用。
+
+    Args:
+        db: 数据库会话
+        project_id: 项目ID
+        entity: 对象类型（project、column、task）
+        entity_ids: 对象ID
+    """
+    entity_ids = list(entity_ids)
+    if not entity_ids:
+        return
+    # 会话未开启自动写入：先写入尚未提交的修改（如以 ORM 表达式递增的版本号），再读取
+    db.flush()
+    version = db.scalar(select(Project.version).where(Project.id == project_id))
+    if version is None:
+        return
+    now = utc_now()
+    db.execute(insert(ProjectChange), [
+        {
+            "project_id": project_id,
+            "version": version,
+            "entity": entity,
+            "entity_id": entity_id,
+            "created_at": now,
+        }
+        for entity_id in entity_ids
+    ])
+
+
+def record_task_changes(db: Session, *conditions) -> None:
+    """按条件记录任务变更（INSERT ... SELECT，不逐个读取任务；不提交）。
+
+    需在递增任务所在项目的版本号之后调用，会先写入会话中尚未提交的修改。
+
+    Args:
+        db: 数据库会话
+        conditions: 任务筛选条件
+    """
+    db.flush()
+    db.execute(insert(ProjectChange).from_select(
+        ["project_id", "version", "entity", "entity_id", "created_at"],
+        select(
+            Task.project_id,
+            Project.version,
+            literal(CHANGE_ENTITY_TASK),
+            Task.id,
+            literal(utc_now(), DateTime),
+        )
+        .join(Project, Project.id == Task.project_id)
+        .where(*conditions),
+    ))
+
+
+def compact_changes(
+    db: Session, retention_hours: Optional[int] = None, batch_size: Optional[int] = None
+) -> int:
+    """分批删除超过保留时长的变更记录，每批单独提交。
+
+    Args:
+        db: 数据库会话
+        retention_hours: 保留时长（小时），默认取 CHANGE_LOG_RETENTION_HOURS
+        batch_size: 每批删除的记录数，默认取 PURGE_BATCH_SIZE
+
+    Returns:
+        删除的记录数
+    """
+    hours = settings.CHANGE_LOG_RETENTION_HOURS if retention_hours is None else retention_hours
+    cutoff = utc_now() - timedelta(hours=hours)
+    batch = (
+        select(ProjectChange.id)
+        .where(ProjectChange.created_at < cutoff)
+        .limit(batch_size or settings.PURGE_BATCH_SIZE)
+    )
+    total = 0
+    while True:
+        deleted = db.execute(delete(ProjectChange).where(ProjectChange.id.in_(batch))).rowcount
+        db.commit()
+        if not deleted:
+            return total
+        total += deleted
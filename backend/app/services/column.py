@@ -2,10 +2,18 @@
 
 from typing import List, Optional
 
+from sqlalchemy import case, select, update
 from sqlalchemy.orm import Session
 
+from ..models.change import CHANGE_ENTITY_COLUMN
 from ..models.column import KanbanColumn
+from ..models.database import utc_now
+from ..models.project import Project
+from ..models.task import Task
 from ..schemas.column import ColumnCreate, ColumnUpdate
+from .changes import record_changes, record_task_changes
+from .counters import adjust_project_counts, bump_project_version
+from .purge import restore_cutoff
 
 
 class ColumnService:
@@ -19,6 +27,22 @@ class ColumnService:
         """
         self.db = db
 
+    def _visible_columns(self):
+        """未删除且所属项目未删除的列查询。"""
+        return (
+            self.db.query(KanbanColumn)
+            .join(Project, Project.id == KanbanColumn.project_id)
+            .filter(KanbanColumn.deleted_at.is_(None), Project.deleted_at.is_(None))
+        )
+
+    def _visible_siblings(self, project_id: int, position: int):
+        """项目中位于指定位置之后的未删除列查询（用于批量调整位置）。"""
+        return self.db.query(KanbanColumn).filter(
+            KanbanColumn.project_id == project_id,
+            KanbanColumn.position > position,
+            KanbanColumn.deleted_at.is_(None),
+        )
+
     def create_column(self, column_data: ColumnCreate, project_id: int) -> KanbanColumn:
         """创建新列。
 
@@ -29,12 +53,9 @@ class ColumnService:
         Returns:
             创建的列对象
         """
-        # 获取当前项目的最大位置
-        max_position = (
-            self.db.query(KanbanColumn)
-            .filter(KanbanColumn.project_id == project_id)
-            .count()
-        )
+        # 项目列数即新列的位置
+        project = self.db.query(Project).filter(Project.id == project_id).first()
+        max_position = project.column_count if project else 0
 
         db_column = KanbanColumn(
             name=column_data.name,
@@ -42,6 +63,9 @@ class ColumnService:
             position=max_position,
         )
         self.db.add(db_column)
+        adjust_project_counts(self.db, project_id, columns=1)
+        self.db.flush()
+        record_changes(self.db, project_id, CHANGE_ENTITY_COLUMN, [db_column.id])
         self.db.commit()
         self.db.refresh(db_column)
         return db_column
@@ -55,7 +79,20 @@ class ColumnService:
         Returns:
             列对象，如果不存在则返回None
         """
-        return self.db.query(KanbanColumn).filter(KanbanColumn.id == column_id).first()
+        return self._visible_columns().filter(KanbanColumn.id == column_id).first()
+
+    def get_columns_by_ids(self, column_ids: List[int]) -> List[KanbanColumn]:
+        """根据ID列表批量获取列。
+
+        Args:
+            column_ids: 列ID列表
+
+        Returns:
+            存在的列列表（顺序不保证与参数一致）
+        """
+        if not column_ids:
+            return []
+        return self._visible_columns().filter(KanbanColumn.id.in_(column_ids)).all()
 
     def get_columns_by_project(self, project_id: int) -> List[KanbanColumn]:
         """获取项目的所有列。
@@ -67,7 +104,7 @@ class ColumnService:
             列列表
         """
         return (
-            self.db.query(KanbanColumn)
+            self._visible_columns()
             .filter(KanbanColumn.project_id == project_id)
             .order_by(KanbanColumn.position)
             .all()
@@ -93,12 +130,16 @@ class ColumnService:
         for field, value in update_data.items():
             setattr(db_column, field, value)
 
+        bump_project_version(self.db, db_column.project_id)
+        record_changes(self.db, db_column.project_id, CHANGE_ENTITY_COLUMN, [column_id])
         self.db.commit()
         self.db.refresh(db_column)
         return db_column
 
     def delete_column(self, column_id: int) -> bool:
-        """删除列。
+        """删除列（软删除）。
+
+        列及其任务立即对外不可见，保留至恢复期限结束后由后台分批清理。
 
         Args:
             column_id: 列ID
@@ -113,17 +154,68 @@ class ColumnService:
         project_id = db_column.project_id
         position = db_column.position
 
-        self.db.delete(db_column)
+        db_column.deleted_at = utc_now()
+        # 列中的任务随列一并隐藏
+        adjust_project_counts(self.db, project_id, tasks=-db_column.task_count, columns=-1)
+        record_changes(self.db, project_id, CHANGE_ENTITY_COLUMN, [column_id])
 
         # 更新后续列的位置
-        self.db.query(KanbanColumn).filter(
-            KanbanColumn.project_id == project_id,
-            KanbanColumn.position > position,
-        ).update({KanbanColumn.position: KanbanColumn.position - 1})
+        self._visible_siblings(project_id, position).update(
+            {KanbanColumn.position: KanbanColumn.position - 1}
+        )
 
         self.db.commit()
         return True
 
+    def get_deleted_column(self, column_id: int) -> Optional[KanbanColumn]:
+        """获取仍在恢复期限内的已删除列（所属项目需未删除）。
+
+        Args:
+            column_id: 列ID
+
+        Returns:
+            列对象，如果不存在、未删除或已超过恢复期限则返回None
+        """
+        return (
+            self.db.query(KanbanColumn)
+            .join(Project, Project.id == KanbanColumn.project_id)
+            .filter(
+                KanbanColumn.id == column_id,
+                KanbanColumn.deleted_at >= restore_cutoff(),
+                Project.deleted_at.is_(None),
+            )
+            .first()
+        )
+
+    def restore_column(self, db_column: KanbanColumn) -> KanbanColumn:
+        """恢复已删除的列，放回原位置（超出列数时追加到末尾）。
+
+        Args:
+            db_column: 已删除的列对象
+
+        Returns:
+            恢复后的列对象
+        """
+        project_id = db_column.project_id
+        column_count = self.db.scalar(
+            select(Project.column_count).where(Project.id == project_id)
+        )
+        position = min(db_column.position, column_count)
+
+        self._visible_siblings(project_id, position - 1).update(
+            {KanbanColumn.position: KanbanColumn.position + 1}
+        )
+        db_column.position = position
+        db_column.deleted_at = None
+        adjust_project_counts(self.db, project_id, tasks=db_column.task_count, columns=1)
+        # 列中的任务随列一并恢复
+        record_changes(self.db, project_id, CHANGE_ENTITY_COLUMN, [db_column.id])
+        record_task_changes(self.db, Task.column_id == db_column.id)
+
+        self.db.commit()
+        self.db.refresh(db_column)
+        return db_column
+
     def reorder_columns(self, project_id: int, column_ids: List[int]) -> List[KanbanColumn]:
         """重新排序列。
 
@@ -134,11 +226,19 @@ class ColumnService:
         Returns:
             更新后的列列表
         """
-        for position, column_id in enumerate(column_ids):
-            self.db.query(KanbanColumn).filter(
-                KanbanColumn.id == column_id,
+        # 单条 UPDATE ... CASE 写入所有列的新位置
+        positions = {column_id: position for position, column_id in enumerate(column_ids)}
+        self.db.execute(
+            update(KanbanColumn)
+            .where(
+                KanbanColumn.id.in_(positions),
                 KanbanColumn.project_id == project_id,
-            ).update({KanbanColumn.position: position})
+            )
+            .values(position=case(positions, value=KanbanColumn.id))
+            .execution_options(synchronize_session=False)
+        )
+        bump_project_version(self.db, project_id)
+        record_changes(self.db, project_id, CHANGE_ENTITY_COLUMN, list(positions))
 
         self.db.commit()
         return self.get_columns_by_project(project_id)
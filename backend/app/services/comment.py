@@ -1,11 +1,48 @@
 """评论服务模块。"""
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from ..models.comment import Comment
+from ..models.task import Task
 from ..schemas.comment import CommentCreate
+from .changes import record_task_changes
+from .counters import bump_task_project_version
+from ..utils.pagination import decode_cursor, decode_datetime, encode_cursor
+
+
+def comment_cursor(comment: Comment) -> str:
+    """生成指向评论的游标。
+
+    Args:
+        comment: 评论对象
+
+    Returns:
+        游标字符串
+    """
+    return encode_cursor({"created_at": comment.created_at, "id": comment.id})
+
+
+def _decode_comment_cursor(cursor: str) -> Tuple:
+    """解析评论游标。
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        (创建时间, 评论ID)
+
+    Raises:
+        ValueError: 如果游标无效
+    """
+    values = decode_cursor(cursor)
+    comment_id = values.get("id")
+    if not isinstance(comment_id, int):
+        raise ValueError("无效的分页游标")
+    return decode_datetime(values.get("created_at")), comment_id
 
 
 class CommentService:
@@ -36,6 +73,8 @@ class CommentService:
             content=comment_data.content,
         )
         self.db.add(db_comment)
+        bump_task_project_version(self.db, task_id)
+        record_task_changes(self.db, Task.id == task_id)
         self.db.commit()
         self.db.refresh(db_comment)
         return db_comment
@@ -81,5 +120,102 @@ class CommentService:
             return False
 
         self.db.delete(db_comment)
+        bump_task_project_version(self.db, db_comment.task_id)
+        record_task_changes(self.db, Task.id == db_comment.task_id)
         self.db.commit()
         return True
+
+
+class AsyncCommentService:
+    """评论服务类（异步只读版本）。"""
+
+    def __init__(self, db: AsyncSession):
+        """初始化异步评论服务。
+
+        Args:
+            db: 异步数据库会话
+        """
+        self.db = db
+
+    async def get_comments_by_task(self, task_id: int) -> List[Comment]:
+        """获取任务的所有评论。
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            评论列表，按时间倒序排列
+        """
+        result = await self.db.execute(
+            select(Comment)
+            .where(Comment.task_id == task_id)
+            .order_by(Comment.created_at.desc())
+        )
+        return list(result.scalars().all())
+
+    async def get_comments_page(
+        self,
+        task_id: int,
+        limit: int = 50,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+    ) -> Tuple[List[Comment], Optional[str], bool]:
+        """按游标获取任务的一页评论，按时间倒序排列。
+
+        以 (task_id, created_at, id) 在索引上定位：before 取游标之前（更早）的评论，
+        after 取游标之后（更新）的评论中紧随游标的一页，两者都不传时取最新一页。
+
+        Args:
+            task_id: 任务ID
+            limit: 每页数量
+            before: 只返回早于该游标的评论
+            after: 只返回晚于该游标的评论
+
+        Returns:
+            (评论列表, 更早一页的游标, 翻页方向上是否还有评论)。没有更早的评论或使用 after 时
+            游标为None；使用 after 时最后一项表示是否还有更新的评论未返回
+
+        Raises:
+            ValueError: 如果游标无效或同时指定了 before 与 after
+        """
+        if before and after:
+            raise ValueError("before 与 after 不能同时使用")
+
+        key = tuple_(Comment.created_at, Comment.id)
+        query = select(Comment).where(Comment.task_id == task_id)
+        if after:
+            query = query.where(key > tuple_(*_decode_comment_cursor(after)))
+            # 多取一行判断是否还有更新的评论
+            result = await self.db.execute(
+                query.order_by(Comment.created_at, Comment.id).limit(limit + 1)
+            )
+            comments = list(result.scalars().all())
+            has_more = len(comments) > limit
+            # 更早的评论调用方已经拿到，不再返回向前翻页的游标
+            return list(reversed(comments[:limit])), None, has_more
+
+        if before:
+            query = query.where(key < tuple_(*_decode_comment_cursor(before)))
+        # 多取一行判断是否还有更早的评论
+        result = await self.db.execute(
+            query.order_by(Comment.created_at.desc(), Comment.id.desc()).limit(limit + 1)
+        )
+        comments = list(result.scalars().all())
+        if len(comments) <= limit:
+            return comments, None, False
+        comments = comments[:limit]
+        return comments, comment_cursor(comments[-1]), True
+
+    async def count_comments(self, task_id: int) -> int:
+        """统计任务的评论数量（仅扫描索引）。
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            评论数量
+        """
+        result = await self.db.execute(
+            select(func.count()).select_from(Comment).where(Comment.task_id == task_id)
+        )
+        return result.scalar_one()
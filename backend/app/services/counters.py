@@ -0,0 +1,105 @@
+"""计数器维护模块。
+
+列的任务数（columns.task_count）、项目的任务数与列数（projects.task_count、
+projects.column_count）为冗余计数器，由服务层的创建、移动、删除操作在同一事务中
+以原子的 ``SET x = x + n`` 语句维护，读取时无需扫描任务表。
+
+项目版本号（projects.version）以同样方式维护：看板内容（项目、列、任务、评论，
+以及任务负责人的显示信息）的每次修改都使其递增，按主键读取即可判断内容是否变化。
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..models.column import KanbanColumn
+from ..models.comment import Comment
+from ..models.project import Project
+from ..models.task import Task
+
+_BUMP_VERSION = {Project.version: Project.version + 1}
+
+
+def adjust_column_task_count(db: Session, column_id: int, delta: int) -> None:
+    """调整列的任务数（不提交）。
+
+    Args:
+        db: 数据库会话
+        column_id: 列ID
+        delta: 变化量
+    """
+    db.query(KanbanColumn).filter(KanbanColumn.id == column_id).update(
+        {KanbanColumn.task_count: KanbanColumn.task_count + delta},
+        synchronize_session=False,
+    )
+
+
+def adjust_project_counts(db: Session, project_id: int, tasks: int = 0, columns: int = 0) -> None:
+    """调整项目的任务数与列数，并递增项目版本号（不提交）。
+
+    Args:
+        db: 数据库会话
+        project_id: 项目ID
+        tasks: 任务数变化量
+        columns: 列数变化量
+    """
+    values = {Project.version: Project.version + 1}
+    if tasks:
+        values[Project.task_count] = Project.task_count + tasks
+    if columns:
+        values[Project.column_count] = Project.column_count + columns
+    db.query(Project).filter(Project.id == project_id).update(
+        values, synchronize_session=False
+    )
+
+
+def bump_project_version(db: Session, project_id: int) -> None:
+    """递增项目版本号（不提交），用于不改变计数器的修改。
+
+    Args:
+        db: 数据库会话
+        project_id: 项目ID
+    """
+    adjust_project_counts(db, project_id)
+
+
+def bump_task_project_version(db: Session, task_id: int) -> None:
+    """递增任务所属项目的版本号（不提交），用于评论的修改。
+
+    Args:
+        db: 数据库会话
+        task_id: 任务ID
+    """
+    project_id = select(Task.project_id).where(Task.id == task_id).scalar_subquery()
+    db.query(Project).filter(Project.id == project_id).update(
+        _BUMP_VERSION, synchronize_session=False
+    )
+
+
+def bump_assignee_project_versions(db: Session, user_id: int) -> None:
+    """递增用户负责的任务所在项目的版本号（不提交），用于修改或删除负责人。
+
+    Args:
+        db: 数据库会话
+        user_id: 用户ID
+    """
+    project_ids = select(Task.project_id).where(Task.assignee_id == user_id)
+    db.query(Project).filter(Project.id.in_(project_ids)).update(
+        _BUMP_VERSION, synchronize_session=False
+    )
+
+
+def bump_comment_author_project_versions(db: Session, user_id: int) -> None:
+    """递增用户评论过的任务所在项目的版本号（不提交），用于删除评论作者。
+
+    Args:
+        db: 数据库会话
+        user_id: 用户ID
+    """
+    project_ids = (
+        select(Task.project_id)
+        .join(Comment, Comment.task_id == Task.id)
+        .where(Comment.user_id == user_id)
+    )
+    db.query(Project).filter(Project.id.in_(project_ids)).update(
+        _BUMP_VERSION, synchronize_session=False
+    )
@@ -0,0 +1,121 @@
+"""已认证用户缓存模块。
+
+每个认证请求都需按令牌中的用户ID查询用户，是轮询负载下最频繁的查询。
+这里在进程内按用户ID缓存鉴权所需的最少字段（ID、角色、是否启用），
+容量有上限（LRU淘汰）且条目有有效期。修改用户的接口在提交后同步失效对应条目。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from ..config import settings
+
+
+@dataclass(frozen=True)
+class Principal:
+    """已认证用户的鉴权信息。"""
+
+    id: int
+    role: str
+    is_active: bool
+
+
+class PrincipalCache:
+    """已认证用户缓存（TTL + LRU）。
+
+    未命中时调用方从数据库加载后写回。为避免加载期间发生的修改被旧数据覆盖，
+    写回时需带上加载前取得的版本号，期间有过失效则放弃写回。
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.PRINCIPAL_CACHE_SIZE,
+        ttl_seconds: float = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    ):
+        """初始化缓存。
+
+        Args:
+            max_size: 最多缓存的用户数
+            ttl_seconds: 条目有效期（秒）
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, Tuple[float, Principal]]" = OrderedDict()
+        self._version = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """当前失效版本号，每次失效时递增。"""
+        return self._version
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """获取缓存的用户信息。
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            用户信息，未缓存或已过期时返回None
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, principal: Principal, version: int) -> None:
+        """写回从数据库加载的用户信息。
+
+        Args:
+            principal: 用户信息
+            version: 加载前取得的版本号，之后有过失效时不写回
+        """
+        with self._lock:
+            if version != self._version or self.max_size <= 0:
+                return
+            self._entries[principal.id] = (time.monotonic() + self.ttl_seconds, principal)
+            self._entries.move_to_end(principal.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        """使用户的缓存失效（修改用户后调用）。
+
+        Args:
+            user_id: 用户ID
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._version += 1
+
+    def clear(self) -> None:
+        """清空缓存与命中统计。"""
+        with self._lock:
+            self._entries.clear()
+            self._version += 1
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """获取命中统计。
+
+        Returns:
+            命中数、未命中数与当前缓存的用户数
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+# 全局用户缓存实例
+principal_cache = PrincipalCache()
@@ -1,20 +1,294 @@
 """项目服务模块。"""
 
+import threading
+import time as time_module
+from collections import defaultdict
 from datetime import time, timedelta
-from typing import List, Optional
-
-from sqlalchemy.orm import Session
-
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from ..config import settings
+from ..models.change import (
+    CHANGE_ENTITY_COLUMN,
+    CHANGE_ENTITY_PROJECT,
+    CHANGE_ENTITY_TASK,
+    ProjectChange,
+)
 from ..models.project import Project
 from ..models.column import KanbanColumn
+from ..models.database import utc_now
 from ..models.task import Task
-from ..schemas.project import ProjectCreate, ProjectUpdate
-from ..schemas.task import TaskFilter
+from ..schemas.column import ColumnResponse, ColumnWithTasksResponse
+from ..schemas.project import (
+    ProjectChangesResponse,
+    ProjectCreate,
+    ProjectDetailResponse,
+    ProjectResponse,
+    ProjectUpdate,
+)
+from ..schemas.task import TaskFilter, TaskResponse
+from ..utils.pagination import decode_cursor, decode_datetime, encode_cursor
+from .changes import record_changes
+from .purge import restore_cutoff
+from .search import task_keyword_condition
+from .task import (
+    column_window_query,
+    task_cursor,
+    task_index_query,
+    use_rank_ordering,
+)
 
 
 # 默认列名称
 DEFAULT_COLUMNS = ["待办", "进行中", "已完成"]
 
+# 项目总数缓存有效期（秒）
+PROJECT_COUNT_TTL_SECONDS = 30
+
+
+class ProjectCountCache:
+    """项目总数缓存。
+
+    游标分页不再需要总数，仅在客户端请求时返回缓存的近似值，
+    避免每次翻页都执行 COUNT(*)。创建、删除项目时清空。
+    """
+
+    def __init__(self, ttl_seconds: int = PROJECT_COUNT_TTL_SECONDS):
+        """初始化缓存。
+
+        Args:
+            ttl_seconds: 缓存有效期（秒）
+        """
+        self.ttl_seconds = ttl_seconds
+        self._counts: Dict[Optional[int], Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, owner_id: Optional[int]) -> Optional[int]:
+        """获取未过期的缓存总数。
+
+        Args:
+            owner_id: 所有者ID，为None时表示全部项目
+
+        Returns:
+            缓存的总数，不存在或已过期时返回None
+        """
+        with self._lock:
+            entry = self._counts.get(owner_id)
+            if entry is None or entry[1] < time_module.monotonic():
+                return None
+            return entry[0]
+
+    def set(self, owner_id: Optional[int], count: int) -> None:
+        """写入缓存总数。
+
+        Args:
+            owner_id: 所有者ID，为None时表示全部项目
+            count: 项目总数
+        """
+        with self._lock:
+            self._counts[owner_id] = (count, time_module.monotonic() + self.ttl_seconds)
+
+    def clear(self) -> None:
+        """清空缓存。"""
+        with self._lock:
+            self._counts.clear()
+
+
+# 全局项目总数缓存实例
+project_count_cache = ProjectCountCache()
+
+
+def _decode_project_cursor(cursor: str) -> Tuple:
+    """解析项目列表游标。
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        (创建时间, 项目ID)
+
+    Raises:
+        ValueError: 如果游标无效
+    """
+    values = decode_cursor(cursor)
+    project_id = values.get("id")
+    if not isinstance(project_id, int):
+        raise ValueError("无效的分页游标")
+    return decode_datetime(values.get("created_at")), project_id
+
+
+def _visible_columns_loader():
+    """预加载项目未删除的列。"""
+    return selectinload(Project.columns.and_(KanbanColumn.deleted_at.is_(None)))
+
+
+def _has_task_filter(task_filter: Optional[TaskFilter]) -> bool:
+    """判断是否设置了任一任务筛选条件。
+
+    Args:
+        task_filter: 任务筛选条件
+
+    Returns:
+        是否需要筛选
+    """
+    return bool(task_filter) and any([
+        task_filter.keyword,
+        task_filter.assignee_id,
+        task_filter.priority,
+        task_filter.due_date_start,
+        task_filter.due_date_end,
+    ])
+
+
+def _filtered_tasks_query(project_id: int, task_filter: TaskFilter):
+    """构建看板筛选查询：一条按项目索引读取、按列与列内顺序排序的筛选查询。
+
+    Args:
+        project_id: 项目ID
+        task_filter: 任务筛选条件
+
+    Returns:
+        任务查询语句
+    """
+    return (
+        select(Task)
+        .where(Task.project_id == project_id, *_task_filter_conditions(task_filter))
+        .order_by(Task.column_id, Task.position, Task.rank)
+    )
+
+
+def _group_tasks_by_column(tasks: Iterable[Task]) -> Dict[int, List[Task]]:
+    """将已排序的任务按列分组。
+
+    Args:
+        tasks: 按列、列内顺序排序的任务
+
+    Returns:
+        列ID到任务列表的映射
+    """
+    tasks_by_column: Dict[int, List[Task]] = defaultdict(list)
+    for task in tasks:
+        tasks_by_column[task.column_id].append(task)
+    return tasks_by_column
+
+
+def _build_board(
+    project: Project,
+    tasks_by_column: Dict[int, List[Task]],
+    windowed: bool = False,
+) -> ProjectDetailResponse:
+    """组装看板响应，不读取也不修改 column.tasks 关系集合。
+
+    rank 排序模式下数据库中的 position 固定为0，按列内顺序补齐；
+    带筛选条件时即为任务在筛选结果中的位置。
+
+    Args:
+        project: 已加载列的项目对象
+        tasks_by_column: 列ID到有序任务列表的映射
+        windowed: 任务是否按列截取（此时各列总数取自任务数计数器）
+
+    Returns:
+        项目详情（含列和任务）
+    """
+    rank_ordering = use_rank_ordering()
+    columns = []
+    for column in project.columns:
+        column_tasks = tasks_by_column.get(column.id, [])
+        tasks = [TaskResponse.model_validate(task) for task in column_tasks]
+        if rank_ordering:
+            for index, task in enumerate(tasks):
+                task.position = index
+        total = column.task_count if windowed else len(tasks)
+        next_cursor = None
+        if total > len(column_tasks):
+            next_cursor = task_cursor(column_tasks[-1], len(column_tasks)) if column_tasks else None
+        columns.append(ColumnWithTasksResponse(
+            **ColumnResponse.model_validate(column).model_dump(),
+            tasks=tasks,
+            task_total=total,
+            next_cursor=next_cursor,
+        ))
+    return ProjectDetailResponse(
+        **ProjectResponse.model_validate(project).model_dump(),
+        columns=columns,
+    )
+
+
+def _board_task_limit(project: Project, task_limit: Optional[int]) -> Optional[int]:
+    """确定看板每列显示的任务数：请求参数优先，其次为项目配置。
+
+    Args:
+        project: 项目对象
+        task_limit: 请求指定的每列任务数
+
+    Returns:
+        每列任务数，为None时显示全部
+    """
+    return task_limit if task_limit is not None else project.board_task_limit
+
+
+def _board_queries(
+    project: Project, task_filter: Optional[TaskFilter], task_limit: Optional[int]
+):
+    """构建看板任务查询。
+
+    有筛选条件时取出全部匹配任务（耗时与匹配数成正比）；否则指定了每列任务数时
+    只取各列前若干个任务，各列总数取自列的任务数计数器。
+
+    Args:
+        project: 已加载列的项目对象
+        task_filter: 任务筛选条件
+        task_limit: 每列任务数，为None时取全部任务
+
+    Returns:
+        (任务查询语句, 是否按列截取)
+    """
+    if _has_task_filter(task_filter):
+        return _filtered_tasks_query(project.id, task_filter), False
+    if task_limit is None or not project.columns:
+        return _filtered_tasks_query(project.id, TaskFilter()), False
+    column_ids = [column.id for column in project.columns]
+    return column_window_query(column_ids, task_limit), True
+
+
+def _task_filter_conditions(task_filter: TaskFilter) -> list:
+    """将任务筛选参数转换为SQL条件。
+
+    Args:
+        task_filter: 任务筛选条件
+
+    Returns:
+        SQLAlchemy条件表达式列表
+    """
+    conditions = []
+
+    if task_filter.keyword:
+        # 全文检索匹配标题、描述与评论
+        conditions.append(task_keyword_condition(task_filter.keyword))
+
+    if task_filter.assignee_id is not None:
+        conditions.append(Task.assignee_id == task_filter.assignee_id)
+
+    if task_filter.priority:
+        conditions.append(Task.priority == task_filter.priority.value)
+
+    if task_filter.due_date_start:
+        conditions.append(Task.due_date >= task_filter.due_date_start)
+
+    if task_filter.due_date_end:
+        due_date_end = task_filter.due_date_end
+        if due_date_end.time() == time.min:
+            # 仅传日期时，按次日零点前包含
+            due_date_end = due_date_end + timedelta(days=1)
+            conditions.append(Task.due_date < due_date_end)
+        else:
+            conditions.append(Task.due_date <= due_date_end)
+
+    return conditions
+
 
 class ProjectService:
     """项目服务类。"""
@@ -41,6 +315,8 @@ class ProjectService:
             name=project_data.name,
             description=project_data.description,
             owner_id=owner_id,
+            board_task_limit=project_data.board_task_limit,
+            column_count=len(DEFAULT_COLUMNS),
         )
         self.db.add(db_project)
         self.db.commit()
@@ -56,6 +332,7 @@ class ProjectService:
             self.db.add(db_column)
         self.db.commit()
         self.db.refresh(db_project)
+        project_count_cache.clear()
 
         return db_project
 
@@ -68,76 +345,45 @@ class ProjectService:
         Returns:
             项目对象，如果不存在则返回None
         """
-        return self.db.query(Project).filter(Project.id == project_id).first()
+        return (
+            self.db.query(Project)
+            .filter(Project.id == project_id, Project.deleted_at.is_(None))
+            .first()
+        )
 
     def get_project_with_filter(
-        self, project_id: int, task_filter: Optional[TaskFilter] = None
-    ) -> Optional[Project]:
-        """根据ID获取项目，支持任务筛选。
+        self,
+        project_id: int,
+        task_filter: Optional[TaskFilter] = None,
+        task_limit: Optional[int] = None,
+    ) -> Optional[ProjectDetailResponse]:
+        """根据ID获取看板，支持任务筛选与按列截取。
+
+        列随项目预加载，任务由一条查询取出后按列分组：有筛选条件时取全部匹配任务，
+        否则按每列任务数（请求参数或项目配置）截取，查询次数与列数、任务数无关。
 
         Args:
             project_id: 项目ID
             task_filter: 任务筛选条件
+            task_limit: 每列任务数，为None时使用项目配置
 
         Returns:
-            项目对象（带筛选后的任务），如果不存在则返回None
+            项目详情（带筛选或截取后的任务），如果不存在则返回None
         """
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+        project = (
+            self.db.query(Project)
+            .options(_visible_columns_loader())
+            .filter(Project.id == project_id, Project.deleted_at.is_(None))
+            .first()
+        )
         if not project:
             return None
 
-        # 如果没有筛选条件，直接返回
-        if not task_filter or not any([
-            task_filter.keyword,
-            task_filter.assignee_id,
-            task_filter.priority,
-            task_filter.due_date_start,
-            task_filter.due_date_end,
-        ]):
-            return project
-
-        # 获取项目的所有列ID
-        column_ids = [col.id for col in project.columns]
-
-        # 构建筛选查询
-        query = self.db.query(Task).filter(Task.column_id.in_(column_ids))
-
-        if task_filter.keyword:
-            # 不区分大小写的模糊匹配，转义 LIKE 通配符防止意外匹配
-            escaped_keyword = (
-                task_filter.keyword
-                .replace("\\", "\\\\")
-                .replace("%", "\\%")
-                .replace("_", "\\_")
-            )
-            query = query.filter(Task.title.ilike(f"%{escaped_keyword}%", escape="\\"))
-
-        if task_filter.assignee_id is not None:
-            query = query.filter(Task.assignee_id == task_filter.assignee_id)
-
-        if task_filter.priority:
-            query = query.filter(Task.priority == task_filter.priority.value)
-
-        if task_filter.due_date_start:
-            query = query.filter(Task.due_date >= task_filter.due_date_start)
-
-        if task_filter.due_date_end:
-            due_date_end = task_filter.due_date_end
-            if due_date_end.time() == time.min:
-                # 仅传日期时，按次日零点前包含
-                due_date_end = due_date_end + timedelta(days=1)
-                query = query.filter(Task.due_date < due_date_end)
-            else:
-                query = query.filter(Task.due_date <= due_date_end)
-
-        # 获取筛选后的任务ID
-        filtered_task_ids = {task.id for task in query.all()}
-
-        # 过滤每个列的任务
-        for column in project.columns:
-            column.tasks = [task for task in column.tasks if task.id in filtered_task_ids]
-
-        return project
+        tasks_query, windowed = _board_queries(
+            project, task_filter, _board_task_limit(project, task_limit)
+        )
+        tasks = self.db.execute(tasks_query).scalars()
+        return _build_board(project, _group_tasks_by_column(tasks), windowed)
 
     def get_projects_by_owner(self, owner_id: int) -> List[Project]:
         """获取用户的所有项目。
@@ -150,7 +396,7 @@ class ProjectService:
         """
         return (
             self.db.query(Project)
-            .filter(Project.owner_id == owner_id)
+            .filter(Project.owner_id == owner_id, Project.deleted_at.is_(None))
             .order_by(Project.created_at.desc())
             .all()
         )
@@ -163,54 +409,67 @@ class ProjectService:
         """
         return (
             self.db.query(Project)
+            .filter(Project.deleted_at.is_(None))
             .order_by(Project.created_at.desc())
             .all()
         )
 
-    def get_all_projects_paginated(
-        self, page: int = 1, page_size: int = 10
-    ) -> tuple[List[Project], int]:
-        """获取所有项目（分页）。
+    def get_projects_page(
+        self, cursor: Optional[str] = None, limit: int = 20, owner_id: Optional[int] = None
+    ) -> Tuple[List[Project], Optional[str]]:
+        """按游标获取一页项目（按创建时间、ID倒序）。
+
+        以 (created_at, id) 作为 keyset 条件从索引中定位，
+        无需 OFFSET 跳过前面的行，翻到任意深度耗时相同。
 
         Args:
-            page: 页码（从1开始）
-            page_size: 每页数量
+            cursor: 上一页返回的游标，为None时从第一页开始
+            limit: 每页数量
+            owner_id: 所有者ID，为None时列出全部项目
 
         Returns:
-            (项目列表, 总数量)
+            (项目列表, 下一页游标)，没有更多数据时游标为None
+
+        Raises:
+            ValueError: 如果游标无效
         """
-        query = self.db.query(Project)
-        total = query.count()
+        query = self.db.query(Project).filter(Project.deleted_at.is_(None))
+        if owner_id is not None:
+            query = query.filter(Project.owner_id == owner_id)
+        if cursor:
+            created_at, project_id = _decode_project_cursor(cursor)
+            query = query.filter(
+                tuple_(Project.created_at, Project.id) < tuple_(created_at, project_id)
+            )
+        # 多取一行判断是否还有下一页
         projects = (
-            query.order_by(Project.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+            query.order_by(Project.created_at.desc(), Project.id.desc())
+            .limit(limit + 1)
             .all()
         )
-        return projects, total
+        if len(projects) <= limit:
+            return projects, None
+        projects = projects[:limit]
+        last = projects[-1]
+        return projects, encode_cursor({"created_at": last.created_at, "id": last.id})
 
-    def get_projects_by_owner_paginated(
-        self, owner_id: int, page: int = 1, page_size: int = 10
-    ) -> tuple[List[Project], int]:
-        """获取用户的项目（分页）。
+    def count_projects(self, owner_id: Optional[int] = None) -> int:
+        """获取项目总数，优先使用缓存值。
 
         Args:
-            owner_id: 用户ID
-            page: 页码（从1开始）
-            page_size: 每页数量
+            owner_id: 所有者ID，为None时统计全部项目
 
         Returns:
-            (项目列表, 总数量)
+            项目总数（缓存有效期内可能略有滞后）
         """
-        query = self.db.query(Project).filter(Project.owner_id == owner_id)
-        total = query.count()
-        projects = (
-            query.order_by(Project.created_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
-            .all()
-        )
-        return projects, total
+        total = project_count_cache.get(owner_id)
+        if total is None:
+            query = self.db.query(func.count(Project.id)).filter(Project.deleted_at.is_(None))
+            if owner_id is not None:
+                query = query.filter(Project.owner_id == owner_id)
+            total = query.scalar()
+            project_count_cache.set(owner_id, total)
+        return total
 
     def update_project(
         self, project_id: int, project_data: ProjectUpdate
@@ -231,13 +490,18 @@ class ProjectService:
         update_data = project_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(db_project, field, value)
+        # 与字段修改合并为一条 UPDATE
+        db_project.version = Project.version + 1
+        record_changes(self.db, project_id, CHANGE_ENTITY_PROJECT, [project_id])
 
         self.db.commit()
         self.db.refresh(db_project)
         return db_project
 
     def delete_project(self, project_id: int) -> bool:
-        """删除项目。
+        """删除项目（软删除）。
+
+        项目立即对外不可见，列、任务等子数据保留至恢复期限结束后由后台分批清理。
 
         Args:
             project_id: 项目ID
@@ -249,6 +513,175 @@ class ProjectService:
         if not db_project:
             return False
 
-        self.db.delete(db_project)
+        db_project.deleted_at = utc_now()
+        db_project.version = Project.version + 1
+        record_changes(self.db, project_id, CHANGE_ENTITY_PROJECT, [project_id])
         self.db.commit()
+        project_count_cache.clear()
         return True
+
+    def get_deleted_project(self, project_id: int) -> Optional[Project]:
+        """获取仍在恢复期限内的已删除项目。
+
+        Args:
+            project_id: 项目ID
+
+        Returns:
+            项目对象，如果不存在、未删除或已超过恢复期限则返回None
+        """
+        return (
+            self.db.query(Project)
+            .filter(Project.id == project_id, Project.deleted_at >= restore_cutoff())
+            .first()
+        )
+
+    def restore_project(self, db_project: Project) -> Project:
+        """恢复已删除的项目。
+
+        Args:
+            db_project: 已删除的项目对象
+
+        Returns:
+            恢复后的项目对象
+        """
+        db_project.deleted_at = None
+        db_project.version = Project.version + 1
+        record_changes(self.db, db_project.id, CHANGE_ENTITY_PROJECT, [db_project.id])
+        self.db.commit()
+        self.db.refresh(db_project)
+        project_count_cache.clear()
+        return db_project
+
+
+class AsyncProjectService:
+    """项目服务类（异步只读版本）。"""
+
+    def __init__(self, db: AsyncSession):
+        """初始化异步项目服务。
+
+        Args:
+            db: 异步数据库会话
+        """
+        self.db = db
+
+    async def get_board_version(self, project_id: int) -> Optional[int]:
+        """获取看板版本号（只读取项目行）。
+
+        Args:
+            project_id: 项目ID
+
+        Returns:
+            版本号，如果项目不存在则返回None
+        """
+        return await self.db.scalar(
+            select(Project.version).where(Project.id == project_id, Project.deleted_at.is_(None))
+        )
+
+    async def get_project_with_filter(
+        self,
+        project_id: int,
+        task_filter: Optional[TaskFilter] = None,
+        task_limit: Optional[int] = None,
+    ) -> Optional[ProjectDetailResponse]:
+        """根据ID获取看板，支持任务筛选与按列截取。
+
+        异步会话不支持延迟加载，列在查询项目时一并预加载；
+        任务由一条查询取出后按列分组。
+
+        Args:
+            project_id: 项目ID
+            task_filter: 任务筛选条件
+            task_limit: 每列任务数，为None时使用项目配置
+
+        Returns:
+            项目详情（带筛选或截取后的任务），如果不存在则返回None
+        """
+        result = await self.db.execute(
+            select(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_(None))
+            .options(_visible_columns_loader())
+        )
+        project = result.scalar_one_or_none()
+        if not project:
+            return None
+
+        tasks_query, windowed = _board_queries(
+            project, task_filter, _board_task_limit(project, task_limit)
+        )
+        result = await self.db.execute(tasks_query)
+        return _build_board(project, _group_tasks_by_column(result.scalars()), windowed)
+
+    async def get_changes(self, project_id: int, since: int) -> Optional[ProjectChangesResponse]:
+        """获取看板自某一版本以来的变更。
+
+        变更记录只含对象类型与ID：对象当前仍在看板中即返回其最新内容，否则视为已删除。
+        since 早于保留的变更记录或变更对象过多时返回 full_resync，客户端需重新获取完整看板。
+
+        Args:
+            project_id: 项目ID
+            since: 客户端已有的看板版本号
+
+        Returns:
+            看板变更，如果项目不存在则返回None
+        """
+        result = await self.db.execute(
+            select(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_(None))
+            .options(_visible_columns_loader())
+        )
+        project = result.scalar_one_or_none()
+        if not project:
+            return None
+        # 先读取版本号再读取变更：期间若有修改，下次同步只会重复返回部分对象
+        version = project.version
+        if since == version:
+            return ProjectChangesResponse(version=version)
+
+        full_resync = ProjectChangesResponse(version=version, full_resync=True)
+        oldest = await self.db.scalar(
+            select(func.min(ProjectChange.version)).where(ProjectChange.project_id == project_id)
+        )
+        if since > version or oldest is None or oldest > since + 1:
+            return full_resync
+        result = await self.db.execute(
+            select(ProjectChange.entity, ProjectChange.entity_id)
+            .where(ProjectChange.project_id == project_id, ProjectChange.version > since)
+            .distinct()
+            .limit(settings.MAX_CHANGES_PER_SYNC + 1)
+        )
+        changes = result.all()
+        if len(changes) > settings.MAX_CHANGES_PER_SYNC:
+            return full_resync
+        changed: Dict[str, set] = defaultdict(set)
+        for entity, entity_id in changes:
+            changed[entity].add(entity_id)
+
+        columns = []
+        visible_column_ids = set()
+        for index, column in enumerate(project.columns):
+            visible_column_ids.add(column.id)
+            if column.id in changed[CHANGE_ENTITY_COLUMN]:
+                response = ColumnResponse.model_validate(column)
+                response.position = index
+                columns.append(response)
+
+        tasks = []
+        task_ids = changed[CHANGE_ENTITY_TASK]
+        if task_ids:
+            result = await self.db.execute(task_index_query(list(task_ids)))
+            for task, index in result.all():
+                # 任务可能已移到其他项目或已删除的列
+                if task.project_id == project_id and task.column_id in visible_column_ids:
+                    response = TaskResponse.model_validate(task)
+                    response.position = index
+                    tasks.append(response)
+        tasks.sort(key=lambda task: (task.column_id, task.position))
+
+        return ProjectChangesResponse(
+            version=version,
+            project=ProjectResponse.model_validate(project),
+            columns=columns,
+            deleted_column_ids=sorted(changed[CHANGE_ENTITY_COLUMN] - visible_column_ids),
+            tasks=tasks,
+            deleted_task_ids=sorted(task_ids - {task.id for task in tasks}),
+        )
@@ -0,0 +1,142 @@
+"""软删除清理服务模块。
+
+删除项目、列时只标记 deleted_at，对外立即不可见；超过 DELETED_RETENTION_DAYS
+天恢复期限后，由后台按批删除其下的评论、任务与归档数据，每批单独提交，
+避免一次删除大量数据长时间占用写锁。过期的看板变更记录也在同一任务中分批清理。
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..models.archive import ArchivedTask
+from ..models.column import KanbanColumn
+from ..models.database import SessionLocal, utc_now
+from ..models.project import Project
+from ..models.task import Task
+from .changes import compact_changes
+
+logger = logging.getLogger(__name__)
+
+
+def restore_cutoff(days: Optional[int] = None) -> datetime:
+    """计算恢复期限：晚于该时间删除的项目、列仍可恢复。
+
+    Args:
+        days: 保留天数，默认取 DELETED_RETENTION_DAYS
+
+    Returns:
+        截止时间
+    """
+    days = settings.DELETED_RETENTION_DAYS if days is None else days
+    return utc_now() - timedelta(days=days)
+
+
+class PurgeService:
+    """软删除清理服务类。"""
+
+    def __init__(self, db: Session):
+        """初始化清理服务。
+
+        Args:
+            db: 数据库会话
+        """
+        self.db = db
+
+    def purge_expired(
+        self, retention_days: Optional[int] = None, batch_size: Optional[int] = None
+    ) -> int:
+        """清理超过恢复期限的已删除列和项目。
+
+        Args:
+            retention_days: 保留天数，默认取 DELETED_RETENTION_DAYS
+            batch_size: 每批删除的任务数，默认取 PURGE_BATCH_SIZE
+
+        Returns:
+            清理的项目和列总数
+        """
+        cutoff = restore_cutoff(retention_days)
+        batch_size = batch_size or settings.PURGE_BATCH_SIZE
+
+        column_ids = list(self.db.scalars(
+            select(KanbanColumn.id).where(KanbanColumn.deleted_at < cutoff)
+        ))
+        for column_id in column_ids:
+            self.purge_column(column_id, batch_size)
+
+        project_ids = list(self.db.scalars(
+            select(Project.id).where(Project.deleted_at < cutoff)
+        ))
+        for project_id in project_ids:
+            self.purge_project(project_id, batch_size)
+        return len(column_ids) + len(project_ids)
+
+    def purge_column(self, column_id: int, batch_size: int) -> None:
+        """分批删除列中的任务，最后删除列本身。
+
+        评论由外键级联删除，每批一条语句，与评论数无关。
+
+        Args:
+            column_id: 列ID
+            batch_size: 每批删除的任务数
+        """
+        batch = select(Task.id).where(Task.column_id == column_id).limit(batch_size)
+        while self.db.execute(delete(Task).where(Task.id.in_(batch))).rowcount:
+            self.db.commit()
+        self.db.execute(delete(KanbanColumn).where(KanbanColumn.id == column_id))
+        self.db.commit()
+
+    def purge_project(self, project_id: int, batch_size: int) -> None:
+        """依次清理项目的列、归档任务，最后删除项目本身。
+
+        Args:
+            project_id: 项目ID
+            batch_size: 每批删除的任务数
+        """
+        column_ids = list(self.db.scalars(
+            select(KanbanColumn.id).where(KanbanColumn.project_id == project_id)
+        ))
+        for column_id in column_ids:
+            self.purge_column(column_id, batch_size)
+
+        # 归档任务不随项目级联，需一并清理（归档评论由外键级联删除）
+        batch = (
+            select(ArchivedTask.id).where(ArchivedTask.project_id == project_id).limit(batch_size)
+        )
+        while self.db.execute(delete(ArchivedTask).where(ArchivedTask.id.in_(batch))).rowcount:
+            self.db.commit()
+        self.db.execute(delete(Project).where(Project.id == project_id))
+        self.db.commit()
+
+
+def run_purge_job() -> int:
+    """执行一次软删除清理并清理过期的变更记录（在独立会话中）。
+
+    Returns:
+        清理的项目和列总数
+    """
+    db = SessionLocal()
+    try:
+        purged = PurgeService(db).purge_expired()
+        compact_changes(db)
+        return purged
+    finally:
+        db.close()
+
+
+async def run_purge_loop() -> None:
+    """后台循环：按 PURGE_INTERVAL_SECONDS 间隔在线程中清理超过恢复期限的数据。"""
+    while True:
+        await asyncio.sleep(settings.PURGE_INTERVAL_SECONDS)
+        try:
+            purged = await asyncio.to_thread(run_purge_job)
+        except Exception:
+            logger.exception("清理已删除数据失败")
+            continue
+        if purged:
+            logger.info("已清理 %d 个已删除的项目或列", purged)
@@ -0,0 +1,308 @@
+"""任务全文检索服务模块。"""
+
+import html
+import re
+from typing import List, Optional
+
+from sqlalchemy import and_, column, literal_column, or_, select, table, text, union_all
+from sqlalchemy.orm import Session, selectinload
+
+from ..models.column import KanbanColumn
+from ..models.comment import Comment
+from ..models.project import Project
+from ..models.search import COMMENT_SEARCH_TABLE, TASK_SEARCH_TABLE, rebuild_task_search
+from ..models.task import Task
+from ..schemas.search import SearchResult
+
+# trigram 分词可检索的最短词长
+MIN_FTS_TERM_LENGTH = 3
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+# FTS5 高亮时使用的占位符（Unicode 私用区字符），转义文本后再替换为 <mark> 标签
+_MARK_START = "\ue000"
+_MARK_END = "\ue001"
+SNIPPET_ELLIPSIS = "…"
+# 摘要中保留的词元数（trigram 下约等于字符数）
+SNIPPET_TOKENS = 24
+
+# 每个检索词在任务或其任一评论中命中即可，多个词需全部命中；
+# 辅助函数 snippet() 只能在 FTS 查询自身中调用，故命中结果先物化再汇总
+_SEARCH_SQL = f"""
+WITH term_hits(term_no, task_id) AS (
+    {{term_hits}}
+),
+matched AS (
+    SELECT task_id FROM term_hits
+    GROUP BY task_id HAVING count(DISTINCT term_no) = :term_count
+),
+task_hits AS MATERIALIZED (
+    SELECT
+        rowid AS task_id,
+        snippet({TASK_SEARCH_TABLE}, -1, :mark_start, :mark_end, :ellipsis, :tokens) AS snippet,
+        rank AS score
+    FROM {TASK_SEARCH_TABLE}
+    WHERE {TASK_SEARCH_TABLE} MATCH :any_query AND rowid IN (SELECT task_id FROM matched)
+),
+comment_hits AS MATERIALIZED (
+    SELECT
+        task_id,
+        snippet({COMMENT_SEARCH_TABLE}, 0, :mark_start, :mark_end, :ellipsis, :tokens) AS snippet,
+        rank AS score
+    FROM {COMMENT_SEARCH_TABLE}
+    WHERE {COMMENT_SEARCH_TABLE} MATCH :any_query AND task_id IN (SELECT task_id FROM matched)
+),
+best_comment_hits AS (
+    -- 取每个任务相关度最高的评论作为摘要
+    SELECT task_id, snippet, min(score) AS score FROM comment_hits GROUP BY task_id
+)
+SELECT
+    tasks.id AS task_id,
+    tasks.title AS title,
+    tasks.column_id AS column_id,
+    tasks.project_id AS project_id,
+    projects.name AS project_name,
+    coalesce(task_hits.snippet, best_comment_hits.snippet, '') AS snippet,
+    coalesce(task_hits.score, 0) + coalesce(best_comment_hits.score, 0) AS score
+FROM matched
+JOIN tasks ON tasks.id = matched.task_id
+JOIN projects ON projects.id = tasks.project_id AND projects.deleted_at IS NULL
+JOIN columns ON columns.id = tasks.column_id AND columns.deleted_at IS NULL
+LEFT JOIN task_hits ON task_hits.task_id = tasks.id
+LEFT JOIN best_comment_hits ON best_comment_hits.task_id = tasks.id
+WHERE 1 = 1 {{project_clause}}
+ORDER BY score, tasks.id
+LIMIT :limit
+"""
+
+_TERM_HITS_SQL = (
+    f"SELECT {{term_no}}, rowid FROM {TASK_SEARCH_TABLE} "
+    f"WHERE {TASK_SEARCH_TABLE} MATCH :term_{{term_no}} "
+    f"UNION ALL SELECT {{term_no}}, task_id FROM {COMMENT_SEARCH_TABLE} "
+    f"WHERE {COMMENT_SEARCH_TABLE} MATCH :term_{{term_no}}"
+)
+
+
+def split_terms(keyword: str) -> List[str]:
+    """将检索词按空白拆分为多个词。
+
+    Args:
+        keyword: 检索词
+
+    Returns:
+        词列表
+    """
+    return keyword.split()
+
+
+def build_term_queries(keyword: str) -> Optional[List[str]]:
+    """为每个检索词构建 FTS5 MATCH 短语。
+
+    Args:
+        keyword: 检索词
+
+    Returns:
+        MATCH 短语列表；存在少于3个字符的词（trigram 无法索引）时返回None
+    """
+    terms = split_terms(keyword)
+    if not terms or any(len(term) < MIN_FTS_TERM_LENGTH for term in terms):
+        return None
+    # 双引号包裹为短语，避免用户输入被解析为 FTS 语法
+    return ['"' + term.replace('"', '""') + '"' for term in terms]
+
+
+def _like_pattern(term: str) -> str:
+    """转义 LIKE 通配符并构造模糊匹配模式。"""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _like_conditions(keyword: str) -> list:
+    """短词回退条件：每个词匹配标题、描述或任一评论。"""
+    conditions = []
+    for term in split_terms(keyword):
+        pattern = _like_pattern(term)
+        conditions.append(or_(
+            Task.title.ilike(pattern, escape="\\"),
+            Task.description.ilike(pattern, escape="\\"),
+            Task.comments.any(Comment.content.ilike(pattern, escape="\\")),
+        ))
+    return conditions
+
+
+def task_keyword_condition(keyword: str):
+    """看板关键词筛选条件，匹配任务标题、描述与评论。
+
+    能使用全文检索时以 FTS5 子查询取得任务ID（任务与评论分别检索后合并），
+    否则回退为模糊匹配。
+
+    Args:
+        keyword: 检索词
+
+    Returns:
+        SQLAlchemy条件表达式
+    """
+    term_queries = build_term_queries(keyword)
+    if term_queries is None:
+        return and_(*_like_conditions(keyword))
+    task_search = table(TASK_SEARCH_TABLE, column("rowid"))
+    comment_search = table(COMMENT_SEARCH_TABLE, column("task_id"))
+    # 每个词在任务标题、描述或任一评论中命中即可
+    return and_(*(
+        Task.id.in_(union_all(
+            select(task_search.c.rowid)
+            .where(literal_column(TASK_SEARCH_TABLE).op("MATCH")(term_query)),
+            select(comment_search.c.task_id)
+            .where(literal_column(COMMENT_SEARCH_TABLE).op("MATCH")(term_query)),
+        ))
+        for term_query in term_queries
+    ))
+
+
+def _render_marks(value: str) -> str:
+    """将 FTS5 以占位符标记的文本转义为 HTML，再把占位符替换为 <mark> 标签。"""
+    escaped = html.escape(value)
+    return escaped.replace(_MARK_START, HIGHLIGHT_START).replace(_MARK_END, HIGHLIGHT_END)
+
+
+def _highlight_terms(value: str, terms: List[str]) -> str:
+    """转义文本为 HTML，并标记所有检索词（不区分大小写）。"""
+    pattern = re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+    parts = []
+    last = 0
+    for match in pattern.finditer(value):
+        parts.append(html.escape(value[last:match.start()]))
+        parts.append(f"{HIGHLIGHT_START}{html.escape(match.group(0))}{HIGHLIGHT_END}")
+        last = match.end()
+    parts.append(html.escape(value[last:]))
+    return "".join(parts)
+
+
+def _make_snippet(values: List[str], terms: List[str]) -> str:
+    """从第一个包含检索词的字段截取摘要并标记检索词。"""
+    lowered_terms = [term.lower() for term in terms]
+    for value in values:
+        lowered = value.lower()
+        positions = [lowered.find(term) for term in lowered_terms if term in lowered]
+        if not positions:
+            continue
+        start = max(min(positions) - SNIPPET_TOKENS // 2, 0)
+        end = start + SNIPPET_TOKENS
+        excerpt = value[start:end]
+        prefix = SNIPPET_ELLIPSIS if start > 0 else ""
+        suffix = SNIPPET_ELLIPSIS if end < len(value) else ""
+        return prefix + _highlight_terms(excerpt, terms) + suffix
+    return ""
+
+
+class SearchService:
+    """任务全文检索服务类。"""
+
+    def __init__(self, db: Session):
+        """初始化检索服务。
+
+        Args:
+            db: 数据库会话
+        """
+        self.db = db
+
+    def search_tasks(
+        self, keyword: str, project_id: Optional[int] = None, limit: int = 20
+    ) -> List[SearchResult]:
+        """检索任务标题、描述与评论，按相关度排序。
+
+        Args:
+            keyword: 检索词，多个词以空白分隔，需全部匹配
+            project_id: 限定的项目ID，为None时检索所有项目
+            limit: 返回的最大结果数
+
+        Returns:
+            检索结果列表（含高亮标题与摘要）
+        """
+        term_queries = build_term_queries(keyword)
+        if term_queries is None:
+            return self._search_tasks_by_like(keyword, project_id, limit)
+
+        term_hits = "\n    UNION ALL ".join(
+            _TERM_HITS_SQL.format(term_no=term_no) for term_no in range(len(term_queries))
+        )
+        project_clause = "AND tasks.project_id = :project_id" if project_id is not None else ""
+        params = {
+            f"term_{term_no}": term_query for term_no, term_query in enumerate(term_queries)
+        }
+        rows = self.db.execute(
+            text(_SEARCH_SQL.format(term_hits=term_hits, project_clause=project_clause)),
+            {
+                **params,
+                "term_count": len(term_queries),
+                "any_query": " OR ".join(term_queries),
+                "project_id": project_id,
+                "limit": limit,
+                "mark_start": _MARK_START,
+                "mark_end": _MARK_END,
+                "ellipsis": SNIPPET_ELLIPSIS,
+                "tokens": SNIPPET_TOKENS,
+            },
+        ).mappings()
+        terms = split_terms(keyword)
+        return [
+            SearchResult(**{
+                **row,
+                "title_highlight": _highlight_terms(row["title"], terms),
+                "snippet": _render_marks(row["snippet"]),
+            })
+            for row in rows
+        ]
+
+    def _search_tasks_by_like(
+        self, keyword: str, project_id: Optional[int], limit: int
+    ) -> List[SearchResult]:
+        """短词回退检索：模糊匹配，按任务新旧排序，摘要在应用层生成。
+
+        Args:
+            keyword: 检索词
+            project_id: 限定的项目ID
+            limit: 返回的最大结果数
+
+        Returns:
+            检索结果列表
+        """
+        query = (
+            self.db.query(Task, Project.name)
+            # 与全文检索一致，排除已删除的项目和列中的任务
+            .join(Project, and_(Project.id == Task.project_id, Project.deleted_at.is_(None)))
+            .join(
+                KanbanColumn,
+                and_(KanbanColumn.id == Task.column_id, KanbanColumn.deleted_at.is_(None)),
+            )
+            .options(selectinload(Task.comments))
+            .filter(*_like_conditions(keyword))
+        )
+        if project_id is not None:
+            query = query.filter(Task.project_id == project_id)
+
+        terms = split_terms(keyword)
+        results = []
+        for task, project_name in query.order_by(Task.id.desc()).limit(limit):
+            comments = [comment.content for comment in task.comments]
+            results.append(SearchResult(
+                task_id=task.id,
+                title=task.title,
+                column_id=task.column_id,
+                project_id=task.project_id,
+                project_name=project_name,
+                title_highlight=_highlight_terms(task.title, terms),
+                snippet=_make_snippet([task.title, task.description or "", *comments], terms),
+                score=0.0,
+            ))
+        return results
+
+    def rebuild_index(self) -> int:
+        """重建全文检索数据。
+
+        Returns:
+            收录的任务数量
+        """
+        count = rebuild_task_search(self.db.connection())
+        self.db.commit()
+        return count
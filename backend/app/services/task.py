@@ -1,12 +1,154 @@
 """任务服务模块。"""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import and_, exists, func, or_, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from ..config import settings
+from ..models.change import CHANGE_ENTITY_TASK
+from ..models.column import KanbanColumn
+from ..models.database import utc_now
+from ..models.project import Project
 from ..models.task import Task
 from ..models.user import User
-from ..schemas.task import TaskCreate, TaskUpdate
+from ..schemas.project import CursorPaginatedResponse
+from ..schemas.task import TaskCreate, TaskResponse, TaskUpdate
+from ..utils.pagination import decode_cursor, encode_cursor
+from ..utils.ranking import MAX_RANK_LENGTH, evenly_spaced_ranks, rank_between
+from .changes import record_changes
+from .counters import adjust_column_task_count, adjust_project_counts, bump_project_version
+
+# 任务排序方式
+TASK_ORDERING_POSITION = "position"
+TASK_ORDERING_RANK = "rank"
+
+# SQLite 单个复合查询（UNION ALL）最多包含的 SELECT 数（SQLITE_MAX_COMPOUND_SELECT）
+MAX_COMPOUND_SELECT = 500
+
+
+def use_rank_ordering() -> bool:
+    """判断当前是否使用排序键（rank）方式排序任务。
+
+    Returns:
+        是否为 rank 排序模式
+    """
+    return settings.TASK_ORDERING == TASK_ORDERING_RANK
+
+
+def _column_order():
+    """列内任务的完整排序键（ID 保证顺序唯一，便于按游标续读）。"""
+    return (Task.position, Task.rank, Task.id)
+
+
+def visible_task_condition():
+    """任务可见条件：所在列与所属项目均未删除。"""
+    return and_(
+        exists().where(KanbanColumn.id == Task.column_id, KanbanColumn.deleted_at.is_(None)),
+        exists().where(Project.id == Task.project_id, Project.deleted_at.is_(None)),
+    )
+
+
+def task_cursor(task: Task, offset: int) -> str:
+    """生成指向列内任务之后的游标。
+
+    Args:
+        task: 当前页的最后一个任务
+        offset: 游标之前的任务数（rank 排序模式下用于补齐位置）
+
+    Returns:
+        游标字符串
+    """
+    return encode_cursor({
+        "position": task.position,
+        "rank": task.rank or "",
+        "id": task.id,
+        "offset": offset,
+    })
+
+
+def _decode_task_cursor(cursor: str) -> Dict:
+    """解析列内任务游标。
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        排序键取值
+
+    Raises:
+        ValueError: 如果游标无效
+    """
+    values = decode_cursor(cursor)
+    if not (
+        isinstance(values.get("position"), int)
+        and isinstance(values.get("rank"), str)
+        and isinstance(values.get("id"), int)
+        and isinstance(values.get("offset"), int)
+    ):
+        raise ValueError("无效的分页游标")
+    return values
+
+
+def column_window_query(column_ids: List[int], limit: int):
+    """构建各列前 limit 个任务的查询。
+
+    每列一个带 LIMIT 的子查询（沿列内顺序索引读取），以 UNION ALL 合并为一条语句，
+    读取量与列数乘以 limit 成正比，与列内任务总数无关。SQLite 单个复合查询最多
+    MAX_COMPOUND_SELECT 个 SELECT，列数更多时分组合并，各组以 OR 连接。
+
+    Args:
+        column_ids: 列ID列表
+        limit: 每列任务数
+
+    Returns:
+        按列、列内顺序排序的任务查询语句
+    """
+    windows = []
+    for column_id in column_ids:
+        window = (
+            select(Task.id)
+            .where(Task.column_id == column_id)
+            .order_by(*_column_order())
+            .limit(limit)
+            .subquery()
+        )
+        windows.append(select(window.c.id))
+    groups = [
+        Task.id.in_(union_all(*windows[start:start + MAX_COMPOUND_SELECT]))
+        for start in range(0, len(windows), MAX_COMPOUND_SELECT)
+    ]
+    return (
+        select(Task)
+        .where(or_(*groups))
+        .order_by(Task.column_id, *_column_order())
+    )
+
+
+def task_index_query(task_ids: List[int]):
+    """构建指定任务及其在所在列中序号的查询（用于增量同步）。
+
+    只对包含这些任务的列按列内顺序编号，与 position、rank 哪种排序方式无关。
+
+    Args:
+        task_ids: 任务ID列表
+
+    Returns:
+        (任务, 列内序号) 的查询语句
+    """
+    index = func.row_number().over(partition_by=Task.column_id, order_by=_column_order()) - 1
+    ranked = (
+        select(Task.id, index.label("index"))
+        .where(Task.column_id.in_(select(Task.column_id).where(Task.id.in_(task_ids))))
+        .subquery()
+    )
+    return (
+        select(Task, ranked.c.index)
+        .join(ranked, ranked.c.id == Task.id)
+        .where(Task.id.in_(task_ids))
+    )
 
 
 class TaskService:
@@ -48,17 +190,14 @@ class TaskService:
             创建的任务对象
 
         Raises:
-            ValueError: 如果负责人不存在或已禁用
+            ValueError: 如果负责人不存在或已禁用，或列不存在
         """
         # 验证负责人
         self._validate_assignee(task_data.assignee_id)
 
-        # 获取当前列的最大位置
-        max_position = (
-            self.db.query(Task)
-            .filter(Task.column_id == column_id)
-            .count()
-        )
+        column = self.db.query(KanbanColumn).filter(KanbanColumn.id == column_id).first()
+        if not column:
+            raise ValueError("列不存在")
 
         db_task = Task(
             title=task_data.title,
@@ -66,14 +205,46 @@ class TaskService:
             due_date=task_data.due_date,
             priority=task_data.priority.value if task_data.priority else "medium",
             assignee_id=task_data.assignee_id,
-            column_id=column_id,
-            position=max_position,
         )
-        self.db.add(db_task)
+        # 列内任务数即新任务的位置
+        position = self.place_new_task(db_task, column, column.task_count)
+        self.db.flush()
+        record_changes(self.db, column.project_id, CHANGE_ENTITY_TASK, [db_task.id])
         self.db.commit()
         self.db.refresh(db_task)
+        if use_rank_ordering():
+            set_committed_value(db_task, "position", position)
         return db_task
 
+    def place_new_task(self, db_task: Task, column: KanbanColumn, position: int) -> int:
+        """将新任务放入列的指定位置，并维护计数器（不提交）。
+
+        Args:
+            db_task: 尚未保存的任务对象
+            column: 目标列
+            position: 目标位置，超出列长度时追加到列尾
+
+        Returns:
+            任务在列中的实际位置
+        """
+        position = min(position, column.task_count)
+        db_task.column_id = column.id
+        db_task.project_id = column.project_id
+        if use_rank_ordering():
+            db_task.position = 0
+            db_task.rank = self._rank_for_insert(column.id, position, None)
+        else:
+            if position < column.task_count:
+                self.db.query(Task).filter(
+                    Task.column_id == column.id,
+                    Task.position >= position,
+                ).update({Task.position: Task.position + 1})
+            db_task.position = position
+        self.db.add(db_task)
+        adjust_column_task_count(self.db, column.id, 1)
+        adjust_project_counts(self.db, column.project_id, tasks=1)
+        return position
+
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """根据ID获取任务。
 
@@ -83,7 +254,7 @@ class TaskService:
         Returns:
             任务对象，如果不存在则返回None
         """
-        return self.db.query(Task).filter(Task.id == task_id).first()
+        return self.db.query(Task).filter(Task.id == task_id, visible_task_condition()).first()
 
     def get_tasks_by_column(self, column_id: int) -> List[Task]:
         """获取列的所有任务。
@@ -97,10 +268,57 @@ class TaskService:
         return (
             self.db.query(Task)
             .filter(Task.column_id == column_id)
-            .order_by(Task.position)
+            .order_by(Task.position, Task.rank)
             .all()
         )
 
+    def get_tasks_page(
+        self, column_id: int, cursor: Optional[str] = None, limit: int = 50
+    ) -> CursorPaginatedResponse[TaskResponse]:
+        """按游标获取列内的一页任务（按列内顺序）。
+
+        以 (position, rank, id) 作为 keyset 条件沿列内顺序索引续读。
+
+        Args:
+            column_id: 列ID
+            cursor: 上一页（或看板列）返回的游标，为None时从列首开始
+            limit: 每页数量
+
+        Returns:
+            游标分页的任务列表（total 为列内任务总数）
+
+        Raises:
+            ValueError: 如果游标无效
+        """
+        query = self.db.query(Task).filter(Task.column_id == column_id)
+        offset = 0
+        if cursor:
+            values = _decode_task_cursor(cursor)
+            offset = values["offset"]
+            query = query.filter(
+                Task.position >= values["position"],
+                tuple_(Task.position, func.coalesce(Task.rank, ""), Task.id)
+                > tuple_(values["position"], values["rank"], values["id"]),
+            )
+        tasks = query.order_by(*_column_order()).limit(limit + 1).all()
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+
+        items = [TaskResponse.model_validate(task) for task in tasks]
+        if use_rank_ordering():
+            for index, item in enumerate(items, start=offset):
+                item.position = index
+        total = (
+            self.db.query(KanbanColumn.task_count).filter(KanbanColumn.id == column_id).scalar()
+        ) or 0
+        next_cursor = task_cursor(tasks[-1], offset + len(tasks)) if has_more else None
+        return CursorPaginatedResponse(
+            items=items,
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total=total,
+        )
+
     def update_task(self, task_id: int, task_data: TaskUpdate) -> Optional[Task]:
         """更新任务。
 
@@ -132,6 +350,8 @@ class TaskService:
                 value = value.value if hasattr(value, "value") else value
             setattr(db_task, field, value)
 
+        bump_project_version(self.db, db_task.project_id)
+        record_changes(self.db, db_task.project_id, CHANGE_ENTITY_TASK, [task_id])
         self.db.commit()
         self.db.refresh(db_task)
         return db_task
@@ -153,6 +373,14 @@ class TaskService:
         position = db_task.position
 
         self.db.delete(db_task)
+        adjust_column_task_count(self.db, column_id, -1)
+        adjust_project_counts(self.db, db_task.project_id, tasks=-1)
+        record_changes(self.db, db_task.project_id, CHANGE_ENTITY_TASK, [task_id])
+
+        if use_rank_ordering():
+            # 排序键模式下其余任务的顺序不受影响
+            self.db.commit()
+            return True
 
         # 更新后续任务的位置
         self.db.query(Task).filter(
@@ -178,6 +406,14 @@ class TaskService:
         if not db_task:
             return None
 
+        if db_task.column_id != target_column_id:
+            self._move_counts(db_task, target_column_id)
+        bump_project_version(self.db, db_task.project_id)
+        record_changes(self.db, db_task.project_id, CHANGE_ENTITY_TASK, [task_id])
+
+        if use_rank_ordering():
+            return self._move_task_by_rank(db_task, target_column_id, position)
+
         source_column_id = db_task.column_id
         source_position = db_task.position
 
@@ -217,3 +453,174 @@ class TaskService:
         self.db.commit()
         self.db.refresh(db_task)
         return db_task
+
+    def _move_counts(self, db_task: Task, target_column_id: int) -> None:
+        """跨列移动时调整两列的任务计数并记录进入新列的时间（不提交）。
+
+        目标列须与任务属于同一项目（由调用方校验），项目的任务总数不变。
+
+        Args:
+            db_task: 要移动的任务
+            target_column_id: 目标列ID
+        """
+        db_task.column_entered_at = utc_now()
+        adjust_column_task_count(self.db, db_task.column_id, -1)
+        adjust_column_task_count(self.db, target_column_id, 1)
+
+    def _move_task_by_rank(self, db_task: Task, target_column_id: int, position: int) -> Task:
+        """按排序键移动任务，只改写被移动任务这一行。
+
+        Args:
+            db_task: 要移动的任务
+            target_column_id: 目标列ID
+            position: 目标位置
+
+        Returns:
+            移动后的任务对象
+        """
+        db_task.rank = self._rank_for_insert(target_column_id, position, db_task)
+        db_task.column_id = target_column_id
+        db_task.position = 0
+        self.db.commit()
+        self.db.refresh(db_task)
+        set_committed_value(db_task, "position", position)
+        return db_task
+
+    def _rank_for_insert(self, column_id: int, position: int, moving: Optional[Task]) -> str:
+        """计算插入到列中指定位置的排序键。
+
+        只读取目标位置前后相邻的两行；相邻任务尚未使用排序键、
+        或新键超过 MAX_RANK_LENGTH 时，先对整列重新分配排序键。
+
+        Args:
+            column_id: 列ID
+            position: 插入位置
+            moving: 正在移动的任务（计算时排除自身），新建任务时为None
+
+        Returns:
+            新的排序键
+        """
+        query = self.db.query(Task.position, Task.rank).filter(Task.column_id == column_id)
+        if moving is not None:
+            query = query.filter(Task.id != moving.id)
+
+        neighbors = (
+            query.order_by(Task.position, Task.rank)
+            .offset(max(position - 1, 0))
+            .limit(2)
+            .all()
+        )
+        if position == 0:
+            before, after = None, (neighbors[0] if neighbors else None)
+        elif neighbors:
+            before, after = neighbors[0], (neighbors[1] if len(neighbors) > 1 else None)
+        else:
+            # 目标位置超出列长度时追加到列尾
+            before = query.order_by(Task.position.desc(), Task.rank.desc()).first()
+            after = None
+
+        bounds = [row for row in (before, after) if row is not None]
+        if all(row.position == 0 and row.rank for row in bounds):
+            rank = rank_between(before.rank if before else None, after.rank if after else None)
+            if len(rank) <= MAX_RANK_LENGTH:
+                return rank
+
+        return self.rebalance_column(column_id, insert_at=position, moving=moving)
+
+    def rebalance_column(
+        self, column_id: int, insert_at: Optional[int] = None, moving: Optional[Task] = None
+    ) -> Optional[str]:
+        """按当前顺序为整列重新分配均匀分布的排序键。
+
+        排序键过长或列中存在 position 模式遗留的数据时自动调用；
+        切换回 position 模式前也可调用以恢复连续的位置。
+        变更随调用方的事务一起提交。
+
+        Args:
+            column_id: 列ID
+            insert_at: 预留排序键的插入位置，为None时不预留
+            moving: 正在移动的任务（不参与本列的重新分配）
+
+        Returns:
+            为插入位置预留的排序键，未预留时返回None
+        """
+        query = self.db.query(Task.id).filter(Task.column_id == column_id)
+        if moving is not None:
+            query = query.filter(Task.id != moving.id)
+        task_ids = [row.id for row in query.order_by(Task.position, Task.rank)]
+
+        slots: List[Optional[int]] = list(task_ids)
+        if insert_at is not None:
+            slots.insert(min(insert_at, len(slots)), None)
+
+        if use_rank_ordering():
+            ranks = evenly_spaced_ranks(len(slots))
+            values = [
+                {"id": task_id, "position": 0, "rank": rank}
+                for task_id, rank in zip(slots, ranks, strict=True)
+                if task_id is not None
+            ]
+        else:
+            ranks = [None] * len(slots)
+            values = [
+                {"id": task_id, "position": index, "rank": None}
+                for index, task_id in enumerate(slots)
+                if task_id is not None
+            ]
+        if values:
+            self.db.execute(update(Task), values)
+
+        if insert_at is None:
+            return None
+        return ranks[slots.index(None)]
+
+    def close_position_gaps(self, column_id: int) -> int:
+        """position 模式下补齐列中任务移走后留下的位置空缺（不提交）。
+
+        按当前顺序重新编号，只改写位置发生变化的任务，空缺之前的任务不写入。
+
+        Args:
+            column_id: 列ID
+
+        Returns:
+            改写的任务数
+        """
+        rows = self.db.execute(
+            select(Task.id, Task.position)
+            .where(Task.column_id == column_id)
+            .order_by(Task.position, Task.id)
+        )
+        values = [
+            {"id": task_id, "position": index}
+            for index, (task_id, position) in enumerate(rows)
+            if position != index
+        ]
+        if values:
+            self.db.execute(update(Task), values)
+        return len(values)
+
+
+class AsyncTaskService:
+    """任务服务类（异步只读版本）。"""
+
+    def __init__(self, db: AsyncSession):
+        """初始化异步任务服务。
+
+        Args:
+            db: 异步数据库会话
+        """
+        self.db = db
+
+    async def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """根据ID获取任务。
+
+        Args:
+            task_id: 任务ID
+
+        Returns:
+            任务对象，如果不存在则返回None
+        """
+        result = await self.db.execute(
+            select(Task).where(Task.id == task_id, visible_task_condition())
+        )
+        return result.scalar_one_or_none()
@@ -0,0 +1,462 @@
+"""批量任务操作服务模块。
+
+一次请求中的创建、更新、移动、删除操作先在内存中按顺序校验并推演列内顺序，
+再以少量批量语句（批量 INSERT、按主键批量 UPDATE、IN 删除）在同一事务中写入。
+权限按项目只检查一次，单个操作失败不影响其余操作。
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Set, Union
+
+from fastapi import status
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from ..models.change import CHANGE_ENTITY_TASK
+from ..models.column import KanbanColumn
+from ..models.database import utc_now
+from ..models.project import Project
+from ..models.task import Task
+from ..models.user import User
+from ..schemas.task import (
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchMove,
+    TaskBatchOperation,
+    TaskBatchResponse,
+    TaskBatchResult,
+    TaskBatchUpdate,
+)
+from ..utils.ranking import MAX_RANK_LENGTH, evenly_spaced_ranks, rank_between
+from .changes import record_changes
+from .counters import adjust_column_task_count, adjust_project_counts
+from .task import use_rank_ordering
+
+# 列内顺序中的任务标识：已有任务为任务ID，新建任务为 "new:<操作序号>"
+TaskKey = Union[int, str]
+
+
+class _OperationError(Exception):
+    """单个批量操作失败。"""
+
+    def __init__(self, status_code: int, detail: str):
+        """初始化错误。
+
+        Args:
+            status_code: 与单个接口一致的状态码
+            detail: 失败原因
+        """
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class TaskBatchService:
+    """批量任务操作服务类。"""
+
+    def __init__(self, db: Session):
+        """初始化批量任务操作服务。
+
+        Args:
+            db: 数据库会话
+        """
+        self.db = db
+
+    def apply(
+        self, operations: List[TaskBatchOperation], can_edit: Callable[[Project], bool]
+    ) -> TaskBatchResponse:
+        """按顺序执行批量操作，并在同一事务中提交。
+
+        Args:
+            operations: 操作列表
+            can_edit: 判断当前用户能否编辑项目的函数（每个项目只调用一次）
+
+        Returns:
+            每个操作的执行结果
+        """
+        self._load(operations)
+        self._can_edit = can_edit
+        self._permissions: Dict[int, bool] = {}
+
+        handlers = {
+            "create": self._create,
+            "update": self._update,
+            "move": self._move,
+            "delete": self._delete,
+        }
+        outcomes: List[Union[TaskKey, _OperationError]] = []
+        for index, operation in enumerate(operations):
+            try:
+                outcomes.append(handlers[operation.op](index, operation))
+            except _OperationError as error:
+                outcomes.append(error)
+
+        task_ids = self._write()
+        return self._build_response(operations, outcomes, task_ids)
+
+    def _load(self, operations: List[TaskBatchOperation]) -> None:
+        """一次性读取操作涉及的任务、列、项目、负责人及列内顺序。
+
+        Args:
+            operations: 操作列表
+        """
+        task_ids = {op.task_id for op in operations if not isinstance(op, TaskBatchCreate)}
+        self._tasks = {}
+        if task_ids:
+            rows = self.db.execute(
+                select(Task.id, Task.column_id, Task.project_id, Task.position, Task.rank)
+                .where(Task.id.in_(task_ids))
+            )
+            self._tasks = {row.id: row for row in rows}
+
+        column_ids = {row.column_id for row in self._tasks.values()}
+        for op in operations:
+            if isinstance(op, TaskBatchCreate):
+                column_ids.add(op.column_id)
+            elif isinstance(op, TaskBatchMove):
+                column_ids.add(op.target_column_id)
+        self._columns = {}
+        if column_ids:
+            rows = self.db.execute(
+                select(KanbanColumn.id, KanbanColumn.project_id)
+                .join(Project, Project.id == KanbanColumn.project_id)
+                .where(
+                    KanbanColumn.id.in_(column_ids),
+                    KanbanColumn.deleted_at.is_(None),
+                    Project.deleted_at.is_(None),
+                )
+            )
+            self._columns = {row.id: row for row in rows}
+        # 所在列或项目已删除的任务视为不存在
+        self._tasks = {
+            task_id: row for task_id, row in self._tasks.items() if row.column_id in self._columns
+        }
+
+        project_ids = {row.project_id for row in self._columns.values()}
+        self._projects = {}
+        if project_ids:
+            projects = self.db.query(Project).filter(Project.id.in_(project_ids)).all()
+            self._projects = {project.id: project for project in projects}
+
+        assignee_ids = {
+            op.data.assignee_id
+            for op in operations
+            if isinstance(op, (TaskBatchCreate, TaskBatchUpdate)) and op.data.assignee_id is not None
+        }
+        self._assignees = {}
+        if assignee_ids:
+            rows = self.db.execute(select(User.id, User.is_active).where(User.id.in_(assignee_ids)))
+            self._assignees = {row.id: row.is_active for row in rows}
+
+        # 列内当前顺序，批量操作在其上推演
+        self._orders: Dict[int, List[TaskKey]] = {column_id: [] for column_id in self._columns}
+        if self._columns:
+            rows = self.db.execute(
+                select(Task.id, Task.column_id, Task.project_id, Task.position, Task.rank)
+                .where(Task.column_id.in_(self._columns))
+                .order_by(Task.column_id, Task.position, Task.rank, Task.id)
+            )
+            for row in rows:
+                self._orders[row.column_id].append(row.id)
+                self._tasks[row.id] = row
+        self._initial_sizes = {column_id: len(keys) for column_id, keys in self._orders.items()}
+
+        self._task_columns = {task_id: row.column_id for task_id, row in self._tasks.items()}
+        self._deleted: Set[int] = set()
+        self._moved: Set[int] = set()
+        self._dirty_columns: Set[int] = set()
+        self._updates: Dict[int, dict] = {}
+        self._new_rows: Dict[str, dict] = {}
+
+    def _check_project(self, project_id: int, detail: str) -> None:
+        """检查项目编辑权限，每个项目只判断一次。
+
+        Raises:
+            _OperationError: 如果无权编辑
+        """
+        if project_id not in self._permissions:
+            project = self._projects.get(project_id)
+            self._permissions[project_id] = project is not None and self._can_edit(project)
+        if not self._permissions[project_id]:
+            raise _OperationError(status.HTTP_403_FORBIDDEN, detail)
+
+    def _check_assignee(self, assignee_id: Optional[int]) -> None:
+        """检查负责人是否存在且有效。
+
+        Raises:
+            _OperationError: 如果负责人不存在或已禁用
+        """
+        if assignee_id is None:
+            return
+        if assignee_id not in self._assignees:
+            raise _OperationError(status.HTTP_400_BAD_REQUEST, "指定的负责人不存在")
+        if not self._assignees[assignee_id]:
+            raise _OperationError(status.HTTP_400_BAD_REQUEST, "指定的负责人已被禁用")
+
+    def _live_task(self, task_id: int):
+        """获取存在且未在本批中删除的任务。
+
+        Raises:
+            _OperationError: 如果任务不存在
+        """
+        task = self._tasks.get(task_id)
+        if task is None or task_id in self._deleted:
+            raise _OperationError(status.HTTP_404_NOT_FOUND, "任务不存在")
+        return task
+
+    def _create(self, index: int, op: TaskBatchCreate) -> TaskKey:
+        """推演创建操作：追加到列尾。"""
+        column = self._columns.get(op.column_id)
+        if column is None:
+            raise _OperationError(status.HTTP_404_NOT_FOUND, "列不存在")
+        self._check_project(column.project_id, "无权访问此列")
+        self._check_assignee(op.data.assignee_id)
+
+        key = f"new:{index}"
+        self._new_rows[key] = {
+            "title": op.data.title,
+            "description": op.data.description,
+            "due_date": op.data.due_date,
+            "priority": op.data.priority.value if op.data.priority else "medium",
+            "assignee_id": op.data.assignee_id,
+            "column_id": column.id,
+            "project_id": column.project_id,
+        }
+        self._orders[column.id].append(key)
+        self._dirty_columns.add(column.id)
+        return key
+
+    def _update(self, index: int, op: TaskBatchUpdate) -> TaskKey:
+        """推演更新操作：合并待写入的字段。"""
+        task = self._live_task(op.task_id)
+        self._check_project(task.project_id, "无权修改此任务")
+        values = op.data.model_dump(exclude_unset=True)
+        if "assignee_id" in values:
+            self._check_assignee(values["assignee_id"])
+        if values.get("priority") is not None:
+            values["priority"] = values["priority"].value
+        self._updates.setdefault(op.task_id, {}).update(values)
+        return op.task_id
+
+    def _move(self, index: int, op: TaskBatchMove) -> TaskKey:
+        """推演移动操作：从原列移除并插入目标位置。"""
+        task = self._live_task(op.task_id)
+        self._check_project(task.project_id, "无权移动此任务")
+        target = self._columns.get(op.target_column_id)
+        if target is None:
+            raise _OperationError(status.HTTP_404_NOT_FOUND, "目标列不存在")
+        if target.project_id != task.project_id:
+            raise _OperationError(status.HTTP_400_BAD_REQUEST, "目标列必须属于同一项目")
+
+        source_column_id = self._task_columns[op.task_id]
+        self._orders[source_column_id].remove(op.task_id)
+        target_order = self._orders[target.id]
+        target_order.insert(min(op.position, len(target_order)), op.task_id)
+        self._task_columns[op.task_id] = target.id
+        self._moved.add(op.task_id)
+        self._dirty_columns.update((source_column_id, target.id))
+        return op.task_id
+
+    def _delete(self, index: int, op: TaskBatchDelete) -> TaskKey:
+        """推演删除操作：从列中移除。"""
+        task = self._live_task(op.task_id)
+        self._check_project(task.project_id, "无权删除此任务")
+        column_id = self._task_columns[op.task_id]
+        self._orders[column_id].remove(op.task_id)
+        self._deleted.add(op.task_id)
+        self._updates.pop(op.task_id, None)
+        self._dirty_columns.add(column_id)
+        return op.task_id
+
+    def _order_values(self, column_id: int) -> Dict[TaskKey, dict]:
+        """计算列内需要写入的顺序字段。
+
+        position 模式下重新编排连续位置，只返回位置有变化的任务；
+        rank 模式下只为新建和移动的任务在相邻排序键之间取值，
+        列中存在遗留数据或排序键过长时整列重新分配。
+
+        Args:
+            column_id: 列ID
+
+        Returns:
+            任务标识到顺序字段（position、rank）的映射
+        """
+        keys = self._orders[column_id]
+        if not use_rank_ordering():
+            return {
+                key: {"position": index}
+                for index, key in enumerate(keys)
+                if isinstance(key, str)
+                or self._tasks[key].position != index
+                or self._tasks[key].column_id != column_id
+            }
+
+        def is_stable(key: TaskKey) -> bool:
+            return isinstance(key, int) and key not in self._moved
+
+        stable = [self._tasks[key] for key in keys if is_stable(key)]
+        if all(row.position == 0 and row.rank for row in stable):
+            values = self._ranks_between_neighbors(keys, is_stable)
+            if values is not None:
+                return values
+        ranks = evenly_spaced_ranks(len(keys))
+        return {key: {"position": 0, "rank": rank} for key, rank in zip(keys, ranks, strict=True)}
+
+    def _ranks_between_neighbors(
+        self, keys: List[TaskKey], is_stable: Callable[[TaskKey], bool]
+    ) -> Optional[Dict[TaskKey, dict]]:
+        """为列中新建、移动的任务在相邻排序键之间取值。
+
+        Returns:
+            任务标识到顺序字段的映射，排序键过长或顺序冲突时返回None
+        """
+        next_stable: List[Optional[str]] = [None] * (len(keys) + 1)
+        for index in range(len(keys) - 1, -1, -1):
+            key = keys[index]
+            next_stable[index] = self._tasks[key].rank if is_stable(key) else next_stable[index + 1]
+
+        values = {}
+        previous = None
+        for index, key in enumerate(keys):
+            if is_stable(key):
+                previous = self._tasks[key].rank
+                continue
+            try:
+                rank = rank_between(previous, next_stable[index + 1])
+            except ValueError:
+                return None
+            if len(rank) > MAX_RANK_LENGTH:
+                return None
+            values[key] = {"position": 0, "rank": rank}
+            previous = rank
+        return values
+
+    def _write(self) -> Dict[str, int]:
+        """以批量语句写入推演结果并提交。
+
+        Returns:
+            新建任务标识到任务ID的映射
+        """
+        if self._deleted:
+            # 评论由外键级联删除
+            self.db.execute(delete(Task).where(Task.id.in_(list(self._deleted))))
+
+        now = utc_now()
+        for column_id in self._dirty_columns:
+            for key, values in self._order_values(column_id).items():
+                if isinstance(key, str):
+                    self._new_rows[key].update(values)
+                    continue
+                values["column_id"] = column_id
+                values["project_id"] = self._columns[column_id].project_id
+                if self._tasks[key].column_id != column_id:
+                    values["column_entered_at"] = now
+                self._updates.setdefault(key, {}).update(values)
+
+        new_ids: Dict[str, int] = {}
+        if self._new_rows:
+            keys = list(self._new_rows)
+            # 多行 VALUES 批量插入；同一写事务内 SQLite 按行序分配递增的主键，
+            # 排序后即与参数顺序对应（sort_by_parameter_order 在 SQLite 上会退化为逐行插入）
+            rows = self.db.execute(
+                insert(Task).returning(Task.id),
+                [self._new_rows[key] for key in keys],
+            )
+            new_ids = dict(zip(keys, sorted(rows.scalars()), strict=True))
+
+        if self._updates:
+            self.db.execute(
+                update(Task),
+                [{"id": task_id, **values} for task_id, values in self._updates.items()],
+            )
+
+        self._apply_counters()
+        self._record_changes(new_ids)
+        self.db.commit()
+        return new_ids
+
+    def _apply_counters(self) -> None:
+        """按各列任务数的净变化调整列与项目的计数器，并递增涉及项目的版本号（不提交）。"""
+        project_deltas: Dict[int, int] = {
+            self._tasks[task_id].project_id: 0 for task_id in self._updates
+        }
+        for column_id in self._dirty_columns:
+            project_id = self._columns[column_id].project_id
+            delta = len(self._orders[column_id]) - self._initial_sizes[column_id]
+            if delta:
+                adjust_column_task_count(self.db, column_id, delta)
+            project_deltas[project_id] = project_deltas.get(project_id, 0) + delta
+        for project_id, delta in project_deltas.items():
+            adjust_project_counts(self.db, project_id, tasks=delta)
+
+    def _record_changes(self, new_ids: Dict[str, int]) -> None:
+        """按项目记录新建、修改、移动与删除的任务（不提交）。
+
+        Args:
+            new_ids: 新建任务标识到任务ID的映射
+        """
+        changed: Dict[int, Set[int]] = {}
+        for key, task_id in new_ids.items():
+            changed.setdefault(self._new_rows[key]["project_id"], set()).add(task_id)
+        for task_id in self._deleted:
+            changed.setdefault(self._tasks[task_id].project_id, set()).add(task_id)
+        for task_id, values in self._updates.items():
+            # 跨项目移动时原项目与目标项目都需记录
+            changed.setdefault(self._tasks[task_id].project_id, set()).add(task_id)
+            if "project_id" in values:
+                changed.setdefault(values["project_id"], set()).add(task_id)
+        for project_id, task_ids in changed.items():
+            record_changes(self.db, project_id, CHANGE_ENTITY_TASK, sorted(task_ids))
+
+    def _build_response(
+        self,
+        operations: List[TaskBatchOperation],
+        outcomes: Iterable[Union[TaskKey, _OperationError]],
+        new_ids: Dict[str, int],
+    ) -> TaskBatchResponse:
+        """组装每个操作的结果。
+
+        Args:
+            operations: 操作列表
+            outcomes: 每个操作推演得到的任务标识或错误
+            new_ids: 新建任务标识到任务ID的映射
+
+        Returns:
+            批量操作响应
+        """
+        locations = {
+            key: (column_id, position)
+            for column_id, keys in self._orders.items()
+            for position, key in enumerate(keys)
+        }
+        results = []
+        for index, (operation, outcome) in enumerate(zip(operations, outcomes, strict=True)):
+            if isinstance(outcome, _OperationError):
+                results.append(TaskBatchResult(
+                    index=index,
+                    op=operation.op,
+                    success=False,
+                    status_code=outcome.status_code,
+                    detail=outcome.detail,
+                    task_id=getattr(operation, "task_id", None),
+                ))
+                continue
+            column_id, position = locations.get(outcome, (None, None))
+            results.append(TaskBatchResult(
+                index=index,
+                op=operation.op,
+                success=True,
+                status_code=(
+                    status.HTTP_201_CREATED if operation.op == "create"
+                    else status.HTTP_204_NO_CONTENT if operation.op == "delete"
+                    else status.HTTP_200_OK
+                ),
+                task_id=new_ids.get(outcome) if isinstance(outcome, str) else outcome,
+                column_id=column_id,
+                position=position,
+            ))
+        succeeded = sum(1 for result in results if result.success)
+        return TaskBatchResponse(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+        )
@@ -0,0 +1,172 @@
+"""批量导入用户服务模块。"""
+
+import csv
+import io
+from typing import Any, Dict, List, Set
+
+from pydantic import ValidationError
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.user import User, UserRole
+from ..schemas.user import MAX_IMPORT_USERS, UserCreate, UserImportResponse, UserImportRowError
+from ..utils.security import hash_passwords
+
+# CSV 导入支持的列
+CSV_FIELDS = ("username", "email", "password", "display_name")
+
+
+def parse_users_csv(content: str) -> List[Dict[str, Any]]:
+    """解析 CSV 格式的用户数据。
+
+    首行为表头，需包含 username、email、password 列，display_name 列可选。
+
+    Args:
+        content: CSV 文本
+
+    Returns:
+        每个数据行对应的用户字段
+
+    Raises:
+        ValueError: 如果缺少必需的列或行数超过上限
+    """
+    reader = csv.DictReader(io.StringIO(content.lstrip("\ufeff")))
+    missing = [field for field in CSV_FIELDS[:3] if field not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"CSV缺少列：{', '.join(missing)}")
+
+    rows = []
+    for record in reader:
+        if len(rows) >= MAX_IMPORT_USERS:
+            raise ValueError(f"单次最多导入{MAX_IMPORT_USERS}个用户")
+        # 空字符串视为未填写，交由模型校验
+        rows.append({
+            field: record[field]
+            for field in CSV_FIELDS
+            if record.get(field) not in (None, "")
+        })
+    if not rows:
+        raise ValueError("CSV中没有用户数据")
+    return rows
+
+
+def _validation_detail(error: ValidationError) -> str:
+    """将模型校验错误转换为简短说明。"""
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    return f"{field}: {first['msg']}" if field else first["msg"]
+
+
+class UserImportService:
+    """批量导入用户服务类。"""
+
+    def __init__(self, db: Session, read_db: Session):
+        """初始化批量导入用户服务。
+
+        Args:
+            db: 数据库会话（只用于最后的批量写入）
+            read_db: 只读数据库会话（用于检查用户名与邮箱是否已存在）
+        """
+        self.db = db
+        self.read_db = read_db
+
+    def import_users(self, rows: List[Dict[str, Any]]) -> UserImportResponse:
+        """批量创建普通用户。
+
+        逐行校验后，以一次集合查询（只读会话）检查用户名与邮箱是否已存在，
+        在进程池中并行哈希密码，最后以一条批量 INSERT 写入。哈希耗时较长，
+        期间不占用写连接，其他写请求无需排队等待。
+
+        Args:
+            rows: 用户字段列表
+
+        Returns:
+            创建成功的用户与各失败行的原因
+
+        Raises:
+            ValueError: 如果写入时与并发创建的用户冲突
+        """
+        errors: List[UserImportRowError] = []
+        valid: List[tuple] = []
+        for row, data in enumerate(rows, start=1):
+            try:
+                valid.append((row, UserCreate.model_validate(data)))
+            except ValidationError as e:
+                username = data.get("username") if isinstance(data, dict) else None
+                errors.append(UserImportRowError(
+                    row=row,
+                    username=username if isinstance(username, str) else None,
+                    detail=_validation_detail(e),
+                ))
+
+        existing_usernames, existing_emails = self._existing(valid)
+        seen_usernames: Set[str] = set()
+        seen_emails: Set[str] = set()
+        accepted: List[UserCreate] = []
+        for row, user in valid:
+            detail = None
+            if user.username in existing_usernames:
+                detail = "用户名已存在"
+            elif user.email in existing_emails:
+                detail = "邮箱已存在"
+            elif user.username in seen_usernames:
+                detail = "用户名在导入数据中重复"
+            elif user.email in seen_emails:
+                detail = "邮箱在导入数据中重复"
+            if detail:
+                errors.append(UserImportRowError(row=row, username=user.username, detail=detail))
+                continue
+            seen_usernames.add(user.username)
+            seen_emails.add(user.email)
+            accepted.append(user)
+
+        created: List[User] = []
+        if accepted:
+            hashed = hash_passwords([user.password for user in accepted])
+            try:
+                created = list(self.db.scalars(
+                    insert(User).returning(User),
+                    [
+                        {
+                            "username": user.username,
+                            "email": user.email,
+                            "password_hash": password_hash,
+                            "display_name": user.display_name or user.username,
+                            "role": UserRole.USER.value,
+                        }
+                        for user, password_hash in zip(accepted, hashed, strict=True)
+                    ],
+                ))
+                self.db.commit()
+            except IntegrityError as exc:
+                self.db.rollback()
+                raise ValueError("用户名或邮箱已存在") from exc
+
+        errors.sort(key=lambda error: error.row)
+        return UserImportResponse(
+            created=sorted(created, key=lambda user: user.id),
+            errors=errors,
+        )
+
+    def _existing(self, valid: List[tuple]) -> tuple:
+        """以一次查询找出已被占用的用户名与邮箱。
+
+        Args:
+            valid: (行号, 用户数据) 列表
+
+        Returns:
+            (已存在的用户名集合, 已存在的邮箱集合)
+        """
+        if not valid:
+            return set(), set()
+        usernames = {user.username for _, user in valid}
+        emails = {user.email for _, user in valid}
+        rows = self.read_db.execute(
+            select(User.username, User.email).where(
+                or_(User.username.in_(usernames), User.email.in_(emails))
+            )
+        ).all()
+        # 结束只读事务，哈希密码期间不占用连接
+        self.read_db.rollback()
+        return {row.username for row in rows}, {row.email for row in rows}
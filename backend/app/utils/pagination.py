@@ -0,0 +1,70 @@
+"""游标分页工具。
+
+游标是对排序键取值的 URL 安全 Base64 编码（JSON），对客户端不透明，
+服务端解码后作为 keyset 条件使用，翻页耗时与页码深度无关。
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """将排序键取值编码为游标。
+
+    Args:
+        values: 排序键取值，datetime 会转为 ISO 格式字符串
+
+    Returns:
+        不透明的游标字符串
+    """
+    payload = {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """解码游标。
+
+    Args:
+        cursor: 游标字符串
+
+    Returns:
+        排序键取值
+
+    Raises:
+        ValueError: 如果游标格式无效
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("无效的分页游标") from e
+    if not isinstance(payload, dict):
+        raise ValueError("无效的分页游标")
+    return payload
+
+
+def decode_datetime(value: Any) -> datetime:
+    """解析游标中的时间值。
+
+    Args:
+        value: ISO 格式时间字符串
+
+    Returns:
+        时间对象
+
+    Raises:
+        ValueError: 如果格式无效
+    """
+    if not isinstance(value, str):
+        raise ValueError("无效的分页游标")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError as e:
+        raise ValueError("无效的分页游标") from e
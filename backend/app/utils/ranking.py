@@ -0,0 +1,101 @@
+"""任务排序键工具。
+
+排序键是由 0-9a-z 组成的字符串，视为 36 进制小数的小数部分（"i" 即 0.i），
+按字节序比较即得到任务顺序。任意两个键之间总能生成新键，
+因此移动任务时只需改写被移动的那一行。键不以 "0" 结尾，保证始终留有间隙。
+"""
+
+from typing import List, Optional
+
+RANK_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+RANK_BASE = len(RANK_DIGITS)
+
+# 排序键超过该长度时对整列重新分配排序键
+MAX_RANK_LENGTH = 32
+
+
+def _digit(key: str, index: int) -> int:
+    """获取键在指定位置的数值，超出长度视为0。"""
+    return RANK_DIGITS.index(key[index]) if index < len(key) else 0
+
+
+def _rank_after(before: str) -> str:
+    """生成紧随其后的键：在第一个可递增的位上加1，追加到列尾时键长增长缓慢。"""
+    index = 0
+    while _digit(before, index) == RANK_BASE - 1:
+        index += 1
+    return before[:index] + RANK_DIGITS[_digit(before, index) + 1]
+
+
+def _rank_before(after: str) -> str:
+    """生成紧邻其前的键：在第一个非0位上减1，插入到列首时键长增长缓慢。"""
+    index = 0
+    while _digit(after, index) == 0:
+        index += 1
+    digit = _digit(after, index)
+    if digit > 1:
+        return after[:index] + RANK_DIGITS[digit - 1]
+    # 减为0后键会以0结尾，改为在其后补最大数字
+    return after[:index] + "0" + RANK_DIGITS[-1]
+
+
+def rank_between(before: Optional[str], after: Optional[str]) -> str:
+    """生成位于两个排序键之间的新键。
+
+    Args:
+        before: 前一个键，为None表示列首
+        after: 后一个键，为None表示列尾
+
+    Returns:
+        满足 before < 新键 < after 的排序键
+
+    Raises:
+        ValueError: 如果 before 不小于 after
+    """
+    before = before or ""
+    if after is None:
+        return _rank_after(before) if before else RANK_DIGITS[RANK_BASE // 2]
+    if before >= after:
+        raise ValueError("排序键顺序无效")
+    if not before:
+        return _rank_before(after)
+
+    prefix = ""
+    index = 0
+    while True:
+        low = _digit(before, index)
+        high = _digit(after, index) if after is not None else RANK_BASE
+        if high - low > 1:
+            return prefix + RANK_DIGITS[(low + high) // 2]
+        # 该位无间隙：沿用较小的数字继续比较下一位
+        prefix += RANK_DIGITS[low]
+        if high > low:
+            # 此后 after 不再构成上界
+            after = None
+        index += 1
+
+
+def evenly_spaced_ranks(count: int) -> List[str]:
+    """生成均匀分布的一组排序键，用于重新分配整列排序。
+
+    Args:
+        count: 需要的键数量
+
+    Returns:
+        升序排列的排序键列表
+    """
+    # 选择足够的位数，使相邻键之间至少留有 RANK_BASE 个间隙
+    width = 1
+    while RANK_BASE ** width < (count + 1) * RANK_BASE:
+        width += 1
+    step = RANK_BASE ** width // (count + 1)
+
+    ranks = []
+    for i in range(1, count + 1):
+        value = step * i
+        digits = []
+        for _ in range(width):
+            value, remainder = divmod(value, RANK_BASE)
+            digits.append(RANK_DIGITS[remainder])
+        ranks.append("".join(reversed(digits)).rstrip("0"))
+    return ranks
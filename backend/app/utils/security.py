@@ -1,8 +1,15 @@
 """安全工具模块：密码加密和JWT令牌处理。"""
 
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
@@ -38,6 +45,52 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# 批量哈希密码的进程池（惰性创建），bcrypt 为CPU密集型，进程池可避免占用请求线程与GIL
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
+def _hash_workers() -> int:
+    """批量哈希密码的进程数，不超过配置值与CPU核数。"""
+    return max(1, min(settings.PASSWORD_HASH_WORKERS, os.cpu_count() or 1))
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    """获取批量哈希密码的进程池。"""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # 使用 spawn 启动子进程，避免在多线程的服务进程中 fork
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=_hash_workers(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _hash_pool
+
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """批量获取密码哈希，多个密码时在进程池中并行计算。
+
+    Args:
+        passwords: 明文密码列表
+
+    Returns:
+        与输入顺序一致的哈希列表
+    """
+    if len(passwords) <= 1 or settings.PASSWORD_HASH_WORKERS <= 0:
+        return [get_password_hash(password) for password in passwords]
+    chunksize = max(1, len(passwords) // (_hash_workers() * 4))
+    return list(_get_hash_pool().map(get_password_hash, passwords, chunksize=chunksize))
+
+
+def shutdown_hash_pool() -> None:
+    """关闭批量哈希密码的进程池。"""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """创建访问令牌。
 
@@ -66,6 +119,18 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
+# 已验证令牌缓存：令牌摘要 -> 解码后的数据（LRU淘汰）。
+# 客户端在令牌有效期内反复发送同一令牌，命中时跳过签名验证与解析；
+# 过期时间在每次命中时重新检查，黑名单由调用方在解码后检查。
+_verified_tokens: "OrderedDict[bytes, dict]" = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
+
+def _token_digest(token: str) -> bytes:
+    """计算令牌的缓存键。"""
+    return hashlib.sha256(token.encode()).digest()
+
+
 def decode_access_token(token: str) -> Optional[dict]:
     """解码访问令牌。
 
@@ -75,10 +140,46 @@ def decode_access_token(token: str) -> Optional[dict]:
     Returns:
         解码后的数据，如果无效则返回None
     """
+    if settings.TOKEN_CACHE_SIZE <= 0:
+        try:
+            return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        except JWTError:
+            return None
+
+    key = _token_digest(token)
+    with _verified_tokens_lock:
+        payload = _verified_tokens.get(key)
+        if payload is not None:
+            exp = payload.get("exp")
+            if exp is None or exp >= time.time():
+                _verified_tokens.move_to_end(key)
+                return dict(payload)
+            del _verified_tokens[key]
+            return None
+
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        return payload
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except JWTError:
         return None
+
+    with _verified_tokens_lock:
+        _verified_tokens[key] = payload
+        while len(_verified_tokens) > settings.TOKEN_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+    return dict(payload)
+
+
+def forget_access_token(token: str) -> None:
+    """从已验证令牌缓存中移除令牌（登出后调用）。
+
+    Args:
+        token: JWT令牌字符串
+    """
+    with _verified_tokens_lock:
+        _verified_tokens.pop(_token_digest(token), None)
+
+
+def clear_token_cache() -> None:
+    """清空已验证令牌缓存。"""
+    with _verified_tokens_lock:
+        _verified_tokens.clear()
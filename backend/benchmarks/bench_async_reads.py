@@ -0,0 +1,146 @@
+"""基准测试：同步线程池路径与异步路径的看板读取吞吐量对比。
+
+在临时数据库中构造一个看板，分别通过同步（def + 线程池）与
+异步（async def + aiosqlite）两种处理函数并发请求看板详情，
+输出每秒请求数与p50/p99延迟。
+
+用法::
+
+    python -m benchmarks.bench_async_reads --concurrency 200 --requests 2000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# 必须在导入应用模块之前指定数据库，模块导入时即创建引擎
+_TMP_DIR = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TMP_DIR.name) / 'bench.db'}"
+# 连接池需大于线程池上限，否则同步路径会因会话关闭也需要线程而互相等待
+os.environ.setdefault("DB_POOL_SIZE", "50")
+
+import anyio  # noqa: E402
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.models.column import KanbanColumn  # noqa: E402
+from app.models.database import (  # noqa: E402
+    Base,
+    SessionLocal,
+    dispose_async_engines,
+    engine,
+    get_async_read_db,
+    get_read_db,
+)
+from app.models.project import Project  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.project import ProjectDetailResponse  # noqa: E402
+from app.services.project import AsyncProjectService, ProjectService  # noqa: E402
+
+
+def seed(columns: int, tasks_per_column: int) -> int:
+    """写入一个看板，返回项目ID。"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(username="bench", email="bench@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        project = Project(name="基准项目", owner_id=user.id)
+        db.add(project)
+        db.flush()
+        for c in range(columns):
+            column = KanbanColumn(
+                name=f"列{c}", project_id=project.id, position=c, task_count=tasks_per_column
+            )
+            db.add(column)
+            db.flush()
+            db.add_all(
+                Task(title=f"任务{c}-{t}", column_id=column.id, project_id=project.id, position=t)
+                for t in range(tasks_per_column)
+            )
+        db.commit()
+        return project.id
+    finally:
+        db.close()
+
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/sync/projects/{project_id}", response_model=ProjectDetailResponse)
+def sync_board(project_id: int, db: Session = Depends(get_read_db)):
+    """同步路径：在线程池中执行。"""
+    return ProjectService(db).get_project_with_filter(project_id)
+
+
+@bench_app.get("/async/projects/{project_id}", response_model=ProjectDetailResponse)
+async def async_board(project_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """异步路径：在事件循环中执行。"""
+    return await AsyncProjectService(db).get_project_with_filter(project_id)
+
+
+async def run_load(path: str, concurrency: int, total: int) -> dict:
+    """以固定并发数发起请求，统计吞吐量与延迟。"""
+    latencies = []
+    counter = iter(range(total))
+    transport = httpx.ASGITransport(app=bench_app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            for _ in counter:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": total / elapsed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """依次运行同步与异步两条路径。"""
+    # 模拟Starlette默认线程池上限
+    anyio.to_thread.current_default_thread_limiter().total_tokens = args.threads
+    project_id = seed(args.columns, args.tasks)
+
+    print(f"{'路径':<8}{'请求/秒':>12}{'p50(ms)':>12}{'p99(ms)':>12}")
+    for name in ("sync", "async"):
+        result = await run_load(f"/{name}/projects/{project_id}", args.concurrency, args.requests)
+        print(f"{name:<8}{result['rps']:>12.1f}{result['p50']:>12.1f}{result['p99']:>12.1f}")
+    await dispose_async_engines()
+
+
+def main() -> None:
+    """命令行入口。"""
+    parser = argparse.ArgumentParser(description="看板读取同步/异步路径基准")
+    parser.add_argument("--concurrency", type=int, default=200, help="并发客户端数")
+    parser.add_argument("--requests", type=int, default=2000, help="每条路径的请求总数")
+    parser.add_argument("--threads", type=int, default=40, help="线程池上限")
+    parser.add_argument("--columns", type=int, default=5, help="看板列数")
+    parser.add_argument("--tasks", type=int, default=20, help="每列任务数")
+    args = parser.parse_args()
+    try:
+        anyio.run(main_async, args)
+    finally:
+        _TMP_DIR.cleanup()
+
+
+if __name__ == "__main__":
+    main()
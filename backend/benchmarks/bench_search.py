@@ -0,0 +1,140 @@
+"""基准测试：对比 LIKE 模糊匹配与 FTS5 全文检索的查询耗时。
+
+在临时数据库中写入大量任务（及部分评论），对同一组关键词分别执行
+LIKE 模糊匹配（标题、描述、评论，即短词回退路径）与 task_search、comment_search 全文检索，
+均取前20条结果，输出平均与 p99 耗时，并统计重建检索数据的耗时。
+高频词的全文检索需要对所有命中结果计算相关度，低频词则只读取命中行。
+
+用法::
+
+    python -m benchmarks.bench_search --tasks 100000
+"""
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from app.models.database import Base, create_db_engine
+from app.models.search import rebuild_task_search
+from app.services.search import SearchService
+
+COLUMNS = 20
+WORDS = [
+    "登录", "接口", "数据库", "性能", "缓存", "部署", "测试", "文档", "权限", "通知",
+    "search", "index", "release", "refactor", "migration", "dashboard", "export", "report",
+]
+KEYWORDS = ["数据库", "性能优化", "migration", "dashboard export", "不存在的词"]
+
+
+def _random_text(rng: random.Random, words: int) -> str:
+    """生成由随机词组成的文本。"""
+    return " ".join(rng.choice(WORDS) + str(rng.randrange(100)) for _ in range(words))
+
+
+def prepare_database(engine, tasks: int) -> None:
+    """建表并写入用户、项目、列、任务与评论。"""
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "INSERT INTO users (id, username, email, password_hash, role, is_active, created_at) "
+            "VALUES (1, 'bench', 'bench@example.com', 'x', 'owner', 1, CURRENT_TIMESTAMP)"
+        ))
+        conn.execute(text(
+            "INSERT INTO projects (id, name, owner_id, created_at, updated_at) "
+            "VALUES (1, '基准项目', 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+        ))
+        conn.execute(
+            text(
+                "INSERT INTO columns (id, name, project_id, position, created_at, updated_at) "
+                "VALUES (:id, :name, 1, :id, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            [{"id": i, "name": f"列{i}"} for i in range(COLUMNS)],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO tasks (id, title, description, priority, column_id, project_id, "
+                "position, created_at, updated_at) VALUES (:id, :title, :description, 'medium', "
+                ":column_id, 1, :position, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            [
+                {
+                    "id": i + 1,
+                    "title": _random_text(rng, 3),
+                    "description": _random_text(rng, 12),
+                    "column_id": i % COLUMNS,
+                    "position": i // COLUMNS,
+                }
+                for i in range(tasks)
+            ],
+        )
+        conn.execute(
+            text(
+                "INSERT INTO comments (task_id, user_id, content, created_at) "
+                "VALUES (:task_id, 1, :content, CURRENT_TIMESTAMP)"
+            ),
+            [
+                {"task_id": rng.randrange(tasks) + 1, "content": _random_text(rng, 8)}
+                for _ in range(tasks // 10)
+            ],
+        )
+
+
+def _timed(func, repeat: int) -> list:
+    """重复执行并返回每次耗时（毫秒）。"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label: str, samples: list) -> None:
+    """输出耗时统计。"""
+    ordered = sorted(samples)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<32}{statistics.mean(samples):>10.2f}{p99:>10.2f}")
+
+
+def main() -> None:
+    """命令行入口。"""
+    parser = argparse.ArgumentParser(description="全文检索基准")
+    parser.add_argument("--tasks", type=int, default=100000, help="任务数")
+    parser.add_argument("--repeat", type=int, default=20, help="每个关键词的查询次数")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        start = time.perf_counter()
+        prepare_database(engine, args.tasks)
+        print(f"写入 {args.tasks} 个任务（含触发器同步）：{time.perf_counter() - start:.1f} 秒")
+
+        with engine.begin() as conn:
+            start = time.perf_counter()
+            rebuild_task_search(conn)
+        print(f"重建检索数据：{time.perf_counter() - start:.1f} 秒\n")
+
+        db = sessionmaker(bind=engine)()
+        service = SearchService(db)
+        print(f"{'查询':<32}{'平均ms':>10}{'p99ms':>10}")
+        for keyword in KEYWORDS:
+            like = _timed(
+                lambda keyword=keyword: service._search_tasks_by_like(keyword, project_id=1, limit=20),
+                args.repeat,
+            )
+            fts = _timed(lambda keyword=keyword: service.search_tasks(keyword, project_id=1), args.repeat)
+            _report(f"LIKE  {keyword}", like)
+            _report(f"FTS5  {keyword}", fts)
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
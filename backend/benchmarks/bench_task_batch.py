@@ -0,0 +1,153 @@
+"""基准测试：批量任务操作接口与逐个调用单任务服务的吞吐量对比。
+
+在临时数据库中构造一个看板，分别以逐个调用 TaskService 与一次
+TaskBatchService 批量提交的方式执行相同的创建、更新、移动、删除操作，
+输出每秒处理的操作数。
+
+用法::
+
+    python -m benchmarks.bench_task_batch --operations 10000
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+# 必须在导入应用模块之前指定数据库，模块导入时即创建引擎
+_TMP_DIR = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(_TMP_DIR.name) / 'bench.db'}"
+
+from app.models.column import KanbanColumn  # noqa: E402
+from app.models.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.project import Project  # noqa: E402
+from app.models.task import Task  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.task import (  # noqa: E402
+    TaskBatchCreate,
+    TaskBatchDelete,
+    TaskBatchMove,
+    TaskBatchUpdate,
+    TaskCreate,
+    TaskUpdate,
+)
+from app.services.task import TaskService  # noqa: E402
+from app.services.task_batch import TaskBatchService  # noqa: E402
+
+
+def seed(columns: int, tasks_per_column: int) -> tuple:
+    """写入一个看板，返回 (列ID列表, 任务ID列表)。"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        user = User(username="bench", email="bench@example.com", password_hash="x")
+        db.add(user)
+        db.flush()
+        project = Project(name="基准项目", owner_id=user.id, column_count=columns)
+        db.add(project)
+        db.flush()
+        column_ids = []
+        tasks = []
+        for c in range(columns):
+            column = KanbanColumn(
+                name=f"列{c}", project_id=project.id, position=c, task_count=tasks_per_column
+            )
+            db.add(column)
+            db.flush()
+            column_ids.append(column.id)
+            tasks.extend(
+                Task(title=f"任务{c}-{t}", column_id=column.id, project_id=project.id, position=t)
+                for t in range(tasks_per_column)
+            )
+        db.add_all(tasks)
+        project.task_count = len(tasks)
+        db.commit()
+        return column_ids, [task.id for task in tasks]
+    finally:
+        db.close()
+
+
+def build_operations(count: int, column_ids: list, task_ids: list) -> list:
+    """生成创建、更新、移动、删除各占四分之一的操作序列，每个任务最多被删除一次。"""
+    rng = random.Random(42)
+    deletable = iter(rng.sample(task_ids, len(task_ids)))
+    operations = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            operations.append(TaskBatchCreate(
+                op="create", column_id=rng.choice(column_ids), data=TaskCreate(title=f"新任务{index}")
+            ))
+        elif kind == 1:
+            operations.append(TaskBatchUpdate(
+                op="update", task_id=rng.choice(task_ids), data=TaskUpdate(title=f"更新{index}")
+            ))
+        elif kind == 2:
+            operations.append(TaskBatchMove(
+                op="move",
+                task_id=rng.choice(task_ids),
+                target_column_id=rng.choice(column_ids),
+                position=rng.randrange(50),
+            ))
+        else:
+            operations.append(TaskBatchDelete(op="delete", task_id=next(deletable)))
+    return operations
+
+
+def run_single(operations: list) -> float:
+    """逐个调用单任务服务，返回耗时（秒）。"""
+    db = SessionLocal()
+    service = TaskService(db)
+    started = time.perf_counter()
+    try:
+        for op in operations:
+            if op.op == "create":
+                service.create_task(op.data, op.column_id)
+            elif op.op == "update":
+                service.update_task(op.task_id, op.data)
+            elif op.op == "move":
+                service.move_task(op.task_id, op.target_column_id, op.position)
+            else:
+                service.delete_task(op.task_id)
+    finally:
+        db.close()
+    return time.perf_counter() - started
+
+
+def run_batch(operations: list) -> float:
+    """一次批量提交，返回耗时（秒）。"""
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        TaskBatchService(db).apply(operations, lambda project: True)
+    finally:
+        db.close()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """命令行入口。"""
+    parser = argparse.ArgumentParser(description="批量任务操作基准")
+    parser.add_argument("--operations", type=int, default=10000, help="批量操作数")
+    parser.add_argument("--single", type=int, default=1000, help="逐个调用的操作数")
+    parser.add_argument("--columns", type=int, default=5, help="看板列数")
+    parser.add_argument("--tasks", type=int, default=2000, help="每列初始任务数")
+    args = parser.parse_args()
+    try:
+        column_ids, task_ids = seed(args.columns, args.tasks)
+        single_ops = build_operations(args.single, column_ids, task_ids[: len(task_ids) // 2])
+        batch_ops = build_operations(args.operations, column_ids, task_ids[len(task_ids) // 2:])
+
+        print(f"{'方式':<8}{'操作数':>10}{'耗时(s)':>12}{'操作/秒':>12}")
+        for name, ops, runner in (("single", single_ops, run_single), ("batch", batch_ops, run_batch)):
+            elapsed = runner(ops)
+            print(f"{name:<8}{len(ops):>10}{elapsed:>12.2f}{len(ops) / elapsed:>12.1f}")
+    finally:
+        engine.dispose()
+        _TMP_DIR.cleanup()
+
+
+if __name__ == "__main__":
+    main()
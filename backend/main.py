@@ -1,16 +1,48 @@
 """看板系统后端入口文件。"""
 
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router as api_router
 from app.config import settings
-from app.models.database import init_db
+from app.models.database import dispose_async_engines, init_db
+from app.services.archive import run_archive_loop
+from app.services.principal_cache import principal_cache
+from app.services.purge import run_purge_loop
+from app.utils.security import shutdown_hash_pool
 
 # 导入模型以确保表被创建
 from app.models import user  # noqa: F401
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """应用生命周期：启动后台归档、清理任务；关闭时停止后台任务并释放异步数据库连接与密码哈希进程池。
+
+    Args:
+        app: FastAPI应用实例
+    """
+    # 用户可能在应用之外被修改（如命令行工具），启动时不沿用已缓存的鉴权信息
+    principal_cache.clear()
+    jobs = []
+    if settings.ARCHIVE_AFTER_DAYS > 0 and settings.ARCHIVE_INTERVAL_SECONDS > 0:
+        jobs.append(asyncio.create_task(run_archive_loop()))
+    if settings.PURGE_INTERVAL_SECONDS > 0:
+        jobs.append(asyncio.create_task(run_purge_loop()))
+    yield
+    for job in jobs:
+        job.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await job
+    await dispose_async_engines()
+    shutdown_hash_pool()
+
+
 def create_app() -> FastAPI:
     """创建并配置FastAPI应用实例。
 
@@ -21,6 +53,7 @@ def create_app() -> FastAPI:
         title="看板系统",
         description="看板系统后端API服务",
         version="0.1.0",
+        lifespan=lifespan,
     )
 
     # 配置CORS - 使用配置文件中的允许来源
@@ -30,6 +63,8 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # 分页接口通过响应头返回游标与总数；看板详情通过 ETag 支持条件请求
+        expose_headers=["X-Total-Count", "X-Next-Cursor", "X-Latest-Cursor", "X-Has-More", "ETag"],
     )
 
     # 注册路由
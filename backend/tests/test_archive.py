@@ -0,0 +1,359 @@
+"""任务归档测试模块。"""
+
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+
+from main import app
+from app.config import settings
+from app.models.archive import ArchivedComment, ArchivedTask
+from app.models.database import Base, engine, SessionLocal, utc_now
+from app.models.user import User
+from app.models.project import Project
+from app.models.column import KanbanColumn
+from app.models.task import Task
+from app.models.comment import Comment
+from app.services.archive import ArchiveService
+from app.services.purge import PurgeService
+
+
+@pytest.fixture(scope="function")
+def client():
+    """创建测试客户端。"""
+    Base.metadata.create_all(bind=engine)
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    # 清理测试数据
+    db = SessionLocal()
+    try:
+        db.query(ArchivedComment).delete()
+        db.query(ArchivedTask).delete()
+        db.query(Comment).delete()
+        db.query(Task).delete()
+        db.query(KanbanColumn).delete()
+        db.query(Project).delete()
+        db.query(User).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+def _login(client, username, email):
+    """注册并登录用户，返回认证头。"""
+    client.post("/api/auth/register", json={
+        "username": username,
+        "email": email,
+        "password": "testpassword123",
+    })
+    login_response = client.post("/api/auth/login", json={
+        "username": username,
+        "password": "testpassword123",
+    })
+    return {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+
+@pytest.fixture
+def auth_headers(client):
+    """创建认证用户并返回认证头（第一个用户自动成为所有者）。"""
+    return _login(client, "testuser", "test@example.com")
+
+
+@pytest.fixture
+def board(client, auth_headers):
+    """创建项目：最后一列有 A、B、C、D 四个任务，第一列有一个任务。
+
+    A、C 与第一列的任务均在40天前进入所在列，A 带一条评论。
+    """
+    project_id = client.post(
+        "/api/projects", json={"name": "归档项目"}, headers=auth_headers
+    ).json()["id"]
+    columns = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"]
+    first_id, last_id = columns[0]["id"], columns[-1]["id"]
+
+    task_ids = {}
+    for title in ["A", "B", "C", "D"]:
+        task_ids[title] = client.post(
+            f"/api/columns/{last_id}/tasks", json={"title": title}, headers=auth_headers
+        ).json()["id"]
+    task_ids["todo"] = client.post(
+        f"/api/columns/{first_id}/tasks", json={"title": "todo"}, headers=auth_headers
+    ).json()["id"]
+    client.post(
+        f"/api/tasks/{task_ids['A']}/comments", json={"content": "归档前的评论"}, headers=auth_headers
+    )
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(Task)
+            .where(Task.id.in_([task_ids["A"], task_ids["C"], task_ids["todo"]]))
+            .values(column_entered_at=utc_now() - timedelta(days=40))
+        )
+        db.commit()
+    finally:
+        db.close()
+    return {
+        "project_id": project_id,
+        "first_column_id": first_id,
+        "last_column_id": last_id,
+        "task_ids": task_ids,
+    }
+
+
+def _archive(days=30, batch_size=None):
+    """执行一次归档，返回归档的任务数。"""
+    db = SessionLocal()
+    try:
+        return ArchiveService(db).archive_stale_tasks(days, batch_size)
+    finally:
+        db.close()
+
+
+def _last_column(client, auth_headers, project_id):
+    """获取看板最后一列。"""
+    detail = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+    return detail, detail["columns"][-1]
+
+
+class TestArchivePolicy:
+    """归档策略测试。"""
+
+    def test_archives_stale_tasks_in_last_column(self, client, auth_headers, board):
+        """测试只归档进入最后一列超期的任务。"""
+        assert _archive(batch_size=1) == 2
+
+        detail, column = _last_column(client, auth_headers, board["project_id"])
+        assert [(task["title"], task["position"]) for task in column["tasks"]] == [("B", 0), ("D", 1)]
+        assert column["task_count"] == 2
+        assert detail["task_count"] == 3
+        assert detail["columns"][0]["tasks"][0]["title"] == "todo"
+
+        db = SessionLocal()
+        try:
+            archived = db.query(ArchivedTask).order_by(ArchivedTask.task_id).all()
+            assert [task.title for task in archived] == ["A", "C"]
+            assert archived[0].task_id == board["task_ids"]["A"]
+            assert archived[0].column_id == board["last_column_id"]
+            comments = db.query(ArchivedComment).all()
+            assert [comment.archived_task_id for comment in comments] == [archived[0].id]
+            assert db.query(Comment).count() == 0
+        finally:
+            db.close()
+
+    def test_batches_close_position_gaps_once(self, client, auth_headers, board):
+        """测试分批归档只在最后一批之后补齐一次位置空缺，且只改写位置变化的任务。"""
+        rewritten = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("UPDATE tasks SET position"):
+                rewritten.extend(parameters if executemany else [parameters])
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            assert _archive(batch_size=1) == 2
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        # A、C 移走后只有 B、D 需要前移
+        assert len(rewritten) == 2
+        _, column = _last_column(client, auth_headers, board["project_id"])
+        assert [(task["title"], task["position"]) for task in column["tasks"]] == [("B", 0), ("D", 1)]
+
+    def test_archived_tasks_leave_search(self, client, auth_headers, board):
+        """测试归档任务不再出现在全文检索中。"""
+        _archive()
+        response = client.get("/api/search", params={"q": "归档前的评论"}, headers=auth_headers)
+        assert response.json() == []
+
+    def test_recent_tasks_are_kept(self, client, auth_headers, board):
+        """测试未超期的任务不归档。"""
+        assert _archive(days=60) == 0
+
+    def test_move_resets_column_entry_time(self, client, auth_headers, board):
+        """测试刚移入最后一列的任务不归档。"""
+        client.put(
+            f"/api/tasks/{board['task_ids']['todo']}/move",
+            json={"target_column_id": board["last_column_id"], "position": 0},
+            headers=auth_headers,
+        )
+        assert _archive() == 2
+        _, column = _last_column(client, auth_headers, board["project_id"])
+        assert [task["title"] for task in column["tasks"]] == ["todo", "B", "D"]
+
+    def test_default_days_from_settings(self, client, auth_headers, board, monkeypatch):
+        """测试默认使用配置的归档天数。"""
+        monkeypatch.setattr(settings, "ARCHIVE_AFTER_DAYS", 50)
+        assert _archive(days=None) == 0
+
+
+class TestArchiveBrowse:
+    """归档任务浏览与检索测试。"""
+
+    def test_browse_and_paginate(self, client, auth_headers, board):
+        """测试按页浏览归档任务。"""
+        _archive()
+        project_id = board["project_id"]
+        first = client.get(
+            f"/api/projects/{project_id}/archive", params={"limit": 1}, headers=auth_headers
+        ).json()
+        assert first["has_more"] is True
+        second = client.get(
+            f"/api/projects/{project_id}/archive",
+            params={"limit": 1, "cursor": first["next_cursor"]},
+            headers=auth_headers,
+        ).json()
+        assert second["has_more"] is False
+        titles = {first["items"][0]["title"], second["items"][0]["title"]}
+        assert titles == {"A", "C"}
+
+    def test_search_matches_comments(self, client, auth_headers, board):
+        """测试检索词可匹配归档评论。"""
+        _archive()
+        response = client.get(
+            f"/api/projects/{board['project_id']}/archive",
+            params={"q": "评论"},
+            headers=auth_headers,
+        )
+        assert [task["title"] for task in response.json()["items"]] == ["A"]
+
+    def test_detail_includes_comments(self, client, auth_headers, board):
+        """测试归档任务详情包含评论。"""
+        _archive()
+        items = client.get(
+            f"/api/projects/{board['project_id']}/archive", params={"q": "A"}, headers=auth_headers
+        ).json()["items"]
+        detail = client.get(f"/api/archive/tasks/{items[0]['id']}", headers=auth_headers).json()
+        assert detail["title"] == "A"
+        assert [comment["content"] for comment in detail["comments"]] == ["归档前的评论"]
+
+    def test_invalid_cursor(self, client, auth_headers, board):
+        """测试无效游标返回400。"""
+        response = client.get(
+            f"/api/projects/{board['project_id']}/archive",
+            params={"cursor": "bad"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+
+
+def _archived_id(title):
+    """按标题取归档ID。"""
+    db = SessionLocal()
+    try:
+        return db.query(ArchivedTask.id).filter(ArchivedTask.title == title).scalar()
+    finally:
+        db.close()
+
+
+class TestUnarchive:
+    """恢复归档任务测试。"""
+
+    def test_unarchive_at_position(self, client, auth_headers, board):
+        """测试恢复到指定位置并带回评论。"""
+        _archive()
+        response = client.post(
+            f"/api/archive/tasks/{_archived_id('A')}/unarchive",
+            json={"position": 1},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+        task = response.json()
+        assert (task["column_id"], task["position"]) == (board["last_column_id"], 1)
+
+        detail, column = _last_column(client, auth_headers, board["project_id"])
+        assert [(t["title"], t["position"]) for t in column["tasks"]] == [("B", 0), ("A", 1), ("D", 2)]
+        assert column["task_count"] == 3
+        assert detail["task_count"] == 4
+        comments = client.get(f"/api/tasks/{task['id']}/comments", headers=auth_headers).json()
+        assert [comment["content"] for comment in comments] == ["归档前的评论"]
+        assert _archived_id("A") is None
+
+    def test_unarchive_keeps_comments_of_deleted_users(self, client, auth_headers, board):
+        """测试作者已删除的归档评论照常恢复，作者置空。"""
+        member_headers = _login(client, "member", "member@example.com")
+        member_id = client.get("/api/auth/me", headers=member_headers).json()["id"]
+        db = SessionLocal()
+        try:
+            db.add(Comment(task_id=board["task_ids"]["A"], user_id=member_id, content="成员的评论"))
+            db.commit()
+        finally:
+            db.close()
+        _archive()
+        assert client.delete(f"/api/users/{member_id}", headers=auth_headers).status_code == 204
+
+        archived_id = _archived_id("A")
+        detail = client.get(f"/api/archive/tasks/{archived_id}", headers=auth_headers).json()
+        assert {
+            (comment["content"], comment["user_id"] is None) for comment in detail["comments"]
+        } == {("成员的评论", True), ("归档前的评论", False)}
+
+        task = client.post(
+            f"/api/archive/tasks/{archived_id}/unarchive", json={}, headers=auth_headers
+        ).json()
+        comments = client.get(f"/api/tasks/{task['id']}/comments", headers=auth_headers).json()
+        assert {(comment["content"], comment["user"] is None) for comment in comments} == {
+            ("成员的评论", True),
+            ("归档前的评论", False),
+        }
+
+    def test_unarchive_to_other_column(self, client, auth_headers, board):
+        """测试恢复到同项目的其他列，默认追加到列尾。"""
+        _archive()
+        task = client.post(
+            f"/api/archive/tasks/{_archived_id('C')}/unarchive",
+            json={"column_id": board["first_column_id"]},
+            headers=auth_headers,
+        ).json()
+        assert (task["column_id"], task["position"]) == (board["first_column_id"], 1)
+
+    def test_unarchive_rank_mode(self, client, auth_headers, board, monkeypatch):
+        """测试rank模式下恢复到指定位置。"""
+        _archive()
+        monkeypatch.setattr(settings, "TASK_ORDERING", "rank")
+        task = client.post(
+            f"/api/archive/tasks/{_archived_id('A')}/unarchive",
+            json={"position": 0},
+            headers=auth_headers,
+        ).json()
+        assert task["position"] == 0
+        _, column = _last_column(client, auth_headers, board["project_id"])
+        assert [t["title"] for t in column["tasks"]] == ["A", "B", "D"]
+
+    def test_unarchive_deleted_column_requires_target(self, client, auth_headers, board):
+        """测试原所在列已删除时需指定目标列。"""
+        _archive()
+        client.delete(f"/api/columns/{board['last_column_id']}", headers=auth_headers)
+        response = client.post(
+            f"/api/archive/tasks/{_archived_id('A')}/unarchive", json={}, headers=auth_headers
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "原所在列已删除，请指定目标列"
+
+    def test_unarchive_forbidden(self, client, auth_headers, board):
+        """测试非项目所有者不能恢复归档任务。"""
+        _archive()
+        other_headers = _login(client, "otheruser", "other@example.com")
+        response = client.post(
+            f"/api/archive/tasks/{_archived_id('A')}/unarchive", json={}, headers=other_headers
+        )
+        assert response.status_code == 403
+
+    def test_purge_deleted_project_removes_archive(self, client, auth_headers, board):
+        """测试已删除项目的归档任务对外不可见，清理项目时一并删除。"""
+        _archive()
+        archived_id = _archived_id("A")
+        client.delete(f"/api/projects/{board['project_id']}", headers=auth_headers)
+        response = client.get(f"/api/archive/tasks/{archived_id}", headers=auth_headers)
+        assert response.status_code == 404
+
+        db = SessionLocal()
+        try:
+            PurgeService(db).purge_expired(retention_days=0)
+            assert db.query(ArchivedTask).count() == 0
+            assert db.query(ArchivedComment).count() == 0
+        finally:
+            db.close()
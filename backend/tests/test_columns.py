@@ -2,6 +2,7 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from main import app
 from app.models.database import Base, engine, SessionLocal
@@ -9,6 +10,7 @@ from app.models.user import User
 from app.models.project import Project
 from app.models.column import KanbanColumn
 from app.models.task import Task
+from app.services.purge import PurgeService
 
 
 @pytest.fixture(scope="function")
@@ -159,6 +161,113 @@ class TestColumnDelete:
         assert positions == [0, 1]
 
 
+class TestColumnSoftDelete:
+    """列软删除与恢复测试。"""
+
+    def _board(self, client, auth_headers, project_id):
+        """获取看板。"""
+        return client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+
+    def _add_tasks(self, client, auth_headers, column_id, count):
+        """在列中创建任务，返回任务ID列表。"""
+        return [
+            client.post(
+                f"/api/columns/{column_id}/tasks", json={"title": f"任务{i}"}, headers=auth_headers
+            ).json()["id"]
+            for i in range(count)
+        ]
+
+    def test_deleted_column_tasks_hidden(self, client, auth_headers, project_id):
+        """测试删除列后列中的任务不可见也不可修改。"""
+        column_id = self._board(client, auth_headers, project_id)["columns"][0]["id"]
+        task_ids = self._add_tasks(client, auth_headers, column_id, 2)
+        client.delete(f"/api/columns/{column_id}", headers=auth_headers)
+
+        response = client.put(
+            f"/api/tasks/{task_ids[0]}", json={"title": "新标题"}, headers=auth_headers
+        )
+        assert response.status_code == 404
+        response = client.get(f"/api/columns/{column_id}/tasks", headers=auth_headers)
+        assert response.status_code == 404
+        board = self._board(client, auth_headers, project_id)
+        assert (board["task_count"], board["column_count"]) == (0, 2)
+
+    def test_restore_column(self, client, auth_headers, project_id):
+        """测试恢复列回到原位置，任务与计数器一并恢复。"""
+        columns = self._board(client, auth_headers, project_id)["columns"]
+        column_id = columns[1]["id"]
+        self._add_tasks(client, auth_headers, column_id, 2)
+        client.delete(f"/api/columns/{column_id}", headers=auth_headers)
+
+        response = client.post(f"/api/columns/{column_id}/restore", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["position"] == 1
+
+        board = self._board(client, auth_headers, project_id)
+        assert [column["id"] for column in board["columns"]] == [column["id"] for column in columns]
+        assert [column["position"] for column in board["columns"]] == [0, 1, 2]
+        assert (board["task_count"], board["column_count"]) == (2, 3)
+        assert len(board["columns"][1]["tasks"]) == 2
+
+    def test_restore_column_appends_when_columns_removed(self, client, auth_headers, project_id):
+        """测试原位置超出当前列数时恢复到末尾。"""
+        columns = self._board(client, auth_headers, project_id)["columns"]
+        client.delete(f"/api/columns/{columns[2]['id']}", headers=auth_headers)
+        client.delete(f"/api/columns/{columns[0]['id']}", headers=auth_headers)
+
+        response = client.post(f"/api/columns/{columns[2]['id']}/restore", headers=auth_headers)
+        assert response.json()["position"] == 1
+        board = self._board(client, auth_headers, project_id)
+        assert [column["id"] for column in board["columns"]] == [columns[1]["id"], columns[2]["id"]]
+
+    def test_restore_column_of_deleted_project(self, client, auth_headers, project_id):
+        """测试所属项目已删除时不能恢复列。"""
+        column_id = self._board(client, auth_headers, project_id)["columns"][0]["id"]
+        client.delete(f"/api/columns/{column_id}", headers=auth_headers)
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+
+        response = client.post(f"/api/columns/{column_id}/restore", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_purge_expired_column(self, client, auth_headers, project_id):
+        """测试后台清理分批删除超过恢复期限的列及其任务。"""
+        column_id = self._board(client, auth_headers, project_id)["columns"][0]["id"]
+        self._add_tasks(client, auth_headers, column_id, 5)
+        client.delete(f"/api/columns/{column_id}", headers=auth_headers)
+
+        db = SessionLocal()
+        try:
+            assert PurgeService(db).purge_expired(retention_days=0, batch_size=2) == 1
+            assert db.query(KanbanColumn).filter(KanbanColumn.id == column_id).count() == 0
+            assert db.query(Task).filter(Task.column_id == column_id).count() == 0
+        finally:
+            db.close()
+        response = client.post(f"/api/columns/{column_id}/restore", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_purge_column_statements_independent_of_size(self, client, auth_headers, project_id):
+        """测试清理列时任务与评论由数据库级联删除，语句数与任务数、评论数无关。"""
+        column_id = self._board(client, auth_headers, project_id)["columns"][0]["id"]
+        for task_id in self._add_tasks(client, auth_headers, column_id, 10):
+            client.post(f"/api/tasks/{task_id}/comments", json={"content": "评论"}, headers=auth_headers)
+        client.delete(f"/api/columns/{column_id}", headers=auth_headers)
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        db = SessionLocal()
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            PurgeService(db).purge_column(column_id, batch_size=100)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+            db.close()
+        # 一批删除任务、一次确认没有剩余任务、删除列
+        assert len([s for s in statements if s.startswith("DELETE")]) == 3
+        assert not any("comments" in statement for statement in statements)
+
+
 class TestColumnReorder:
     """列排序测试。"""
 
@@ -184,6 +293,40 @@ class TestColumnReorder:
         new_ids = [col["id"] for col in columns]
         assert new_ids == reversed_ids
 
+    def test_reorder_columns_uses_single_statements(self, client, auth_headers, project_id):
+        """测试列排序只执行一次批量校验查询和一条UPDATE。"""
+        for i in range(7):
+            client.post(
+                f"/api/projects/{project_id}/columns",
+                json={"name": f"列{i}"},
+                headers=auth_headers,
+            )
+        detail_response = client.get(f"/api/projects/{project_id}", headers=auth_headers)
+        reversed_ids = list(reversed([col["id"] for col in detail_response.json()["columns"]]))
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "columns" in statement:
+                statements.append(" ".join(statement.split()).upper())
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            response = client.put(
+                "/api/columns/reorder",
+                json={"column_ids": reversed_ids},
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        assert response.status_code == 200
+        assert [col["id"] for col in response.json()] == reversed_ids
+        assert [col["position"] for col in response.json()] == list(range(10))
+        updates = [s for s in statements if s.startswith("UPDATE COLUMNS")]
+        lookups = [s for s in statements if s.startswith("SELECT") and "COLUMNS.ID IN" in s]
+        assert len(updates) == 1
+        assert len(lookups) == 1
+
     def test_reorder_columns_empty_list(self, client, auth_headers):
         """测试空列表排序。"""
         response = client.put(
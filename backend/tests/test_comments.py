@@ -2,9 +2,10 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from main import app
-from app.models.database import Base, engine, SessionLocal
+from app.models.database import Base, async_read_engine, engine, SessionLocal
 from app.models.user import User
 from app.models.project import Project
 from app.models.column import KanbanColumn
@@ -243,6 +244,99 @@ class TestCommentList:
         assert "id" in data[0]["user"]
 
 
+class TestCommentPagination:
+    """评论游标分页测试。"""
+
+    def _create_comments(self, client, auth_headers, task_id, count):
+        """按顺序创建评论，返回按时间倒序的评论ID。"""
+        ids = [
+            client.post(
+                f"/api/tasks/{task_id}/comments",
+                json={"content": f"评论{i}"},
+                headers=auth_headers,
+            ).json()["id"]
+            for i in range(count)
+        ]
+        return list(reversed(ids))
+
+    def _get(self, client, auth_headers, task_id, **params):
+        """获取一页评论。"""
+        return client.get(f"/api/tasks/{task_id}/comments", params=params, headers=auth_headers)
+
+    def test_before_cursor_walks_pages(self, client, auth_headers, task_id):
+        """测试通过 before 游标依次获取更早的评论。"""
+        expected = self._create_comments(client, auth_headers, task_id, 5)
+
+        seen = []
+        params = {"limit": 2}
+        for _ in range(3):
+            response = self._get(client, auth_headers, task_id, **params)
+            assert response.headers["X-Total-Count"] == "5"
+            seen.extend(comment["id"] for comment in response.json())
+            params["before"] = response.headers.get("X-Next-Cursor")
+            assert response.headers["X-Has-More"] == ("true" if params["before"] else "false")
+        assert seen == expected
+        assert params["before"] is None
+
+    def test_after_cursor_returns_new_comments(self, client, auth_headers, task_id):
+        """测试通过 after 游标只获取新增的评论。"""
+        self._create_comments(client, auth_headers, task_id, 2)
+        response = self._get(client, auth_headers, task_id)
+        latest = response.headers["X-Latest-Cursor"]
+
+        response = self._get(client, auth_headers, task_id, after=latest)
+        assert response.json() == []
+        assert response.headers["X-Latest-Cursor"] == latest
+        assert response.headers["X-Has-More"] == "false"
+
+        new_ids = self._create_comments(client, auth_headers, task_id, 3)
+        response = self._get(client, auth_headers, task_id, after=latest, limit=2)
+        # 紧随游标的两条评论，仍按时间倒序排列
+        assert [comment["id"] for comment in response.json()] == new_ids[1:]
+        assert response.headers["X-Has-More"] == "true"
+        response = self._get(
+            client, auth_headers, task_id, after=response.headers["X-Latest-Cursor"]
+        )
+        assert [comment["id"] for comment in response.json()] == new_ids[:1]
+        assert response.headers["X-Has-More"] == "false"
+
+    def test_invalid_cursor(self, client, auth_headers, task_id):
+        """测试无效游标或同时指定 before 与 after 返回400。"""
+        self._create_comments(client, auth_headers, task_id, 1)
+        cursor = self._get(client, auth_headers, task_id).headers["X-Latest-Cursor"]
+        assert self._get(client, auth_headers, task_id, before="bad").status_code == 400
+        assert self._get(client, auth_headers, task_id, after="e30").status_code == 400
+        response = self._get(client, auth_headers, task_id, before=cursor, after=cursor)
+        assert response.status_code == 400
+
+    def test_page_query_uses_index_order(self, client, auth_headers, task_id):
+        """测试分页查询直接按索引顺序读取，不扫描评论表也不额外排序。"""
+        self._create_comments(client, auth_headers, task_id, 3)
+        cursor = self._get(client, auth_headers, task_id, limit=1).headers["X-Next-Cursor"]
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM comments" in statement:
+                statements.append((statement, parameters))
+
+        event.listen(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            self._get(client, auth_headers, task_id, before=cursor, limit=1)
+            self._get(client, auth_headers, task_id, after=cursor, limit=1)
+        finally:
+            event.remove(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+
+        assert statements
+        with engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = " ".join(
+                    row[-1]
+                    for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                )
+                assert "ix_comments_task_id_created_at" in plan
+                assert "TEMP B-TREE" not in plan
+
+
 class TestCommentDelete:
     """评论删除测试。"""
 
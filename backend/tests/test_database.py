@@ -0,0 +1,184 @@
+"""数据库引擎工厂测试模块。"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from app.config import settings
+from app.models.database import (
+    SQLITE_TUNING_PROFILES,
+    create_async_db_engine,
+    create_db_engine,
+    get_database_url,
+    get_tuning_profile,
+    is_sqlite_memory_url,
+    make_async_url,
+    make_read_only_url,
+)
+
+
+def _pragma(engine, name):
+    """读取单个PRAGMA的当前值。"""
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestDatabaseUrl:
+    """数据库URL解析测试。"""
+
+    def test_database_url_from_settings(self, monkeypatch):
+        """测试优先使用配置中的DATABASE_URL。"""
+        monkeypatch.setattr(settings, "DATABASE_URL", "sqlite:////tmp/custom.db")
+        assert get_database_url() == "sqlite:////tmp/custom.db"
+
+    def test_database_url_default(self, monkeypatch):
+        """测试未配置时使用默认数据文件。"""
+        monkeypatch.setattr(settings, "DATABASE_URL", None)
+        assert get_database_url().endswith("/data/kanban.db")
+
+    def test_is_sqlite_memory_url(self):
+        """测试内存库URL识别。"""
+        assert is_sqlite_memory_url("sqlite://")
+        assert is_sqlite_memory_url("sqlite:///:memory:")
+        assert not is_sqlite_memory_url("sqlite:///data/kanban.db")
+
+
+class TestEngineFactory:
+    """引擎工厂测试。"""
+
+    def test_default_profile_enables_wal(self, tmp_path):
+        """测试默认配置档启用WAL及相关PRAGMA。"""
+        engine = create_db_engine(f"sqlite:///{tmp_path}/wal.db", profile="default")
+        try:
+            assert _pragma(engine, "journal_mode") == "wal"
+            assert _pragma(engine, "synchronous") == 1  # NORMAL
+            assert _pragma(engine, "busy_timeout") == 5000
+            assert _pragma(engine, "cache_size") == -20000
+            assert _pragma(engine, "temp_store") == 2  # MEMORY
+        finally:
+            engine.dispose()
+
+    def test_foreign_keys_enabled_for_every_profile(self, tmp_path):
+        """测试任何配置档的读写连接都开启外键检查。"""
+        url = f"sqlite:///{tmp_path}/fk.db"
+        for profile in SQLITE_TUNING_PROFILES:
+            engine = create_db_engine(url, profile=profile)
+            try:
+                assert _pragma(engine, "foreign_keys") == 1
+            finally:
+                engine.dispose()
+        read_engine = create_db_engine(url, read_only=True)
+        try:
+            assert _pragma(read_engine, "foreign_keys") == 1
+        finally:
+            read_engine.dispose()
+
+    def test_legacy_profile_keeps_rollback_journal(self, tmp_path):
+        """测试legacy配置档保持回滚日志模式。"""
+        engine = create_db_engine(f"sqlite:///{tmp_path}/legacy.db", profile="legacy")
+        try:
+            assert _pragma(engine, "journal_mode") == "delete"
+        finally:
+            engine.dispose()
+
+    def test_file_engine_pool_sizing(self, tmp_path, monkeypatch):
+        """测试文件库使用显式大小的连接池。"""
+        monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+        monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 2)
+        engine = create_db_engine(f"sqlite:///{tmp_path}/pool.db")
+        try:
+            assert isinstance(engine.pool, QueuePool)
+            assert engine.pool.size() == 3
+            assert engine.pool._max_overflow == 2
+        finally:
+            engine.dispose()
+
+    def test_memory_engine_uses_static_pool(self):
+        """测试内存库共享单一连接。"""
+        engine = create_db_engine("sqlite://")
+        try:
+            assert isinstance(engine.pool, StaticPool)
+        finally:
+            engine.dispose()
+
+    def test_unknown_profile(self):
+        """测试未知配置档抛出错误。"""
+        with pytest.raises(ValueError):
+            get_tuning_profile("turbo")
+
+
+class TestReadWriteSplit:
+    """读写分离引擎测试。"""
+
+    @pytest.fixture
+    def engines(self, tmp_path):
+        """创建共享同一数据文件的写引擎与只读引擎。"""
+        url = f"sqlite:///{tmp_path}/split.db"
+        write_engine = create_db_engine(url, pool_size=1, max_overflow=0)
+        with write_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        read_engine = create_db_engine(url, read_only=True)
+        yield write_engine, read_engine
+        read_engine.dispose()
+        write_engine.dispose()
+
+    def test_make_read_only_url(self):
+        """测试只读URI转换。"""
+        assert make_read_only_url("sqlite:////tmp/a.db") == "sqlite:///file:/tmp/a.db?mode=ro&uri=true"
+        assert make_read_only_url("sqlite://") is None
+
+    def test_read_only_engine_rejects_writes(self, engines):
+        """测试只读连接无法写入。"""
+        _, read_engine = engines
+        assert _pragma(read_engine, "query_only") == 1
+        with pytest.raises(OperationalError):
+            with read_engine.begin() as conn:
+                conn.execute(text("INSERT INTO items (name) VALUES ('x')"))
+
+    def test_read_only_engine_sees_committed_writes(self, engines):
+        """测试只读连接可读取写连接已提交的数据。"""
+        write_engine, read_engine = engines
+        with write_engine.begin() as conn:
+            conn.execute(text("INSERT INTO items (name) VALUES ('a')"))
+        with read_engine.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM items")).scalar() == 1
+
+    def test_read_only_requires_sqlite_file(self):
+        """测试内存库不支持只读引擎。"""
+        with pytest.raises(ValueError):
+            create_db_engine("sqlite://", read_only=True)
+
+
+class TestAsyncEngine:
+    """异步引擎测试。"""
+
+    def test_make_async_url(self):
+        """测试SQLite URL转换为aiosqlite驱动。"""
+        assert make_async_url("sqlite:////tmp/a.db") == "sqlite+aiosqlite:////tmp/a.db"
+        assert make_async_url("postgresql+asyncpg://u@h/db") == "postgresql+asyncpg://u@h/db"
+
+    def test_async_read_only_engine(self, tmp_path):
+        """测试异步只读引擎可读取数据且设置了只读PRAGMA。"""
+        url = f"sqlite:///{tmp_path}/async.db"
+        write_engine = create_db_engine(url)
+        with write_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO items DEFAULT VALUES"))
+
+        async def read():
+            async_engine = create_async_db_engine(url, read_only=True)
+            try:
+                async with async_engine.connect() as conn:
+                    count = (await conn.execute(text("SELECT count(*) FROM items"))).scalar()
+                    query_only = (await conn.execute(text("PRAGMA query_only"))).scalar()
+                return count, query_only
+            finally:
+                await async_engine.dispose()
+
+        try:
+            assert asyncio.run(read()) == (1, 1)
+        finally:
+            write_engine.dispose()
@@ -0,0 +1,355 @@
+"""数据库迁移测试模块。"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import inspect, text
+
+from app.migrations import get_migration_status, load_migrations, run_migrations
+from app.migrations.ops import backfill_in_batches
+from app.models.database import Base, create_db_engine
+
+
+@pytest.fixture
+def temp_engine(tmp_path):
+    """创建临时数据库引擎。"""
+    engine = create_db_engine(f"sqlite:///{tmp_path}/migrate.db")
+    yield engine
+    engine.dispose()
+
+
+def _columns(engine, table):
+    """获取表字段名集合。"""
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+class TestMigrationRunner:
+    """迁移执行器测试。"""
+
+    def test_versions_are_ordered(self):
+        """测试迁移按版本号升序加载。"""
+        versions = [m.VERSION for m in load_migrations()]
+        assert versions == sorted(versions)
+        assert versions[:2] == [1, 2]
+
+    def test_fresh_database_creates_schema(self, temp_engine):
+        """测试全新数据库直接建表并记录所有版本。"""
+        assert run_migrations(temp_engine) == []
+        assert set(Base.metadata.tables) <= set(inspect(temp_engine).get_table_names())
+        assert "task_search" in inspect(temp_engine).get_table_names()
+        assert all(applied for _, _, applied in get_migration_status(temp_engine))
+
+    def test_current_schema_skips_create_all(self, temp_engine):
+        """测试结构已是最新时启动不再建表。"""
+        run_migrations(temp_engine)
+        with patch.object(Base.metadata, "create_all") as create_all:
+            assert run_migrations(temp_engine) == []
+            create_all.assert_not_called()
+
+    def test_legacy_database_is_upgraded(self, temp_engine):
+        """测试旧版数据库执行迁移补齐字段。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(50), "
+                "email VARCHAR(100), password_hash VARCHAR(255))"
+            ))
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(100), owner_id INTEGER, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE columns (id INTEGER PRIMARY KEY, name VARCHAR(100), project_id INTEGER, "
+                "position INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200), "
+                "column_id INTEGER, position INTEGER)"
+            ))
+            conn.execute(text("INSERT INTO users (username, email, password_hash) VALUES ('a', 'a@x', 'h')"))
+            conn.execute(text("INSERT INTO users (username, email, password_hash) VALUES ('b', 'b@x', 'h')"))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, '旧项目', 1)"))
+            conn.execute(text("INSERT INTO columns (id, name, project_id, position) VALUES (1, '待办', 1, 0)"))
+            conn.execute(text("INSERT INTO tasks (title, column_id, position) VALUES ('旧任务', 1, 0)"))
+
+        executed = run_migrations(temp_engine)
+
+        assert executed[:8] == [1, 2, 3, 4, 5, 6, 7, 8]
+        assert {"description", "due_date", "priority", "assignee_id"} <= _columns(temp_engine, "tasks")
+        with temp_engine.connect() as conn:
+            roles = conn.execute(text("SELECT username, role FROM users ORDER BY id")).all()
+        assert roles == [("a", "owner"), ("b", "user")]
+        # 模型中存在而旧库缺失的表会被补建
+        assert "comments" in inspect(temp_engine).get_table_names()
+        assert "project_changes" in inspect(temp_engine).get_table_names()
+        task_indexes = {index["name"] for index in inspect(temp_engine).get_indexes("tasks")}
+        assert "ix_tasks_column_id_position_rank" in task_indexes
+        # 已有任务被收录到全文检索，后建的评论表也带有同步触发器
+        with temp_engine.connect() as conn:
+            assert conn.execute(text("SELECT title FROM task_search")).scalars().all() == ["旧任务"]
+            triggers = conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'comments'"
+            )).scalars().all()
+        assert "comments_search_insert" in triggers
+
+    def test_project_board_task_limit_added(self, temp_engine):
+        """测试旧版项目表补齐看板每列任务数与版本号字段，已有项目保持显示全部。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(100), owner_id INTEGER, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text("INSERT INTO projects (name, owner_id) VALUES ('旧项目', 1)"))
+
+        run_migrations(temp_engine)
+
+        with temp_engine.connect() as conn:
+            limits = conn.execute(text("SELECT board_task_limit FROM projects")).scalars().all()
+        assert limits == [None]
+
+        with temp_engine.connect() as conn:
+            versions = conn.execute(text("SELECT version FROM projects")).scalars().all()
+        assert versions == [0]
+
+    def test_counters_are_backfilled(self, temp_engine):
+        """测试旧版数据库按现有数据回填任务数、列数计数器。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(100), owner_id INTEGER, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE columns (id INTEGER PRIMARY KEY, name VARCHAR(100), project_id INTEGER, "
+                "position INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200), "
+                "column_id INTEGER, position INTEGER)"
+            ))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, 'p', 1)"))
+            conn.execute(text(
+                "INSERT INTO columns (id, name, project_id, position) VALUES (1, 'a', 1, 0), (2, 'b', 1, 1)"
+            ))
+            conn.execute(text(
+                "INSERT INTO tasks (title, column_id, position) VALUES ('t1', 1, 0), ('t2', 1, 1), ('t3', 2, 0)"
+            ))
+
+        run_migrations(temp_engine)
+
+        with temp_engine.connect() as conn:
+            column_counts = conn.execute(text("SELECT task_count FROM columns ORDER BY id")).scalars().all()
+            project_counts = conn.execute(text("SELECT task_count, column_count FROM projects")).one()
+        assert column_counts == [2, 1]
+        assert tuple(project_counts) == (3, 2)
+
+    def test_task_project_id_is_backfilled(self, temp_engine):
+        """测试按任务所在列回填项目ID，所在列不存在的任务保持为空。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(100), owner_id INTEGER, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (5, 'p5', 1), (6, 'p6', 1)"))
+            conn.execute(text(
+                "CREATE TABLE columns (id INTEGER PRIMARY KEY, name VARCHAR(100), project_id INTEGER, "
+                "position INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200), "
+                "column_id INTEGER, position INTEGER)"
+            ))
+            conn.execute(text(
+                "INSERT INTO columns (id, name, project_id, position) VALUES (1, 'a', 5, 0), (2, 'b', 6, 0)"
+            ))
+            conn.execute(text(
+                "INSERT INTO tasks (title, column_id, position) VALUES ('t1', 1, 0), ('t2', 2, 0), ('t3', 9, 0)"
+            ))
+
+        # 迁移 011 会清除无法确定项目的任务，此处只执行到回填所在的版本
+        run_migrations(temp_engine, target=8)
+
+        with temp_engine.connect() as conn:
+            project_ids = conn.execute(text("SELECT project_id FROM tasks ORDER BY id")).scalars().all()
+        assert project_ids == [5, 6, None]
+        task_indexes = {index["name"] for index in inspect(temp_engine).get_indexes("tasks")}
+        assert "ix_tasks_project_id" in task_indexes
+
+    def test_foreign_key_cascades_added(self, temp_engine):
+        """测试旧库按模型重建表：外键级联生效、清除孤立行、保留作者已删除的评论与检索触发器。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE users (id INTEGER PRIMARY KEY, username VARCHAR(50), "
+                "email VARCHAR(100), password_hash VARCHAR(255))"
+            ))
+            conn.execute(text(
+                "CREATE TABLE projects (id INTEGER PRIMARY KEY, name VARCHAR(100), owner_id INTEGER, "
+                "created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE columns (id INTEGER PRIMARY KEY, name VARCHAR(100), project_id INTEGER, "
+                "position INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200), "
+                "column_id INTEGER, position INTEGER)"
+            ))
+            conn.execute(text(
+                "CREATE TABLE comments (id INTEGER PRIMARY KEY, task_id INTEGER, user_id INTEGER, "
+                "content TEXT, created_at DATETIME)"
+            ))
+            conn.execute(text("INSERT INTO users (id, username, email, password_hash) VALUES (1, 'a', 'a@x', 'h')"))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, 'p', 1)"))
+            conn.execute(text("INSERT INTO columns (id, name, project_id, position) VALUES (1, 'c', 1, 0)"))
+            conn.execute(text(
+                "INSERT INTO tasks (id, title, column_id, position) VALUES (1, '任务一', 1, 0), (2, '孤立任务', 7, 0)"
+            ))
+            # 第二条评论的作者已删除
+            conn.execute(text(
+                "INSERT INTO comments (task_id, user_id, content) VALUES (1, 1, '评论'), (1, 9, '旧评论')"
+            ))
+
+        run_migrations(temp_engine)
+
+        with temp_engine.connect() as conn:
+            actions = {
+                (table, row[3]): row[6]
+                for table in ("columns", "tasks", "comments")
+                for row in conn.execute(text(f"PRAGMA foreign_key_list({table})"))
+            }
+            assert actions[("columns", "project_id")] == "CASCADE"
+            assert actions[("tasks", "column_id")] == "CASCADE"
+            assert actions[("tasks", "assignee_id")] == "SET NULL"
+            assert actions[("comments", "user_id")] == "SET NULL"
+            assert conn.execute(text("SELECT title FROM tasks")).scalars().all() == ["任务一"]
+            assert conn.execute(
+                text("SELECT content, user_id FROM comments ORDER BY id")
+            ).all() == [("评论", 1), ("旧评论", None)]
+            assert conn.execute(text("SELECT title FROM task_search")).scalars().all() == ["任务一"]
+
+            conn.execute(text("DELETE FROM projects WHERE id = 1"))
+            conn.commit()
+            for table in ("columns", "tasks", "comments", "task_search", "comment_search"):
+                assert conn.execute(text(f"SELECT count(*) FROM {table}")).scalar() == 0
+
+    def test_comments_of_deleted_users_kept(self, temp_engine):
+        """测试已执行迁移 011 的库重建评论表：删除用户时保留评论并置空作者。"""
+        assert run_migrations(temp_engine, target=13) == []
+        with temp_engine.begin() as conn:
+            # 迁移 011 曾建立的结构：删除用户时级联删除评论
+            conn.execute(text("PRAGMA foreign_keys=OFF"))
+            conn.execute(text("DROP TABLE comments"))
+            conn.execute(text(
+                "CREATE TABLE comments (id INTEGER PRIMARY KEY, "
+                "task_id INTEGER NOT NULL REFERENCES tasks (id) ON DELETE CASCADE, "
+                "user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE, "
+                "content TEXT NOT NULL, created_at DATETIME)"
+            ))
+            conn.execute(text("DROP TABLE comments_archive"))
+            conn.execute(text(
+                "CREATE TABLE comments_archive (id INTEGER PRIMARY KEY, "
+                "archived_task_id INTEGER NOT NULL REFERENCES tasks_archive (id) ON DELETE CASCADE, "
+                "user_id INTEGER NOT NULL, content TEXT NOT NULL, created_at DATETIME)"
+            ))
+            conn.execute(text(
+                "INSERT INTO users (id, username, email, password_hash, role) VALUES (1, 'a', 'a@x', 'h', 'owner'), (2, 'b', 'b@x', 'h', 'member')"
+            ))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, 'p', 1)"))
+            conn.execute(text("INSERT INTO columns (id, name, project_id, position) VALUES (1, 'c', 1, 0)"))
+            conn.execute(text(
+                "INSERT INTO tasks (id, title, column_id, project_id, position, priority) "
+                "VALUES (1, '任务一', 1, 1, 0, 'medium')"
+            ))
+            conn.execute(text("INSERT INTO comments (task_id, user_id, content) VALUES (1, 2, '保留的评论')"))
+
+        assert run_migrations(temp_engine, target=14) == [14]
+
+        with temp_engine.connect() as conn:
+            actions = {row[3]: row[6] for row in conn.execute(text("PRAGMA foreign_key_list(comments)"))}
+            assert actions["user_id"] == "SET NULL"
+            nullable = {
+                table: {row[1]: not row[3] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+                for table in ("comments", "comments_archive")
+            }
+            assert nullable["comments"]["user_id"] and nullable["comments_archive"]["user_id"]
+            comment_indexes = {index["name"] for index in inspect(temp_engine).get_indexes("comments")}
+            assert "ix_comments_user_id" in comment_indexes
+
+            conn.execute(text("INSERT INTO comments (task_id, user_id, content) VALUES (1, 2, '迁移后的评论')"))
+            conn.execute(text("DELETE FROM users WHERE id = 2"))
+            conn.commit()
+            assert conn.execute(
+                text("SELECT content, user_id FROM comments ORDER BY id")
+            ).all() == [("保留的评论", None), ("迁移后的评论", None)]
+            # 检索触发器随评论表重建
+            assert conn.execute(
+                text("SELECT task_id FROM comment_search WHERE comment_search MATCH '迁移后'")
+            ).scalars().all() == [1]
+
+    def test_comment_search_split_from_task_search(self, temp_engine):
+        """测试旧版合并评论的检索表拆分为任务、评论两张表并回填。"""
+        assert run_migrations(temp_engine, target=14) == []
+        with temp_engine.begin() as conn:
+            # 迁移 005 曾建立的结构：任务的全部评论拼接后存入一行
+            for trigger in ("insert", "update", "delete"):
+                conn.execute(text(f"DROP TRIGGER tasks_search_{trigger}"))
+                conn.execute(text(f"DROP TRIGGER comments_search_{trigger}"))
+            conn.execute(text("DROP TABLE task_search"))
+            conn.execute(text("DROP TABLE comment_search"))
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE task_search USING fts5(title, description, comments, tokenize='trigram')"
+            ))
+            conn.execute(text(
+                "INSERT INTO users (id, username, email, password_hash, role) VALUES (1, 'a', 'a@x', 'h', 'owner')"
+            ))
+            conn.execute(text("INSERT INTO projects (id, name, owner_id) VALUES (1, 'p', 1)"))
+            conn.execute(text("INSERT INTO columns (id, name, project_id, position) VALUES (1, 'c', 1, 0)"))
+            conn.execute(text(
+                "INSERT INTO tasks (id, title, column_id, project_id, position, priority) "
+                "VALUES (1, '任务一', 1, 1, 0, 'medium')"
+            ))
+            conn.execute(text(
+                "INSERT INTO comments (id, task_id, user_id, content) "
+                "VALUES (5, 1, 1, '第一条评论'), (6, 1, 1, '第二条评论')"
+            ))
+
+        assert run_migrations(temp_engine) == [15]
+
+        with temp_engine.connect() as conn:
+            assert _columns(temp_engine, "task_search") == {"title", "description"}
+            assert conn.execute(text("SELECT rowid, title FROM task_search")).all() == [(1, "任务一")]
+            assert conn.execute(
+                text("SELECT rowid, task_id FROM comment_search ORDER BY rowid")
+            ).all() == [(5, 1), (6, 1)]
+
+            # 同步触发器按新定义重建
+            conn.execute(text("UPDATE comments SET content = '改写后的评论' WHERE id = 5"))
+            conn.execute(text("DELETE FROM comments WHERE id = 6"))
+            conn.commit()
+            assert conn.execute(
+                text("SELECT rowid, task_id FROM comment_search WHERE comment_search MATCH '改写后'")
+            ).all() == [(5, 1)]
+            assert conn.execute(text("SELECT count(*) FROM comment_search")).scalar() == 1
+
+    def test_target_version(self, temp_engine):
+        """测试只执行到指定版本。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE tasks (id INTEGER PRIMARY KEY, title VARCHAR(200))"))
+        assert run_migrations(temp_engine, target=1) == [1]
+        status = {version: applied for version, _, applied in get_migration_status(temp_engine)}
+        assert status[1] and not status[2]
+
+
+class TestBackfill:
+    """分批回填测试。"""
+
+    def test_backfill_commits_in_batches(self, temp_engine):
+        """测试回填按批次执行并处理所有行。"""
+        with temp_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, value INTEGER)"))
+            conn.execute(text("INSERT INTO items (value) VALUES (NULL)"), [{}] * 25)
+
+        with temp_engine.connect() as conn:
+            with patch.object(conn, "commit", wraps=conn.commit) as commit:
+                total = backfill_in_batches(conn, "items", "value = id * 2", "value IS NULL", batch_size=10)
+            assert total == 25
+            assert commit.call_count == 3
+            assert conn.execute(text("SELECT count(*) FROM items WHERE value = id * 2")).scalar() == 25
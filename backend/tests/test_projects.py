@@ -1,14 +1,22 @@
 """项目API测试模块。"""
 
+from datetime import timedelta
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event, text
 
 from main import app
-from app.models.database import Base, engine, SessionLocal
+from app.config import settings
+from app.models.counters import repair_counters
+from app.models.database import Base, async_read_engine, engine, SessionLocal, utc_now
 from app.models.user import User, UserRole
 from app.models.project import Project
 from app.models.column import KanbanColumn
 from app.models.task import Task
+from app.models.change import ProjectChange
+from app.services.changes import compact_changes
+from app.services.purge import PurgeService
 
 
 @pytest.fixture(scope="function")
@@ -193,56 +201,737 @@ class TestProjectDetail:
         assert response.status_code == 200
         assert response.json()["name"] == "用户1的项目"
 
+    def _create_board(self, client, auth_headers, column_count, tasks_per_column):
+        """创建指定列数和任务数的看板，任务均设置负责人。"""
+        user_id = client.get("/api/auth/me", headers=auth_headers).json()["id"]
+        project_id = client.post(
+            "/api/projects", json={"name": "看板"}, headers=auth_headers
+        ).json()["id"]
+        for i in range(column_count - 3):
+            client.post(
+                f"/api/projects/{project_id}/columns",
+                json={"name": f"列{i}"},
+                headers=auth_headers,
+            )
+        columns = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"]
+        for column in columns:
+            for i in range(tasks_per_column):
+                client.post(
+                    f"/api/columns/{column['id']}/tasks",
+                    json={"title": f"任务{i}", "assignee_id": user_id},
+                    headers=auth_headers,
+                )
+        return project_id
+
+    def _count_board_statements(self, client, auth_headers, project_id):
+        """统计获取看板时执行的SQL语句数。"""
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            response = client.get(f"/api/projects/{project_id}", headers=auth_headers)
+        finally:
+            event.remove(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+        assert response.status_code == 200
+        return response.json(), len(statements)
+
+    def test_board_query_count_is_fixed(self, client, auth_headers):
+        """测试看板查询次数不随列数和任务数增长。"""
+        small_id = self._create_board(client, auth_headers, column_count=3, tasks_per_column=1)
+        large_id = self._create_board(client, auth_headers, column_count=12, tasks_per_column=5)
+
+        small_board, small_count = self._count_board_statements(client, auth_headers, small_id)
+        large_board, large_count = self._count_board_statements(client, auth_headers, large_id)
+
+        assert len(large_board["columns"]) == 12
+        assert all(len(column["tasks"]) == 5 for column in large_board["columns"])
+        assert all(
+            task["assignee"] is not None
+            for column in large_board["columns"]
+            for task in column["tasks"]
+        )
+        # 版本号、项目、列、任务（含负责人）各一条；当前用户已在缓存中
+        assert small_count == large_count == 4
+
+
+class TestBoardETag:
+    """看板条件请求（ETag）测试。"""
+
+    def _create_board(self, client, auth_headers):
+        """创建项目并在第一列创建一个任务，返回项目ID、第一列ID与任务ID。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "看板"}, headers=auth_headers
+        ).json()["id"]
+        detail = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        column_id = detail["columns"][0]["id"]
+        task_id = client.post(
+            f"/api/columns/{column_id}/tasks", json={"title": "任务"}, headers=auth_headers
+        ).json()["id"]
+        return project_id, column_id, task_id
+
+    def _get_board(self, client, auth_headers, project_id, etag=None, query=""):
+        """获取看板，可携带 If-None-Match。"""
+        headers = dict(auth_headers)
+        if etag:
+            headers["If-None-Match"] = etag
+        return client.get(f"/api/projects/{project_id}{query}", headers=headers)
+
+    def test_etag_readable_cross_origin(self, client, auth_headers):
+        """测试跨域请求可读取 ETag 响应头，以便携带 If-None-Match。"""
+        project_id, _, _ = self._create_board(client, auth_headers)
+        headers = {**auth_headers, "Origin": settings.CORS_ORIGINS[0]}
+        response = client.get(f"/api/projects/{project_id}", headers=headers)
+        assert response.status_code == 200
+        exposed = response.headers["Access-Control-Expose-Headers"].lower().split(", ")
+        assert "etag" in exposed
 
-class TestProjectPaginated:
-    """项目分页测试。"""
+    def test_not_modified_without_loading_board(self, client, auth_headers):
+        """测试看板未变化时返回304，且不查询列与任务表。"""
+        project_id, _, _ = self._create_board(client, auth_headers)
+        response = self._get_board(client, auth_headers, project_id)
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
 
-    def test_get_projects_paginated_success(self, client, auth_headers):
-        """测试分页获取项目成功。"""
-        # 创建5个项目
-        for i in range(5):
-            client.post("/api/projects", json={"name": f"项目{i}"}, headers=auth_headers)
+        statements = []
 
-        # 获取第一页（每页2个）
-        response = client.get(
-            "/api/projects/paginated?page=1&page_size=2",
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            response = self._get_board(client, auth_headers, project_id, etag)
+        finally:
+            event.remove(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert len(statements) == 1
+        assert "tasks" not in statements[0] and "columns" not in statements[0]
+
+    def test_etag_changes_after_board_mutations(self, client, auth_headers):
+        """测试修改任务、列、项目后 ETag 变化，返回完整看板。"""
+        project_id, column_id, task_id = self._create_board(client, auth_headers)
+        column_ids = [
+            column["id"] for column in self._get_board(client, auth_headers, project_id).json()["columns"]
+        ]
+        second_column_id = column_ids[1]
+
+        mutations = [
+            lambda: client.put(f"/api/tasks/{task_id}", json={"title": "新标题"}, headers=auth_headers),
+            lambda: client.post(
+                "/api/tasks/batch",
+                json={"operations": [{"op": "update", "task_id": task_id, "data": {"priority": "high"}}]},
+                headers=auth_headers,
+            ),
+            lambda: client.put(
+                f"/api/tasks/{task_id}/move",
+                json={"target_column_id": second_column_id, "position": 0},
+                headers=auth_headers,
+            ),
+            lambda: client.put(f"/api/columns/{column_id}", json={"name": "新列名"}, headers=auth_headers),
+            lambda: client.put(
+                "/api/columns/reorder",
+                json={"column_ids": column_ids[::-1]},
+                headers=auth_headers,
+            ),
+            lambda: client.put(f"/api/projects/{project_id}", json={"name": "新项目名"}, headers=auth_headers),
+            lambda: client.delete(f"/api/tasks/{task_id}", headers=auth_headers),
+        ]
+        etag = self._get_board(client, auth_headers, project_id).headers["ETag"]
+        for mutate in mutations:
+            assert mutate().status_code < 300
+            response = self._get_board(client, auth_headers, project_id, etag)
+            assert response.status_code == 200
+            assert response.headers["ETag"] != etag
+            etag = response.headers["ETag"]
+
+    def test_etag_depends_on_query(self, client, auth_headers):
+        """测试不同筛选参数的看板使用不同的 ETag。"""
+        project_id, _, _ = self._create_board(client, auth_headers)
+        etag = self._get_board(client, auth_headers, project_id).headers["ETag"]
+
+        response = self._get_board(client, auth_headers, project_id, etag, "?priority=high")
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_not_modified_for_missing_project(self, client, auth_headers):
+        """测试项目不存在时返回404。"""
+        response = self._get_board(client, auth_headers, 99999, '"99999-0-all"')
+        assert response.status_code == 404
+
+
+class TestProjectVersion:
+    """项目版本号测试。"""
+
+    def _version(self, project_id):
+        """直接读取项目版本号（包括已删除的项目）。"""
+        db = SessionLocal()
+        try:
+            return db.query(Project.version).filter(Project.id == project_id).scalar()
+        finally:
+            db.close()
+
+    def test_version_exposed_in_response(self, client, auth_headers):
+        """测试项目响应包含版本号，修改项目后递增。"""
+        project = client.post("/api/projects", json={"name": "项目"}, headers=auth_headers).json()
+        assert project["version"] == 0
+
+        response = client.put(
+            f"/api/projects/{project['id']}", json={"name": "新名称"}, headers=auth_headers
+        )
+        assert response.json()["version"] == 1
+        detail = client.get(f"/api/projects/{project['id']}", headers=auth_headers).json()
+        assert detail["version"] == 1
+
+    def test_every_board_mutation_bumps_version(self, client, auth_headers):
+        """测试项目、列、任务、评论的每个写操作都递增版本号。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "项目"}, headers=auth_headers
+        ).json()["id"]
+        column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][0]["id"]
+        state = {}
+
+        def create_task():
+            response = client.post(
+                f"/api/columns/{column_id}/tasks", json={"title": "任务"}, headers=auth_headers
+            )
+            state["task_id"] = response.json()["id"]
+            return response
+
+        def create_comment():
+            response = client.post(
+                f"/api/tasks/{state['task_id']}/comments", json={"content": "评论"}, headers=auth_headers
+            )
+            state["comment_id"] = response.json()["id"]
+            return response
+
+        def create_column():
+            response = client.post(
+                f"/api/projects/{project_id}/columns", json={"name": "新列"}, headers=auth_headers
+            )
+            state["column_id"] = response.json()["id"]
+            return response
+
+        mutations = [
+            create_task,
+            create_comment,
+            lambda: client.delete(f"/api/comments/{state['comment_id']}", headers=auth_headers),
+            create_column,
+            lambda: client.put(
+                f"/api/tasks/{state['task_id']}/move",
+                json={"target_column_id": state["column_id"], "position": 0},
+                headers=auth_headers,
+            ),
+            lambda: client.delete(f"/api/columns/{state['column_id']}", headers=auth_headers),
+            lambda: client.post(f"/api/columns/{state['column_id']}/restore", headers=auth_headers),
+            lambda: client.delete(f"/api/tasks/{state['task_id']}", headers=auth_headers),
+            lambda: client.delete(f"/api/projects/{project_id}", headers=auth_headers),
+            lambda: client.post(f"/api/projects/{project_id}/restore", headers=auth_headers),
+        ]
+        version = self._version(project_id)
+        for mutate in mutations:
+            assert mutate().status_code < 300
+            assert self._version(project_id) > version
+            version = self._version(project_id)
+
+    def test_assignee_rename_bumps_version(self, client, auth_headers):
+        """测试负责人修改显示名称后，其任务所在项目的版本号递增。"""
+        user_id = client.get("/api/auth/me", headers=auth_headers).json()["id"]
+        project_id = client.post(
+            "/api/projects", json={"name": "项目"}, headers=auth_headers
+        ).json()["id"]
+        other_id = client.post(
+            "/api/projects", json={"name": "无关项目"}, headers=auth_headers
+        ).json()["id"]
+        column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][0]["id"]
+        client.post(
+            f"/api/columns/{column_id}/tasks",
+            json={"title": "任务", "assignee_id": user_id},
             headers=auth_headers,
         )
+        version, other_version = self._version(project_id), self._version(other_id)
+
+        response = client.put(
+            "/api/users/me/profile", json={"display_name": "新名字"}, headers=auth_headers
+        )
         assert response.status_code == 200
-        data = response.json()
-        assert len(data["items"]) == 2
-        assert data["total"] == 5
-        assert data["page"] == 1
-        assert data["page_size"] == 2
-        assert data["total_pages"] == 3
+        assert self._version(project_id) == version + 1
+        assert self._version(other_id) == other_version
+
+
+class TestProjectChanges:
+    """看板增量同步测试。"""
+
+    def _create_board(self, client, auth_headers):
+        """创建项目并在第一列创建两个任务，返回看板详情。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "看板"}, headers=auth_headers
+        ).json()["id"]
+        board = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        for title in ("任务一", "任务二"):
+            client.post(
+                f"/api/columns/{board['columns'][0]['id']}/tasks",
+                json={"title": title},
+                headers=auth_headers,
+            )
+        return client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+
+    def _get_changes(self, client, auth_headers, project_id, since):
+        """获取增量变更。"""
+        response = client.get(
+            f"/api/projects/{project_id}/changes", params={"since": since}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def _apply(self, board, changes):
+        """按客户端的方式将增量变更应用到看板。"""
+        board.update(changes["project"])
+        removed = set(changes["deleted_column_ids"]) | {c["id"] for c in changes["columns"]}
+        existing = {column["id"]: column for column in board["columns"]}
+        board["columns"] = [c for c in board["columns"] if c["id"] not in removed]
+        for column in sorted(changes["columns"], key=lambda c: c["position"]):
+            tasks = existing[column["id"]]["tasks"] if column["id"] in existing else []
+            board["columns"].insert(column["position"], {**column, "tasks": tasks})
+
+        removed = set(changes["deleted_task_ids"]) | {t["id"] for t in changes["tasks"]}
+        for column in board["columns"]:
+            column["tasks"] = [t for t in column["tasks"] if t["id"] not in removed]
+        columns = {column["id"]: column for column in board["columns"]}
+        for task in sorted(changes["tasks"], key=lambda t: t["position"]):
+            columns[task["column_id"]]["tasks"].insert(task["position"], task)
+        return board
+
+    def _layout(self, board):
+        """看板的列与任务顺序及名称。"""
+        return [
+            (column["id"], column["name"], [(task["id"], task["title"]) for task in column["tasks"]])
+            for column in board["columns"]
+        ]
+
+    def test_unchanged_board_returns_empty_delta(self, client, auth_headers):
+        """测试看板未变化时返回空的增量。"""
+        board = self._create_board(client, auth_headers)
+        changes = self._get_changes(client, auth_headers, board["id"], board["version"])
+        assert changes["version"] == board["version"]
+        assert changes["full_resync"] is False
+        assert changes["columns"] == [] and changes["tasks"] == []
+        assert changes["deleted_column_ids"] == [] and changes["deleted_task_ids"] == []
+
+    def test_delta_only_contains_changed_task(self, client, auth_headers):
+        """测试只修改一个任务时，增量只包含该任务。"""
+        board = self._create_board(client, auth_headers)
+        task_id = board["columns"][0]["tasks"][1]["id"]
+        client.put(f"/api/tasks/{task_id}", json={"title": "新标题"}, headers=auth_headers)
+
+        changes = self._get_changes(client, auth_headers, board["id"], board["version"])
+        assert changes["version"] == board["version"] + 1
+        assert changes["columns"] == []
+        assert [(t["id"], t["title"], t["position"]) for t in changes["tasks"]] == [
+            (task_id, "新标题", 1)
+        ]
+
+    @pytest.mark.parametrize("ordering", ["position", "rank"])
+    def test_applied_delta_matches_full_board(self, client, auth_headers, monkeypatch, ordering):
+        """测试将增量应用到旧看板后与重新获取的完整看板一致（两种排序方式）。"""
+        monkeypatch.setattr(settings, "TASK_ORDERING", ordering)
+        board = self._create_board(client, auth_headers)
+        project_id = board["id"]
+        first, second = board["columns"][0], board["columns"][1]
+        moved_id, deleted_id = first["tasks"][0]["id"], first["tasks"][1]["id"]
+        third_column_id = board["columns"][2]["id"]
+
+        new_column_id = client.post(
+            f"/api/projects/{project_id}/columns", json={"name": "新列"}, headers=auth_headers
+        ).json()["id"]
+        mutations = [
+            lambda: client.post(
+                f"/api/columns/{new_column_id}/tasks", json={"title": "新任务"}, headers=auth_headers
+            ),
+            lambda: client.put(
+                f"/api/tasks/{moved_id}/move",
+                json={"target_column_id": second["id"], "position": 0},
+                headers=auth_headers,
+            ),
+            lambda: client.post(
+                f"/api/tasks/{moved_id}/comments", json={"content": "评论"}, headers=auth_headers
+            ),
+            lambda: client.delete(f"/api/tasks/{deleted_id}", headers=auth_headers),
+            lambda: client.delete(f"/api/columns/{third_column_id}", headers=auth_headers),
+            lambda: client.put(
+                "/api/columns/reorder",
+                json={"column_ids": [new_column_id, second["id"], first["id"]]},
+                headers=auth_headers,
+            ),
+            lambda: client.put(f"/api/projects/{project_id}", json={"name": "新名称"}, headers=auth_headers),
+        ]
+        for mutate in mutations:
+            assert mutate().status_code < 300
+
+        changes = self._get_changes(client, auth_headers, project_id, board["version"])
+        assert changes["full_resync"] is False
+        assert changes["deleted_column_ids"] == [third_column_id]
+        assert changes["deleted_task_ids"] == [deleted_id]
+
+        current = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        applied = self._apply(board, changes)
+        assert applied["name"] == "新名称"
+        assert applied["version"] == current["version"] == changes["version"]
+        assert self._layout(applied) == self._layout(current)
+
+    def test_full_resync_after_compaction(self, client, auth_headers):
+        """测试变更记录清理后，早于保留记录的版本需重新获取完整看板。"""
+        board = self._create_board(client, auth_headers)
+        task_id = board["columns"][0]["tasks"][0]["id"]
+        client.put(f"/api/tasks/{task_id}", json={"title": "新标题"}, headers=auth_headers)
+
+        db = SessionLocal()
+        try:
+            assert compact_changes(db, retention_hours=0) > 0
+        finally:
+            db.close()
+
+        changes = self._get_changes(client, auth_headers, board["id"], board["version"])
+        assert changes["full_resync"] is True
+        assert changes["version"] == board["version"] + 1
+        assert changes["tasks"] == []
+
+    def test_compaction_keeps_recent_changes(self, client, auth_headers):
+        """测试清理只删除超过保留时长的变更记录。"""
+        board = self._create_board(client, auth_headers)
+        db = SessionLocal()
+        try:
+            assert compact_changes(db) == 0
+            assert db.query(ProjectChange).filter(ProjectChange.project_id == board["id"]).count() == 2
+        finally:
+            db.close()
 
-    def test_get_projects_paginated_last_page(self, client, auth_headers):
-        """测试获取最后一页。"""
-        # 创建5个项目
-        for i in range(5):
-            client.post("/api/projects", json={"name": f"项目{i}"}, headers=auth_headers)
+    def test_full_resync_for_unknown_or_large_history(self, client, auth_headers, monkeypatch):
+        """测试 since 超出当前版本或变更对象过多时需重新获取完整看板。"""
+        board = self._create_board(client, auth_headers)
+        changes = self._get_changes(client, auth_headers, board["id"], board["version"] + 1)
+        assert changes["full_resync"] is True
+
+        monkeypatch.setattr(settings, "MAX_CHANGES_PER_SYNC", 1)
+        changes = self._get_changes(client, auth_headers, board["id"], 0)
+        assert changes["full_resync"] is True
+
+    def test_project_writes_logged_at_new_version(self, client, auth_headers):
+        """测试修改、删除、恢复项目后，变更记录的版本号与项目版本号一致。"""
+        board = self._create_board(client, auth_headers)
+        project_id = board["id"]
+        mutations = [
+            lambda: client.put(f"/api/projects/{project_id}", json={"name": "新名称"}, headers=auth_headers),
+            lambda: client.delete(f"/api/projects/{project_id}", headers=auth_headers),
+            lambda: client.post(f"/api/projects/{project_id}/restore", headers=auth_headers),
+        ]
+        for mutate in mutations:
+            assert mutate().status_code < 300
+            db = SessionLocal()
+            try:
+                version = db.query(Project.version).filter(Project.id == project_id).scalar()
+                logged = (
+                    db.query(ProjectChange.version)
+                    .filter(ProjectChange.project_id == project_id)
+                    .order_by(ProjectChange.id.desc())
+                    .first()[0]
+                )
+            finally:
+                db.close()
+            assert logged == version
+
+    def test_changes_for_missing_project(self, client, auth_headers):
+        """测试项目不存在或已删除时返回404。"""
+        response = client.get("/api/projects/99999/changes?since=0", headers=auth_headers)
+        assert response.status_code == 404
 
-        # 获取最后一页
+        board = self._create_board(client, auth_headers)
+        client.delete(f"/api/projects/{board['id']}", headers=auth_headers)
         response = client.get(
-            "/api/projects/paginated?page=3&page_size=2",
+            f"/api/projects/{board['id']}/changes", params={"since": 0}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+
+class TestProjectBoardWindow:
+    """看板按列截取任务测试。"""
+
+    def _create_project(self, client, auth_headers, task_count, **fields):
+        """创建项目并在第一列创建任务，返回项目ID与第一列ID。"""
+        project = client.post(
+            "/api/projects", json={"name": "看板", **fields}, headers=auth_headers
+        ).json()
+        detail = client.get(f"/api/projects/{project['id']}", headers=auth_headers).json()
+        column_id = detail["columns"][0]["id"]
+        for i in range(task_count):
+            client.post(
+                f"/api/columns/{column_id}/tasks",
+                json={"title": f"任务{i}"},
+                headers=auth_headers,
+            )
+        return project["id"], column_id
+
+    def test_full_board_by_default(self, client, auth_headers):
+        """测试未配置时返回全部任务与总数。"""
+        project_id, _ = self._create_project(client, auth_headers, 3)
+        column = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"][0]
+        assert len(column["tasks"]) == 3
+        assert column["task_total"] == 3
+        assert column["next_cursor"] is None
+
+    def test_request_task_limit(self, client, auth_headers):
+        """测试按请求参数截取每列任务，并通过列接口续读其余任务。"""
+        project_id, column_id = self._create_project(client, auth_headers, 5)
+
+        board = client.get(
+            f"/api/projects/{project_id}", params={"task_limit": 2}, headers=auth_headers
+        ).json()
+        first, second, third = board["columns"]
+        assert [task["title"] for task in first["tasks"]] == ["任务0", "任务1"]
+        assert first["task_total"] == 5
+        assert second["tasks"] == [] and second["task_total"] == 0
+        assert second["next_cursor"] is None and third["next_cursor"] is None
+
+        page = client.get(
+            f"/api/columns/{column_id}/tasks",
+            params={"cursor": first["next_cursor"], "limit": 2},
             headers=auth_headers,
+        ).json()
+        assert [task["title"] for task in page["items"]] == ["任务2", "任务3"]
+        assert page["total"] == 5
+        page = client.get(
+            f"/api/columns/{column_id}/tasks",
+            params={"cursor": page["next_cursor"]},
+            headers=auth_headers,
+        ).json()
+        assert [task["title"] for task in page["items"]] == ["任务4"]
+        assert page["has_more"] is False
+
+    def test_task_limit_with_many_columns(self, client, auth_headers):
+        """测试列数超过 SQLite 复合查询上限（500）时仍可按列截取。"""
+        project_id, _ = self._create_project(client, auth_headers, 0)
+        db = SessionLocal()
+        try:
+            columns = [
+                KanbanColumn(name=f"列{i}", project_id=project_id, position=3 + i) for i in range(520)
+            ]
+            db.add_all(columns)
+            db.flush()
+            db.add_all(
+                Task(title=f"任务{i}-{j}", column_id=column.id, project_id=project_id, position=j)
+                for i, column in enumerate(columns)
+                for j in range(2)
+            )
+            db.commit()
+        finally:
+            db.close()
+        with engine.connect() as conn:
+            repair_counters(conn)
+
+        response = client.get(
+            f"/api/projects/{project_id}", params={"task_limit": 1}, headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
-        assert len(data["items"]) == 1
-        assert data["page"] == 3
-
-    def test_get_projects_paginated_empty(self, client, auth_headers):
-        """测试分页获取空项目列表。"""
+        columns = response.json()["columns"]
+        assert len(columns) == 523
+        assert [task["title"] for task in columns[-1]["tasks"]] == ["任务519-0"]
+        assert columns[-1]["task_total"] == 2
+
+    def test_project_task_limit(self, client, auth_headers):
+        """测试项目配置的每列任务数，请求参数优先。"""
+        project_id, _ = self._create_project(client, auth_headers, 4, board_task_limit=3)
+        board = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        assert board["board_task_limit"] == 3
+        assert len(board["columns"][0]["tasks"]) == 3
+        assert board["columns"][0]["task_total"] == 4
+
+        board = client.get(
+            f"/api/projects/{project_id}", params={"task_limit": 1}, headers=auth_headers
+        ).json()
+        assert len(board["columns"][0]["tasks"]) == 1
+
+        client.put(
+            f"/api/projects/{project_id}", json={"board_task_limit": None}, headers=auth_headers
+        )
+        board = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        assert len(board["columns"][0]["tasks"]) == 4
+
+    def test_filter_returns_all_matches(self, client, auth_headers):
+        """测试带筛选条件时返回全部匹配任务。"""
+        project_id, _ = self._create_project(client, auth_headers, 4, board_task_limit=1)
+        board = client.get(
+            f"/api/projects/{project_id}", params={"priority": "medium"}, headers=auth_headers
+        ).json()
+        assert len(board["columns"][0]["tasks"]) == 4
+        assert board["columns"][0]["task_total"] == 4
+        assert board["columns"][0]["next_cursor"] is None
+
+    def test_invalid_task_limit(self, client, auth_headers):
+        """测试无效的每列任务数。"""
+        project_id, _ = self._create_project(client, auth_headers, 0)
         response = client.get(
-            "/api/projects/paginated?page=1&page_size=10",
+            f"/api/projects/{project_id}", params={"task_limit": 0}, headers=auth_headers
+        )
+        assert response.status_code == 422
+        response = client.post(
+            "/api/projects", json={"name": "看板", "board_task_limit": 0}, headers=auth_headers
+        )
+        assert response.status_code == 422
+
+
+class TestProjectCounters:
+    """任务数、列数计数器测试。"""
+
+    def _counts(self, client, auth_headers, project_id):
+        """返回项目的 (任务数, 列数, 各列任务数)。"""
+        board = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        return (
+            board["task_count"],
+            board["column_count"],
+            [column["task_count"] for column in board["columns"]],
+        )
+
+    def test_counters_follow_writes(self, client, auth_headers):
+        """测试创建、移动、删除任务与列时计数器同步更新。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "计数"}, headers=auth_headers
+        ).json()["id"]
+        assert self._counts(client, auth_headers, project_id) == (0, 3, [0, 0, 0])
+
+        new_column = client.post(
+            f"/api/projects/{project_id}/columns", json={"name": "归档"}, headers=auth_headers
+        ).json()
+        assert new_column["position"] == 3
+        columns = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"]
+        task_ids = [
+            client.post(
+                f"/api/columns/{columns[0]['id']}/tasks", json={"title": f"任务{i}"}, headers=auth_headers
+            ).json()["id"]
+            for i in range(3)
+        ]
+        assert self._counts(client, auth_headers, project_id) == (3, 4, [3, 0, 0, 0])
+
+        client.put(
+            f"/api/tasks/{task_ids[0]}/move",
+            json={"target_column_id": new_column["id"], "position": 0},
             headers=auth_headers,
         )
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data["items"]) == 0
-        assert data["total"] == 0
-        assert data["total_pages"] == 0
+        client.put(
+            f"/api/tasks/{task_ids[1]}/move",
+            json={"target_column_id": columns[0]["id"], "position": 1},
+            headers=auth_headers,
+        )
+        client.delete(f"/api/tasks/{task_ids[2]}", headers=auth_headers)
+        assert self._counts(client, auth_headers, project_id) == (2, 4, [1, 0, 0, 1])
+
+        client.delete(f"/api/columns/{new_column['id']}", headers=auth_headers)
+        assert self._counts(client, auth_headers, project_id) == (1, 3, [1, 0, 0])
+        listed = client.get("/api/projects", headers=auth_headers).json()
+        assert (listed[0]["task_count"], listed[0]["column_count"]) == (1, 3)
+
+    def test_repair_counters(self, client, auth_headers):
+        """测试一致性检查分批找出并修复错误的计数器。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "计数"}, headers=auth_headers
+        ).json()["id"]
+        columns = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"]
+        for column in columns[:2]:
+            client.post(f"/api/columns/{column['id']}/tasks", json={"title": "任务"}, headers=auth_headers)
+
+        with engine.begin() as conn:
+            conn.execute(text("UPDATE columns SET task_count = 7"))
+            conn.execute(text("UPDATE projects SET column_count = 0"))
+
+        with engine.connect() as conn:
+            assert repair_counters(conn, batch_size=2, dry_run=True) == {"columns": 3, "projects": 1}
+            assert repair_counters(conn, batch_size=2) == {"columns": 3, "projects": 1}
+            assert repair_counters(conn, batch_size=2) == {"columns": 0, "projects": 0}
+        assert self._counts(client, auth_headers, project_id) == (2, 3, [1, 1, 0])
+
+
+class TestProjectCursorPagination:
+    """项目游标分页测试。"""
+
+    def _create_projects(self, client, auth_headers, count):
+        """按顺序创建项目，返回按创建时间倒序的项目ID。"""
+        ids = [
+            client.post("/api/projects", json={"name": f"项目{i}"}, headers=auth_headers).json()["id"]
+            for i in range(count)
+        ]
+        return list(reversed(ids))
+
+    def test_cursor_walks_all_pages(self, client, auth_headers):
+        """测试按游标依次翻页，结果不重不漏。"""
+        expected = self._create_projects(client, auth_headers, 5)
+
+        seen = []
+        cursor = None
+        for _ in range(3):
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            data = client.get("/api/projects/cursor", params=params, headers=auth_headers).json()
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+            assert data["has_more"] == (cursor is not None)
+            assert data["total"] is None
+        assert seen == expected
+        assert cursor is None
+
+    def test_cursor_with_total_and_owner(self, client, auth_headers, other_auth_headers):
+        """测试按所有者筛选并返回总数量。"""
+        self._create_projects(client, auth_headers, 3)
+        other_ids = self._create_projects(client, other_auth_headers, 2)
+        first_page = client.get("/api/projects/cursor", headers=other_auth_headers).json()
+        owner_id = first_page["items"][0]["owner_id"]
+
+        data = client.get(
+            "/api/projects/cursor",
+            params={"owner_id": owner_id, "include_total": True},
+            headers=auth_headers,
+        ).json()
+        assert [item["id"] for item in data["items"]] == other_ids
+        assert data["total"] == 2
+
+        data = client.get(
+            "/api/projects/cursor", params={"include_total": True}, headers=auth_headers
+        ).json()
+        assert data["total"] == 5
+
+    def test_invalid_cursor(self, client, auth_headers):
+        """测试无效游标返回400。"""
+        for cursor in ["not-a-cursor", "e30", "eyJpZCI6ICJ4In0"]:
+            response = client.get(
+                "/api/projects/cursor", params={"cursor": cursor}, headers=auth_headers
+            )
+            assert response.status_code == 400
+            response = client.get("/api/projects", params={"cursor": cursor}, headers=auth_headers)
+            assert response.status_code == 400
+
+    def test_project_list_is_bounded(self, client, auth_headers):
+        """测试项目列表接口单次返回数量有上限，并通过响应头返回下一页游标。"""
+        expected = self._create_projects(client, auth_headers, 3)
+
+        response = client.get("/api/projects", params={"limit": 2}, headers=auth_headers)
+        assert [item["id"] for item in response.json()] == expected[:2]
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = client.get(
+            "/api/projects", params={"limit": 2, "cursor": cursor}, headers=auth_headers
+        )
+        assert [item["id"] for item in response.json()] == expected[2:]
+        assert "X-Next-Cursor" not in response.headers
+
+        response = client.get("/api/projects", params={"limit": 10000}, headers=auth_headers)
+        assert response.status_code == 422
 
 
 class TestProjectUpdate:
@@ -392,6 +1081,107 @@ class TestProjectDelete:
         assert get_response.status_code == 404
 
 
+class TestProjectSoftDelete:
+    """项目软删除与恢复测试。"""
+
+    def _create_project_with_tasks(self, client, auth_headers, count=3):
+        """创建项目并在第一列添加任务，返回 (项目ID, 任务ID列表)。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "软删除项目"}, headers=auth_headers
+        ).json()["id"]
+        column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][0]["id"]
+        task_ids = [
+            client.post(
+                f"/api/columns/{column_id}/tasks", json={"title": f"任务{i}"}, headers=auth_headers
+            ).json()["id"]
+            for i in range(count)
+        ]
+        return project_id, task_ids
+
+    def test_deleted_project_hidden(self, client, auth_headers):
+        """测试删除后项目及其任务立即不可见，数据仍保留。"""
+        project_id, task_ids = self._create_project_with_tasks(client, auth_headers)
+        response = client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        assert response.status_code == 204
+
+        assert client.get("/api/projects", headers=auth_headers).json() == []
+        response = client.put(
+            f"/api/tasks/{task_ids[0]}", json={"title": "新标题"}, headers=auth_headers
+        )
+        assert response.status_code == 404
+        response = client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        assert response.status_code == 404
+
+        db = SessionLocal()
+        try:
+            assert db.query(Task).filter(Task.project_id == project_id).count() == 3
+        finally:
+            db.close()
+
+    def test_restore_project(self, client, auth_headers):
+        """测试恢复期限内可恢复项目，列与任务原样恢复。"""
+        project_id, _ = self._create_project_with_tasks(client, auth_headers)
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+
+        response = client.post(f"/api/projects/{project_id}/restore", headers=auth_headers)
+        assert response.status_code == 200
+        assert response.json()["task_count"] == 3
+
+        board = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        assert [len(column["tasks"]) for column in board["columns"]] == [3, 0, 0]
+
+    def test_restore_project_not_deleted(self, client, auth_headers):
+        """测试恢复未删除的项目返回404。"""
+        project_id, _ = self._create_project_with_tasks(client, auth_headers, count=0)
+        response = client.post(f"/api/projects/{project_id}/restore", headers=auth_headers)
+        assert response.status_code == 404
+        assert "已超过恢复期限" in response.json()["detail"]
+
+    def test_restore_project_expired(self, client, auth_headers):
+        """测试超过恢复期限的项目不可恢复。"""
+        project_id, _ = self._create_project_with_tasks(client, auth_headers, count=0)
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        with engine.begin() as conn:
+            conn.execute(
+                text("UPDATE projects SET deleted_at = :deleted_at WHERE id = :id"),
+                {"deleted_at": utc_now() - timedelta(days=settings.DELETED_RETENTION_DAYS + 1),
+                 "id": project_id},
+            )
+
+        response = client.post(f"/api/projects/{project_id}/restore", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_restore_project_forbidden(self, client, auth_headers, other_auth_headers):
+        """测试不能恢复他人的项目。"""
+        project_id = client.post(
+            "/api/projects", json={"name": "用户1的项目"}, headers=auth_headers
+        ).json()["id"]
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+        response = client.post(f"/api/projects/{project_id}/restore", headers=other_auth_headers)
+        assert response.status_code == 403
+        assert "无权恢复" in response.json()["detail"]
+
+    def test_purge_expired_project(self, client, auth_headers):
+        """测试后台清理分批删除超过恢复期限的项目及其列与任务。"""
+        project_id, _ = self._create_project_with_tasks(client, auth_headers, count=5)
+        kept_id, _ = self._create_project_with_tasks(client, auth_headers, count=1)
+        client.delete(f"/api/projects/{project_id}", headers=auth_headers)
+
+        db = SessionLocal()
+        try:
+            # 恢复期限内不清理
+            assert PurgeService(db).purge_expired() == 0
+            assert PurgeService(db).purge_expired(retention_days=0, batch_size=2) == 1
+            assert db.query(Project).filter(Project.id == project_id).count() == 0
+            assert db.query(KanbanColumn).filter(KanbanColumn.project_id == project_id).count() == 0
+            assert db.query(Task).filter(Task.project_id == project_id).count() == 0
+            assert db.query(Task).filter(Task.project_id == kept_id).count() == 1
+        finally:
+            db.close()
+
+
 class TestProjectRolePermissions:
     """项目角色权限测试。"""
 
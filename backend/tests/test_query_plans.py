@@ -0,0 +1,158 @@
+"""服务层查询计划回归测试模块。
+
+捕获各服务方法实际执行的SQL，对其执行 EXPLAIN QUERY PLAN，
+若任一业务表出现不走索引的全表扫描则测试失败。
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import settings
+from app.models.database import Base, create_db_engine
+from app.models.user import User
+from app.schemas.column import ColumnCreate
+from app.schemas.comment import CommentCreate
+from app.schemas.project import ProjectCreate
+from app.schemas.task import TaskCreate, TaskFilter, TaskPriority
+from app.services.column import ColumnService
+from app.services.comment import CommentService
+from app.services.project import ProjectService
+from app.services.task import TaskService
+
+# 形如 "SCAN tasks"（不带 USING INDEX）的计划行表示全表扫描
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@pytest.fixture
+def plan_env(tmp_path):
+    """创建带样例数据的临时数据库，并记录执行的SQL。"""
+    engine = create_db_engine(f"sqlite:///{tmp_path}/plans.db")
+    Base.metadata.create_all(bind=engine)
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+            captured.append((statement, parameters))
+
+    db = sessionmaker(bind=engine, autoflush=False)()
+    user = User(username="planner", email="planner@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+
+    project = ProjectService(db).create_project(ProjectCreate(name="计划项目"), user.id)
+    columns = ColumnService(db).get_columns_by_project(project.id)
+    task_service = TaskService(db)
+    due = datetime.now(timezone.utc) + timedelta(days=3)
+    for i in range(6):
+        task_service.create_task(
+            TaskCreate(title=f"任务{i}", assignee_id=user.id, due_date=due, priority=TaskPriority.HIGH),
+            columns[i % 2].id,
+        )
+    data = {"user_id": user.id, "project_id": project.id, "column_ids": [c.id for c in columns]}
+    db.expunge_all()
+    captured.clear()
+
+    yield engine, db, captured, data
+
+    db.close()
+    engine.dispose()
+
+
+def _full_scans(engine, captured):
+    """对捕获的SQL执行 EXPLAIN QUERY PLAN，返回全表扫描列表。"""
+    tables = set(Base.metadata.tables)
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            for row in rows:
+                match = FULL_SCAN.match(row[-1])
+                if match and match.group(1) in tables:
+                    scans.append((statement, row[-1]))
+    return scans
+
+
+class TestServiceQueryPlans:
+    """服务层查询均应命中索引。"""
+
+    def test_project_queries_use_indexes(self, plan_env):
+        """测试项目查询、筛选与分页使用索引。"""
+        engine, db, captured, data = plan_env
+        service = ProjectService(db)
+        project = service.get_project_with_filter(data["project_id"])
+        for column in project.columns:
+            list(column.tasks)
+        service.get_project_with_filter(data["project_id"], TaskFilter(assignee_id=data["user_id"]))
+        service.get_project_with_filter(
+            data["project_id"], TaskFilter(due_date_start=datetime.now(timezone.utc))
+        )
+        service.get_project_with_filter(data["project_id"], task_limit=2)
+        service.get_all_projects()
+        service.get_projects_by_owner(data["user_id"])
+        _, cursor = service.get_projects_page(limit=1)
+        service.get_projects_page(cursor, limit=1)
+        service.get_projects_page(cursor, limit=1, owner_id=data["user_id"])
+
+        assert captured
+        assert _full_scans(engine, captured) == []
+
+    def test_task_write_paths_use_indexes(self, plan_env):
+        """测试任务创建、移动与删除使用索引。"""
+        engine, db, captured, data = plan_env
+        column_ids = data["column_ids"]
+        service = TaskService(db)
+        task = service.create_task(TaskCreate(title="新任务"), column_ids[0])
+        service.get_tasks_by_column(column_ids[0])
+        page = service.get_tasks_page(column_ids[0], limit=1)
+        service.get_tasks_page(column_ids[0], page.next_cursor, limit=1)
+        service.move_task(task.id, column_ids[0], 0)
+        service.move_task(task.id, column_ids[1], 1)
+        service.delete_task(task.id)
+
+        assert _full_scans(engine, captured) == []
+
+    def test_rank_ordering_uses_indexes(self, plan_env, monkeypatch):
+        """测试排序键模式下的创建、移动与重新分配使用索引。"""
+        monkeypatch.setattr(settings, "TASK_ORDERING", "rank")
+        engine, db, captured, data = plan_env
+        column_ids = data["column_ids"]
+        service = TaskService(db)
+        task = service.create_task(TaskCreate(title="新任务"), column_ids[0])
+        service.move_task(task.id, column_ids[0], 1)
+        service.move_task(task.id, column_ids[1], 10)
+        service.rebalance_column(column_ids[1])
+
+        assert _full_scans(engine, captured) == []
+
+    def test_column_queries_use_indexes(self, plan_env):
+        """测试列的创建、排序与删除使用索引。"""
+        engine, db, captured, data = plan_env
+        service = ColumnService(db)
+        column = service.create_column(ColumnCreate(name="新列"), data["project_id"])
+        ids = [c.id for c in service.get_columns_by_project(data["project_id"])]
+        service.reorder_columns(data["project_id"], list(reversed(ids)))
+        service.delete_column(column.id)
+
+        assert _full_scans(engine, captured) == []
+
+    def test_comment_queries_use_indexes(self, plan_env):
+        """测试评论查询使用索引。"""
+        engine, db, captured, data = plan_env
+        task = TaskService(db).get_tasks_by_column(data["column_ids"][0])[0]
+        service = CommentService(db)
+        comment = service.create_comment(task.id, data["user_id"], CommentCreate(content="评论"))
+        service.get_comments_by_task(task.id)
+        service.delete_comment(comment.id)
+
+        assert _full_scans(engine, captured) == []
+
+    def test_detects_full_scan(self, plan_env):
+        """测试检测逻辑本身能发现全表扫描。"""
+        engine, _, _, _ = plan_env
+        scans = _full_scans(engine, [("SELECT * FROM tasks WHERE title = ?", ("x",))])
+        assert scans and scans[0][1] == "SCAN tasks"
@@ -0,0 +1,302 @@
+"""全文检索API测试模块。"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from main import app
+from app.models.database import Base, engine, SessionLocal
+from app.models.user import User
+from app.models.project import Project
+from app.models.column import KanbanColumn
+from app.models.task import Task
+from app.models.comment import Comment
+from app.models.search import rebuild_task_search
+
+
+@pytest.fixture(scope="function")
+def client():
+    """创建测试客户端。"""
+    Base.metadata.create_all(bind=engine)
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    # 清理测试数据
+    db = SessionLocal()
+    try:
+        db.query(Comment).delete()
+        db.query(Task).delete()
+        db.query(KanbanColumn).delete()
+        db.query(Project).delete()
+        db.query(User).delete()
+        db.commit()
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def auth_headers(client):
+    """创建认证用户并返回认证头。"""
+    user_data = {
+        "username": "testuser",
+        "email": "test@example.com",
+        "password": "testpassword123",
+    }
+    client.post("/api/auth/register", json=user_data)
+    login_response = client.post("/api/auth/login", json={
+        "username": user_data["username"],
+        "password": user_data["password"],
+    })
+    token = login_response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _create_project(client, auth_headers, name):
+    """创建项目，返回项目ID和第一列ID。"""
+    project_id = client.post("/api/projects", json={"name": name}, headers=auth_headers).json()["id"]
+    detail = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+    return project_id, detail["columns"][0]["id"]
+
+
+def _create_task(client, auth_headers, column_id, **fields):
+    """创建任务，返回任务ID。"""
+    response = client.post(f"/api/columns/{column_id}/tasks", json=fields, headers=auth_headers)
+    return response.json()["id"]
+
+
+def _search(client, auth_headers, **params):
+    """调用检索接口并返回结果。"""
+    response = client.get("/api/search", params=params, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def search_data(client, auth_headers):
+    """创建两个项目及用于检索的任务和评论。"""
+    project_id, column_id = _create_project(client, auth_headers, "检索项目")
+    other_project_id, other_column_id = _create_project(client, auth_headers, "其他项目")
+
+    title_task = _create_task(client, auth_headers, column_id, title="数据库连接池优化")
+    description_task = _create_task(
+        client, auth_headers, column_id, title="接口调整", description="需要升级数据库驱动"
+    )
+    comment_task = _create_task(client, auth_headers, column_id, title="发布准备")
+    client.post(
+        f"/api/tasks/{comment_task}/comments",
+        json={"content": "上线前备份数据库"},
+        headers=auth_headers,
+    )
+    other_task = _create_task(client, auth_headers, other_column_id, title="数据库迁移脚本")
+
+    return {
+        "project_id": project_id,
+        "other_project_id": other_project_id,
+        "column_id": column_id,
+        "title_task": title_task,
+        "description_task": description_task,
+        "comment_task": comment_task,
+        "other_task": other_task,
+    }
+
+
+class TestSearch:
+    """全文检索测试。"""
+
+    def test_search_matches_title_description_and_comments(self, client, auth_headers, search_data):
+        """测试检索覆盖标题、描述与评论，并返回高亮片段。"""
+        results = _search(client, auth_headers, q="数据库")
+
+        task_ids = {result["task_id"] for result in results}
+        assert task_ids == {
+            search_data["title_task"],
+            search_data["description_task"],
+            search_data["comment_task"],
+            search_data["other_task"],
+        }
+        by_id = {result["task_id"]: result for result in results}
+        assert by_id[search_data["title_task"]]["title_highlight"] == "<mark>数据库</mark>连接池优化"
+        assert "<mark>数据库</mark>" in by_id[search_data["description_task"]]["snippet"]
+        assert "<mark>数据库</mark>" in by_id[search_data["comment_task"]]["snippet"]
+        assert by_id[search_data["other_task"]]["project_name"] == "其他项目"
+
+    def test_search_within_project(self, client, auth_headers, search_data):
+        """测试限定项目检索。"""
+        results = _search(client, auth_headers, q="数据库", project_id=search_data["other_project_id"])
+        assert [result["task_id"] for result in results] == [search_data["other_task"]]
+
+    def test_search_ranks_title_matches_first(self, client, auth_headers, search_data):
+        """测试结果按相关度排序：多处命中的任务排在前面。"""
+        _create_task(
+            client,
+            auth_headers,
+            search_data["column_id"],
+            title="数据库巡检",
+            description="数据库 数据库 数据库",
+        )
+        results = _search(client, auth_headers, q="数据库", project_id=search_data["project_id"])
+        assert results[0]["title"] == "数据库巡检"
+        scores = [result["score"] for result in results]
+        assert scores == sorted(scores)
+
+    def test_search_multiple_terms(self, client, auth_headers, search_data):
+        """测试多个词需全部匹配。"""
+        results = _search(client, auth_headers, q="数据库 连接池")
+        assert [result["task_id"] for result in results] == [search_data["title_task"]]
+
+    def test_search_terms_across_task_and_comments(self, client, auth_headers, search_data):
+        """测试多个词可分别命中任务标题与评论。"""
+        results = _search(client, auth_headers, q="发布准备 备份数据库")
+        assert [result["task_id"] for result in results] == [search_data["comment_task"]]
+        assert results[0]["title_highlight"] == "<mark>发布准备</mark>"
+
+        response = client.get(
+            f"/api/projects/{search_data['project_id']}",
+            params={"keyword": "发布准备 备份数据库"},
+            headers=auth_headers,
+        )
+        titles = [task["title"] for task in response.json()["columns"][0]["tasks"]]
+        assert titles == ["发布准备"]
+
+    def test_comments_indexed_as_separate_rows(self, client, auth_headers, search_data):
+        """测试每条评论单独收录，增删评论只影响其自身的检索行。"""
+        task_id = search_data["comment_task"]
+        comment_ids = [
+            client.post(
+                f"/api/tasks/{task_id}/comments",
+                json={"content": f"第{index}次回归测试"},
+                headers=auth_headers,
+            ).json()["id"]
+            for index in range(3)
+        ]
+
+        def indexed_comments():
+            with engine.connect() as conn:
+                return dict(conn.execute(text(
+                    "SELECT rowid, task_id FROM comment_search WHERE rowid IN "
+                    f"({', '.join(str(comment_id) for comment_id in comment_ids)})"
+                )).all())
+
+        assert indexed_comments() == {comment_id: task_id for comment_id in comment_ids}
+
+        client.delete(f"/api/comments/{comment_ids[0]}", headers=auth_headers)
+        assert indexed_comments() == {comment_id: task_id for comment_id in comment_ids[1:]}
+        assert [r["task_id"] for r in _search(client, auth_headers, q="回归测试")] == [task_id]
+
+        client.delete(f"/api/tasks/{task_id}", headers=auth_headers)
+        assert indexed_comments() == {}
+        assert _search(client, auth_headers, q="回归测试") == []
+
+    def test_search_stays_in_sync(self, client, auth_headers, search_data):
+        """测试任务与评论的增删改同步到检索数据。"""
+        client.put(
+            f"/api/tasks/{search_data['title_task']}",
+            json={"title": "缓存预热"},
+            headers=auth_headers,
+        )
+        client.delete(f"/api/tasks/{search_data['other_task']}", headers=auth_headers)
+        comment = client.post(
+            f"/api/tasks/{search_data['title_task']}/comments",
+            json={"content": "顺便检查缓存命中率"},
+            headers=auth_headers,
+        ).json()
+
+        task_ids = {result["task_id"] for result in _search(client, auth_headers, q="数据库")}
+        assert task_ids == {search_data["description_task"], search_data["comment_task"]}
+        assert [r["task_id"] for r in _search(client, auth_headers, q="命中率")] == [
+            search_data["title_task"]
+        ]
+
+        client.delete(f"/api/comments/{comment['id']}", headers=auth_headers)
+        assert _search(client, auth_headers, q="命中率") == []
+
+    def test_short_keyword_falls_back_to_like(self, client, auth_headers, search_data):
+        """测试少于3个字符的检索词回退为模糊匹配。"""
+        results = _search(client, auth_headers, q="备份")
+        assert [result["task_id"] for result in results] == [search_data["comment_task"]]
+        assert "<mark>备份</mark>" in results[0]["snippet"]
+
+    @pytest.mark.parametrize("q", ["数据库", "数据"])
+    def test_search_excludes_deleted_projects_and_columns(self, client, auth_headers, search_data, q):
+        """测试全文检索与短词模糊匹配均不返回已删除项目、列中的任务。"""
+        client.delete(f"/api/projects/{search_data['other_project_id']}", headers=auth_headers)
+        client.delete(f"/api/columns/{search_data['column_id']}", headers=auth_headers)
+        assert _search(client, auth_headers, q=q) == []
+
+        client.post(f"/api/projects/{search_data['other_project_id']}/restore", headers=auth_headers)
+        assert [result["task_id"] for result in _search(client, auth_headers, q=q)] == [
+            search_data["other_task"]
+        ]
+
+    @pytest.mark.parametrize("q", ["数据库", "数据"])
+    def test_search_highlight_escapes_html(self, client, auth_headers, search_data, q):
+        """测试全文检索与短词模糊匹配的高亮片段均转义任务文本中的HTML。"""
+        task_id = _create_task(
+            client,
+            auth_headers,
+            search_data["column_id"],
+            title="<b>数据库</b>告警",
+        )
+        description_task = _create_task(
+            client,
+            auth_headers,
+            search_data["column_id"],
+            title="页面修复",
+            description='<img src=x onerror="alert(1)">数据库 & 缓存',
+        )
+        results = _search(client, auth_headers, q=f"{q} 告警")
+        assert [result["task_id"] for result in results] == [task_id]
+
+        result = results[0]
+        assert result["title"] == "<b>数据库</b>告警"
+        assert result["title_highlight"].startswith(f"&lt;b&gt;<mark>{q}</mark>")
+        assert "<b>" not in result["title_highlight"]
+        assert "&lt;b&gt;" in result["title_highlight"]
+
+        results = _search(client, auth_headers, q=f"{q} 缓存")
+        assert [result["task_id"] for result in results] == [description_task]
+        snippet = results[0]["snippet"]
+        assert "<img" not in snippet
+        assert "=&quot;alert(1)&quot;&gt;" in snippet
+        assert f"<mark>{q}</mark>" in snippet
+        assert "&amp;" in snippet
+
+    def test_search_query_syntax_is_escaped(self, client, auth_headers, search_data):
+        """测试用户输入中的FTS语法字符不会导致错误。"""
+        for q in ['"数据库', "数据库 OR", "NEAR(数据库*)", "a:b"]:
+            response = client.get("/api/search", params={"q": q}, headers=auth_headers)
+            assert response.status_code == 200
+
+    def test_search_project_not_found(self, client, auth_headers):
+        """测试限定不存在的项目。"""
+        response = client.get(
+            "/api/search", params={"q": "数据库", "project_id": 99999}, headers=auth_headers
+        )
+        assert response.status_code == 404
+
+    def test_search_requires_auth(self, client):
+        """测试未登录不能检索。"""
+        response = client.get("/api/search", params={"q": "数据库"})
+        assert response.status_code == 401
+
+    def test_board_keyword_uses_full_text(self, client, auth_headers, search_data):
+        """测试看板关键词筛选同样匹配描述与评论。"""
+        response = client.get(
+            f"/api/projects/{search_data['project_id']}",
+            params={"keyword": "数据库"},
+            headers=auth_headers,
+        )
+        titles = [task["title"] for task in response.json()["columns"][0]["tasks"]]
+        assert titles == ["数据库连接池优化", "接口调整", "发布准备"]
+
+    def test_rebuild_index(self, client, auth_headers, search_data):
+        """测试重建检索数据。"""
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM task_search"))
+            conn.execute(text("DELETE FROM comment_search"))
+        assert _search(client, auth_headers, q="数据库") == []
+
+        with engine.begin() as conn:
+            assert rebuild_task_search(conn) >= 4
+        assert len(_search(client, auth_headers, q="数据库")) == 4
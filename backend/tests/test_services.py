@@ -7,11 +7,21 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
+from app.services.principal_cache import Principal, PrincipalCache, principal_cache
 from app.services.rate_limiter import RateLimiter, login_rate_limiter
 from app.services.token_blacklist import TokenBlacklist, token_blacklist
-from app.utils.security import create_access_token, decode_access_token, get_password_hash, verify_password
+from app.utils.ranking import evenly_spaced_ranks, rank_between
+from app.utils.security import (
+    clear_token_cache,
+    create_access_token,
+    decode_access_token,
+    forget_access_token,
+    get_password_hash,
+    verify_password,
+)
 from main import app
 from app.models.database import Base, engine, SessionLocal
+from app.models.project import Project
 from app.models.user import User
 
 
@@ -28,6 +38,7 @@ def client():
 
     db = SessionLocal()
     try:
+        db.query(Project).delete()
         db.query(User).delete()
         db.commit()
     finally:
@@ -278,6 +289,116 @@ class TestSecurity:
 
         assert decode_access_token(token) is None
 
+    def test_decode_cached_token_skips_verification(self):
+        """测试重复解码同一令牌时命中缓存，不再验证签名。"""
+        clear_token_cache()
+        token = create_access_token({"sub": "123"})
+        first = decode_access_token(token)
+
+        with patch("app.utils.security.jwt.decode") as mock_decode:
+            assert decode_access_token(token) == first
+            mock_decode.assert_not_called()
+
+        # 移除后重新验证
+        forget_access_token(token)
+        with patch("app.utils.security.jwt.decode", return_value=first) as mock_decode:
+            decode_access_token(token)
+            mock_decode.assert_called_once()
+
+    def test_decode_cached_token_checks_expiry(self):
+        """测试缓存的令牌过期后不再返回。"""
+        clear_token_cache()
+        token = create_access_token({"sub": "123"}, timedelta(seconds=30))
+        assert decode_access_token(token) is not None
+
+        with patch("app.utils.security.time.time", return_value=time.time() + 31):
+            assert decode_access_token(token) is None
+
+
+class TestRanking:
+    """排序键工具单元测试。"""
+
+    def test_rank_between_bounds(self):
+        """测试生成的键位于前后两个键之间。"""
+        cases = [(None, None), (None, "1"), ("i", None), ("i", "j"), ("i", "i1"), ("0i", "1")]
+        for before, after in cases:
+            rank = rank_between(before, after)
+            assert before is None or before < rank
+            assert after is None or rank < after
+            assert not rank.endswith("0")
+
+    def test_repeated_insert_stays_ordered(self):
+        """测试在同一位置反复插入仍保持顺序。"""
+        ranks = [rank_between(None, None)]
+        for _ in range(50):
+            ranks.insert(0, rank_between(None, ranks[0]))
+            ranks.insert(2, rank_between(ranks[1], ranks[2] if len(ranks) > 2 else None))
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == len(ranks)
+
+    def test_rank_between_invalid_order(self):
+        """测试前键不小于后键时报错。"""
+        with pytest.raises(ValueError):
+            rank_between("j", "i")
+
+    def test_evenly_spaced_ranks(self):
+        """测试均匀分配的键有序、唯一且留有间隙。"""
+        ranks = evenly_spaced_ranks(2000)
+        assert len(ranks) == 2000
+        assert ranks == sorted(ranks)
+        assert len(set(ranks)) == 2000
+        assert rank_between(ranks[0], ranks[1]) < ranks[1]
+        assert evenly_spaced_ranks(0) == []
+
+
+class TestPrincipalCache:
+    """已认证用户缓存单元测试。"""
+
+    def test_get_returns_cached_principal(self):
+        """测试写回后命中缓存并计数。"""
+        cache = PrincipalCache(max_size=10, ttl_seconds=60)
+        principal = Principal(id=1, role="user", is_active=True)
+
+        assert cache.get(1) is None
+        cache.set(principal, cache.version)
+
+        assert cache.get(1) == principal
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_evicts_least_recently_used(self):
+        """测试超出容量时淘汰最久未使用的条目。"""
+        cache = PrincipalCache(max_size=2, ttl_seconds=60)
+        for user_id in (1, 2):
+            cache.set(Principal(id=user_id, role="user", is_active=True), cache.version)
+
+        # 访问1后写入3，应淘汰2
+        cache.get(1)
+        cache.set(Principal(id=3, role="user", is_active=True), cache.version)
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert cache.get(3) is not None
+
+    def test_expired_entry_is_miss(self):
+        """测试过期条目视为未命中。"""
+        cache = PrincipalCache(max_size=10, ttl_seconds=60)
+        cache.set(Principal(id=1, role="user", is_active=True), cache.version)
+
+        with patch("app.services.principal_cache.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get(1) is None
+        assert cache.stats()["size"] == 0
+
+    def test_set_skipped_after_invalidate(self):
+        """测试加载期间发生失效时不写回旧数据。"""
+        cache = PrincipalCache(max_size=10, ttl_seconds=60)
+        version = cache.version
+
+        # 加载期间用户被修改
+        cache.invalidate(1)
+        cache.set(Principal(id=1, role="admin", is_active=True), version)
+
+        assert cache.get(1) is None
+
 
 class TestDeps:
     """依赖注入模块测试。"""
@@ -370,3 +491,65 @@ class TestDeps:
             headers={"Authorization": f"Bearer {token}"}
         )
         assert response.status_code == 401
+
+    def test_authenticated_requests_use_principal_cache(self, client, test_user_data):
+        """测试重复的认证请求命中缓存，不再查询用户。"""
+        client.post("/api/auth/register", json=test_user_data)
+        login_response = client.post("/api/auth/login", json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"]
+        })
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        principal_cache.clear()
+        for _ in range(3):
+            assert client.get("/api/projects", headers=headers).status_code == 200
+
+        assert principal_cache.stats()["misses"] == 1
+        assert principal_cache.stats()["hits"] == 2
+
+    def test_role_change_invalidates_principal_cache(self, client, test_user_data):
+        """测试修改用户角色后缓存立即失效，权限即时生效。"""
+        # 第一个注册的用户为所有者
+        client.post("/api/auth/register", json=test_user_data)
+        owner_token = client.post("/api/auth/login", json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"]
+        }).json()["access_token"]
+        owner_headers = {"Authorization": f"Bearer {owner_token}"}
+
+        other_user = {"username": "cacheduser", "email": "cached@example.com", "password": "password123"}
+        user_id = client.post("/api/auth/register", json=other_user).json()["id"]
+        token = client.post("/api/auth/login", json={
+            "username": other_user["username"],
+            "password": other_user["password"]
+        }).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        project_id = client.post(
+            "/api/projects", json={"name": "所有者的项目"}, headers=owner_headers
+        ).json()["id"]
+
+        # 管理员可编辑他人项目
+        client.put(f"/api/users/{user_id}/role", json={"role": "admin"}, headers=owner_headers)
+        response = client.put(f"/api/projects/{project_id}", json={"name": "管理员修改"}, headers=headers)
+        assert response.status_code == 200
+
+        # 降级后同一令牌立即失去管理员权限
+        response = client.put(f"/api/users/{user_id}/role", json={"role": "user"}, headers=owner_headers)
+        assert response.status_code == 200
+        response = client.put(f"/api/projects/{project_id}", json={"name": "普通用户修改"}, headers=headers)
+        assert response.status_code == 403
+
+    def test_logout_rejects_cached_token(self, client, test_user_data):
+        """测试令牌已缓存时登出后立即失效。"""
+        client.post("/api/auth/register", json=test_user_data)
+        token = client.post("/api/auth/login", json={
+            "username": test_user_data["username"],
+            "password": test_user_data["password"]
+        }).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+        assert client.post("/api/auth/logout", headers=headers).status_code == 200
+        assert client.get("/api/auth/me", headers=headers).status_code == 401
@@ -3,9 +3,10 @@
 import pytest
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from main import app
-from app.models.database import Base, engine, SessionLocal
+from app.models.database import Base, async_read_engine, engine, SessionLocal
 from app.models.user import User
 from app.models.project import Project
 from app.models.column import KanbanColumn
@@ -425,3 +426,28 @@ class TestTaskFilterCombined:
             all_tasks.extend(column["tasks"])
 
         assert len(all_tasks) == 6
+
+    def test_filter_loads_only_matching_tasks(self, client, auth_headers, project_with_tasks):
+        """测试筛选看板只执行一条筛选后的任务查询，保持列内顺序。"""
+        project_id = project_with_tasks["project_id"]
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "FROM tasks" in statement:
+                statements.append(statement)
+
+        event.listen(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            response = client.get(
+                f"/api/projects/{project_id}?priority=high",
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(async_read_engine.sync_engine, "before_cursor_execute", _capture)
+
+        assert response.status_code == 200
+        tasks = response.json()["columns"][0]["tasks"]
+        assert [task["title"] for task in tasks] == ["紧急任务", "另一个紧急任务"]
+        assert [task["position"] for task in tasks] == [0, 4]
+        assert len(statements) == 1
+        assert "tasks.priority = " in statements[0]
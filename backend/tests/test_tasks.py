@@ -2,13 +2,17 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from main import app
+from app.config import settings
+from app.services import task as task_service_module
 from app.models.database import Base, engine, SessionLocal
 from app.models.user import User
 from app.models.project import Project
 from app.models.column import KanbanColumn
 from app.models.task import Task
+from app.models.comment import Comment
 
 
 @pytest.fixture(scope="function")
@@ -223,6 +227,38 @@ class TestTaskDelete:
         response = client.delete("/api/tasks/99999", headers=auth_headers)
         assert response.status_code == 404
 
+    def test_delete_task_cascades_comments_in_database(
+        self, client, auth_headers, project_and_column
+    ):
+        """测试删除任务时评论由数据库级联删除，不逐条加载。"""
+        task_id = client.post(
+            f"/api/columns/{project_and_column['column_id']}/tasks",
+            json={"title": "任务"},
+            headers=auth_headers,
+        ).json()["id"]
+        for i in range(5):
+            client.post(
+                f"/api/tasks/{task_id}/comments", json={"content": f"评论{i}"}, headers=auth_headers
+            )
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            response = client.delete(f"/api/tasks/{task_id}", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+        assert response.status_code == 204
+        assert not any("comments" in statement for statement in statements)
+
+        db = SessionLocal()
+        try:
+            assert db.query(Comment).filter(Comment.task_id == task_id).count() == 0
+        finally:
+            db.close()
+
 
 class TestTaskMove:
     """任务移动测试。"""
@@ -392,6 +428,100 @@ def other_auth_headers(client):
     return {"Authorization": f"Bearer {token}"}
 
 
+class TestColumnTaskPages:
+    """列内任务分页测试。"""
+
+    def test_walk_column_pages(self, client, auth_headers, project_and_column):
+        """测试按游标依次读取列内任务。"""
+        column_id = project_and_column["column_id"]
+        for i in range(5):
+            client.post(
+                f"/api/columns/{column_id}/tasks", json={"title": f"任务{i}"}, headers=auth_headers
+            )
+
+        titles = []
+        params = {"limit": 2}
+        while True:
+            page = client.get(
+                f"/api/columns/{column_id}/tasks", params=params, headers=auth_headers
+            ).json()
+            titles.extend(task["title"] for task in page["items"])
+            assert page["total"] == 5
+            if not page["has_more"]:
+                break
+            params["cursor"] = page["next_cursor"]
+        assert titles == [f"任务{i}" for i in range(5)]
+
+    def test_column_not_found(self, client, auth_headers):
+        """测试列不存在。"""
+        response = client.get("/api/columns/99999/tasks", headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_invalid_cursor(self, client, auth_headers, project_and_column):
+        """测试无效游标返回400。"""
+        column_id = project_and_column["column_id"]
+        response = client.get(
+            f"/api/columns/{column_id}/tasks", params={"cursor": "e30"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+
+
+class TestTaskProjectId:
+    """任务冗余项目ID测试。"""
+
+    def test_project_id_follows_task(self, client, auth_headers, project_and_column):
+        """测试创建任务记录所属项目，跨列移动时项目ID与项目任务数不变，两列计数同步更新。"""
+        project_id = project_and_column["project_id"]
+        column_id = project_and_column["column_id"]
+        task_id = client.post(
+            f"/api/columns/{column_id}/tasks", json={"title": "任务"}, headers=auth_headers
+        ).json()["id"]
+        target_column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][1]["id"]
+
+        response = client.put(
+            f"/api/tasks/{task_id}/move",
+            json={"target_column_id": target_column_id, "position": 0},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+        db = SessionLocal()
+        try:
+            assert db.get(Task, task_id).project_id == project_id
+            assert db.get(Project, project_id).task_count == 1
+            assert db.get(KanbanColumn, column_id).task_count == 0
+            assert db.get(KanbanColumn, target_column_id).task_count == 1
+        finally:
+            db.close()
+
+    def test_task_authorization_skips_column_lookup(
+        self, client, auth_headers, project_and_column
+    ):
+        """测试修改任务的权限检查直接按任务的项目ID查询，不再单独查询列。"""
+        task_id = client.post(
+            f"/api/columns/{project_and_column['column_id']}/tasks",
+            json={"title": "任务"},
+            headers=auth_headers,
+        ).json()["id"]
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            response = client.put(
+                f"/api/tasks/{task_id}", json={"title": "新标题"}, headers=auth_headers
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+        assert response.status_code == 200
+        # 列仅在任务查询中作为可见性条件（EXISTS）出现
+        assert not any("SELECT columns." in statement for statement in statements)
+
+
 class TestTaskDetailFields:
     """任务详情字段测试。"""
 
@@ -932,3 +1062,338 @@ class TestTaskPermission:
         )
         assert response.status_code == 403
         assert "无权" in response.json()["detail"]
+
+
+@pytest.fixture
+def rank_ordering(monkeypatch):
+    """切换为排序键（rank）排序模式。"""
+    monkeypatch.setattr(settings, "TASK_ORDERING", "rank")
+
+
+def _board_tasks(client, auth_headers, project_id, column_index=0):
+    """获取看板中指定列的任务。"""
+    detail_response = client.get(f"/api/projects/{project_id}", headers=auth_headers)
+    return detail_response.json()["columns"][column_index]["tasks"]
+
+
+def _create_tasks(client, auth_headers, column_id, titles):
+    """在列中依次创建任务，返回任务ID列表。"""
+    return [
+        client.post(
+            f"/api/columns/{column_id}/tasks",
+            json={"title": title},
+            headers=auth_headers,
+        ).json()["id"]
+        for title in titles
+    ]
+
+
+class TestTaskRankOrdering:
+    """排序键模式下的任务排序测试。"""
+
+    def test_create_and_move_keep_position_contract(
+        self, client, auth_headers, project_and_column, rank_ordering
+    ):
+        """测试rank模式下创建与移动仍返回连续位置。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["任务1", "任务2", "任务3"])
+
+        response = client.put(
+            f"/api/tasks/{task_ids[0]}/move",
+            json={"target_column_id": column_id, "position": 2},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["position"] == 2
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        assert [task["title"] for task in tasks] == ["任务2", "任务3", "任务1"]
+        assert [task["position"] for task in tasks] == [0, 1, 2]
+
+    def test_move_to_another_column(self, client, auth_headers, project_and_column, rank_ordering):
+        """测试rank模式下跨列移动。"""
+        project_id = project_and_column["project_id"]
+        columns = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["columns"]
+        source_ids = _create_tasks(client, auth_headers, columns[0]["id"], ["A", "B"])
+        _create_tasks(client, auth_headers, columns[1]["id"], ["C", "D"])
+
+        response = client.put(
+            f"/api/tasks/{source_ids[0]}/move",
+            json={"target_column_id": columns[1]["id"], "position": 1},
+            headers=auth_headers,
+        )
+        assert response.json()["column_id"] == columns[1]["id"]
+
+        assert [t["title"] for t in _board_tasks(client, auth_headers, project_id, 0)] == ["B"]
+        target_tasks = _board_tasks(client, auth_headers, project_id, 1)
+        assert [t["title"] for t in target_tasks] == ["C", "A", "D"]
+        assert [t["position"] for t in target_tasks] == [0, 1, 2]
+
+    def test_move_writes_single_row(self, client, auth_headers, project_and_column, rank_ordering):
+        """测试rank模式下移动任务只改写一行。"""
+        column_id = project_and_column["column_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, [f"任务{i}" for i in range(20)])
+        updates = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("UPDATE TASKS"):
+                updates.append((statement, executemany))
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            response = client.put(
+                f"/api/tasks/{task_ids[-1]}/move",
+                json={"target_column_id": column_id, "position": 0},
+                headers=auth_headers,
+            )
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+
+        assert response.status_code == 200
+        assert len(updates) == 1
+        assert not updates[0][1]
+
+    def test_delete_keeps_positions_contiguous(
+        self, client, auth_headers, project_and_column, rank_ordering
+    ):
+        """测试rank模式下删除任务后位置仍连续。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["任务1", "任务2", "任务3"])
+
+        client.delete(f"/api/tasks/{task_ids[1]}", headers=auth_headers)
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        assert [task["title"] for task in tasks] == ["任务1", "任务3"]
+        assert [task["position"] for task in tasks] == [0, 1]
+
+    def test_position_data_is_rebalanced(
+        self, client, auth_headers, project_and_column, monkeypatch
+    ):
+        """测试切换到rank模式后，旧的位置数据在首次移动时重新分配排序键。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["任务1", "任务2", "任务3"])
+
+        monkeypatch.setattr(settings, "TASK_ORDERING", "rank")
+        client.put(
+            f"/api/tasks/{task_ids[2]}/move",
+            json={"target_column_id": column_id, "position": 1},
+            headers=auth_headers,
+        )
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        assert [task["title"] for task in tasks] == ["任务1", "任务3", "任务2"]
+        db = SessionLocal()
+        try:
+            rows = db.query(Task.position, Task.rank).filter(Task.column_id == column_id).all()
+        finally:
+            db.close()
+        assert all(position == 0 and rank for position, rank in rows)
+
+    def test_long_ranks_trigger_rebalance(
+        self, client, auth_headers, project_and_column, rank_ordering, monkeypatch
+    ):
+        """测试排序键超过长度上限时自动重新分配。"""
+        monkeypatch.setattr(task_service_module, "MAX_RANK_LENGTH", 3)
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["首", "尾"])
+
+        # 反复插入到同一间隙，排序键会不断变长
+        moved_ids = _create_tasks(client, auth_headers, column_id, [f"中{i}" for i in range(10)])
+        for task_id in moved_ids:
+            client.put(
+                f"/api/tasks/{task_id}/move",
+                json={"target_column_id": column_id, "position": 1},
+                headers=auth_headers,
+            )
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        expected = ["首"] + [f"中{i}" for i in reversed(range(10))] + ["尾"]
+        assert [task["title"] for task in tasks] == expected
+        db = SessionLocal()
+        try:
+            ranks = [rank for (rank,) in db.query(Task.rank).filter(Task.id.in_(task_ids + moved_ids))]
+        finally:
+            db.close()
+        assert all(len(rank) <= 3 for rank in ranks)
+
+    def test_column_pages_continue_positions(
+        self, client, auth_headers, project_and_column, rank_ordering
+    ):
+        """测试rank模式下截取看板后续读的任务位置连续。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["A", "B", "C", "D"])
+        client.put(
+            f"/api/tasks/{task_ids[3]}/move",
+            json={"target_column_id": column_id, "position": 0},
+            headers=auth_headers,
+        )
+
+        column = client.get(
+            f"/api/projects/{project_id}", params={"task_limit": 2}, headers=auth_headers
+        ).json()["columns"][0]
+        assert [task["title"] for task in column["tasks"]] == ["D", "A"]
+        page = client.get(
+            f"/api/columns/{column_id}/tasks",
+            params={"cursor": column["next_cursor"]},
+            headers=auth_headers,
+        ).json()
+        assert [task["title"] for task in page["items"]] == ["B", "C"]
+        assert [task["position"] for task in page["items"]] == [2, 3]
+
+
+def _batch(client, auth_headers, operations):
+    """提交批量任务操作并返回响应。"""
+    return client.post(
+        "/api/tasks/batch",
+        json={"operations": operations},
+        headers=auth_headers,
+    )
+
+
+class TestTaskBatch:
+    """批量任务操作测试。"""
+
+    def test_mixed_operations(self, client, auth_headers, project_and_column):
+        """测试一次提交创建、更新、移动、删除操作。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["A", "B", "C"])
+        target_column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][1]["id"]
+
+        response = _batch(client, auth_headers, [
+            {"op": "create", "column_id": column_id, "data": {"title": "D", "priority": "high"}},
+            {"op": "update", "task_id": task_ids[1], "data": {"title": "B2"}},
+            {"op": "move", "task_id": task_ids[2], "target_column_id": target_column_id, "position": 0},
+            {"op": "delete", "task_id": task_ids[0]},
+        ])
+        assert response.status_code == 200
+        data = response.json()
+        assert data["succeeded"] == 4
+        assert data["failed"] == 0
+        created = data["results"][0]
+        assert created["status_code"] == 201
+        assert (created["column_id"], created["position"]) == (column_id, 1)
+        assert data["results"][3]["status_code"] == 204
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        assert [(task["title"], task["position"]) for task in tasks] == [("B2", 0), ("D", 1)]
+        assert tasks[1]["priority"] == "high"
+        moved = _board_tasks(client, auth_headers, project_id, column_index=1)
+        assert [task["title"] for task in moved] == ["C"]
+
+        project = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()
+        assert project["task_count"] == 3
+        assert [column["task_count"] for column in project["columns"][:2]] == [2, 1]
+
+    def test_failed_items_do_not_block_others(
+        self, client, auth_headers, project_and_column, other_auth_headers
+    ):
+        """测试单个操作失败时返回原因，其余操作照常提交。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        own_project_id = client.post(
+            "/api/projects", json={"name": "用户2的项目"}, headers=other_auth_headers
+        ).json()["id"]
+        own_column_id = client.get(
+            f"/api/projects/{own_project_id}", headers=other_auth_headers
+        ).json()["columns"][0]["id"]
+
+        response = _batch(client, other_auth_headers, [
+            {"op": "create", "column_id": own_column_id, "data": {"title": "A"}},
+            {"op": "create", "column_id": column_id, "data": {"title": "越权"}},
+            {"op": "update", "task_id": 999999, "data": {"title": "不存在"}},
+            {"op": "create", "column_id": own_column_id, "data": {"title": "B", "assignee_id": 999999}},
+            {"op": "create", "column_id": own_column_id, "data": {"title": "C"}},
+        ])
+        data = response.json()
+        assert [result["success"] for result in data["results"]] == [True, False, False, False, True]
+        assert [result["status_code"] for result in data["results"][1:4]] == [403, 404, 400]
+        assert data["results"][3]["detail"] == "指定的负责人不存在"
+        assert data["results"][4]["position"] == 1
+
+        tasks = _board_tasks(client, other_auth_headers, own_project_id)
+        assert [task["title"] for task in tasks] == ["A", "C"]
+        assert _board_tasks(client, auth_headers, project_id) == []
+
+    def test_move_to_other_project_rejected(
+        self, client, auth_headers, project_and_column
+    ):
+        """测试批量移动到其他项目的列被拒绝。"""
+        column_id = project_and_column["column_id"]
+        task_id = _create_tasks(client, auth_headers, column_id, ["A"])[0]
+        other_project_id = client.post(
+            "/api/projects", json={"name": "另一个项目"}, headers=auth_headers
+        ).json()["id"]
+        other_column_id = client.get(
+            f"/api/projects/{other_project_id}", headers=auth_headers
+        ).json()["columns"][0]["id"]
+
+        result = _batch(client, auth_headers, [
+            {"op": "move", "task_id": task_id, "target_column_id": other_column_id, "position": 0},
+        ]).json()["results"][0]
+        assert result["status_code"] == 400
+        assert result["detail"] == "目标列必须属于同一项目"
+
+    def test_invalid_operation_rejected(self, client, auth_headers):
+        """测试未知操作类型返回422。"""
+        response = _batch(client, auth_headers, [{"op": "archive", "task_id": 1}])
+        assert response.status_code == 422
+
+    def test_statement_count_is_constant(self, client, auth_headers, project_and_column):
+        """测试批量创建的语句数不随操作数增长。"""
+        column_id = project_and_column["column_id"]
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            response = _batch(client, auth_headers, [
+                {"op": "create", "column_id": column_id, "data": {"title": f"任务{i}"}}
+                for i in range(50)
+            ])
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+        assert response.json()["succeeded"] == 50
+        inserts = [statement for statement in statements if statement.startswith("INSERT INTO tasks")]
+        assert len(inserts) <= 1
+        assert len(statements) < 20
+
+    def test_rank_mode_writes_ranks(
+        self, client, auth_headers, project_and_column, rank_ordering
+    ):
+        """测试rank模式下批量操作只为新建与移动的任务分配排序键。"""
+        column_id = project_and_column["column_id"]
+        project_id = project_and_column["project_id"]
+        task_ids = _create_tasks(client, auth_headers, column_id, ["A", "B", "C"])
+        db = SessionLocal()
+        try:
+            ranks_before = dict(db.query(Task.id, Task.rank).filter(Task.id.in_(task_ids)))
+        finally:
+            db.close()
+
+        data = _batch(client, auth_headers, [
+            {"op": "move", "task_id": task_ids[2], "target_column_id": column_id, "position": 0},
+            {"op": "create", "column_id": column_id, "data": {"title": "D"}},
+        ]).json()
+        assert [result["position"] for result in data["results"]] == [0, 3]
+
+        tasks = _board_tasks(client, auth_headers, project_id)
+        assert [(task["title"], task["position"]) for task in tasks] == [
+            ("C", 0), ("A", 1), ("B", 2), ("D", 3)
+        ]
+        db = SessionLocal()
+        try:
+            ranks_after = dict(db.query(Task.id, Task.rank).filter(Task.id.in_(task_ids)))
+        finally:
+            db.close()
+        assert ranks_after[task_ids[0]] == ranks_before[task_ids[0]]
+        assert ranks_after[task_ids[1]] == ranks_before[task_ids[1]]
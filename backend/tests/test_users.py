@@ -2,10 +2,16 @@
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 
 from main import app
+from app.models.comment import Comment
 from app.models.database import Base, engine, SessionLocal
+from app.models.project import Project
+from app.models.task import Task
 from app.models.user import User, UserRole
+from app.services import user_import
+from app.utils.security import hash_passwords
 
 
 @pytest.fixture(scope="function")
@@ -19,6 +25,8 @@ def client():
     # 清理测试数据
     db = SessionLocal()
     try:
+        # 列、任务、评论由外键级联删除
+        db.query(Project).delete()
         db.query(User).delete()
         db.commit()
     finally:
@@ -892,6 +900,121 @@ class TestCreateUser:
         assert "只有所有者可以创建用户" in response.json()["detail"]
 
 
+class TestImportUsers:
+    """批量导入用户测试（所有者操作）。"""
+
+    def test_import_users_json(self, client, auth_headers):
+        """测试以JSON批量导入用户。"""
+        users = [
+            {"username": f"import{i}", "email": f"import{i}@example.com", "password": "password123"}
+            for i in range(3)
+        ]
+        users[0]["display_name"] = "导入用户"
+        response = client.post("/api/users/import", json={"users": users}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["errors"] == []
+        assert [user["username"] for user in data["created"]] == ["import0", "import1", "import2"]
+        assert data["created"][0]["display_name"] == "导入用户"
+        assert data["created"][1]["display_name"] == "import1"
+        assert {user["role"] for user in data["created"]} == {"user"}
+
+        # 导入的用户可以用各自的密码登录
+        login_response = client.post("/api/auth/login", json={
+            "username": "import2",
+            "password": "password123",
+        })
+        assert login_response.status_code == 200
+
+    def test_import_does_not_hold_writer_while_hashing(self, client, auth_headers, monkeypatch):
+        """测试哈希密码期间不占用写连接，只在最后写入时使用。"""
+        checked_out = []
+
+        def _hash_passwords(passwords):
+            checked_out.append(engine.pool.checkedout())
+            return hash_passwords(passwords)
+
+        monkeypatch.setattr(user_import, "hash_passwords", _hash_passwords)
+        users = [{"username": "import0", "email": "import0@example.com", "password": "password123"}]
+        response = client.post("/api/users/import", json={"users": users}, headers=auth_headers)
+        assert response.status_code == 200
+        assert checked_out == [0]
+
+    def test_import_users_reports_row_errors(self, client, auth_headers):
+        """测试逐行报告错误，合法的行照常导入。"""
+        users = [
+            {"username": "testuser", "email": "taken@example.com", "password": "password123"},
+            {"username": "fresh1", "email": "test@example.com", "password": "password123"},
+            {"username": "fresh2", "email": "fresh2@example.com", "password": "123"},
+            {"username": "fresh3", "email": "fresh3@example.com", "password": "password123"},
+            {"username": "fresh3", "email": "other3@example.com", "password": "password123"},
+            {"username": "fresh4", "email": "fresh3@example.com", "password": "password123"},
+        ]
+        response = client.post("/api/users/import", json={"users": users}, headers=auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert [user["username"] for user in data["created"]] == ["fresh3"]
+        errors = {error["row"]: error["detail"] for error in data["errors"]}
+        assert errors[1] == "用户名已存在"
+        assert errors[2] == "邮箱已存在"
+        assert errors[3].startswith("password")
+        assert errors[5] == "用户名在导入数据中重复"
+        assert errors[6] == "邮箱在导入数据中重复"
+        assert [error["row"] for error in data["errors"]] == [1, 2, 3, 5, 6]
+
+    def test_import_users_csv(self, client, auth_headers):
+        """测试以CSV文件批量导入用户。"""
+        content = (
+            "username,email,password,display_name\n"
+            "csvuser1,csv1@example.com,password123,CSV用户\n"
+            "csvuser2,csv2@example.com,password123,\n"
+            "csvuser3,not-an-email,password123,\n"
+        )
+        response = client.post(
+            "/api/users/import/csv",
+            files={"file": ("users.csv", content.encode("utf-8"), "text/csv")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [(user["username"], user["display_name"]) for user in data["created"]] == [
+            ("csvuser1", "CSV用户"),
+            ("csvuser2", "csvuser2"),
+        ]
+        assert [(error["row"], error["username"]) for error in data["errors"]] == [(3, "csvuser3")]
+
+    def test_import_users_csv_missing_columns(self, client, auth_headers):
+        """测试CSV缺少必需的列。"""
+        response = client.post(
+            "/api/users/import/csv",
+            files={"file": ("users.csv", b"username,email\nu1,u1@example.com\n", "text/csv")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+    def test_normal_user_cannot_import_users(self, client, auth_headers):
+        """测试普通用户不能批量导入用户。"""
+        client.post("/api/auth/register", json={
+            "username": "normaluser",
+            "email": "normal@example.com",
+            "password": "password123",
+        })
+        login_response = client.post("/api/auth/login", json={
+            "username": "normaluser",
+            "password": "password123",
+        })
+        user_headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        response = client.post(
+            "/api/users/import",
+            json={"users": [{"username": "x1", "email": "x1@example.com", "password": "password123"}]},
+            headers=user_headers,
+        )
+        assert response.status_code == 403
+        assert "只有所有者可以创建用户" in response.json()["detail"]
+
+
 class TestDeleteUser:
     """删除用户测试（所有者操作）。"""
 
@@ -923,6 +1046,111 @@ class TestDeleteUser:
         finally:
             db.close()
 
+    def _create_member_activity(self, client, auth_headers):
+        """注册另一个用户，由其评论若干任务并被指派为负责人，返回 (用户ID, 任务ID列表)。"""
+        client.post("/api/auth/register", json={
+            "username": "otheruser",
+            "email": "other@example.com",
+            "password": "password123",
+        })
+        other_headers = {"Authorization": "Bearer " + client.post("/api/auth/login", json={
+            "username": "otheruser",
+            "password": "password123",
+        }).json()["access_token"]}
+        user_id = client.get("/api/auth/me", headers=other_headers).json()["id"]
+
+        project_id = client.post(
+            "/api/projects", json={"name": "项目"}, headers=auth_headers
+        ).json()["id"]
+        column_id = client.get(
+            f"/api/projects/{project_id}", headers=auth_headers
+        ).json()["columns"][0]["id"]
+        task_ids = []
+        for i in range(3):
+            task_id = client.post(
+                f"/api/columns/{column_id}/tasks",
+                json={"title": f"任务{i}", "assignee_id": user_id},
+                headers=auth_headers,
+            ).json()["id"]
+            client.post(
+                f"/api/tasks/{task_id}/comments", json={"content": "评论"}, headers=other_headers
+            )
+            task_ids.append(task_id)
+        return user_id, task_ids
+
+    def test_delete_user_keeps_comments_in_database(self, client, auth_headers):
+        """测试删除用户时由数据库置空其评论的作者并取消指派，不逐个加载关联数据。"""
+        user_id, task_ids = self._create_member_activity(client, auth_headers)
+        statements = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _capture)
+        try:
+            response = client.delete(f"/api/users/{user_id}", headers=auth_headers)
+        finally:
+            event.remove(engine, "before_cursor_execute", _capture)
+        assert response.status_code == 204
+        # 项目版本号与变更记录由 UPDATE、INSERT ... SELECT 完成，不读取任务与评论
+        assert not any(
+            statement.startswith("SELECT") and ("FROM tasks" in statement or "FROM comments" in statement)
+            for statement in statements
+        )
+
+        db = SessionLocal()
+        try:
+            comments = db.query(Comment.user_id).filter(Comment.task_id.in_(task_ids)).all()
+            assert comments == [(None,)] * 3
+            assignees = db.query(Task.assignee_id).filter(Task.id.in_(task_ids)).all()
+            assert assignees == [(None,)] * 3
+        finally:
+            db.close()
+
+        comments = client.get(f"/api/tasks/{task_ids[0]}/comments", headers=auth_headers).json()
+        assert [(c["content"], c["user_id"], c["user"]) for c in comments] == [("评论", None, None)]
+
+    def test_delete_commenter_updates_board(self, client, auth_headers):
+        """测试删除仅发表过评论的用户时递增看板版本号并记录评论所在的任务。"""
+        user_id, task_ids = self._create_member_activity(client, auth_headers)
+        client.put(f"/api/tasks/{task_ids[0]}", json={"assignee_id": None}, headers=auth_headers)
+        project_id = client.get("/api/projects", headers=auth_headers).json()[0]["id"]
+        version = client.get(f"/api/projects/{project_id}", headers=auth_headers).json()["version"]
+
+        db = SessionLocal()
+        try:
+            # 只保留第一个任务上的评论，且该任务无负责人
+            db.query(Comment).filter(Comment.task_id.in_(task_ids[1:])).delete()
+            db.query(Task).filter(Task.id.in_(task_ids[1:])).update({Task.assignee_id: None})
+            db.commit()
+        finally:
+            db.close()
+
+        assert client.delete(f"/api/users/{user_id}", headers=auth_headers).status_code == 204
+        changes = client.get(
+            f"/api/projects/{project_id}/changes", params={"since": version}, headers=auth_headers
+        ).json()
+        assert changes["version"] > version
+        assert [task["id"] for task in changes["tasks"]] == [task_ids[0]]
+
+    def test_cannot_delete_user_owning_projects(self, client, auth_headers):
+        """测试仍拥有项目的用户不能删除。"""
+        client.post("/api/auth/register", json={
+            "username": "otheruser",
+            "email": "other@example.com",
+            "password": "password123",
+        })
+        other_headers = {"Authorization": "Bearer " + client.post("/api/auth/login", json={
+            "username": "otheruser",
+            "password": "password123",
+        }).json()["access_token"]}
+        user_id = client.get("/api/auth/me", headers=other_headers).json()["id"]
+        client.post("/api/projects", json={"name": "用户2的项目"}, headers=other_headers)
+
+        response = client.delete(f"/api/users/{user_id}", headers=auth_headers)
+        assert response.status_code == 400
+        assert "仍拥有项目" in response.json()["detail"]
+
     def test_owner_cannot_delete_self(self, client, auth_headers):
         """测试所有者不能删除自己。"""
         me_response = client.get("/api/auth/me", headers=auth_headers)
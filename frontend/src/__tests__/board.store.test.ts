@@ -8,7 +8,7 @@ import { useBoardStore } from '@/stores/board'
 import * as taskApi from '@/api/task'
 import * as columnApi from '@/api/column'
 import * as projectApi from '@/api/project'
-import type { ProjectDetail, Task, ColumnWithTasks } from '@/types'
+import type { ProjectDetail, ProjectChanges, Task, ColumnWithTasks } from '@/types'
 
 // Mock API 模块
 vi.mock('@/api/task')
@@ -624,21 +624,49 @@ describe('useBoardStore', () => {
       store.currentProject = project
 
       const updatedProject = createProject({ id: 1, name: '更新后的项目' })
-      vi.mocked(projectApi.getProject).mockResolvedValue(updatedProject)
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValue({ data: updatedProject, etag: '"1-2-all"' })
 
       await store.silentRefresh()
 
-      expect(projectApi.getProject).toHaveBeenCalledWith(1, {})
+      expect(projectApi.getProjectIfChanged).toHaveBeenCalledWith(1, {}, null)
       expect(store.currentProject?.name).toBe('更新后的项目')
     })
 
+    it('应该携带上次的 ETag，看板未变化时保留当前数据', async () => {
+      const store = useBoardStore()
+      const project = createProject({ id: 1, name: '测试项目' })
+      store.currentProject = project
+
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValueOnce({ data: project, etag: '"1-2-all"' })
+      await store.silentRefresh()
+
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValueOnce({ data: null, etag: '"1-2-all"' })
+      await store.silentRefresh()
+
+      expect(projectApi.getProjectIfChanged).toHaveBeenLastCalledWith(1, {}, '"1-2-all"')
+      expect(store.currentProject).toEqual(project)
+    })
+
+    it('重新加载项目后不应该沿用旧的 ETag', async () => {
+      const store = useBoardStore()
+      store.currentProject = createProject({ id: 1 })
+
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValue({ data: null, etag: '"1-2-all"' })
+      await store.silentRefresh()
+      vi.mocked(projectApi.getProject).mockResolvedValue(createProject({ id: 1 }))
+      await store.loadProject(1)
+      await store.silentRefresh()
+
+      expect(projectApi.getProjectIfChanged).toHaveBeenLastCalledWith(1, {}, null)
+    })
+
     it('当 currentProject 为 null 时不应该刷新', async () => {
       const store = useBoardStore()
       store.currentProject = null
 
       await store.silentRefresh()
 
-      expect(projectApi.getProject).not.toHaveBeenCalled()
+      expect(projectApi.getProjectIfChanged).not.toHaveBeenCalled()
     })
 
     it('当用户正在编辑时不应该刷新', async () => {
@@ -648,14 +676,14 @@ describe('useBoardStore', () => {
 
       await store.silentRefresh()
 
-      expect(projectApi.getProject).not.toHaveBeenCalled()
+      expect(projectApi.getProjectIfChanged).not.toHaveBeenCalled()
     })
 
     it('刷新失败时不应该抛出错误', async () => {
       const store = useBoardStore()
       store.currentProject = createProject({ id: 1 })
 
-      vi.mocked(projectApi.getProject).mockRejectedValue(new Error('网络错误'))
+      vi.mocked(projectApi.getProjectIfChanged).mockRejectedValue(new Error('网络错误'))
 
       // 不应该抛出错误
       await expect(store.silentRefresh()).resolves.toBeUndefined()
@@ -666,11 +694,137 @@ describe('useBoardStore', () => {
       store.currentProject = createProject({ id: 1 })
       store.taskFilter = { keyword: '测试', priority: 'high' }
 
-      vi.mocked(projectApi.getProject).mockResolvedValue(createProject({ id: 1 }))
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValue({ data: createProject({ id: 1 }), etag: null })
 
       await store.silentRefresh()
 
-      expect(projectApi.getProject).toHaveBeenCalledWith(1, { keyword: '测试', priority: 'high' })
+      expect(projectApi.getProjectIfChanged).toHaveBeenCalledWith(
+        1,
+        { keyword: '测试', priority: 'high' },
+        null
+      )
+    })
+  })
+
+  describe('silentRefresh - 增量同步', () => {
+    function createChanges(overrides: Partial<ProjectChanges> = {}): ProjectChanges {
+      return {
+        version: 6,
+        full_resync: false,
+        project: null,
+        columns: [],
+        deleted_column_ids: [],
+        tasks: [],
+        deleted_task_ids: [],
+        ...overrides
+      }
+    }
+
+    it('已知版本号时应该只拉取增量并原地应用', async () => {
+      const store = useBoardStore()
+      const unchanged = createTask({ id: 1, column_id: 1, position: 0 })
+      store.currentProject = createProject({
+        id: 1,
+        version: 5,
+        columns: [
+          createColumn({
+            id: 1,
+            tasks: [unchanged, createTask({ id: 2, column_id: 1, position: 1 })]
+          }),
+          createColumn({ id: 2, position: 1, tasks: [createTask({ id: 3, column_id: 2 })] })
+        ]
+      })
+
+      vi.mocked(projectApi.getProjectChanges).mockResolvedValue(
+        createChanges({
+          project: { ...createProject({ id: 1, name: '新名称' }), version: 6 },
+          columns: [createColumn({ id: 4, name: '新列', position: 1 })],
+          deleted_column_ids: [2],
+          tasks: [
+            createTask({ id: 2, title: '移到列首', column_id: 1, position: 0 }),
+            createTask({ id: 5, title: '新任务', column_id: 4, position: 0 })
+          ]
+        })
+      )
+
+      await store.silentRefresh()
+
+      expect(projectApi.getProjectChanges).toHaveBeenCalledWith(1, 5)
+      expect(projectApi.getProjectIfChanged).not.toHaveBeenCalled()
+      expect(store.currentProject?.name).toBe('新名称')
+      expect(store.currentProject?.version).toBe(6)
+      expect(store.columns.map((c) => c.id)).toEqual([1, 4])
+      expect(store.columns[0].tasks.map((t) => t.id)).toEqual([2, 1])
+      expect(store.columns[0].tasks[1]).toEqual(unchanged)
+      expect(store.columns[1].tasks.map((t) => t.title)).toEqual(['新任务'])
+    })
+
+    it('应该移除已删除的任务', async () => {
+      const store = useBoardStore()
+      store.currentProject = createProject({
+        id: 1,
+        version: 5,
+        columns: [
+          createColumn({
+            id: 1,
+            task_total: 2,
+            tasks: [createTask({ id: 1 }), createTask({ id: 2, position: 1 })]
+          })
+        ]
+      })
+
+      vi.mocked(projectApi.getProjectChanges).mockResolvedValue(
+        createChanges({ deleted_task_ids: [1] })
+      )
+
+      await store.silentRefresh()
+
+      expect(store.columns[0].tasks.map((t) => t.id)).toEqual([2])
+      expect(store.columns[0].task_total).toBe(1)
+    })
+
+    it('需要全量同步时应该重新获取完整看板', async () => {
+      const store = useBoardStore()
+      store.currentProject = createProject({ id: 1, version: 5 })
+      const reloaded = createProject({ id: 1, name: '完整看板', version: 9 })
+
+      vi.mocked(projectApi.getProjectChanges).mockResolvedValue(
+        createChanges({ version: 9, full_resync: true })
+      )
+      vi.mocked(projectApi.getProject).mockResolvedValue(reloaded)
+
+      await store.silentRefresh()
+
+      expect(projectApi.getProject).toHaveBeenCalledWith(1)
+      expect(store.currentProject).toEqual(reloaded)
+    })
+
+    it('列内任务未全部加载时应该改用条件请求', async () => {
+      const store = useBoardStore()
+      store.currentProject = createProject({
+        id: 1,
+        version: 5,
+        columns: [createColumn({ id: 1, task_total: 3, tasks: [createTask({ id: 1 })] })]
+      })
+
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValue({ data: null, etag: null })
+
+      await store.silentRefresh()
+
+      expect(projectApi.getProjectChanges).not.toHaveBeenCalled()
+      expect(projectApi.getProjectIfChanged).toHaveBeenCalledWith(1, {}, null)
+    })
+
+    it('有筛选条件时应该改用条件请求', async () => {
+      const store = useBoardStore()
+      store.currentProject = createProject({ id: 1, version: 5 })
+      store.taskFilter = { keyword: '测试' }
+
+      vi.mocked(projectApi.getProjectIfChanged).mockResolvedValue({ data: null, etag: null })
+
+      await store.silentRefresh()
+
+      expect(projectApi.getProjectChanges).not.toHaveBeenCalled()
     })
   })
 
@@ -36,25 +36,60 @@ describe('comment API', () => {
   })
 
   describe('getComments', () => {
-    it('应该正确调用 GET 请求获取评论列表', async () => {
+    it('应该以完整响应调用 GET 请求并解析分页响应头', async () => {
       const mockComments = [
-        createComment({ id: 1, content: '评论1' }),
-        createComment({ id: 2, content: '评论2' })
+        createComment({ id: 2, content: '评论2' }),
+        createComment({ id: 1, content: '评论1' })
       ]
-      vi.mocked(get).mockResolvedValue(mockComments)
+      vi.mocked(get).mockResolvedValue({
+        data: mockComments,
+        headers: {
+          'x-total-count': '60',
+          'x-next-cursor': 'older',
+          'x-latest-cursor': 'latest',
+          'x-has-more': 'true'
+        }
+      })
 
       const result = await commentApi.getComments(1)
 
-      expect(get).toHaveBeenCalledWith('/tasks/1/comments')
-      expect(result).toEqual(mockComments)
+      expect(get).toHaveBeenCalledWith('/tasks/1/comments', { rawResponse: true })
+      expect(result).toEqual({
+        comments: mockComments,
+        total: 60,
+        nextCursor: 'older',
+        latestCursor: 'latest',
+        hasMore: true
+      })
     })
 
-    it('应该正确处理空评论列表', async () => {
-      vi.mocked(get).mockResolvedValue([])
+    it('应该正确序列化分页参数', async () => {
+      vi.mocked(get).mockResolvedValue({ data: [], headers: {} })
+
+      await commentApi.getComments(1, { before: 'abc=', limit: 20 })
+      expect(get).toHaveBeenCalledWith('/tasks/1/comments?before=abc%3D&limit=20', {
+        rawResponse: true
+      })
+
+      await commentApi.getComments(1, { after: 'xyz' })
+      expect(get).toHaveBeenLastCalledWith('/tasks/1/comments?after=xyz', { rawResponse: true })
+    })
+
+    it('应该正确处理空评论列表（无游标）', async () => {
+      vi.mocked(get).mockResolvedValue({
+        data: [],
+        headers: { 'x-total-count': '0', 'x-has-more': 'false' }
+      })
 
       const result = await commentApi.getComments(1)
 
-      expect(result).toEqual([])
+      expect(result).toEqual({
+        comments: [],
+        total: 0,
+        nextCursor: null,
+        latestCursor: null,
+        hasMore: false
+      })
     })
   })
 
@@ -3,7 +3,16 @@
  * 重点测试筛选参数的序列化
  */
 import { describe, it, expect, vi, beforeEach } from 'vitest'
-import { getProject, getProjects, createProject, updateProject, deleteProject } from '@/api/project'
+import {
+  getProject,
+  getProjectIfChanged,
+  getProjectChanges,
+  getProjects,
+  getProjectsPage,
+  createProject,
+  updateProject,
+  deleteProject
+} from '@/api/project'
 import * as request from '@/api/request'
 import type { Project, ProjectDetail, TaskFilterParams } from '@/types'
 
@@ -126,15 +135,76 @@ describe('project API', () => {
     })
   })
 
+  describe('getProjectIfChanged', () => {
+    it('应该携带 ETag 并使用与 getProject 相同的 URL', async () => {
+      vi.mocked(request.getIfChanged).mockResolvedValue({ data: null, etag: '"1-2-all"' })
+
+      const result = await getProjectIfChanged(1, { priority: 'high' }, '"1-2-all"')
+
+      expect(request.getIfChanged).toHaveBeenCalledWith('/projects/1?priority=high', '"1-2-all"')
+      expect(result).toEqual({ data: null, etag: '"1-2-all"' })
+    })
+  })
+
+  describe('getProjectChanges', () => {
+    it('应该携带 since 版本号调用增量同步端点', async () => {
+      const changes = {
+        version: 3,
+        full_resync: false,
+        project: mockProject,
+        columns: [],
+        deleted_column_ids: [],
+        tasks: [],
+        deleted_task_ids: [2]
+      }
+      vi.mocked(request.get).mockResolvedValue(changes)
+
+      const result = await getProjectChanges(1, 2)
+
+      expect(request.get).toHaveBeenCalledWith('/projects/1/changes?since=2')
+      expect(result).toEqual(changes)
+    })
+  })
+
+  describe('getProjectsPage', () => {
+    it('应该携带游标请求并返回下一页游标', async () => {
+      vi.mocked(request.get).mockResolvedValue({
+        data: [mockProject],
+        headers: { 'x-next-cursor': 'next' }
+      })
+
+      const result = await getProjectsPage('a+b=')
+
+      expect(request.get).toHaveBeenCalledWith('/projects?cursor=a%2Bb%3D', { rawResponse: true })
+      expect(result).toEqual({ projects: [mockProject], nextCursor: 'next' })
+    })
+  })
+
   describe('getProjects', () => {
     it('应该调用正确的 API 端点', async () => {
-      vi.mocked(request.get).mockResolvedValue([mockProject])
+      vi.mocked(request.get).mockResolvedValue({ data: [mockProject], headers: {} })
 
       const result = await getProjects()
 
-      expect(request.get).toHaveBeenCalledWith('/projects')
+      expect(request.get).toHaveBeenCalledTimes(1)
+      expect(request.get).toHaveBeenCalledWith('/projects', { rawResponse: true })
       expect(result).toEqual([mockProject])
     })
+
+    it('应该沿 X-Next-Cursor 获取所有页', async () => {
+      const secondProject = { ...mockProject, id: 2, name: '第二个项目' }
+      vi.mocked(request.get)
+        .mockResolvedValueOnce({ data: [mockProject], headers: { 'x-next-cursor': 'page2' } })
+        .mockResolvedValueOnce({ data: [secondProject], headers: {} })
+
+      const result = await getProjects()
+
+      expect(request.get).toHaveBeenNthCalledWith(1, '/projects', { rawResponse: true })
+      expect(request.get).toHaveBeenNthCalledWith(2, '/projects?cursor=page2', {
+        rawResponse: true
+      })
+      expect(result).toEqual([mockProject, secondProject])
+    })
   })
 
   describe('createProject', () => {
@@ -1,15 +1,37 @@
 /**
  * 评论相关API
  */
+import type { AxiosResponse } from 'axios'
 import { get, post, del } from './request'
-import type { Comment, CommentCreateRequest } from '@/types'
+import type { Comment, CommentCreateRequest, CommentPage, CommentPageParams } from '@/types'
 
 /**
- * 获取任务评论列表
+ * 获取任务的一页评论（游标分页，按时间倒序）
  * @param taskId - 任务ID
+ * @param params - 分页参数：before 取 nextCursor 获取更早的评论，after 取 latestCursor 获取新增评论
  */
-export function getComments(taskId: number): Promise<Comment[]> {
-  return get<Comment[]>(`/tasks/${taskId}/comments`)
+export async function getComments(
+  taskId: number,
+  params: CommentPageParams = {}
+): Promise<CommentPage> {
+  const query = new URLSearchParams()
+  if (params.before) query.append('before', params.before)
+  if (params.after) query.append('after', params.after)
+  if (params.limit) query.append('limit', String(params.limit))
+  const queryString = query.toString()
+  const url = queryString
+    ? `/tasks/${taskId}/comments?${queryString}`
+    : `/tasks/${taskId}/comments`
+
+  const response = await get<AxiosResponse<Comment[]>>(url, { rawResponse: true })
+  const headers = response.headers
+  return {
+    comments: response.data,
+    total: Number(headers['x-total-count'] ?? response.data.length),
+    nextCursor: (headers['x-next-cursor'] as string | undefined) ?? null,
+    latestCursor: (headers['x-latest-cursor'] as string | undefined) ?? null,
+    hasMore: headers['x-has-more'] === 'true'
+  }
 }
 
 /**
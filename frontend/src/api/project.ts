@@ -1,11 +1,15 @@
 /**
  * 项目相关API
  */
-import { get, post, put, del } from './request'
+import type { AxiosResponse } from 'axios'
+import { get, getIfChanged, post, put, del } from './request'
+import type { ConditionalResponse } from './request'
 import type {
   Project,
   ProjectDetail,
+  ProjectChanges,
   ProjectCreateRequest,
+  ProjectPage,
   ProjectUpdateRequest,
   TaskFilterParams
 } from '@/types'
@@ -19,21 +23,38 @@ export function createProject(data: ProjectCreateRequest): Promise<Project> {
 }
 
 /**
- * 获取项目列表
+ * 获取一页项目（按创建时间倒序）
+ * @param cursor - 分页游标，取自上一页的 nextCursor
  */
-export function getProjects(): Promise<Project[]> {
-  return get<Project[]>('/projects')
+export async function getProjectsPage(cursor?: string | null): Promise<ProjectPage> {
+  const url = cursor ? `/projects?cursor=${encodeURIComponent(cursor)}` : '/projects'
+  const response = await get<AxiosResponse<Project[]>>(url, { rawResponse: true })
+  return {
+    projects: response.data,
+    nextCursor: (response.headers['x-next-cursor'] as string | undefined) ?? null
+  }
 }
 
 /**
- * 获取项目详情
+ * 获取项目列表（沿 X-Next-Cursor 依次获取所有页）
+ */
+export async function getProjects(): Promise<Project[]> {
+  const projects: Project[] = []
+  let cursor: string | null = null
+  do {
+    const page = await getProjectsPage(cursor)
+    projects.push(...page.projects)
+    cursor = page.nextCursor
+  } while (cursor)
+  return projects
+}
+
+/**
+ * 构建项目详情地址
  * @param projectId - 项目ID
  * @param filter - 任务筛选参数（可选）
  */
-export function getProject(
-  projectId: number,
-  filter?: TaskFilterParams
-): Promise<ProjectDetail> {
+function projectDetailUrl(projectId: number, filter?: TaskFilterParams): string {
   // 构建查询参数
   const params = new URLSearchParams()
   if (filter) {
@@ -45,10 +66,44 @@ export function getProject(
     if (filter.due_date_end) params.append('due_date_end', filter.due_date_end)
   }
   const queryString = params.toString()
-  const url = queryString
+  return queryString
     ? `/projects/${projectId}?${queryString}`
     : `/projects/${projectId}`
-  return get<ProjectDetail>(url)
+}
+
+/**
+ * 获取项目详情
+ * @param projectId - 项目ID
+ * @param filter - 任务筛选参数（可选）
+ */
+export function getProject(
+  projectId: number,
+  filter?: TaskFilterParams
+): Promise<ProjectDetail> {
+  return get<ProjectDetail>(projectDetailUrl(projectId, filter))
+}
+
+/**
+ * 获取项目详情（条件请求），看板未变化时 data 为 null
+ * @param projectId - 项目ID
+ * @param filter - 任务筛选参数（可选）
+ * @param etag - 上次响应的 ETag
+ */
+export function getProjectIfChanged(
+  projectId: number,
+  filter?: TaskFilterParams,
+  etag?: string | null
+): Promise<ConditionalResponse<ProjectDetail>> {
+  return getIfChanged<ProjectDetail>(projectDetailUrl(projectId, filter), etag)
+}
+
+/**
+ * 获取看板自某一版本以来的变更（增量同步）
+ * @param projectId - 项目ID
+ * @param since - 客户端已有的看板版本号
+ */
+export function getProjectChanges(projectId: number, since: number): Promise<ProjectChanges> {
+  return get<ProjectChanges>(`/projects/${projectId}/changes?since=${since}`)
 }
 
 /**
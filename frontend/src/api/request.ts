@@ -5,6 +5,19 @@ import axios from 'axios'
 import type { AxiosInstance, AxiosRequestConfig, AxiosResponse } from 'axios'
 import { ElMessage } from 'element-plus'
 
+declare module 'axios' {
+  interface AxiosRequestConfig {
+    /** 为 true 时拦截器返回完整响应（含响应头），而不只是响应体 */
+    rawResponse?: boolean
+  }
+}
+
+/** 条件GET请求的结果，内容未变化（304）时 data 为 null */
+export interface ConditionalResponse<T> {
+  data: T | null
+  etag: string | null
+}
+
 /** Token存储键名 */
 const TOKEN_KEY = 'kanban_token'
 
@@ -41,7 +54,7 @@ instance.interceptors.request.use(
  */
 instance.interceptors.response.use(
   (response: AxiosResponse) => {
-    return response.data
+    return response.config.rawResponse ? response : response.data
   },
   (error) => {
     // 统一错误处理
@@ -93,6 +106,27 @@ export function get<T>(url: string, config?: AxiosRequestConfig): Promise<T> {
   return instance.get(url, config)
 }
 
+/**
+ * 封装条件GET请求：携带 If-None-Match，服务端内容未变化时返回 304
+ * @param url - 请求地址
+ * @param etag - 上次响应的 ETag
+ */
+export async function getIfChanged<T>(
+  url: string,
+  etag?: string | null
+): Promise<ConditionalResponse<T>> {
+  const response: AxiosResponse<T> = await instance.get(url, {
+    headers: etag ? { 'If-None-Match': etag } : undefined,
+    validateStatus: (status) => (status >= 200 && status < 300) || status === 304,
+    rawResponse: true
+  })
+  const newEtag = (response.headers.etag as string | undefined) ?? null
+  if (response.status === 304) {
+    return { data: null, etag: newEtag ?? etag ?? null }
+  }
+  return { data: response.data, etag: newEtag }
+}
+
 /**
  * 封装POST请求
  * @param url - 请求地址
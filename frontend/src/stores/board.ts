@@ -5,6 +5,7 @@ import { defineStore } from 'pinia'
 import { ref, computed } from 'vue'
 import type {
   ProjectDetail,
+  ProjectChanges,
   ColumnWithTasks,
   Task,
   ColumnCreateRequest,
@@ -24,6 +25,8 @@ export const useBoardStore = defineStore('board', () => {
   const loading = ref(false)
   const taskFilter = ref<TaskFilterParams>({})
   const isUserEditing = ref(false)
+  // 看板最近一次响应的 ETag，轮询时据此发送条件请求
+  let boardEtag: string | null = null
 
   // 计算属性
   const columns = computed(() => currentProject.value?.columns || [])
@@ -44,6 +47,7 @@ export const useBoardStore = defineStore('board', () => {
    */
   async function loadProject(projectId: number): Promise<void> {
     loading.value = true
+    boardEtag = null
     try {
       currentProject.value = await projectApi.getProject(projectId, taskFilter.value)
     } finally {
@@ -51,15 +55,85 @@ export const useBoardStore = defineStore('board', () => {
     }
   }
 
+  /**
+   * 判断能否增量同步：无筛选条件、已知看板版本号且各列任务均已加载
+   */
+  function canSyncChanges(project: ProjectDetail): boolean {
+    return (
+      !hasActiveFilter.value &&
+      project.version !== undefined &&
+      project.columns.every(
+        (c) => c.task_total === undefined || c.task_total <= c.tasks.length
+      )
+    )
+  }
+
+  /**
+   * 将增量变更应用到当前看板（原地修改，未变化的列和任务保持不变）
+   * 先移除已删除与已变更的对象，再按 position 从小到大插入变更后的对象
+   */
+  function applyChanges(project: ProjectDetail, changes: ProjectChanges): void {
+    if (changes.project) {
+      Object.assign(project, changes.project)
+    }
+
+    const removedColumns = new Set([
+      ...changes.deleted_column_ids,
+      ...changes.columns.map((c) => c.id)
+    ])
+    const existingColumns = new Map(project.columns.map((c) => [c.id, c]))
+    project.columns = project.columns.filter((c) => !removedColumns.has(c.id))
+    for (const column of [...changes.columns].sort((a, b) => a.position - b.position)) {
+      const tasks = existingColumns.get(column.id)?.tasks ?? []
+      project.columns.splice(column.position, 0, { ...column, tasks })
+    }
+
+    const removedTasks = new Set([
+      ...changes.deleted_task_ids,
+      ...changes.tasks.map((t) => t.id)
+    ])
+    for (const column of project.columns) {
+      column.tasks = column.tasks.filter((t) => !removedTasks.has(t.id))
+    }
+    const columnsById = new Map(project.columns.map((c) => [c.id, c]))
+    for (const task of [...changes.tasks].sort((a, b) => a.position - b.position)) {
+      columnsById.get(task.column_id)?.tasks.splice(task.position, 0, task)
+    }
+    for (const column of project.columns) {
+      column.task_total = column.tasks.length
+    }
+    project.version = changes.version
+  }
+
   /**
    * 静默刷新项目数据（不显示 loading 状态）
-   * 用于轮询刷新，不影响用户操作
+   * 用于轮询刷新，不影响用户操作。无筛选且任务已全部加载时只拉取增量变更，
+   * 否则携带 ETag，看板未变化时不替换数据
    */
   async function silentRefresh(): Promise<void> {
     if (!currentProject.value || isUserEditing.value) return
     try {
-      const data = await projectApi.getProject(currentProject.value.id, taskFilter.value)
-      currentProject.value = data
+      const project = currentProject.value
+      if (canSyncChanges(project)) {
+        const changes = await projectApi.getProjectChanges(project.id, project.version!)
+        // 等待期间可能已切换项目或重新加载
+        if (currentProject.value !== project) return
+        if (changes.full_resync) {
+          currentProject.value = await projectApi.getProject(project.id)
+        } else if (changes.version !== project.version) {
+          applyChanges(project, changes)
+        }
+        return
+      }
+      const { data, etag } = await projectApi.getProjectIfChanged(
+        currentProject.value.id,
+        taskFilter.value,
+        boardEtag
+      )
+      boardEtag = etag
+      if (data) {
+        currentProject.value = data
+      }
     } catch {
       // 静默刷新失败时不显示错误
     }
@@ -102,6 +176,7 @@ export const useBoardStore = defineStore('board', () => {
    */
   function clearProject(): void {
     currentProject.value = null
+    boardEtag = null
     taskFilter.value = {}
   }
 
@@ -53,6 +53,8 @@ export interface Column {
 /** 看板列（包含任务） */
 export interface ColumnWithTasks extends Column {
   tasks: Task[]
+  /** 列内任务总数，大于 tasks 长度时列内还有未加载的任务 */
+  task_total?: number
 }
 
 /** 列创建请求 */
@@ -82,6 +84,8 @@ export interface Project {
   name: string
   description: string | null
   owner_id: number
+  /** 看板版本号，项目、列、任务、评论的每次修改都会递增 */
+  version?: number
   created_at: string
   updated_at: string
 }
@@ -91,6 +95,26 @@ export interface ProjectDetail extends Project {
   columns: ColumnWithTasks[]
 }
 
+/** 一页项目（按创建时间倒序） */
+export interface ProjectPage {
+  projects: Project[]
+  /** 下一页游标，没有更多项目时为 null */
+  nextCursor: string | null
+}
+
+/** 看板增量变更（position 为列在看板、任务在列内的序号） */
+export interface ProjectChanges {
+  /** 当前看板版本号，下次增量同步时作为 since */
+  version: number
+  /** 变更记录已清理或变更过多，需重新获取完整看板 */
+  full_resync: boolean
+  project: Project | null
+  columns: Column[]
+  deleted_column_ids: number[]
+  tasks: Task[]
+  deleted_task_ids: number[]
+}
+
 /** 项目创建请求 */
 export interface ProjectCreateRequest {
   name: string
@@ -123,13 +147,37 @@ export interface CommentUser {
 export interface Comment {
   id: number
   task_id: number
-  user_id: number
+  /** 作者ID，作者已删除时为 null */
+  user_id: number | null
   content: string
   created_at: string
-  user: CommentUser
+  /** 作者信息，作者已删除时为 null */
+  user: CommentUser | null
 }
 
 /** 评论创建请求 */
 export interface CommentCreateRequest {
   content: string
 }
+
+/** 评论分页查询参数（before 与 after 不能同时使用） */
+export interface CommentPageParams {
+  /** 只返回早于该游标的评论 */
+  before?: string
+  /** 只返回晚于该游标的评论 */
+  after?: string
+  limit?: number
+}
+
+/** 一页评论（按时间倒序） */
+export interface CommentPage {
+  comments: Comment[]
+  /** 任务的评论总数 */
+  total: number
+  /** 更早一页的游标，没有更早的评论时为 null */
+  nextCursor: string | null
+  /** 最新评论的游标，作为 after 获取新增评论 */
+  latestCursor: string | null
+  /** 翻页方向上是否还有评论 */
+  hasMore: boolean
+}